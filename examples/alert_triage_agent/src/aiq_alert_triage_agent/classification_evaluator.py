@@ -48,7 +48,11 @@ async def register_classification_evaluator(config: ClassificationEvaluatorConfi
     """
     evaluator = ClassificationEvaluator(builder.get_max_concurrency())
 
-    yield EvaluatorInfo(config=config, evaluate_fn=evaluator.evaluate, description="Classification Accuracy Evaluator")
+    yield EvaluatorInfo(config=config,
+                        evaluate_fn=evaluator.evaluate,
+                        description="Classification Accuracy Evaluator",
+                        evaluate_item_fn=evaluator.evaluate_item_with_limits,
+                        aggregate_fn=evaluator.aggregate)
 
 
 class ClassificationEvaluator(BaseEvaluator):
@@ -25,14 +25,14 @@ async def nemo_langchain(retriever_config: NemoRetrieverConfig, builder: Builder
     from aiq.retriever.nemo_retriever.retriever import NemoLangchainRetriever
     from aiq.retriever.nemo_retriever.retriever import NemoRetriever
 
-    retriever = NemoRetriever(**retriever_config.model_dump(exclude={"type", "top_k", "collection_name"}))
-    optional_fields = ["collection_name", "top_k", "output_fields"]
-    model_dict = retriever_config.model_dump()
-    optional_args = {field: model_dict[field] for field in optional_fields if model_dict[field] is not None}
+    async with NemoRetriever(**retriever_config.model_dump(exclude={"type", "top_k", "collection_name"})) as retriever:
+        optional_fields = ["collection_name", "top_k", "output_fields"]
+        model_dict = retriever_config.model_dump()
+        optional_args = {field: model_dict[field] for field in optional_fields if model_dict[field] is not None}
 
-    retriever.bind(**optional_args)
+        retriever.bind(**optional_args)
 
-    yield NemoLangchainRetriever(client=retriever)
+        yield NemoLangchainRetriever(client=retriever)
 
 
 @register_retriever_client(config_type=MilvusRetrieverConfig, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
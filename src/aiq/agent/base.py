@@ -27,6 +27,7 @@ from langgraph.graph.graph import CompiledGraph
 log = logging.getLogger(__name__)
 
 TOOL_NOT_FOUND_ERROR_MESSAGE = "There is no tool named {tool_name}. Tool must be one of {tools}."
+TOOL_TIMEOUT_ERROR_MESSAGE = "The tool {tool_name} did not respond within {timeout} seconds."
 INPUT_SCHEMA_MESSAGE = ". Arguments must be provided as a valid JSON object following this format: {schema}"
 NO_INPUT_ERROR_MESSAGE = "No human input recieved to the agent, Please ask a valid question."
 
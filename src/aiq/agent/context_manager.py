@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import logging
+import typing
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import trim_messages
+from langchain_core.messages.base import BaseMessage
+from langchain_core.messages.human import HumanMessage
+
+from aiq.agent.base import AGENT_LOG_PREFIX
+from aiq.builder.context import AIQContext
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+
+logger = logging.getLogger(__name__)
+
+TokenCounter = Callable[[str], int]
+Summarizer = Callable[[str, int], Awaitable[str]]
+CompactionStrategy = typing.Literal["truncate", "summarize"]
+
+# approximate number of tokens used by chat templates to delimit each message
+TOKENS_PER_MESSAGE = 4
+# approximate number of characters per token of English text, used when no tokenizer is configured
+CHARACTERS_PER_TOKEN = 4
+MAX_CACHED_TEXTS = 4096
+MAX_COMPACTED_OBSERVATIONS = 256
+
+CONTEXT_COMPACTION_STEP_NAME = "agent_context_compaction"
+TRUNCATED_OBSERVATION_MESSAGE = "\n... [truncated {tokens} tokens]"
+SUMMARIZE_OBSERVATION_PROMPT = (
+    "Summarize the following tool output in at most {max_tokens} tokens. Keep every fact, number and name which may "
+    "be needed to answer a question about it, and do not add any information.\n\nTool output:\n{observation}")
+
+
+def approximate_token_count(text: str) -> int:
+    """Estimates the number of tokens of the text from its length, without a tokenizer"""
+    return (len(text) + CHARACTERS_PER_TOKEN - 1) // CHARACTERS_PER_TOKEN
+
+
+def get_token_counter(encoding_name: str | None = None) -> TokenCounter:
+    """
+    Returns a function counting the tokens of a text with the tiktoken encoding `encoding_name`, such as
+    `cl100k_base`. If `encoding_name` is None, the number of tokens is estimated from the length of the text.
+    """
+    if encoding_name is None:
+        return approximate_token_count
+
+    try:
+        import tiktoken
+    except ImportError:
+        logger.error(
+            "tiktoken is not installed. Please install tiktoken to count tokens with the '%s' encoding, or "
+            "do not set a tokenizer encoding to estimate the number of tokens.",
+            encoding_name)
+        raise
+
+    encoding = tiktoken.get_encoding(encoding_name)
+
+    def _count_tokens(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return _count_tokens
+
+
+def llm_summarizer(llm: BaseChatModel) -> Summarizer:
+    """Returns a summarizer which asks the LLM to summarize tool observations"""
+
+    async def _summarize(observation: str, max_tokens: int) -> str:
+        prompt = SUMMARIZE_OBSERVATION_PROMPT.format(max_tokens=max_tokens, observation=observation)
+        response = await llm.ainvoke([HumanMessage(content=prompt)])
+        return str(response.content)
+
+    return _summarize
+
+
+def _get_text(message: BaseMessage) -> str:
+    return message.content if isinstance(message.content, str) else str(message.content)
+
+
+class AgentContextManager:
+    """
+    Keeps the messages an agent sends to its LLM within a token budget.
+
+    The agent's context is made of fixed messages, such as the question, followed by turns. A turn is the agent's
+    output followed by the observations of the tools it called. Observations of all but the `keep_recent_turns` most
+    recent turns are compacted to `max_observation_tokens`, by truncating or summarizing them, and the oldest turns are
+    then dropped until the context fits in `max_tokens`. The most recent turn is always kept.
+
+    Token counts are cached per text, so each message is only tokenized once while the agent iterates over a growing
+    scratchpad. Every reduction of the context is reported as an intermediate step.
+    """
+
+    def __init__(self,
+                 max_tokens: int | None = None,
+                 token_counter: TokenCounter | None = None,
+                 max_observation_tokens: int | None = None,
+                 compaction: CompactionStrategy = "truncate",
+                 summarizer: Summarizer | None = None,
+                 keep_recent_turns: int = 1):
+        if compaction == "summarize" and summarizer is None:
+            raise ValueError("A summarizer is required to summarize observations")
+        if keep_recent_turns < 1:
+            raise ValueError("keep_recent_turns must be at least 1")
+        self.max_tokens = max_tokens
+        self.max_observation_tokens = max_observation_tokens
+        self.compaction = compaction
+        self.keep_recent_turns = keep_recent_turns
+        self._summarizer = summarizer
+        self._count_text_tokens = functools.lru_cache(maxsize=MAX_CACHED_TEXTS)(token_counter
+                                                                                or approximate_token_count)
+        self._compacted: OrderedDict[str, str] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_tokens is not None or self.max_observation_tokens is not None
+
+    def count_text_tokens(self, text: str) -> int:
+        return self._count_text_tokens(text)
+
+    def count_message_tokens(self, message: BaseMessage) -> int:
+        return self.count_text_tokens(_get_text(message)) + TOKENS_PER_MESSAGE
+
+    def count_tokens(self, messages: typing.Iterable[BaseMessage]) -> int:
+        return sum(self.count_message_tokens(message) for message in messages)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Returns the beginning of the text with at most `max_tokens` tokens, noting how many tokens were removed"""
+        tokens = self.count_text_tokens(text)
+        if tokens <= max_tokens:
+            return text
+
+        # tokenizers cannot be assumed to decode tokens, cut the text by its average number of characters per token
+        end = len(text) * max_tokens // tokens
+        while end > 0 and self.count_text_tokens(text[:end]) > max_tokens:
+            end = end * 9 // 10
+
+        return text[:end] + TRUNCATED_OBSERVATION_MESSAGE.format(tokens=tokens - self.count_text_tokens(text[:end]))
+
+    async def compact_observation(self, observation: str) -> str:
+        """Returns the observation compacted to at most `max_observation_tokens`, compacted observations are cached"""
+        if self.max_observation_tokens is None or self.count_text_tokens(observation) <= self.max_observation_tokens:
+            return observation
+
+        compacted = self._compacted.get(observation)
+        if compacted is not None:
+            self._compacted.move_to_end(observation)
+            return compacted
+
+        if self.compaction == "summarize":
+            try:
+                compacted = await self._summarizer(observation, self.max_observation_tokens)
+            except Exception as ex:
+                logger.warning("%s Unable to summarize a tool observation, truncating it instead: %s",
+                               AGENT_LOG_PREFIX,
+                               ex,
+                               exc_info=True)
+                compacted = observation
+            # the summary may not respect the budget
+            compacted = self.truncate(compacted, self.max_observation_tokens)
+        else:
+            compacted = self.truncate(observation, self.max_observation_tokens)
+
+        self._compacted[observation] = compacted
+        if len(self._compacted) > MAX_COMPACTED_OBSERVATIONS:
+            self._compacted.popitem(last=False)
+
+        return compacted
+
+    async def fit(self, fixed: list[BaseMessage], turns: list[list[BaseMessage]]) -> list[BaseMessage]:
+        """
+        Returns the fixed messages followed by the messages of the turns which fit in the token budget, with the
+        observations of older turns compacted.
+        """
+        if not self.enabled:
+            return fixed + [message for turn in turns for message in turn]
+
+        tokens_before = self.count_tokens(fixed) + sum(self.count_tokens(turn) for turn in turns)
+
+        compacted_observations = 0
+        fitted_turns: list[list[BaseMessage]] = []
+        for index, turn in enumerate(turns):
+            if index >= len(turns) - self.keep_recent_turns:
+                fitted_turns.append(turn)
+                continue
+            fitted_turn = turn[:1]
+            for observation in turn[1:]:
+                content = await self.compact_observation(_get_text(observation))
+                if content != _get_text(observation):
+                    compacted_observations += 1
+                    observation = observation.model_copy(update={"content": content})
+                fitted_turn.append(observation)
+            fitted_turns.append(fitted_turn)
+
+        dropped_turns = 0
+        if self.max_tokens is not None:
+            tokens = self.count_tokens(fixed) + sum(self.count_tokens(turn) for turn in fitted_turns)
+            while len(fitted_turns) > 1 and tokens > self.max_tokens:
+                tokens -= self.count_tokens(fitted_turns.pop(0))
+                dropped_turns += 1
+
+        messages = fixed + [message for turn in fitted_turns for message in turn]
+        self._report(tokens_before,
+                     self.count_tokens(messages),
+                     dropped_turns=dropped_turns,
+                     compacted_observations=compacted_observations)
+
+        return messages
+
+    def trim_history(self, messages: list[BaseMessage]) -> list[BaseMessage]:
+        """
+        Returns the most recent messages of a conversation which fit in the token budget, starting on a human message.
+        The last message is kept even if it does not fit by itself.
+        """
+        if self.max_tokens is None or not messages:
+            return messages
+
+        trimmed = trim_messages(messages=messages,
+                                max_tokens=self.max_tokens,
+                                strategy="last",
+                                token_counter=self.count_tokens,
+                                start_on="human",
+                                include_system=True)
+        if not trimmed:
+            trimmed = messages[-1:]
+
+        self._report(self.count_tokens(messages),
+                     self.count_tokens(trimmed),
+                     dropped_messages=len(messages) - len(trimmed))
+
+        return trimmed
+
+    def _report(self, tokens_before: int, tokens_after: int, **details: int):
+        if tokens_after >= tokens_before:
+            return
+
+        logger.debug("%s Reduced the agent's context from %d to %d tokens",
+                     AGENT_LOG_PREFIX,
+                     tokens_before,
+                     tokens_after)
+
+        metadata = {"tokens_before": tokens_before, "tokens_after": tokens_after, **details}
+        step_manager = AIQContext.get().intermediate_step_manager
+        start = IntermediateStepPayload(event_type=IntermediateStepType.CUSTOM_START,
+                                        name=CONTEXT_COMPACTION_STEP_NAME,
+                                        data=StreamEventData(input=tokens_before),
+                                        metadata=metadata)
+        step_manager.push_intermediate_step(start)
+        step_manager.push_intermediate_step(
+            IntermediateStepPayload(UUID=start.UUID,
+                                    event_type=IntermediateStepType.CUSTOM_END,
+                                    span_event_timestamp=start.event_timestamp,
+                                    name=CONTEXT_COMPACTION_STEP_NAME,
+                                    data=StreamEventData(input=tokens_before, output=tokens_after),
+                                    metadata=metadata))
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 # pylint: disable=R0917
 import logging
@@ -39,10 +40,13 @@ from aiq.agent.base import INPUT_SCHEMA_MESSAGE
 from aiq.agent.base import NO_INPUT_ERROR_MESSAGE
 from aiq.agent.base import TOOL_NOT_FOUND_ERROR_MESSAGE
 from aiq.agent.base import TOOL_RESPONSE_LOG_MESSAGE
+from aiq.agent.base import TOOL_TIMEOUT_ERROR_MESSAGE
 from aiq.agent.base import AgentDecision
+from aiq.agent.context_manager import AgentContextManager
 from aiq.agent.dual_node import DualNodeAgent
 from aiq.agent.react_agent.output_parser import ReActOutputParser
 from aiq.agent.react_agent.output_parser import ReActOutputParserException
+from aiq.agent.react_agent.prompt import PARALLEL_ACTIONS_PROMPT
 from aiq.agent.react_agent.prompt import SYSTEM_PROMPT
 from aiq.agent.react_agent.prompt import USER_PROMPT
 from aiq.agent.react_agent.register import ReActAgentWorkflowConfig
@@ -53,14 +57,18 @@ logger = logging.getLogger(__name__)
 class ReActGraphState(BaseModel):
     """State schema for the ReAct Agent Graph"""
     messages: list[BaseMessage] = Field(default_factory=list)  # input and output of the ReAct Agent
-    agent_scratchpad: list[AgentAction] = Field(default_factory=list)  # agent thoughts / intermediate steps
+    # agent thoughts / intermediate steps, a list of actions if the agent requested several tools at once
+    agent_scratchpad: list[AgentAction | list[AgentAction]] = Field(default_factory=list)
     tool_responses: list[BaseMessage] = Field(default_factory=list)  # the responses from any tool calls
 
 
 class ReActAgentGraph(DualNodeAgent):
     """Configurable LangGraph ReAct Agent. A ReAct Agent performs reasoning inbetween tool calls, and utilizes the tool
     names and descriptions to select the optimal tool.  Supports retrying on output parsing errors.  Argument
-    "detailed_logs" toggles logging of inputs, outputs, and intermediate steps."""
+    "detailed_logs" toggles logging of inputs, outputs, and intermediate steps.  Argument "parallel_actions" lets the
+    agent request several tools in a single step, which are called concurrently, and "tool_call_timeout" bounds the
+    time spent waiting for each tool.  Argument "context_manager" keeps the question and scratchpad within a token
+    budget."""
 
     def __init__(self,
                  llm: BaseChatModel,
@@ -70,10 +78,16 @@ class ReActAgentGraph(DualNodeAgent):
                  callbacks: list[AsyncCallbackHandler] = None,
                  detailed_logs: bool = False,
                  retry_parsing_errors: bool = True,
-                 max_retries: int = 1):
+                 max_retries: int = 1,
+                 parallel_actions: bool = False,
+                 tool_call_timeout: float | None = None,
+                 context_manager: AgentContextManager | None = None):
         super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
         self.retry_parsing_errors = retry_parsing_errors
         self.max_tries = (max_retries + 1) if retry_parsing_errors else 1
+        self.parallel_actions = parallel_actions
+        self.tool_call_timeout = tool_call_timeout
+        self.context_manager = context_manager or AgentContextManager()
         logger.debug(
             "%s Filling the prompt variables 'tools' and 'tool_names', using the tools provided in the config.",
             AGENT_LOG_PREFIX)
@@ -107,12 +121,24 @@ class ReActAgentGraph(DualNodeAgent):
                              exc_info=True)
             raise ex
 
+    async def _build_scratchpad(self, state: ReActGraphState) -> list[BaseMessage]:
+        # preserve the agent's thoughts from the previous cycles, along with the responses from the tools it called
+        turns = []
+        for index, intermediate_step in enumerate(state.agent_scratchpad):
+            agent_thoughts = AIMessage(content=_get_actions(intermediate_step)[0].log)
+            tool_response = HumanMessage(content=state.tool_responses[index].content)
+            turns.append([agent_thoughts, tool_response])
+        # the question counts towards the token budget, but is never dropped
+        question = HumanMessage(content=state.messages[0].content)
+        return (await self.context_manager.fit([question], turns))[1:]
+
     async def agent_node(self, state: ReActGraphState):
         try:
             logger.debug("%s Starting the ReAct Agent Node", AGENT_LOG_PREFIX)
             # keeping a working state allows us to resolve parsing errors without polluting the agent scratchpad
             # the agent "forgets" about the parsing error after solving it - prevents hallucinations in next cycles
             working_state = []
+            scratchpad = await self._build_scratchpad(state) if len(state.agent_scratchpad) > 0 else []
             for attempt in range(1, self.max_tries + 1):
                 # the first time we are invoking the ReAct Agent, it won't have any intermediate steps / agent thoughts
                 if len(state.agent_scratchpad) == 0 and len(working_state) == 0:
@@ -137,13 +163,7 @@ class ReActAgentGraph(DualNodeAgent):
                     # ReAct Agents require agentic cycles
                     # in an agentic cycle, preserve the agent's thoughts from the previous cycles,
                     # and give the agent the response from the tool it called
-                    agent_scratchpad = []
-                    for index, intermediate_step in enumerate(state.agent_scratchpad):
-                        agent_thoughts = AIMessage(content=intermediate_step.log)
-                        agent_scratchpad.append(agent_thoughts)
-                        tool_response = HumanMessage(content=state.tool_responses[index].content)
-                        agent_scratchpad.append(tool_response)
-                    agent_scratchpad += working_state
+                    agent_scratchpad = scratchpad + working_state
                     question = state.messages[0].content
                     logger.debug("%s Querying agent, attempt: %s", AGENT_LOG_PREFIX, attempt)
                     output_message = ""
@@ -161,7 +181,8 @@ class ReActAgentGraph(DualNodeAgent):
                 try:
                     # check if the agent has the final answer yet
                     logger.debug("%s Successfully obtained agent response. Parsing agent's response", AGENT_LOG_PREFIX)
-                    agent_output = await ReActOutputParser().aparse(output_message.content)
+                    agent_output = await ReActOutputParser(parallel_actions=self.parallel_actions
+                                                           ).aparse(output_message.content)
                     logger.debug("%s Successfully parsed agent's response", AGENT_LOG_PREFIX)
                     if attempt > 1:
                         logger.debug("%s Successfully parsed agent response after %s attempts",
@@ -175,8 +196,11 @@ class ReActAgentGraph(DualNodeAgent):
                         state.messages += [AIMessage(content=final_answer)]
                     else:
                         # the agent wants to call a tool, ensure the thoughts are preserved for the next agentic cycle
-                        agent_output.log = output_message.content
-                        logger.debug("%s The agent wants to call a tool: %s", AGENT_LOG_PREFIX, agent_output.tool)
+                        for agent_action in _get_actions(agent_output):
+                            agent_action.log = output_message.content
+                            logger.debug("%s The agent wants to call a tool: %s", AGENT_LOG_PREFIX, agent_action.tool)
+                        if isinstance(agent_output, list) and len(agent_output) == 1:
+                            agent_output = agent_output[0]
                         state.agent_scratchpad += [agent_output]
                     return state
                 except ReActOutputParserException as ex:
@@ -215,83 +239,124 @@ class ReActAgentGraph(DualNodeAgent):
                 logger.debug("%s Final answer:\n%s", AGENT_LOG_PREFIX, state.messages[-1].content)
                 return AgentDecision.END
             # else the agent wants to call a tool
-            agent_output = state.agent_scratchpad[-1]
-            logger.debug("%s The agent wants to call: %s with input: %s",
-                         AGENT_LOG_PREFIX,
-                         agent_output.tool,
-                         agent_output.tool_input)
+            for agent_output in _get_actions(state.agent_scratchpad[-1]):
+                logger.debug("%s The agent wants to call: %s with input: %s",
+                             AGENT_LOG_PREFIX,
+                             agent_output.tool,
+                             agent_output.tool_input)
             return AgentDecision.TOOL
         except Exception as ex:
             logger.exception("Failed to determine whether agent is calling a tool: %s", ex, exc_info=True)
             logger.warning("%s Ending graph traversal", AGENT_LOG_PREFIX)
             return AgentDecision.END
 
+    async def _call_tool(self, agent_thoughts: AgentAction) -> ToolMessage:
+        # the agent can run any installed tool, simply install the tool and add it to the config file
+        requested_tool = self._get_tool(agent_thoughts.tool)
+        if not requested_tool:
+            configured_tool_names = list(self.tools_dict.keys())
+            logger.warning(
+                "%s ReAct Agent wants to call tool %s. In the ReAct Agent's configuration within the config file,"
+                "there is no tool with that name: %s",
+                AGENT_LOG_PREFIX,
+                agent_thoughts.tool,
+                configured_tool_names)
+            return ToolMessage(name='agent_error',
+                               tool_call_id='agent_error',
+                               content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=agent_thoughts.tool,
+                                                                           tools=configured_tool_names))
+
+        logger.debug("%s Calling tool %s with input: %s",
+                     AGENT_LOG_PREFIX,
+                     requested_tool.name,
+                     agent_thoughts.tool_input)
+
+        # Run the tool. Try to use structured input, if possible.
+        try:
+            tool_input_str = agent_thoughts.tool_input.strip().replace("'", '"')
+            tool_input_dict = json.loads(tool_input_str) if tool_input_str != 'None' else tool_input_str
+            logger.debug("%s Successfully parsed structured tool input from Action Input", AGENT_LOG_PREFIX)
+            tool_response = await requested_tool.ainvoke(tool_input_dict,
+                                                         config=RunnableConfig(callbacks=self.callbacks))
+            if self.detailed_logs:
+                # The tool response can be very large, so we log only the first 1000 characters
+                tool_response_str = str(tool_response)
+                tool_response_str = tool_response_str[:1000] + "..." if len(
+                    tool_response_str) > 1000 else tool_response_str
+                tool_response_log_message = TOOL_RESPONSE_LOG_MESSAGE % (
+                    requested_tool.name, tool_input_str, tool_response_str)
+                logger.info(tool_response_log_message)
+        except JSONDecodeError as ex:
+            logger.warning(
+                "%s Unable to parse structured tool input from Action Input. Using Action Input as is."
+                "\nParsing error: %s",
+                AGENT_LOG_PREFIX,
+                ex,
+                exc_info=True)
+            tool_input_str = agent_thoughts.tool_input
+            tool_response = await requested_tool.ainvoke(tool_input_str,
+                                                         config=RunnableConfig(callbacks=self.callbacks))
+
+        # some tools, such as Wikipedia, will return an empty response when no search results are found
+        if tool_response is None or tool_response == "":
+            tool_response = "The tool provided an empty response.\n"
+        # put the tool response in the graph state
+        tool_response = ToolMessage(name=agent_thoughts.tool, tool_call_id=agent_thoughts.tool, content=tool_response)
+        logger.debug("%s Called tool %s with input: %s\nThe tool returned: %s",
+                     AGENT_LOG_PREFIX,
+                     requested_tool.name,
+                     agent_thoughts.tool_input,
+                     tool_response.content)
+        return tool_response
+
+    async def _call_tool_with_timeout(self, agent_thoughts: AgentAction) -> ToolMessage:
+        if self.tool_call_timeout is None:
+            return await self._call_tool(agent_thoughts)
+
+        try:
+            return await asyncio.wait_for(self._call_tool(agent_thoughts), timeout=self.tool_call_timeout)
+        except TimeoutError:
+            logger.warning("%s Tool %s did not respond within %s seconds",
+                           AGENT_LOG_PREFIX,
+                           agent_thoughts.tool,
+                           self.tool_call_timeout)
+            return ToolMessage(name=agent_thoughts.tool,
+                               tool_call_id=agent_thoughts.tool,
+                               content=TOOL_TIMEOUT_ERROR_MESSAGE.format(tool_name=agent_thoughts.tool,
+                                                                         timeout=self.tool_call_timeout))
+
+    async def _call_tools(self, agent_actions: list[AgentAction]) -> ToolMessage:
+        """
+        Calls the tools requested in a single step concurrently, and combines their responses in one message so the
+        agent receives every observation of the step together.
+        """
+        logger.debug("%s Calling %d tools concurrently", AGENT_LOG_PREFIX, len(agent_actions))
+        tasks = [asyncio.create_task(self._call_tool_with_timeout(agent_action)) for agent_action in agent_actions]
+        try:
+            tool_responses = await asyncio.gather(*tasks)
+        finally:
+            # if a tool failed, the remaining tool calls are cancelled and awaited so none keeps running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        observations = []
+        for index, (agent_action, tool_response) in enumerate(zip(agent_actions, tool_responses), start=1):
+            observations.append(f"Observation {index} ({agent_action.tool}): {tool_response.content}")
+        content = "\n\n".join(observations)
+        tool_names = ",".join(agent_action.tool for agent_action in agent_actions)
+        return ToolMessage(name=tool_names, tool_call_id=tool_names, content=content)
+
     async def tool_node(self, state: ReActGraphState):
         try:
             logger.debug("%s Starting the Tool Call Node", AGENT_LOG_PREFIX)
             if len(state.agent_scratchpad) == 0:
                 raise RuntimeError('No tool input received in state: "agent_scratchpad"')
             agent_thoughts = state.agent_scratchpad[-1]
-            # the agent can run any installed tool, simply install the tool and add it to the config file
-            requested_tool = self._get_tool(agent_thoughts.tool)
-            if not requested_tool:
-                configured_tool_names = list(self.tools_dict.keys())
-                logger.warning(
-                    "%s ReAct Agent wants to call tool %s. In the ReAct Agent's configuration within the config file,"
-                    "there is no tool with that name: %s",
-                    AGENT_LOG_PREFIX,
-                    agent_thoughts.tool,
-                    configured_tool_names)
-                tool_response = ToolMessage(name='agent_error',
-                                            tool_call_id='agent_error',
-                                            content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=agent_thoughts.tool,
-                                                                                        tools=configured_tool_names))
-                state.tool_responses += [tool_response]
-                return state
-
-            logger.debug("%s Calling tool %s with input: %s",
-                         AGENT_LOG_PREFIX,
-                         requested_tool.name,
-                         agent_thoughts.tool_input)
-
-            # Run the tool. Try to use structured input, if possible.
-            try:
-                tool_input_str = agent_thoughts.tool_input.strip().replace("'", '"')
-                tool_input_dict = json.loads(tool_input_str) if tool_input_str != 'None' else tool_input_str
-                logger.debug("%s Successfully parsed structured tool input from Action Input", AGENT_LOG_PREFIX)
-                tool_response = await requested_tool.ainvoke(tool_input_dict,
-                                                             config=RunnableConfig(callbacks=self.callbacks))
-                if self.detailed_logs:
-                    # The tool response can be very large, so we log only the first 1000 characters
-                    tool_response_str = str(tool_response)
-                    tool_response_str = tool_response_str[:1000] + "..." if len(
-                        tool_response_str) > 1000 else tool_response_str
-                    tool_response_log_message = TOOL_RESPONSE_LOG_MESSAGE % (
-                        requested_tool.name, tool_input_str, tool_response_str)
-                    logger.info(tool_response_log_message)
-            except JSONDecodeError as ex:
-                logger.warning(
-                    "%s Unable to parse structured tool input from Action Input. Using Action Input as is."
-                    "\nParsing error: %s",
-                    AGENT_LOG_PREFIX,
-                    ex,
-                    exc_info=True)
-                tool_input_str = agent_thoughts.tool_input
-                tool_response = await requested_tool.ainvoke(tool_input_str,
-                                                             config=RunnableConfig(callbacks=self.callbacks))
-
-            # some tools, such as Wikipedia, will return an empty response when no search results are found
-            if tool_response is None or tool_response == "":
-                tool_response = "The tool provided an empty response.\n"
-            # put the tool response in the graph state
-            tool_response = ToolMessage(name=agent_thoughts.tool,
-                                        tool_call_id=agent_thoughts.tool,
-                                        content=tool_response)
-            logger.debug("%s Called tool %s with input: %s\nThe tool returned: %s",
-                         AGENT_LOG_PREFIX,
-                         requested_tool.name,
-                         agent_thoughts.tool_input,
-                         tool_response.content)
+            if isinstance(agent_thoughts, list):
+                tool_response = await self._call_tools(agent_thoughts)
+            else:
+                tool_response = await self._call_tool_with_timeout(agent_thoughts)
             state.tool_responses += [tool_response]
             return state
         except Exception as ex:
@@ -326,6 +391,11 @@ class ReActAgentGraph(DualNodeAgent):
         return True
 
 
+def _get_actions(intermediate_step: AgentAction | list[AgentAction]) -> list[AgentAction]:
+    """Returns the actions of a step of the agent's scratchpad, which holds a list if several tools were requested"""
+    return intermediate_step if isinstance(intermediate_step, list) else [intermediate_step]
+
+
 def create_react_agent_prompt(config: ReActAgentWorkflowConfig) -> ChatPromptTemplate:
     """
     Create a ReAct Agent prompt from the config.
@@ -343,6 +413,9 @@ def create_react_agent_prompt(config: ReActAgentWorkflowConfig) -> ChatPromptTem
     else:
         prompt_str = SYSTEM_PROMPT
 
+    if config.parallel_actions:
+        prompt_str += PARALLEL_ACTIONS_PROMPT
+
     if config.additional_instructions:
         prompt_str += f" {config.additional_instructions}"
 
@@ -28,6 +28,11 @@ MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "Invalid Format: Missing 'Acti
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = ("Parsing LLM output produced both a final answer and a parse-able "
                                                   "action:")
 
+ACTION_REGEX = r"Action\s*\d*\s*:[\s]*(.*?)\s*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)(?=\s*[\n|\s]\s*Observation\b|$)"
+# with parallel actions the input of an action also ends where the next action starts, on a new line
+PARALLEL_ACTIONS_REGEX = (r"Action\s*\d*\s*:[\s]*(.*?)\s*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)"
+                          r"(?=\s*[\n|\s]\s*Observation\b|\s*\n\s*Action\s*\d*\s*:|$)")
+
 
 class ReActOutputParserException(ValueError, LangChainException):
 
@@ -67,26 +72,37 @@ class ReActOutputParser(AgentOutputParser):
     Final Answer: The temperature is 100 degrees
     ```
 
+    With `parallel_actions` set, the output may contain several Action / Action Input pairs before the Observation,
+    and a list with an AgentAction for each of them is returned.
+
     """
 
+    parallel_actions: bool = False
+
     def get_format_instructions(self) -> str:
         return SYSTEM_PROMPT
 
-    def parse(self, text: str) -> AgentAction | AgentFinish:
+    def parse(self, text: str) -> AgentAction | list[AgentAction] | AgentFinish:
         includes_answer = FINAL_ANSWER_ACTION in text
-        regex = r"Action\s*\d*\s*:[\s]*(.*?)\s*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)(?=\s*[\n|\s]\s*Observation\b|$)"
-        action_match = re.search(regex, text, re.DOTALL)
-        if action_match:
+        if self.parallel_actions:
+            action_matches = list(re.finditer(PARALLEL_ACTIONS_REGEX, text, re.DOTALL))
+        else:
+            action_match = re.search(ACTION_REGEX, text, re.DOTALL)
+            action_matches = [action_match] if action_match else []
+        if action_matches:
             if includes_answer:
                 raise ReActOutputParserException(
                     final_answer_and_action=True,
                     observation=f"{FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE}: {text}")
-            action = action_match.group(1).strip()
-            action_input = action_match.group(2)
-            tool_input = action_input.strip(" ")
-            tool_input = tool_input.strip('"')
-
-            return AgentAction(action, tool_input, text)
+            actions = []
+            for action_match in action_matches:
+                action = action_match.group(1).strip()
+                action_input = action_match.group(2)
+                tool_input = action_input.strip(" ")
+                tool_input = tool_input.strip('"')
+                actions.append(AgentAction(action, tool_input, text))
+
+            return actions if self.parallel_actions else actions[0]
 
         if includes_answer:
             return AgentFinish({"output": text.split(FINAL_ANSWER_ACTION)[-1].strip()}, text)
@@ -36,6 +36,19 @@ Thought: I now know the final answer
 Final Answer: the final answer to the original input question
 """
 
+PARALLEL_ACTIONS_PROMPT = """
+When several tools can be used independently of each other, you may ask the human to use all of them at once by repeating the Action and Action Input for each tool before a single Observation:
+
+Thought: you should always think about what to do
+Action: the first action to take, should be one of [{tool_names}]
+Action Input: the input to the first action
+Action: the second action to take, should be one of [{tool_names}]
+Action Input: the input to the second action
+Observation: wait for the human to respond with the results from all the tools, do not assume the responses
+
+Only request several tools at once when the input of each tool does not depend on the result of another.
+"""
+
 USER_PROMPT = """
 Question: {question}
 """
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+import typing
 
 from pydantic import Field
 
@@ -57,6 +58,33 @@ class ReActAgentWorkflowConfig(FunctionBaseConfig, name="react_agent"):
                                               "If False, strings will be used."))
     additional_instructions: str | None = Field(
         default=None, description="Additional instructions to provide to the agent in addition to the base prompt.")
+    parallel_actions: bool = Field(
+        default=False,
+        description=("Allow the agent to request several tools in a single step. The tools are called concurrently "
+                     "and all of their responses are returned to the agent together."))
+    tool_call_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description=("Maximum number of seconds to wait for a tool call. A tool which does not respond in time is "
+                     "reported to the agent instead of failing the workflow. If None, there is no timeout."))
+    max_context_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description=("Maximum number of tokens of the conversation history and agent scratchpad sent to the LLM. The "
+                     "oldest tool calls are dropped from the scratchpad to stay within it. If None, the number of "
+                     "tokens is not limited."))
+    max_observation_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description=("Tool responses from earlier iterations which are longer than this number of tokens are "
+                     "compacted. If None, tool responses are not compacted."))
+    observation_compaction: typing.Literal["truncate", "summarize"] = Field(
+        default="truncate",
+        description="How long tool responses are compacted, either truncated or summarized by the agent's LLM.")
+    tokenizer_encoding: str | None = Field(
+        default=None,
+        description=("The tiktoken encoding used to count tokens, such as 'cl100k_base'. If None, the number of tokens "
+                     "is estimated from the length of the messages."))
 
 
 @register_function(config_type=ReActAgentWorkflowConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
@@ -65,6 +93,9 @@ async def react_agent_workflow(config: ReActAgentWorkflowConfig, builder: Builde
     from langchain_core.messages import trim_messages
     from langgraph.graph.graph import CompiledGraph
 
+    from aiq.agent.context_manager import AgentContextManager
+    from aiq.agent.context_manager import get_token_counter
+    from aiq.agent.context_manager import llm_summarizer
     from aiq.agent.react_agent.agent import ReActAgentGraph
     from aiq.agent.react_agent.agent import ReActGraphState
     from aiq.agent.react_agent.agent import create_react_agent_prompt
@@ -78,6 +109,12 @@ async def react_agent_workflow(config: ReActAgentWorkflowConfig, builder: Builde
     tools = builder.get_tools(tool_names=config.tool_names, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
     if not tools:
         raise ValueError(f"No tools specified for ReAct Agent '{config.llm_name}'")
+    context_manager = AgentContextManager(
+        max_tokens=config.max_context_tokens,
+        token_counter=get_token_counter(config.tokenizer_encoding),
+        max_observation_tokens=config.max_observation_tokens,
+        compaction=config.observation_compaction,
+        summarizer=llm_summarizer(llm) if config.observation_compaction == "summarize" else None)
     # configure callbacks, for sending intermediate steps
     # construct the ReAct Agent Graph from the configured llm, prompt, and tools
     graph: CompiledGraph = await ReActAgentGraph(llm=llm,
@@ -86,7 +123,10 @@ async def react_agent_workflow(config: ReActAgentWorkflowConfig, builder: Builde
                                                  use_tool_schema=config.include_tool_input_schema_in_tool_description,
                                                  detailed_logs=config.verbose,
                                                  retry_parsing_errors=config.retry_parsing_errors,
-                                                 max_retries=config.max_retries).build_graph()
+                                                 max_retries=config.max_retries,
+                                                 parallel_actions=config.parallel_actions,
+                                                 tool_call_timeout=config.tool_call_timeout,
+                                                 context_manager=context_manager).build_graph()
 
     async def _response_fn(input_message: AIQChatRequest) -> AIQChatResponse:
         try:
@@ -97,6 +137,7 @@ async def react_agent_workflow(config: ReActAgentWorkflowConfig, builder: Builde
                                                         token_counter=len,
                                                         start_on="human",
                                                         include_system=True)
+            messages = context_manager.trim_history(messages)
 
             state = ReActGraphState(messages=messages)
 
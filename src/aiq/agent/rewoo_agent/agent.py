@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 # pylint: disable=R0917
 import logging
@@ -57,7 +58,9 @@ class ReWOOGraphState(BaseModel):
 class ReWOOAgentGraph(BaseAgent):
     """Configurable LangGraph ReWOO Agent. A ReWOO Agent performs reasoning by interacting with other objects or tools
     and utilizes their outputs to make decisions. Supports retrying on output parsing errors. Argument
-    "detailed_logs" toggles logging of inputs, outputs, and intermediate steps."""
+    "detailed_logs" toggles logging of inputs, outputs, and intermediate steps. Argument "max_parallel_steps" sets how
+    many independent steps of the plan are executed concurrently, with 1 the executor runs one step per iteration in
+    plan order."""
 
     def __init__(self,
                  llm: BaseChatModel,
@@ -66,9 +69,15 @@ class ReWOOAgentGraph(BaseAgent):
                  tools: list[BaseTool],
                  use_tool_schema: bool = True,
                  callbacks: list[AsyncCallbackHandler] = None,
-                 detailed_logs: bool = False):
+                 detailed_logs: bool = False,
+                 max_parallel_steps: int = 1):
         super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
 
+        if max_parallel_steps < 1:
+            raise ValueError(f"max_parallel_steps must be at least 1, got {max_parallel_steps}")
+
+        self.max_parallel_steps = max_parallel_steps
+
         logger.debug(
             "%s Filling the prompt variables 'tools' and 'tool_names', using the tools provided in the config.",
             AGENT_LOG_PREFIX)
@@ -114,6 +123,25 @@ class ReWOOAgentGraph(BaseAgent):
 
         return len(state.intermediate_results)
 
+    @staticmethod
+    def _get_step_dependencies(steps: list[dict]) -> list[set[int]]:
+        """
+        Returns the indices of the steps each step depends on, the earlier steps whose placeholder is referenced by the
+        step's tool input. Placeholders are matched as substrings, which may add a spurious dependency but never misses
+        one.
+        """
+        placeholders = [step["evidence"].get("placeholder", "") for step in steps]
+
+        dependencies = []
+        for index, step in enumerate(steps):
+            tool_input = str(step["evidence"].get("tool_input", ""))
+            dependencies.append({
+                earlier
+                for earlier, placeholder in enumerate(placeholders[:index]) if placeholder and placeholder in tool_input
+            })
+
+        return dependencies
+
     @staticmethod
     def _parse_planner_output(planner_output: str) -> AIMessage:
 
@@ -201,6 +229,123 @@ class ReWOOAgentGraph(BaseAgent):
             logger.exception("%s Failed to call planner_node: %s", AGENT_LOG_PREFIX, ex, exc_info=True)
             raise ex
 
+    async def _execute_step(self, step_info: dict, intermediate_results: dict[str, ToolMessage]) -> ToolMessage:
+        """
+        Run the tool of a step, after replacing the placeholders in its tool input with the results of the previous
+        steps.
+        """
+        tool = step_info.get("tool", "")
+        tool_input = step_info.get("tool_input", "")
+
+        # Replace the placeholder in the tool input with the previous tool output
+        for _placeholder, _tool_output in intermediate_results.items():
+            _tool_output = _tool_output.content
+            # If the content is a list, get the first element which should be a dict
+            if isinstance(_tool_output, list):
+                _tool_output = _tool_output[0]
+                assert isinstance(_tool_output, dict)
+
+            tool_input = self._replace_placeholder(_placeholder, tool_input, _tool_output)
+
+        requested_tool = self._get_tool(tool)
+        if not requested_tool:
+            configured_tool_names = list(self.tools_dict.keys())
+            logger.warning(
+                "%s ReWOO Agent wants to call tool %s. In the ReWOO Agent's configuration within the config file,"
+                "there is no tool with that name: %s",
+                AGENT_LOG_PREFIX,
+                tool,
+                configured_tool_names)
+
+            return ToolMessage(content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=tool, tools=configured_tool_names),
+                               tool_call_id=tool)
+
+        if self.detailed_logs:
+            logger.debug("%s Calling tool %s with input: %s", AGENT_LOG_PREFIX, requested_tool.name, tool_input)
+
+        # Run the tool. Try to use structured input, if possible
+        tool_input_parsed = self._parse_tool_input(tool_input)
+        tool_response = await requested_tool.ainvoke(tool_input_parsed, config=RunnableConfig(callbacks=self.callbacks))
+
+        # some tools, such as Wikipedia, will return an empty response when no search results are found
+        if tool_response is None or tool_response == "":
+            tool_response = "The tool provided an empty response.\n"
+
+        # ToolMessage only accepts str or list[str | dict] as content.
+        # Convert into list if the response is a dict.
+        if isinstance(tool_response, dict):
+            tool_response = [tool_response]
+
+        tool_response_message = ToolMessage(name=tool, tool_call_id=tool, content=tool_response)
+
+        logger.debug("%s Successfully called the tool", AGENT_LOG_PREFIX)
+        if self.detailed_logs:
+            # The tool response can be very large, so we log only the first 1000 characters
+            tool_response_str = tool_response_message.content
+            tool_response_str = tool_response_str[:1000] + "..." if len(tool_response_str) > 1000 else tool_response_str
+            tool_response_log_message = TOOL_RESPONSE_LOG_MESSAGE % (
+                requested_tool.name, tool_input_parsed, tool_response_str)
+            logger.info("ReWOO agent executor output: %s", tool_response_log_message)
+
+        return tool_response_message
+
+    async def _execute_parallel_steps(self, state: ReWOOGraphState) -> dict[str, ToolMessage]:
+        """
+        Run all the remaining steps of the plan. A step starts as soon as the steps it depends on have finished, with
+        at most `max_parallel_steps` tools running at once.
+        """
+        steps = state.steps.content
+        placeholders = [step["evidence"].get("placeholder", "") for step in steps]
+        dependencies = self._get_step_dependencies(steps)
+        intermediate_results = state.intermediate_results
+
+        done = {index for index, placeholder in enumerate(placeholders) if placeholder in intermediate_results}
+        pending = [index for index in range(len(steps)) if index not in done]
+        running: dict[asyncio.Task, int] = {}
+        semaphore = asyncio.Semaphore(self.max_parallel_steps)
+
+        async def _run_step(index: int) -> ToolMessage:
+            async with semaphore:
+                # Only the results of earlier steps are substituted, as when running the steps in plan order
+                previous_results = {
+                    placeholder: intermediate_results[placeholder]
+                    for placeholder in placeholders[:index] if placeholder in intermediate_results
+                }
+                return await self._execute_step(steps[index]["evidence"], previous_results)
+
+        try:
+            while pending or running:
+                ready = [index for index in pending if dependencies[index] <= done]
+                for index in ready:
+                    pending.remove(index)
+                    running[asyncio.create_task(_run_step(index))] = index
+
+                logger.debug("%s Running %d of the remaining %d steps",
+                             AGENT_LOG_PREFIX,
+                             len(running),
+                             len(running) + len(pending))
+
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    index = running.pop(task)
+                    intermediate_results[placeholders[index]] = task.result()
+                    done.add(index)
+        finally:
+            # wait for the cancelled steps so that no tool keeps running once the executor has failed
+            if running:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+
+        # the steps finish in any order, keep the results in plan order for the solver
+        ordered_results = {
+            placeholder: intermediate_results[placeholder]
+            for placeholder in placeholders if placeholder in intermediate_results
+        }
+        ordered_results.update(intermediate_results)
+
+        return ordered_results
+
     async def executor_node(self, state: ReWOOGraphState):
         try:
             logger.debug("%s Starting the ReWOO Executor Node", AGENT_LOG_PREFIX)
@@ -213,68 +358,14 @@ class ReWOOAgentGraph(BaseAgent):
                              current_step)
                 raise RuntimeError(f"ReWOO Executor is invoked with an invalid step number: {current_step}")
 
+            if self.max_parallel_steps > 1:
+                return {"intermediate_results": await self._execute_parallel_steps(state)}
+
             step_info = state.steps.content[current_step]["evidence"]
             placeholder = step_info.get("placeholder", "")
-            tool = step_info.get("tool", "")
-            tool_input = step_info.get("tool_input", "")
 
             intermediate_results = state.intermediate_results
-
-            # Replace the placeholder in the tool input with the previous tool output
-            for _placeholder, _tool_output in intermediate_results.items():
-                _tool_output = _tool_output.content
-                # If the content is a list, get the first element which should be a dict
-                if isinstance(_tool_output, list):
-                    _tool_output = _tool_output[0]
-                    assert isinstance(_tool_output, dict)
-
-                tool_input = self._replace_placeholder(_placeholder, tool_input, _tool_output)
-
-            requested_tool = self._get_tool(tool)
-            if not requested_tool:
-                configured_tool_names = list(self.tools_dict.keys())
-                logger.warning(
-                    "%s ReWOO Agent wants to call tool %s. In the ReWOO Agent's configuration within the config file,"
-                    "there is no tool with that name: %s",
-                    AGENT_LOG_PREFIX,
-                    tool,
-                    configured_tool_names)
-
-                intermediate_results[placeholder] = ToolMessage(content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(
-                    tool_name=tool, tools=configured_tool_names),
-                                                                tool_call_id=tool)
-                return {"intermediate_results": intermediate_results}
-
-            if self.detailed_logs:
-                logger.debug("%s Calling tool %s with input: %s", AGENT_LOG_PREFIX, requested_tool.name, tool_input)
-
-            # Run the tool. Try to use structured input, if possible
-            tool_input_parsed = self._parse_tool_input(tool_input)
-            tool_response = await requested_tool.ainvoke(tool_input_parsed,
-                                                         config=RunnableConfig(callbacks=self.callbacks))
-
-            # some tools, such as Wikipedia, will return an empty response when no search results are found
-            if tool_response is None or tool_response == "":
-                tool_response = "The tool provided an empty response.\n"
-
-            # ToolMessage only accepts str or list[str | dict] as content.
-            # Convert into list if the response is a dict.
-            if isinstance(tool_response, dict):
-                tool_response = [tool_response]
-
-            tool_response_message = ToolMessage(name=tool, tool_call_id=tool, content=tool_response)
-
-            logger.debug("%s Successfully called the tool", AGENT_LOG_PREFIX)
-            if self.detailed_logs:
-                # The tool response can be very large, so we log only the first 1000 characters
-                tool_response_str = tool_response_message.content
-                tool_response_str = tool_response_str[:1000] + "..." if len(
-                    tool_response_str) > 1000 else tool_response_str
-                tool_response_log_message = TOOL_RESPONSE_LOG_MESSAGE % (
-                    requested_tool.name, tool_input_parsed, tool_response_str)
-                logger.info("ReWOO agent executor output: %s", tool_response_log_message)
-
-            intermediate_results[placeholder] = tool_response_message
+            intermediate_results[placeholder] = await self._execute_step(step_info, intermediate_results)
             return {"intermediate_results": intermediate_results}
 
         except Exception as ex:
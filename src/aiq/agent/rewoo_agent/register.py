@@ -56,6 +56,20 @@ class ReWOOAgentWorkflowConfig(FunctionBaseConfig, name="rewoo_agent"):
                                               "If False, strings will be used."))
     additional_instructions: str | None = Field(
         default=None, description="Additional instructions to provide to the agent in addition to the base prompt.")
+    max_parallel_steps: int = Field(
+        default=4,
+        ge=1,
+        description=("Maximum number of independent plan steps to execute concurrently. "
+                     "If 1, the steps are executed one at a time in plan order, which is useful for debugging."))
+    max_context_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description=("Maximum number of tokens of the conversation history sent to the agent. If None, the number of "
+                     "tokens is not limited."))
+    tokenizer_encoding: str | None = Field(
+        default=None,
+        description=("The tiktoken encoding used to count tokens, such as 'cl100k_base'. If None, the number of tokens "
+                     "is estimated from the length of the messages."))
 
 
 @register_function(config_type=ReWOOAgentWorkflowConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
@@ -66,6 +80,8 @@ async def ReWOO_agent_workflow(config: ReWOOAgentWorkflowConfig, builder: Builde
     from langchain_core.prompts import ChatPromptTemplate
     from langgraph.graph.graph import CompiledGraph
 
+    from aiq.agent.context_manager import AgentContextManager
+    from aiq.agent.context_manager import get_token_counter
     from aiq.agent.rewoo_agent.prompt import PLANNER_USER_PROMPT
     from aiq.agent.rewoo_agent.prompt import SOLVER_USER_PROMPT
 
@@ -108,6 +124,8 @@ async def ReWOO_agent_workflow(config: ReWOOAgentWorkflowConfig, builder: Builde
     tools = builder.get_tools(tool_names=config.tool_names, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
     if not tools:
         raise ValueError(f"No tools specified for ReWOO Agent '{config.llm_name}'")
+    context_manager = AgentContextManager(max_tokens=config.max_context_tokens,
+                                          token_counter=get_token_counter(config.tokenizer_encoding))
 
     # construct the ReWOO Agent Graph from the configured llm, prompt, and tools
     graph: CompiledGraph = await ReWOOAgentGraph(llm=llm,
@@ -115,7 +133,8 @@ async def ReWOO_agent_workflow(config: ReWOOAgentWorkflowConfig, builder: Builde
                                                  solver_prompt=solver_prompt,
                                                  tools=tools,
                                                  use_tool_schema=config.include_tool_input_schema_in_tool_description,
-                                                 detailed_logs=config.verbose).build_graph()
+                                                 detailed_logs=config.verbose,
+                                                 max_parallel_steps=config.max_parallel_steps).build_graph()
 
     async def _response_fn(input_message: AIQChatRequest) -> AIQChatResponse:
         try:
@@ -126,6 +145,7 @@ async def ReWOO_agent_workflow(config: ReWOOAgentWorkflowConfig, builder: Builde
                                                         token_counter=len,
                                                         start_on="human",
                                                         include_system=True)
+            messages = context_manager.trim_history(messages)
             task = HumanMessage(content=messages[0].content)
             state = ReWOOGraphState(task=task)
 
@@ -18,6 +18,7 @@ import logging
 
 from langchain_core.callbacks.base import AsyncCallbackHandler
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages.ai import AIMessage
 from langchain_core.messages.base import BaseMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
@@ -29,6 +30,7 @@ from aiq.agent.base import AGENT_LOG_PREFIX
 from aiq.agent.base import AGENT_RESPONSE_LOG_MESSAGE
 from aiq.agent.base import TOOL_RESPONSE_LOG_MESSAGE
 from aiq.agent.base import AgentDecision
+from aiq.agent.context_manager import AgentContextManager
 from aiq.agent.dual_node import DualNodeAgent
 
 logger = logging.getLogger(__name__)
@@ -42,16 +44,19 @@ class ToolCallAgentGraphState(BaseModel):
 class ToolCallAgentGraph(DualNodeAgent):
     """Configurable LangGraph Tool Calling Agent. A Tool Calling Agent requires an LLM which supports tool calling.
     A tool Calling Agent utilizes the tool input parameters to select the optimal tool.  Supports handling tool errors.
-    Argument "detailed_logs" toggles logging of inputs, outputs, and intermediate steps."""
+    Argument "detailed_logs" toggles logging of inputs, outputs, and intermediate steps.  Argument "context_manager"
+    keeps the messages sent to the LLM within a token budget."""
 
     def __init__(self,
                  llm: BaseChatModel,
                  tools: list[BaseTool],
                  callbacks: list[AsyncCallbackHandler] = None,
                  detailed_logs: bool = False,
-                 handle_tool_errors: bool = True):
+                 handle_tool_errors: bool = True,
+                 context_manager: AgentContextManager | None = None):
         super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
         self.tool_caller = ToolNode(tools, handle_tool_errors=handle_tool_errors)
+        self.context_manager = context_manager or AgentContextManager()
         logger.debug("%s Initialized Tool Calling Agent Graph", AGENT_LOG_PREFIX)
 
     async def agent_node(self, state: ToolCallAgentGraphState):
@@ -59,7 +64,19 @@ class ToolCallAgentGraph(DualNodeAgent):
             logger.debug('%s Starting the Tool Calling Agent Node', AGENT_LOG_PREFIX)
             if len(state.messages) == 0:
                 raise RuntimeError('No input received in state: "messages"')
-            response = await self.llm.ainvoke(state.messages, config=RunnableConfig(callbacks=self.callbacks))
+            # each tool call of the agent and the tool responses which follow it form a turn of the conversation,
+            # older turns may be compacted or dropped to fit the token budget
+            fixed: list[BaseMessage] = []
+            turns: list[list[BaseMessage]] = []
+            for message in state.messages:
+                if isinstance(message, AIMessage):
+                    turns.append([message])
+                elif turns:
+                    turns[-1].append(message)
+                else:
+                    fixed.append(message)
+            messages = await self.context_manager.fit(fixed, turns)
+            response = await self.llm.ainvoke(messages, config=RunnableConfig(callbacks=self.callbacks))
             if self.detailed_logs:
                 agent_input = "\n".join(str(message.content) for message in state.messages)
                 logger.info(AGENT_RESPONSE_LOG_MESSAGE, agent_input, response)
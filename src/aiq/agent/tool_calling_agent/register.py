@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+import typing
 
 from pydantic import Field
 
@@ -42,6 +43,24 @@ class ToolCallAgentWorkflowConfig(FunctionBaseConfig, name="tool_calling_agent")
     handle_tool_errors: bool = Field(default=True, description="Specify ability to handle tool calling errors.")
     description: str = Field(default="Tool Calling Agent Workflow", description="Description of this functions use.")
     max_iterations: int = Field(default=15, description="Number of tool calls before stoping the tool calling agent.")
+    max_context_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description=("Maximum number of tokens of the conversation history and agent scratchpad sent to the LLM. The "
+                     "oldest tool calls are dropped from the scratchpad to stay within it. If None, the number of "
+                     "tokens is not limited."))
+    max_observation_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description=("Tool responses from earlier iterations which are longer than this number of tokens are "
+                     "compacted. If None, tool responses are not compacted."))
+    observation_compaction: typing.Literal["truncate", "summarize"] = Field(
+        default="truncate",
+        description="How long tool responses are compacted, either truncated or summarized by the agent's LLM.")
+    tokenizer_encoding: str | None = Field(
+        default=None,
+        description=("The tiktoken encoding used to count tokens, such as 'cl100k_base'. If None, the number of tokens "
+                     "is estimated from the length of the messages."))
 
 
 @register_function(config_type=ToolCallAgentWorkflowConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
@@ -49,6 +68,10 @@ async def tool_calling_agent_workflow(config: ToolCallAgentWorkflowConfig, build
     from langchain_core.messages.human import HumanMessage
     from langgraph.graph.graph import CompiledGraph
 
+    from aiq.agent.context_manager import AgentContextManager
+    from aiq.agent.context_manager import get_token_counter
+    from aiq.agent.context_manager import llm_summarizer
+
     from .agent import ToolCallAgentGraph
     from .agent import ToolCallAgentGraphState
 
@@ -59,6 +82,12 @@ async def tool_calling_agent_workflow(config: ToolCallAgentWorkflowConfig, build
     tools = builder.get_tools(tool_names=config.tool_names, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
     if not tools:
         raise ValueError(f"No tools specified for Tool Calling Agent '{config.llm_name}'")
+    context_manager = AgentContextManager(
+        max_tokens=config.max_context_tokens,
+        token_counter=get_token_counter(config.tokenizer_encoding),
+        max_observation_tokens=config.max_observation_tokens,
+        compaction=config.observation_compaction,
+        summarizer=llm_summarizer(llm) if config.observation_compaction == "summarize" else None)
 
     # some LLMs support tool calling
     # these models accept the tool's input schema and decide when to use a tool based on the input's relevance
@@ -73,7 +102,8 @@ async def tool_calling_agent_workflow(config: ToolCallAgentWorkflowConfig, build
     graph: CompiledGraph = await ToolCallAgentGraph(llm=llm,
                                                     tools=tools,
                                                     detailed_logs=config.verbose,
-                                                    handle_tool_errors=config.handle_tool_errors).build_graph()
+                                                    handle_tool_errors=config.handle_tool_errors,
+                                                    context_manager=context_manager).build_graph()
 
     async def _response_fn(input_message: str) -> str:
         try:
@@ -301,3 +301,52 @@ def build_dependency_sequence(config: "AIQConfig") -> list[ComponentInstanceData
     assert len(dependency_sequence) == total_node_count, "Dependency sequence generation failed. Report as bug."
 
     return dependency_sequence
+
+
+def build_dependency_levels(config: "AIQConfig") -> list[list[ComponentInstanceData]]:
+    """Groups the instantiation sequence of an AIQ Toolkit configuration object into levels which can be built
+    concurrently.
+
+    Each component is placed one level after the last of the components it references. Functions are placed after
+    every other component, since function build functions may look up LLMs, embedders, memory clients and retrievers
+    they do not reference in their configuration. The workflow is always alone in the last level.
+
+    Args:
+        config (AIQConfig): An AIQ Toolkit configuration object.
+
+    Returns:
+        list[list[ComponentInstanceData]]: The levels in instantiation order, each listing its components in the
+            order of the instantiation sequence.
+    """
+
+    dependency_sequence = build_dependency_sequence(config)
+    _, dependency_graph = config_to_dependency_objects(config=config)
+
+    levels: dict[str, int] = {}
+
+    def _get_level(component_instance: ComponentInstanceData, min_level: int) -> int:
+        level = min_level
+        if (component_instance.instance_id in dependency_graph):
+            for ref_node in dependency_graph.successors(component_instance.instance_id):
+                for dependency_instance_id in dependency_graph.successors(ref_node):
+                    if (dependency_instance_id in levels):
+                        level = max(level, levels[dependency_instance_id] + 1)
+        return level
+
+    # The sequence is ordered from leaf to root, so dependencies are always assigned a level first
+    for component_instance in dependency_sequence:
+        if (component_instance.component_group != ComponentGroup.FUNCTIONS):
+            levels[component_instance.instance_id] = _get_level(component_instance, 0)
+
+    function_level = max(levels.values(), default=-1) + 1
+    for component_instance in dependency_sequence:
+        if (component_instance.component_group == ComponentGroup.FUNCTIONS and not component_instance.is_root):
+            levels[component_instance.instance_id] = _get_level(component_instance, function_level)
+
+    workflow_level = max(levels.values(), default=-1) + 1
+
+    dependency_levels: list[list[ComponentInstanceData]] = [[] for _ in range(workflow_level + 1)]
+    for component_instance in dependency_sequence:
+        dependency_levels[levels.get(component_instance.instance_id, workflow_level)].append(component_instance)
+
+    return [level for level in dependency_levels if level]
@@ -14,7 +14,6 @@
 # limitations under the License.
 
 import typing
-import uuid
 from collections.abc import Awaitable
 from collections.abc import Callable
 from contextlib import contextmanager
@@ -31,6 +30,7 @@ from aiq.data_models.intermediate_step import StreamEventData
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.runtime.user_metadata import RequestAttributes
 from aiq.utils.reactive.subject import Subject
+from aiq.utils.uuid_utils import uuid4_str
 
 
 class Singleton(type):
@@ -166,7 +166,7 @@ class AIQContext:
         AND create an OTel child span for that function call.
         """
         parent_function_node = self._context_state.active_function.get()
-        current_function_id = str(uuid.uuid4())
+        current_function_id = uuid4_str()
         current_function_node = InvocationNode(function_id=current_function_id,
                                                function_name=function_name,
                                                parent_id=parent_function_node.function_id,
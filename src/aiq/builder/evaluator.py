@@ -13,17 +13,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from aiq.data_models.evaluator import EvaluatorBaseConfig
 from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
 from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
 
 
 class EvaluatorInfo:
 
-    def __init__(self, *, config: EvaluatorBaseConfig, evaluate_fn: Callable[[EvalInput], EvalOutput],
-                 description: str):
+    def __init__(self,
+                 *,
+                 config: EvaluatorBaseConfig,
+                 evaluate_fn: Callable[[EvalInput], EvalOutput],
+                 description: str,
+                 evaluate_item_fn: Callable[[EvalInputItem], Awaitable[EvalOutputItem]] | None = None,
+                 aggregate_fn: Callable[[list[EvalOutputItem]], EvalOutput] | None = None):
+        """
+        `evaluate_fn` scores a complete EvalInput. Evaluators that score each item independently can additionally
+        provide `evaluate_item_fn` and `aggregate_fn`, allowing items to be scored as soon as their workflow run
+        finishes instead of waiting for the whole dataset.
+        """
+        if (evaluate_item_fn is None) != (aggregate_fn is None):
+            raise ValueError("evaluate_item_fn and aggregate_fn must be provided together")
+
         self.config = config
         self.evaluate_fn = evaluate_fn
         self.description = description
+        self.evaluate_item_fn = evaluate_item_fn
+        self.aggregate_fn = aggregate_fn
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.evaluate_item_fn is not None
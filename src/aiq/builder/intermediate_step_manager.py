@@ -21,6 +21,8 @@ from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepState
 from aiq.data_models.invocation_node import InvocationNode
+from aiq.utils.reactive.batch_observer import BatchObserver
+from aiq.utils.reactive.batch_observer import OnBatch
 from aiq.utils.reactive.observable import OnComplete
 from aiq.utils.reactive.observable import OnError
 from aiq.utils.reactive.observable import OnNext
@@ -40,6 +42,8 @@ class OpenStep:
     step_parent_id: str | None
     prev_stack: list[str]
     active_stack: list[str]
+    # Ancestry of the start step, reused by the chunk and end steps when they come from the same function
+    function_ancestry: InvocationNode | None = None
 
 
 class IntermediateStepManager:
@@ -61,8 +65,9 @@ class IntermediateStepManager:
             raise TypeError(f"Payload must be of type IntermediateStepPayload, not {type(payload)}")
 
         active_span_id_stack = self._context_state.active_span_id_stack.get()
+        event_state = payload.event_state
 
-        if (payload.event_state == IntermediateStepState.START):
+        if (event_state == IntermediateStepState.START):
 
             prev_stack = active_span_id_stack
 
@@ -72,12 +77,13 @@ class IntermediateStepManager:
             active_span_id_stack = active_span_id_stack + [payload.UUID]
             self._context_state.active_span_id_stack.set(active_span_id_stack)
 
-            self._outstanding_start_steps[payload.UUID] = OpenStep(step_id=payload.UUID,
-                                                                   step_name=payload.name or payload.UUID,
-                                                                   step_type=payload.event_type,
-                                                                   step_parent_id=parent_step_id,
-                                                                   prev_stack=prev_stack,
-                                                                   active_stack=active_span_id_stack)
+            open_step = OpenStep(step_id=payload.UUID,
+                                 step_name=payload.name or payload.UUID,
+                                 step_type=payload.event_type,
+                                 step_parent_id=parent_step_id,
+                                 prev_stack=prev_stack,
+                                 active_stack=active_span_id_stack)
+            self._outstanding_start_steps[payload.UUID] = open_step
 
             logger.debug("Pushed start step %s, name %s, type %s, parent %s, stack id %s",
                          payload.UUID,
@@ -86,7 +92,7 @@ class IntermediateStepManager:
                          parent_step_id,
                          id(active_span_id_stack))
 
-        elif (payload.event_state == IntermediateStepState.END):
+        elif (event_state == IntermediateStepState.END):
 
             # Remove the current step from the outstanding steps
             open_step = self._outstanding_start_steps.pop(payload.UUID, None)
@@ -139,7 +145,7 @@ class IntermediateStepManager:
                          parent_step_id,
                          id(curr_stack))
 
-        elif (payload.event_state == IntermediateStepState.CHUNK):
+        elif (event_state == IntermediateStepState.CHUNK):
 
             # Get the current step from the outstanding steps
             open_step = self._outstanding_start_steps.get(payload.UUID, None)
@@ -156,10 +162,14 @@ class IntermediateStepManager:
 
         active_function = self._context_state.active_function.get()
 
-        function_ancestry = InvocationNode(function_name=active_function.function_name,
-                                           function_id=active_function.function_id,
-                                           parent_id=parent_step_id,
-                                           parent_name=active_function.parent_name)
+        function_ancestry = open_step.function_ancestry
+        if (function_ancestry is None or function_ancestry.function_id != active_function.function_id):
+            function_ancestry = InvocationNode(function_name=active_function.function_name,
+                                               function_id=active_function.function_id,
+                                               parent_id=parent_step_id,
+                                               parent_name=active_function.parent_name)
+            if (open_step.function_ancestry is None):
+                open_step.function_ancestry = function_ancestry
 
         intermediate_step = IntermediateStep(function_ancestry=function_ancestry, payload=payload)
 
@@ -174,3 +184,16 @@ class IntermediateStepManager:
         """
 
         return self._context_state.event_stream.get().subscribe(on_next, on_error, on_complete)
+
+    def subscribe_batch(self,
+                        on_batch: OnBatch[IntermediateStep],
+                        on_error: OnError = None,
+                        on_complete: OnComplete = None,
+                        max_batch_size: int = 64) -> Subscription:
+        """
+        Subscribes to the AIQ Toolkit Event Stream for intermediate steps, receiving them in micro-batches. This keeps
+        the cost of the subscriber off the path emitting each step, such as streamed LLM tokens.
+        """
+
+        return self._context_state.event_stream.get().subscribe(
+            BatchObserver(on_batch, on_error, on_complete, max_batch_size=max_batch_size))
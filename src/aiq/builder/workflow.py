@@ -28,6 +28,7 @@ from aiq.builder.llm import LLMProviderInfo
 from aiq.builder.retriever import RetrieverProviderInfo
 from aiq.data_models.config import AIQConfig
 from aiq.memory.interfaces import MemoryEditor
+from aiq.observability.async_otel_listener import SpanListenerSettings
 from aiq.runtime.runner import AIQRunner
 from aiq.utils.optional_imports import TelemetryOptionalImportError
 from aiq.utils.optional_imports import try_import_opentelemetry
@@ -56,7 +57,8 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                  memory: dict[str, MemoryEditor] | None = None,
                  exporters: dict[str, SpanExporter] | None = None,
                  retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
-                 context_state: AIQContextState):
+                 context_state: AIQContextState,
+                 span_listener_settings: SpanListenerSettings | None = None):
 
         super().__init__(input_schema=entry_fn.input_schema,
                          streaming_output_schema=entry_fn.streaming_output_schema,
@@ -75,6 +77,8 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
 
         self._exporters = exporters or {}
 
+        self._span_listener_settings = span_listener_settings
+
     @property
     def has_streaming_output(self) -> bool:
 
@@ -91,8 +95,10 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
         Called each time we start a new workflow run. We'll create
         a new top-level workflow span here.
         """
-        async with AIQRunner(input_message=message, entry_fn=self._entry_fn,
-                             context_state=self._context_state) as runner:
+        async with AIQRunner(input_message=message,
+                             entry_fn=self._entry_fn,
+                             context_state=self._context_state,
+                             span_listener_settings=self._span_listener_settings) as runner:
 
             # The caller can `yield runner` so they can do `runner.result()` or `runner.result_stream()`
             yield runner
@@ -114,16 +120,19 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
             return result, intermediate_steps
 
     @staticmethod
-    def from_entry_fn(*,
-                      config: AIQConfig,
-                      entry_fn: Function[InputT, StreamingOutputT, SingleOutputT],
-                      functions: dict[str, Function] | None = None,
-                      llms: dict[str, LLMProviderInfo] | None = None,
-                      embeddings: dict[str, EmbedderProviderInfo] | None = None,
-                      memory: dict[str, MemoryEditor] | None = None,
-                      exporters: dict[str, SpanExporter] | None = None,
-                      retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
-                      context_state: AIQContextState) -> 'Workflow[InputT, StreamingOutputT, SingleOutputT]':
+    def from_entry_fn(
+        *,
+        config: AIQConfig,
+        entry_fn: Function[InputT, StreamingOutputT, SingleOutputT],
+        functions: dict[str, Function] | None = None,
+        llms: dict[str, LLMProviderInfo] | None = None,
+        embeddings: dict[str, EmbedderProviderInfo] | None = None,
+        memory: dict[str, MemoryEditor] | None = None,
+        exporters: dict[str, SpanExporter] | None = None,
+        retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
+        context_state: AIQContextState,
+        span_listener_settings: SpanListenerSettings | None = None
+    ) -> 'Workflow[InputT, StreamingOutputT, SingleOutputT]':
 
         input_type: type = entry_fn.input_type
         streaming_output_type = entry_fn.streaming_output_type
@@ -140,4 +149,5 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                             memory=memory,
                             exporters=exporters,
                             retrievers=retrievers,
-                            context_state=context_state)
+                            context_state=context_state,
+                            span_listener_settings=span_listener_settings)
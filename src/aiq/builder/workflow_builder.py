@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import dataclasses
 import inspect
 import logging
@@ -23,7 +24,8 @@ from contextlib import asynccontextmanager
 
 from aiq.builder.builder import Builder
 from aiq.builder.builder import UserManagerHolder
-from aiq.builder.component_utils import build_dependency_sequence
+from aiq.builder.component_utils import ComponentInstanceData
+from aiq.builder.component_utils import build_dependency_levels
 from aiq.builder.context import AIQContext
 from aiq.builder.context import AIQContextState
 from aiq.builder.embedder import EmbedderProviderInfo
@@ -52,6 +54,9 @@ from aiq.data_models.memory import MemoryBaseConfig
 from aiq.data_models.retriever import RetrieverBaseConfig
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from aiq.memory.interfaces import MemoryEditor
+from aiq.observability.async_otel_listener import SpanListenerSettings
+from aiq.observability.payload_serializer import PayloadSerializer
+from aiq.observability.sampling import TraceSampler
 from aiq.profiler.decorators.framework_wrapper import chain_wrapped_build_fn
 from aiq.profiler.utils import detect_llm_frameworks_in_build_fn
 from aiq.utils.optional_imports import TelemetryOptionalImportError
@@ -122,6 +127,7 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
         self._logging_handlers: dict[str, logging.Handler] = {}
         self._exporters: dict[str, ConfiguredExporter] = {}
+        self._span_listener_settings: SpanListenerSettings | None = None
 
         self._functions: dict[str, ConfiguredFunction] = {}
         self._workflow: ConfiguredFunction | None = None
@@ -187,6 +193,13 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
             trace.set_tracer_provider(provider)
 
+            # Every run of the built workflow uses the configured sampling, and its span listener the payload limits
+            # and event queue. They are kept on the workflow, so builders with other settings do not affect each other
+            self._span_listener_settings = SpanListenerSettings(payload_serializer=PayloadSerializer(
+                max_length=telemetry_config.span_payload.max_length, max_items=telemetry_config.span_payload.max_items),
+                                                                queue_config=telemetry_config.span_queue,
+                                                                sampler=TraceSampler(telemetry_config.sampling))
+
             for key, trace_exporter_config in telemetry_config.tracing.items():
 
                 exporter_info = self._registry.get_telemetry_exporter(type(trace_exporter_config))
@@ -289,7 +302,8 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                                               k: v.instance
                                               for k, v in self._retrievers.items()
                                           },
-                                          context_state=self._context_state)
+                                          context_state=self._context_state,
+                                          span_listener_settings=self._span_listener_settings)
 
         return workflow
 
@@ -608,11 +622,26 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
             skip_workflow (bool): If True, skips the workflow instantiation step. Defaults to False.
 
         """
-        # Generate the build sequence
-        build_sequence = build_dependency_sequence(config)
+        # Generate the build sequence, grouped into levels which only depend on earlier levels
+        build_levels = build_dependency_levels(config)
 
         # Loop over all objects and add to the workflow builder
-        for component_instance in build_sequence:
+        for build_level in build_levels:
+            # If the function is the root, set it as the workflow later
+            components = [x for x in build_level if not x.is_root]
+
+            if (self.general_config.build_concurrency == 1 or len(components) <= 1):
+                for component_instance in components:
+                    await self._add_component(component_instance)
+            else:
+                await self._add_components_concurrently(components)
+
+        # Instantiate the workflow
+        if not skip_workflow:
+            await self.set_workflow(config.workflow)
+
+    async def _add_component(self, component_instance: ComponentInstanceData):
+        try:
             # Instantiate a the llm
             if component_instance.component_group == ComponentGroup.LLMS:
                 await self.add_llm(component_instance.name, component_instance.config)
@@ -627,15 +656,37 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                 await self.add_retriever(component_instance.name, component_instance.config)
             # Instantiate a function
             elif component_instance.component_group == ComponentGroup.FUNCTIONS:
-                # If the function is the root, set it as the workflow later
-                if (not component_instance.is_root):
-                    await self.add_function(component_instance.name, component_instance.config)
+                await self.add_function(component_instance.name, component_instance.config)
             else:
                 raise ValueError(f"Unknown component group {component_instance.component_group}")
+        except Exception as e:
+            # Components of a level are built concurrently, name the failed one in the error
+            e.add_note(f"While building {component_instance.component_group.value} `{component_instance.name}`")
+            raise
 
-        # Instantiate the workflow
-        if not skip_workflow:
-            await self.set_workflow(config.workflow)
+    async def _add_components_concurrently(self, components: list[ComponentInstanceData]):
+        """
+        Build independent components concurrently, limited by `general.build_concurrency`. If any component fails
+        the remaining builds are cancelled and the error of the first failed component, in build order, is raised.
+        """
+        semaphore = asyncio.Semaphore(self.general_config.build_concurrency)
+
+        async def _build(component_instance: ComponentInstanceData):
+            async with semaphore:
+                await self._add_component(component_instance)
+
+        tasks = [asyncio.create_task(_build(x)) for x in components]
+
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in tasks:
+            if (not task.cancelled() and task.exception() is not None):
+                raise task.exception()
 
     @classmethod
     @asynccontextmanager
@@ -15,12 +15,13 @@
 
 import asyncio
 import logging
+import typing
 from pathlib import Path
 
 import click
 
-from aiq.eval.evaluate import EvaluationRun
-from aiq.eval.evaluate import EvaluationRunConfig
+if typing.TYPE_CHECKING:
+    from aiq.eval.evaluate import EvaluationRunConfig
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +78,26 @@ logger = logging.getLogger(__name__)
     default=1,
     help="Number of repetitions for the evaluation.",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Resume an interrupted evaluation from the checkpoint in the output directory. Workflow runs and "
+    "evaluator scores recorded in the checkpoint are not repeated.",
+)
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Split the dataset into this many shards, each evaluated in a separate process with its own workflow. "
+    "The results of the shards are merged into the output directory.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes used to evaluate the shards. Defaults to one per shard, up to the number of CPUs.",
+)
 @click.option(
     "--override",
     type=(str, str),
@@ -89,7 +110,9 @@ def eval_command(ctx, **kwargs) -> None:
     pass
 
 
-async def run_and_evaluate(config: EvaluationRunConfig):
+async def run_and_evaluate(config: "EvaluationRunConfig"):
+    from aiq.eval.evaluate import EvaluationRun
+
     # Run evaluation
     eval_runner = EvaluationRun(config=config)
     await eval_runner.run_and_evaluate()
@@ -108,6 +131,9 @@ def process_aiq_eval(
     endpoint_timeout: int,
     reps: int,
     override: tuple[tuple[str, str], ...],
+    resume: bool,
+    shards: int,
+    workers: int | None,
 ):
     """
     Process the eval command and execute the evaluation. Here the config_file, if provided, is checked for its existence
@@ -118,12 +144,19 @@ def process_aiq_eval(
         raise click.UsageError("The options '--skip_workflow' and '--endpoint' are mutually exclusive. "
                                "Please use only one of them.")
 
+    # The remote workflow is not checkpointed
+    if resume and endpoint:
+        raise click.UsageError("The options '--resume' and '--endpoint' are mutually exclusive. "
+                               "Please use only one of them.")
+
     # You cannot run multiple repetitions if you are skipping the workflow or skipping completed entries
     if reps > 1 and (skip_workflow or skip_completed_entries):
         raise click.UsageError("The options '--reps' and '--skip_workflow' or '--skip_completed_entries' are mutually "
                                "exclusive. You cannot run multiple repetitions if you are skipping the workflow or "
                                "have a partially completed dataset.")
 
+    from aiq.eval.evaluate import EvaluationRunConfig
+
     # Create the configuration object
     config = EvaluationRunConfig(
         config_file=config_file,
@@ -135,5 +168,8 @@ def process_aiq_eval(
         endpoint_timeout=endpoint_timeout,
         reps=reps,
         override=override,
+        resume=resume,
+        shards=shards,
+        workers=workers,
     )
     asyncio.run(run_and_evaluate(config))
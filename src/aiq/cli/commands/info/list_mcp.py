@@ -19,8 +19,6 @@ import logging
 import anyio
 import click
 
-from aiq.tool.mcp.mcp_client import MCPBuilder
-
 # Suppress verbose logs from mcp.client.sse and httpx
 logging.getLogger("mcp.client.sse").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -58,6 +56,8 @@ def print_tool(tool_dict, detail=False):
 
 
 async def list_tools_and_schemas(url, tool_name=None):
+    from aiq.tool.mcp.mcp_client import MCPBuilder
+
     builder = MCPBuilder(url=url)
     try:
         if tool_name:
@@ -21,6 +21,7 @@ from contextlib import AbstractAsyncContextManager
 from contextlib import contextmanager
 from copy import deepcopy
 from functools import cached_property
+from functools import lru_cache
 from logging import Handler
 
 from pydantic import BaseModel
@@ -268,6 +269,58 @@ class RegisteredPackage(BaseModel):
     discovery_metadata: DiscoveryMetadata
 
 
+def registration_name(component_type: AIQComponentEnum, name: str) -> str:
+    """
+    The name under which a registration is listed by `TypeRegistry.get_registered_names`. Names are qualified by the
+    component type since the same local name can be registered for several, e.g. an LLM and an embedder provider.
+    """
+    return f"{component_type.value}:{name}"
+
+
+def client_registration_name(component_type: AIQComponentEnum, config_type: type, llm_framework: str | None) -> str:
+    """The name under which a client registration is listed by `TypeRegistry.get_registered_names`"""
+    full_type = getattr(config_type, "full_type", config_type.__name__)
+
+    return registration_name(component_type, f"{full_type}:{_framework_name(llm_framework)}")
+
+
+def _framework_name(llm_framework: str | None) -> str | None:
+    # LLM frameworks are registered and requested either as `LLMFrameworkEnum` members or plain strings
+    return getattr(llm_framework, "value", llm_framework)
+
+
+@lru_cache(maxsize=256)
+def _compute_union(cls: type[TypedBaseModelT], registrations: tuple[tuple[str, type[TypedBaseModelT]], ...]):
+    """
+    Build the discriminated union of the registered config types, given as `(full_type, config_type)` pairs. Each type
+    is tagged with its full name, and with its local name when that is unique.
+    """
+    registrations = list(registrations)
+
+    while (len(registrations) < 2):
+        registrations.append((f"_ignore/{len(registrations)}", cls))
+
+    short_names: dict[str, int] = {}
+    type_list: list[tuple[str, type[TypedBaseModelT]]] = []
+
+    # For all keys in the list, split the key by / and increment the count of the last element
+    for full_type, config_type in registrations:
+        local_name = full_type.split("/")[-1]
+        short_names[local_name] = short_names.get(local_name, 0) + 1
+
+        type_list.append((full_type, config_type))
+
+    # Now loop again and if the short name is unique, then create two entries, for the short and full name
+    for full_type, config_type in registrations:
+        local_name = full_type.split("/")[-1]
+
+        if (short_names[local_name] == 1):
+            type_list.append((local_name, config_type))
+
+    # pylint: disable=consider-alternative-union-syntax
+    return typing.Union[tuple(typing.Annotated[x_type, Tag(x_id)] for x_id, x_type in type_list)]
+
+
 class TypeRegistry:  # pylint: disable=too-many-public-methods
 
     def __init__(self) -> None:
@@ -323,10 +376,18 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         self._registration_changed_hooks: list[Callable[[], None]] = []
         self._registration_changed_hooks_active: bool = True
 
+        # Called with the registered name of a missing client or tool wrapper, returns True if it registered new plugins
+        self._lazy_loader: Callable[[str], bool] | None = None
+
+        # Identifies the registered config types, reset whenever a registration changes
+        self._schema_fingerprint: tuple | None = None
+
         self._registered_channel_map = {}
 
     def _registration_changed(self):
 
+        self._schema_fingerprint = None
+
         if (not self._registration_changed_hooks_active):
             return
 
@@ -352,6 +413,77 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
             # Ensure that the registration changed hooks are called
             self._registration_changed()
 
+    def set_lazy_loader(self, loader: Callable[[str], bool] | None) -> None:
+        """
+        Set the callback used to import plugins on demand. When a client or tool wrapper lookup fails, the loader is
+        called with the name of the missing registration, as listed by `get_registered_names`, and the lookup is
+        retried if the loader returns True.
+        """
+        self._lazy_loader = loader
+
+    def _load_lazily(self, name: str) -> bool:
+
+        if (self._lazy_loader is None):
+            return False
+
+        return self._lazy_loader(name)
+
+    def get_registered_names(self) -> set[str]:
+        """
+        Returns the names of everything registered, used to index which plugin provides each registration. Config types
+        are listed by their full and local names, clients by their provider config and LLM framework, and tool wrappers
+        by their LLM framework. See `registration_name`.
+        """
+        names: set[str] = set()
+
+        for component_type, infos in self._get_config_type_infos().items():
+            for info in infos.values():
+                names.add(registration_name(component_type, info.full_type))
+                names.add(registration_name(component_type, info.local_name))
+
+        clients_by_type = {
+            AIQComponentEnum.LLM_CLIENT: self._llm_client_provider_to_framework,
+            AIQComponentEnum.EMBEDDER_CLIENT: self._embedder_client_provider_to_framework,
+            AIQComponentEnum.RETRIEVER_CLIENT: self._retriever_client_provider_to_framework,
+        }
+
+        for component_type, clients in clients_by_type.items():
+            for config_type, frameworks in clients.items():
+                for framework in frameworks:
+                    names.add(client_registration_name(component_type, config_type, framework))
+
+        for framework in self._registered_tool_wrappers:
+            names.add(registration_name(AIQComponentEnum.TOOL_WRAPPER, _framework_name(framework)))
+
+        return names
+
+    def _get_config_type_infos(self) -> dict[AIQComponentEnum, dict[type, RegisteredInfo]]:
+        """The registrations of every component type selected in a configuration by its `_type`"""
+        return {
+            AIQComponentEnum.TRACING: self._registered_telemetry_exporters,
+            AIQComponentEnum.LOGGING: self._registered_logging_methods,
+            AIQComponentEnum.FRONT_END: self._registered_front_end_infos,
+            AIQComponentEnum.FUNCTION: self._registered_functions,
+            AIQComponentEnum.LLM_PROVIDER: self._registered_llm_provider_infos,
+            AIQComponentEnum.EMBEDDER_PROVIDER: self._registered_embedder_provider_infos,
+            AIQComponentEnum.EVALUATOR: self._registered_evaluator_infos,
+            AIQComponentEnum.MEMORY: self._registered_memory_infos,
+            AIQComponentEnum.RETRIEVER_PROVIDER: self._registered_retriever_provider_infos,
+            AIQComponentEnum.REGISTRY_HANDLER: self._registered_registry_handler_infos,
+        }
+
+    def get_schema_fingerprint(self) -> tuple:
+        """
+        Identifies the registered config types, and therefore the annotations computed by `compute_annotation`. Two
+        registries with the same fingerprint produce the same configuration schemas.
+        """
+        if (self._schema_fingerprint is None):
+            self._schema_fingerprint = tuple((component_type, info.full_type, info.config_type)
+                                             for component_type, infos in self._get_config_type_infos().items()
+                                             for info in infos.values())
+
+        return self._schema_fingerprint
+
     def register_telemetry_exporter(self, registration: RegisteredTelemetryExporter):
 
         if (registration.config_type in self._registered_telemetry_exporters):
@@ -478,6 +610,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             client_info = self._llm_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._load_lazily(client_registration_name(AIQComponentEnum.LLM_CLIENT, config_type, wrapper_type))):
+                return self.get_llm_client(config_type, wrapper_type)
+
             raise KeyError(f"An invalid LLM config and wrapper combination was supplied. Config: `{config_type}`, "
                            f"Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} LLM client but "
                            f"there is no registered conversion from that LLM provider to LLM framework: "
@@ -527,6 +662,10 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             client_info = self._embedder_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._load_lazily(client_registration_name(AIQComponentEnum.EMBEDDER_CLIENT, config_type,
+                                                           wrapper_type))):
+                return self.get_embedder_client(config_type, wrapper_type)
+
             raise KeyError(
                 f"An invalid Embedder config and wrapper combination was supplied. Config: `{config_type}`, "
                 "Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} Embedder client but "
@@ -620,6 +759,10 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             client_info = self._retriever_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._load_lazily(client_registration_name(AIQComponentEnum.RETRIEVER_CLIENT, config_type,
+                                                           wrapper_type))):
+                return self.get_retriever_client(config_type, wrapper_type)
+
             raise KeyError(
                 f"An invalid Retriever config and wrapper combination was supplied. Config: `{config_type}`, "
                 "Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} Retriever client but "
@@ -644,6 +787,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             return self._registered_tool_wrappers[llm_framework]
         except KeyError as err:
+            if (self._load_lazily(registration_name(AIQComponentEnum.TOOL_WRAPPER, _framework_name(llm_framework)))):
+                return self.get_tool_wrapper(llm_framework)
+
             raise KeyError(f"Could not find a registered tool wrapper for LLM framework `{llm_framework}`. "
                            f"Registered LLM frameworks: {set(self._registered_tool_wrappers.keys())}") from err
 
@@ -794,27 +940,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
     def _do_compute_annotation(self, cls: type[TypedBaseModelT], registrations: list[RegisteredInfo[TypedBaseModelT]]):
 
-        while (len(registrations) < 2):
-            registrations.append(RegisteredInfo[TypedBaseModelT](full_type=f"_ignore/{len(registrations)}",
-                                                                 config_type=cls))
-
-        short_names: dict[str, int] = {}
-        type_list: list[tuple[str, type[TypedBaseModelT]]] = []
-
-        # For all keys in the list, split the key by / and increment the count of the last element
-        for key in registrations:
-            short_names[key.local_name] = short_names.get(key.local_name, 0) + 1
-
-            type_list.append((key.full_type, key.config_type))
-
-        # Now loop again and if the short name is unique, then create two entries, for the short and full name
-        for key in registrations:
-
-            if (short_names[key.local_name] == 1):
-                type_list.append((key.local_name, key.config_type))
-
-        # pylint: disable=consider-alternative-union-syntax
-        return typing.Union[tuple(typing.Annotated[x_type, Tag(x_id)] for x_id, x_type in type_list)]
+        # Unions are cached by their registrations so rebuilding a configuration model with unchanged registrations
+        # compares the same annotation objects
+        return _compute_union(cls, tuple((info.full_type, info.config_type) for info in registrations))
 
     def compute_annotation(self, cls: type[TypedBaseModelT]):
 
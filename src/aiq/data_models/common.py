@@ -16,6 +16,7 @@
 import inspect
 import sys
 import typing
+from collections import OrderedDict
 from hashlib import sha512
 
 from pydantic import AliasChoices
@@ -24,6 +25,14 @@ from pydantic import Field
 
 _LT = typing.TypeVar("_LT")
 
+# Compiled schemas of the models rebuilt by `rebuild_model`, keyed by the model and the fingerprint of its annotations
+_rebuilt_models: OrderedDict[tuple[type[BaseModel], typing.Hashable], dict[str, typing.Any]] = OrderedDict()
+_MAX_REBUILT_MODELS = 64
+_REBUILT_MODEL_ATTRS = ("__pydantic_core_schema__",
+                        "__pydantic_validator__",
+                        "__pydantic_serializer__",
+                        "__signature__")
+
 
 class HashableBaseModel(BaseModel):
     """
@@ -62,6 +71,35 @@ class HashableBaseModel(BaseModel):
             json.dump(schema, f, indent=2)
 
 
+def rebuild_model(cls: type[BaseModel], fingerprint: typing.Hashable) -> bool | None:
+    """
+    Rebuild a model after its field annotations were replaced, returning the result of `model_rebuild`.
+
+    Models whose annotations depend on the registered plugins are rebuilt whenever a plugin is registered or the type
+    registry is swapped. `fingerprint` must identify the annotations of the model and of the models it contains, the
+    compiled schema is cached per fingerprint so that returning to a previous set of registrations restores it rather
+    than compiling it again.
+    """
+    key = (cls, fingerprint)
+
+    saved = _rebuilt_models.get(key)
+    if saved is not None:
+        _rebuilt_models.move_to_end(key)
+        for name, value in saved.items():
+            setattr(cls, name, value)
+
+        return True
+
+    rebuilt = cls.model_rebuild(force=True)
+
+    if rebuilt:
+        _rebuilt_models[key] = {name: cls.__dict__[name] for name in _REBUILT_MODEL_ATTRS if name in cls.__dict__}
+        if len(_rebuilt_models) > _MAX_REBUILT_MODELS:
+            _rebuilt_models.popitem(last=False)
+
+    return rebuilt
+
+
 def subclass_depth(cls: type) -> int:
     """
     Compute a class' subclass depth.
@@ -16,10 +16,12 @@
 import logging
 import sys
 import typing
+from enum import Enum
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Discriminator
+from pydantic import Field
 from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
@@ -35,6 +37,7 @@ from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfi
 
 from .common import HashableBaseModel
 from .common import TypedBaseModel
+from .common import rebuild_model
 from .embedder import EmbedderBaseConfig
 from .llm import LLMBaseConfig
 from .memory import MemoryBaseConfig
@@ -124,10 +127,85 @@ def _process_validation_error(err: ValidationError, handler: ValidatorFunctionWr
         raise ValidationError.from_exception_data(title=err.title, line_errors=new_errors)
 
 
+class SpanPayloadConfig(BaseModel):
+    """
+    Limits applied to the input and output payloads recorded on spans, large payloads are bounded before they are
+    JSON-encoded.
+    """
+    max_length: int | None = Field(default=None,
+                                   gt=0,
+                                   description="Maximum number of characters recorded for a payload. Longer payloads "
+                                   "are truncated.")
+    max_items: int | None = Field(default=None,
+                                  gt=0,
+                                  description="Maximum number of list or tuple elements recorded for a payload. Only "
+                                  "the first elements are serialized.")
+
+
+class SpanOverflowPolicy(str, Enum):
+    """Policy applied when the queue of events waiting to be turned into spans is full."""
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+class SpanQueueConfig(BaseModel):
+    """
+    Controls how intermediate steps are turned into spans. By default spans are built on a background thread so the
+    workflow does not wait on span creation, payload serialization or exporter calls.
+    """
+    background: bool = Field(default=True,
+                             description="Build spans on a background thread. When disabled spans are built inline "
+                             "while the workflow emits its events.")
+    max_queue_size: int = Field(default=10000,
+                                gt=0,
+                                description="Maximum number of events waiting to be turned into spans, per workflow "
+                                "run.")
+    overflow_policy: SpanOverflowPolicy = Field(default=SpanOverflowPolicy.DROP_NEWEST,
+                                                description="What to do when the queue is full: drop the new event, "
+                                                "drop the oldest queued event, or block the emitting thread until "
+                                                "there is space. Events emitted on the event loop thread are dropped "
+                                                "instead of blocking the loop.")
+
+
+class TailSamplingConfig(BaseModel):
+    """
+    Tail sampling buffers the intermediate steps of a request and only exports its trace once the request has finished,
+    if the request matched at least one of the conditions below.
+    """
+    keep_errors: bool = Field(default=True, description="Keep the traces of requests which raised an error.")
+    latency_threshold: float | None = Field(default=None,
+                                            gt=0,
+                                            description="Keep the traces of requests which took longer than this "
+                                            "number of seconds.")
+    token_threshold: int | None = Field(default=None,
+                                        gt=0,
+                                        description="Keep the traces of requests whose LLM calls used more than this "
+                                        "number of tokens.")
+
+
+class TraceSamplingConfig(BaseModel):
+    """
+    Controls which requests are traced. Head sampling decides when a request starts whether it is traced at all,
+    requests which are not sampled do not create spans. Tail sampling then filters the traced requests once they have
+    finished.
+    """
+    head_rate: float = Field(default=1.0,
+                             ge=0.0,
+                             le=1.0,
+                             description="Fraction of the workflow's requests which are traced.")
+    tail: TailSamplingConfig | None = Field(default=None,
+                                            description="Only export the traces of requests matching these "
+                                            "conditions. When unset every sampled request is exported.")
+
+
 class TelemetryConfig(BaseModel):
 
     logging: dict[str, LoggingBaseConfig] = {}
     tracing: dict[str, TelemetryExporterBaseConfig] = {}
+    span_payload: SpanPayloadConfig = SpanPayloadConfig()
+    span_queue: SpanQueueConfig = SpanQueueConfig()
+    sampling: TraceSamplingConfig = TraceSamplingConfig()
 
     @field_validator("logging", "tracing", mode="wrap")
     @classmethod
@@ -167,7 +245,7 @@ class TelemetryConfig(BaseModel):
             should_rebuild = True
 
         if (should_rebuild):
-            return cls.model_rebuild(force=True)
+            return rebuild_model(cls, type_registry.get_schema_fingerprint())
 
         return False
 
@@ -182,6 +260,12 @@ class GeneralConfig(BaseModel):
     better error messages when debugging.
     """
 
+    build_concurrency: int = Field(default=8, ge=1)
+    """
+    Maximum number of components built concurrently when the workflow starts. Components are only built concurrently
+    with components they do not depend on. Set to 1 to build the components one at a time.
+    """
+
     telemetry: TelemetryConfig = TelemetryConfig()
 
     # FrontEnd Configuration
@@ -218,7 +302,7 @@ class GeneralConfig(BaseModel):
             should_rebuild = True
 
         if (should_rebuild):
-            return cls.model_rebuild(force=True)
+            return rebuild_model(cls, type_registry.get_schema_fingerprint())
 
         return False
 
@@ -344,6 +428,6 @@ class AIQConfig(HashableBaseModel):
             should_rebuild = True
 
         if (should_rebuild):
-            return cls.model_rebuild(force=True)
+            return rebuild_model(cls, type_registry.get_schema_fingerprint())
 
         return False
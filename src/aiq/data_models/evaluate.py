@@ -19,9 +19,11 @@ from pathlib import Path
 
 from pydantic import BaseModel
 from pydantic import Discriminator
+from pydantic import Field
 from pydantic import model_validator
 
 from aiq.data_models.common import TypedBaseModel
+from aiq.data_models.common import rebuild_model
 from aiq.data_models.dataset_handler import EvalDatasetConfig
 from aiq.data_models.dataset_handler import EvalS3Config
 from aiq.data_models.evaluator import EvaluatorBaseConfig
@@ -69,6 +71,16 @@ class EvalOutputConfig(BaseModel):
     workflow_output_step_filter: list[IntermediateStepType] | None = None
 
 
+class EvalPipelineConfig(BaseModel):
+    # Score items with evaluators that support item-level evaluation as soon as their workflow run finishes,
+    # overlapping the workflow and evaluation phases
+    enabled: bool = True
+    # Maximum number of finished items buffered per evaluator. The workflow is throttled while a queue is full.
+    queue_size: int = Field(default=32, gt=0)
+    # Maximum number of items scored concurrently per evaluator. Defaults to max_concurrency if not set.
+    max_concurrency: int | None = Field(default=None, gt=0)
+
+
 class EvalGeneralConfig(BaseModel):
     max_concurrency: int = 8
 
@@ -84,6 +96,13 @@ class EvalGeneralConfig(BaseModel):
     # Inference profiler
     profiler: ProfilerConfig | None = None
 
+    # Streaming of workflow results to the evaluators
+    pipeline: EvalPipelineConfig = EvalPipelineConfig()
+
+    # Record per-item workflow and evaluator results to a checkpoint in the output directory as they complete,
+    # allowing an interrupted evaluation to be continued with `aiq eval --resume`
+    checkpoint: bool = True
+
     # overwrite the output_dir with the output config if present
     @model_validator(mode="before")
     @classmethod
@@ -120,4 +139,6 @@ class EvalConfig(BaseModel):
             should_rebuild = True
 
         if (should_rebuild):
-            cls.model_rebuild(force=True)
+            return rebuild_model(cls, type_registry.get_schema_fingerprint())
+
+        return False
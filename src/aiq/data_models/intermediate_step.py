@@ -15,7 +15,6 @@
 
 import time
 import typing
-import uuid
 from enum import Enum
 from typing import Literal
 
@@ -27,6 +26,7 @@ from pydantic import model_validator
 from aiq.builder.framework_enum import LLMFrameworkEnum
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.utils.uuid_utils import uuid4_str
 
 
 class IntermediateStepCategory(str, Enum):
@@ -64,6 +64,46 @@ class IntermediateStepState(str, Enum):
     END = "END"
 
 
+# Category and state of each event type, looked up for every event so they are precomputed
+_EVENT_TYPE_CATEGORY: dict[IntermediateStepType, IntermediateStepCategory] = {
+    IntermediateStepType.LLM_START: IntermediateStepCategory.LLM,
+    IntermediateStepType.LLM_END: IntermediateStepCategory.LLM,
+    IntermediateStepType.LLM_NEW_TOKEN: IntermediateStepCategory.LLM,
+    IntermediateStepType.TOOL_START: IntermediateStepCategory.TOOL,
+    IntermediateStepType.TOOL_END: IntermediateStepCategory.TOOL,
+    IntermediateStepType.WORKFLOW_START: IntermediateStepCategory.WORKFLOW,
+    IntermediateStepType.WORKFLOW_END: IntermediateStepCategory.WORKFLOW,
+    IntermediateStepType.TASK_START: IntermediateStepCategory.TASK,
+    IntermediateStepType.TASK_END: IntermediateStepCategory.TASK,
+    IntermediateStepType.FUNCTION_START: IntermediateStepCategory.FUNCTION,
+    IntermediateStepType.FUNCTION_END: IntermediateStepCategory.FUNCTION,
+    IntermediateStepType.CUSTOM_START: IntermediateStepCategory.CUSTOM,
+    IntermediateStepType.CUSTOM_END: IntermediateStepCategory.CUSTOM,
+    IntermediateStepType.SPAN_START: IntermediateStepCategory.SPAN,
+    IntermediateStepType.SPAN_CHUNK: IntermediateStepCategory.SPAN,
+    IntermediateStepType.SPAN_END: IntermediateStepCategory.SPAN,
+}
+
+_EVENT_TYPE_STATE: dict[IntermediateStepType, IntermediateStepState] = {
+    IntermediateStepType.LLM_START: IntermediateStepState.START,
+    IntermediateStepType.LLM_END: IntermediateStepState.END,
+    IntermediateStepType.LLM_NEW_TOKEN: IntermediateStepState.CHUNK,
+    IntermediateStepType.TOOL_START: IntermediateStepState.START,
+    IntermediateStepType.TOOL_END: IntermediateStepState.END,
+    IntermediateStepType.WORKFLOW_START: IntermediateStepState.START,
+    IntermediateStepType.WORKFLOW_END: IntermediateStepState.END,
+    IntermediateStepType.TASK_START: IntermediateStepState.START,
+    IntermediateStepType.TASK_END: IntermediateStepState.END,
+    IntermediateStepType.FUNCTION_START: IntermediateStepState.START,
+    IntermediateStepType.FUNCTION_END: IntermediateStepState.END,
+    IntermediateStepType.CUSTOM_START: IntermediateStepState.START,
+    IntermediateStepType.CUSTOM_END: IntermediateStepState.END,
+    IntermediateStepType.SPAN_START: IntermediateStepState.START,
+    IntermediateStepType.SPAN_CHUNK: IntermediateStepState.CHUNK,
+    IntermediateStepType.SPAN_END: IntermediateStepState.END,
+}
+
+
 class StreamEventData(BaseModel):
     """
     AIQStreamEventData is a data model that represents the data field in an streaming event.
@@ -139,87 +179,25 @@ class IntermediateStepPayload(BaseModel):
     metadata: dict[str, typing.Any] | TraceMetadata | None = None
     data: StreamEventData | None = None
     usage_info: UsageInfo | None = None
-    UUID: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    UUID: str = Field(default_factory=uuid4_str)
 
     @property
-    def event_category(self) -> IntermediateStepCategory:  # pylint: disable=too-many-return-statements
-        match self.event_type:
-            case IntermediateStepType.LLM_START:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.LLM_END:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.LLM_NEW_TOKEN:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.TOOL_START:
-                return IntermediateStepCategory.TOOL
-            case IntermediateStepType.TOOL_END:
-                return IntermediateStepCategory.TOOL
-            case IntermediateStepType.WORKFLOW_START:
-                return IntermediateStepCategory.WORKFLOW
-            case IntermediateStepType.WORKFLOW_END:
-                return IntermediateStepCategory.WORKFLOW
-            case IntermediateStepType.TASK_START:
-                return IntermediateStepCategory.TASK
-            case IntermediateStepType.TASK_END:
-                return IntermediateStepCategory.TASK
-            case IntermediateStepType.FUNCTION_START:
-                return IntermediateStepCategory.FUNCTION
-            case IntermediateStepType.FUNCTION_END:
-                return IntermediateStepCategory.FUNCTION
-            case IntermediateStepType.CUSTOM_START:
-                return IntermediateStepCategory.CUSTOM
-            case IntermediateStepType.CUSTOM_END:
-                return IntermediateStepCategory.CUSTOM
-            case IntermediateStepType.SPAN_START:
-                return IntermediateStepCategory.SPAN
-            case IntermediateStepType.SPAN_CHUNK:
-                return IntermediateStepCategory.SPAN
-            case IntermediateStepType.SPAN_END:
-                return IntermediateStepCategory.SPAN
-            case _:
-                raise ValueError(f"Unknown event type: {self.event_type}")
+    def event_category(self) -> IntermediateStepCategory:
+        try:
+            return _EVENT_TYPE_CATEGORY[self.event_type]
+        except KeyError:
+            raise ValueError(f"Unknown event type: {self.event_type}") from None
 
     @property
-    def event_state(self) -> IntermediateStepState:  # pylint: disable=too-many-return-statements
-        match self.event_type:
-            case IntermediateStepType.LLM_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.LLM_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.LLM_NEW_TOKEN:
-                return IntermediateStepState.CHUNK
-            case IntermediateStepType.TOOL_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.TOOL_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.WORKFLOW_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.WORKFLOW_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.TASK_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.TASK_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.FUNCTION_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.FUNCTION_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.CUSTOM_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.CUSTOM_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.SPAN_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.SPAN_CHUNK:
-                return IntermediateStepState.CHUNK
-            case IntermediateStepType.SPAN_END:
-                return IntermediateStepState.END
-            case _:
-                raise ValueError(f"Unknown event type: {self.event_type}")
+    def event_state(self) -> IntermediateStepState:
+        try:
+            return _EVENT_TYPE_STATE[self.event_type]
+        except KeyError:
+            raise ValueError(f"Unknown event type: {self.event_type}") from None
 
     @model_validator(mode="after")
     def check_span_event_timestamp(self) -> "IntermediateStepPayload":
-        if self.event_state != IntermediateStepState.END and self.span_event_timestamp is not None:
+        if self.span_event_timestamp is not None and self.event_state != IntermediateStepState.END:
             raise ValueError("span_event_timestamp can only be provided for events with an END state")
         return self
 
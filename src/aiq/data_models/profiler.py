@@ -19,6 +19,10 @@ from pydantic import BaseModel
 class PromptCachingConfig(BaseModel):
     enable: bool = False
     min_frequency: float = 0.5
+    # report prefixes on word and punctuation token boundaries rather than on every character
+    token_level: bool = False
+    # bound the time and memory spent on very long prompts, in characters or tokens
+    max_prefix_length: int | None = None
 
 
 class BottleneckConfig(BaseModel):
@@ -47,6 +51,10 @@ class ProfilerConfig(BaseModel):
     workflow_runtime_forecast: bool = False
     compute_llm_metrics: bool = False
     csv_exclude_io_text: bool = False
+    # zstd-compress the JSON Lines trace file, requires the `zstandard` package
+    compress_traces: bool = False
+    # additionally write the standardized data and raw traces as Parquet files, requires the `pyarrow` package
+    export_parquet: bool = False
     prompt_caching_prefixes: PromptCachingConfig = PromptCachingConfig()
     bottleneck_analysis: BottleneckConfig = BottleneckConfig()
     concurrency_spike_analysis: ConcurrencySpikeConfig = ConcurrencySpikeConfig()
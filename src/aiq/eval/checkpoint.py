@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE_NAME = "eval_checkpoint.jsonl"
+
+
+def get_checkpoint_path(output_dir: str | Path) -> Path:
+    """
+    Return the path of the evaluation checkpoint file within `output_dir`.
+    """
+    return Path(output_dir) / CHECKPOINT_FILE_NAME
+
+
+def checkpoint_key(item_id: typing.Any) -> str:
+    """Items are keyed by their string id, dataset ids may be integers but are always written to JSON as strings"""
+    return str(item_id)
+
+
+class WorkflowCheckpoint(BaseModel):
+    output_obj: typing.Any = None
+    trajectory: list[IntermediateStep] = []
+
+
+class EvalCheckpointState(BaseModel):
+    """
+    Results recovered from a checkpoint file. Evaluator results recorded before a workflow record they depend on are
+    dropped, they were computed on a stale workflow output.
+    """
+    # item id -> workflow result
+    workflow_items: dict[str, WorkflowCheckpoint] = {}
+    # evaluator name -> item id -> score
+    evaluator_items: dict[str, dict[str, EvalOutputItem]] = {}
+    # evaluator name -> complete output of evaluators that need the whole dataset
+    evaluator_outputs: dict[str, EvalOutput] = {}
+
+
+class EvalCheckpointWriter:
+    """
+    Append-only log of evaluation progress, used by `aiq eval --resume` to continue an interrupted evaluation.
+
+    Every result is written as a single JSON Lines record as soon as it is available::
+
+        {"type": "workflow", "id": "1", "output_obj": "...", "trajectory": [...]}
+        {"type": "evaluator_item", "evaluator": "accuracy", "id": "1", "output_item": {...}}
+        {"type": "evaluator_output", "evaluator": "ragas", "output": {...}}
+
+    Each record is flushed once written, so a crash loses at most the record being written. A truncated trailing
+    record is skipped when the checkpoint is loaded.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._file: typing.TextIO | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def open(self, append: bool = False) -> "EvalCheckpointWriter":
+        """Open the checkpoint file, truncating it unless `append` is set"""
+        if self._file is not None:
+            return self
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, "a" if append else "w", encoding="utf-8")  # pylint: disable=consider-using-with
+
+        return self
+
+    def _write(self, record: dict[str, typing.Any]):
+        if self._file is None:
+            raise RuntimeError("EvalCheckpointWriter must be opened before writing")
+
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def write_workflow_item(self, item: EvalInputItem):
+        self._write({
+            "type": "workflow",
+            "id": checkpoint_key(item.id),
+            "output_obj": item.output_obj,
+            "trajectory": [step.model_dump() for step in item.trajectory],
+        })
+
+    def write_evaluator_item(self, evaluator_name: str, item_id: typing.Any, output_item: EvalOutputItem):
+        self._write({
+            "type": "evaluator_item",
+            "evaluator": evaluator_name,
+            "id": checkpoint_key(item_id),
+            "output_item": output_item.model_dump(),
+        })
+
+    def write_evaluator_output(self, evaluator_name: str, eval_output: EvalOutput):
+        self._write({"type": "evaluator_output", "evaluator": evaluator_name, "output": eval_output.model_dump()})
+
+    def close(self):
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "EvalCheckpointWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def load_checkpoint(path: str | Path) -> EvalCheckpointState:
+    """
+    Read a checkpoint written by `EvalCheckpointWriter`. Later records for the same item replace earlier ones.
+    """
+    state = EvalCheckpointState()
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+                record_type = record["type"]
+                if record_type == "workflow":
+                    key = record["id"]
+                    state.workflow_items[key] = WorkflowCheckpoint(output_obj=record["output_obj"],
+                                                                   trajectory=record["trajectory"])
+                    # scores computed before the item was re-run are stale
+                    for items in state.evaluator_items.values():
+                        items.pop(key, None)
+                    state.evaluator_outputs.clear()
+                elif record_type == "evaluator_item":
+                    output_item = EvalOutputItem.model_validate(record["output_item"])
+                    state.evaluator_items.setdefault(record["evaluator"], {})[record["id"]] = output_item
+                elif record_type == "evaluator_output":
+                    state.evaluator_outputs[record["evaluator"]] = EvalOutput.model_validate(record["output"])
+                else:
+                    logger.warning("Ignoring unknown checkpoint record type %s at %s:%d",
+                                   record_type,
+                                   path,
+                                   line_number)
+            except (ValueError, KeyError) as e:
+                # The last record may have been partially written if the evaluation was interrupted
+                logger.warning("Ignoring unreadable checkpoint record at %s:%d: %s", path, line_number, e)
+
+    return state
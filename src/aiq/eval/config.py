@@ -31,6 +31,9 @@ class EvaluationRunConfig(BaseModel):
     endpoint_timeout: int = 300
     reps: int = 1
     override: tuple[tuple[str, str], ...] = ()
+    resume: bool = False  # continue from the checkpoint of a previous run in the same output directory
+    shards: int = 1  # number of shards the dataset is split into, each shard is evaluated in a separate process
+    workers: int | None = None  # number of shard worker processes, defaults to one per shard up to the CPU count
 
 
 class EvaluationRunOutput(BaseModel):
@@ -14,8 +14,11 @@
 # limitations under the License.
 
 import asyncio
+import functools
 import logging
+import multiprocessing
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -23,20 +26,44 @@ from uuid import uuid4
 from pydantic import BaseModel
 from tqdm import tqdm
 
+from aiq.builder.evaluator import EvaluatorInfo
+from aiq.data_models.config import AIQConfig
 from aiq.data_models.evaluate import EvalConfig
 from aiq.data_models.evaluate import JobEvictionPolicy
+from aiq.eval.checkpoint import EvalCheckpointState
+from aiq.eval.checkpoint import EvalCheckpointWriter
+from aiq.eval.checkpoint import checkpoint_key
+from aiq.eval.checkpoint import get_checkpoint_path
+from aiq.eval.checkpoint import load_checkpoint
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.dataset_handler.dataset_handler import DatasetHandler
+from aiq.eval.evaluator.base_evaluator import BaseEvaluator
 from aiq.eval.evaluator.evaluator_model import EvalInput
 from aiq.eval.evaluator.evaluator_model import EvalInputItem
 from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+from aiq.eval.sharding import EvalShardResult
+from aiq.eval.sharding import get_default_num_workers
+from aiq.eval.sharding import get_shard_indices
+from aiq.eval.sharding import get_shard_output_dir
+from aiq.eval.sharding import init_shard_worker
+from aiq.eval.sharding import merge_eval_outputs
+from aiq.eval.sharding import merge_profiler_traces
+from aiq.eval.sharding import run_eval_shard
+from aiq.eval.utils.evaluator_pipeline import EvaluatorStage
 from aiq.eval.utils.output_uploader import OutputUploader
 from aiq.runtime.session import AIQSessionManager
 
 logger = logging.getLogger(__name__)
 
 
+def _averages_item_scores(evaluator: Any) -> bool:
+    """Whether the evaluator's average score is the mean of its item scores computed by `BaseEvaluator.aggregate`"""
+    aggregate_fn = getattr(evaluator, "aggregate_fn", None)
+    return getattr(aggregate_fn, "__func__", None) is BaseEvaluator.aggregate
+
+
 class EvaluationRun:  # pylint: disable=too-many-public-methods
     """
     Instantiated for each evaluation run and used to store data for that single run.
@@ -68,6 +95,21 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         # evaluation output files
         self.evaluator_output_files: list[Path] = []
 
+        # evaluators scoring items while the workflow runs, and the dataset indices already submitted to them
+        self.evaluator_stages: list[EvaluatorStage] = []
+        self._submitted_indices: set[int] = set()
+        # evaluators whose average score is the mean of their item scores, merged from the items when sharding
+        self._mean_of_items_evaluators: list[str] = []
+
+        # checkpoint of the per-item results, and the results of a previous run restored from it when resuming
+        self.checkpoint_writer: EvalCheckpointWriter | None = None
+        self._restored_workflow_indices: set[int] = set()
+        self._restored_evaluator_items: dict[str, dict[int, EvalOutputItem]] = {}
+        self._restored_evaluator_outputs: dict[str, EvalOutput] = {}
+
+        # profiler traces streamed while the workflow runs, set only if every item was written
+        self.profiler_trace_path: Path | None = None
+
     async def run_workflow_local(self, session_manager: AIQSessionManager):
         '''
         Launch the workflow with the specified questions and extract the output using the jsonpath
@@ -80,8 +122,9 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         # Run the workflow
         jsonpath_expr = parse(self.config.result_json_path)
         stop_event = asyncio.Event()
+        trace_writer = self._create_profiler_trace_writer()
 
-        async def run_one(item: EvalInputItem):
+        async def run_one(request_number: int, item: EvalInputItem):
             if stop_event.is_set():
                 return "", []
 
@@ -137,22 +180,65 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
                 item.output_obj = output
                 item.trajectory = self.intermediate_step_adapter.validate_intermediate_steps(intermediate_steps)
+                if trace_writer:
+                    trace_writer.write_request(request_number, item.trajectory)
+                if self.checkpoint_writer:
+                    self.checkpoint_writer.write_workflow_item(item)
 
-        async def wrapped_run(item: EvalInputItem) -> None:
-            await run_one(item)
+        async def wrapped_run(request_number: int, item: EvalInputItem) -> None:
+            await run_one(request_number, item)
             pbar.update(1)
+            await self.submit_to_evaluator_stages(request_number, item)
+
+        # request numbers follow the dataset order used by the profiler
+        numbered_items = list(enumerate(self.eval_input.eval_input_items))
+
+        # items restored from the checkpoint are not re-run
+        eval_input_items = [(i, item) for i, item in numbered_items if i not in self._restored_workflow_indices]
 
         # if self.config.skip_complete is set skip eval_input_items with a non-empty output_obj
         if self.config.skip_completed_entries:
-            eval_input_items = [item for item in self.eval_input.eval_input_items if not item.output_obj]
-            if not eval_input_items:
+            eval_input_items = [(i, item) for i, item in eval_input_items if not item.output_obj]
+
+        if not eval_input_items:
+            if len(self._restored_workflow_indices) == len(numbered_items):
+                logger.info("All %d items were restored from the checkpoint. Skipping workflow pass altogether.",
+                            len(numbered_items))
+            else:
                 logger.warning("All items have a non-empty output. Skipping workflow pass altogether.")
-                return
-        else:
-            eval_input_items = self.eval_input.eval_input_items
+            return
+
+        if trace_writer:
+            trace_writer.open()
+            # Completed entries are not re-run, write their existing trajectories up front
+            pending = {i for i, _ in eval_input_items}
+            for i, item in numbered_items:
+                if i not in pending:
+                    trace_writer.write_request(i, item.trajectory)
+
         pbar = tqdm(total=len(eval_input_items), desc="Running workflow")
-        await asyncio.gather(*[wrapped_run(item) for item in eval_input_items])
-        pbar.close()
+        try:
+            await asyncio.gather(*[wrapped_run(i, item) for i, item in eval_input_items])
+        finally:
+            pbar.close()
+            if trace_writer:
+                trace_writer.close()
+
+        # The streamed traces can only be re-used by the profiler if every item was written
+        if trace_writer and trace_writer.num_requests == len(numbered_items):
+            self.profiler_trace_path = trace_writer.path
+
+    def _create_profiler_trace_writer(self):
+        """Return a writer for streaming profiler traces while the workflow runs, or None if profiling is disabled"""
+        if not (self.eval_config and self.eval_config.general.profiler):
+            return None
+
+        from aiq.profiler.trace_writer import ProfilerTraceWriter
+        from aiq.profiler.trace_writer import get_trace_path
+
+        compress = self.eval_config.general.profiler.compress_traces
+        return ProfilerTraceWriter(get_trace_path(self.eval_config.general.output_dir, compress=compress),
+                                   compress=compress)
 
     async def run_workflow_remote(self):
         from aiq.eval.remote_workflow import EvaluationRemoteWorkflowHandler
@@ -176,7 +262,7 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
         profiler_runner = ProfilerRunner(self.eval_config.general.profiler, self.eval_config.general.output_dir)
 
-        await profiler_runner.run(all_stats)
+        await profiler_runner.run(all_stats, trace_path=self.profiler_trace_path)
 
     def cleanup_output_directory(self):
         '''Remove contents of the output directory if it exists'''
@@ -268,11 +354,138 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                    "`eval` with the --skip_completed_entries flag.")
             logger.warning(msg)
 
+    def open_checkpoint(self):
+        """
+        Open the checkpoint for this run. When resuming, the results recorded by the previous run are restored first
+        so they are not computed again, and new results are appended to the same checkpoint.
+        """
+        if not self.eval_config.general.checkpoint:
+            if self.config.resume:
+                logger.warning("Checkpointing is disabled, there is nothing to resume from.")
+            return
+
+        checkpoint_path = get_checkpoint_path(self.eval_config.general.output_dir)
+        resume = self.config.resume and checkpoint_path.exists()
+        if resume:
+            self.restore_checkpoint(load_checkpoint(checkpoint_path))
+        elif self.config.resume:
+            logger.warning("No checkpoint found at %s, starting a new evaluation.", checkpoint_path)
+
+        self.checkpoint_writer = EvalCheckpointWriter(checkpoint_path).open(append=resume)
+
+    def close_checkpoint(self):
+        if self.checkpoint_writer:
+            self.checkpoint_writer.close()
+            self.checkpoint_writer = None
+
+    def restore_checkpoint(self, state: EvalCheckpointState):
+        """Restore the workflow results and the evaluator scores that are still valid for this run"""
+        items = self.eval_input.eval_input_items
+        keys = [checkpoint_key(item.id) for item in items]
+
+        if not self.config.skip_workflow:
+            for index, (key, item) in enumerate(zip(keys, items)):
+                workflow_item = state.workflow_items.get(key)
+                if workflow_item is not None:
+                    item.output_obj = workflow_item.output_obj
+                    item.trajectory = workflow_item.trajectory
+                    self._restored_workflow_indices.add(index)
+
+        # Scores are only valid for items that are not going to be run by the workflow again
+        final_indices = {
+            index
+            for index, item in enumerate(items)
+            if self.config.skip_workflow or index in self._restored_workflow_indices or (
+                self.config.skip_completed_entries and item.output_obj)
+        }
+        for evaluator_name, scores in state.evaluator_items.items():
+            restored = {index: scores[keys[index]] for index in final_indices if keys[index] in scores}
+            if restored:
+                self._restored_evaluator_items[evaluator_name] = restored
+
+        if len(final_indices) == len(items):
+            self._restored_evaluator_outputs = dict(state.evaluator_outputs)
+
+        logger.info("Resuming evaluation: restored %d of %d workflow results and %d evaluator scores",
+                    len(self._restored_workflow_indices),
+                    len(items),
+                    sum(len(scores) for scores in self._restored_evaluator_items.values()))
+
+    def _record_evaluator_item(self, evaluator_name: str, index: int, output_item: EvalOutputItem):
+        if self.checkpoint_writer:
+            self.checkpoint_writer.write_evaluator_item(evaluator_name,
+                                                        self.eval_input.eval_input_items[index].id,
+                                                        output_item)
+
+    def start_evaluator_stages(self, evaluators: dict[str, Any]) -> dict[str, Any]:
+        """
+        Start a pipeline stage for every evaluator that supports item-level evaluation so items are scored as soon as
+        their workflow run finishes. Returns the remaining evaluators, which need the complete dataset and are run by
+        `run_evaluators` after the workflow.
+        """
+        pipeline_config = self.eval_config.general.pipeline
+        if not pipeline_config.enabled:
+            return evaluators
+
+        max_concurrency = pipeline_config.max_concurrency or self.eval_config.general.max_concurrency
+        batch_evaluators = {}
+        for name, evaluator in evaluators.items():
+            if isinstance(evaluator, EvaluatorInfo) and evaluator.supports_streaming:
+                stage = EvaluatorStage(name,
+                                       evaluator,
+                                       queue_size=pipeline_config.queue_size,
+                                       max_concurrency=max_concurrency,
+                                       total=len(self.eval_input.eval_input_items),
+                                       completed=self._restored_evaluator_items.get(name),
+                                       on_result=functools.partial(self._record_evaluator_item, name))
+                stage.start()
+                self.evaluator_stages.append(stage)
+            else:
+                batch_evaluators[name] = evaluator
+
+        return batch_evaluators
+
+    async def submit_to_evaluator_stages(self, index: int, item: EvalInputItem):
+        """Hand a finished item to the evaluator stages, each item is submitted at most once"""
+        if not self.evaluator_stages or index in self._submitted_indices:
+            return
+
+        self._submitted_indices.add(index)
+        for stage in self.evaluator_stages:
+            await stage.submit(index, item)
+
+    async def finish_evaluator_stages(self):
+        """Submit the items the workflow did not run, wait for the stages to drain and store their results"""
+        if not self.evaluator_stages:
+            return
+
+        for index, item in enumerate(self.eval_input.eval_input_items):
+            await self.submit_to_evaluator_stages(index, item)
+
+        results = await asyncio.gather(*[stage.finish() for stage in self.evaluator_stages], return_exceptions=True)
+        for stage, result in zip(self.evaluator_stages, results):
+            if isinstance(result, Exception):
+                logger.error("An error occurred while running evaluator %s: %s", stage.name, result, exc_info=result)
+            else:
+                self.evaluation_results.append((stage.name, result))
+
+    async def close_evaluator_stages(self):
+        await asyncio.gather(*[stage.close() for stage in self.evaluator_stages])
+        self.evaluator_stages = []
+
     async def run_single_evaluator(self, evaluator_name: str, evaluator: Any):
         """Run a single evaluator and store its results."""
+        restored_output = self._restored_evaluator_outputs.get(evaluator_name)
+        if restored_output is not None:
+            logger.info("Using the result of evaluator %s restored from the checkpoint", evaluator_name)
+            self.evaluation_results.append((evaluator_name, restored_output))
+            return
+
         try:
             eval_output = await evaluator.evaluate_fn(self.eval_input)
             self.evaluation_results.append((evaluator_name, eval_output))
+            if self.checkpoint_writer:
+                self.checkpoint_writer.write_evaluator_output(evaluator_name, eval_output)
         except Exception as e:
             logger.exception("An error occurred while running evaluator %s: %s", evaluator_name, e, exc_info=True)
 
@@ -290,20 +503,162 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
             logger.exception("An error occurred while running evaluators: %s", e, exc_info=True)
             raise
 
+    async def run_workflow_and_evaluators(self, config: AIQConfig, session_manager: AIQSessionManager | None = None):
+        """Run the workflow on the loaded dataset and evaluate the results"""
+        from aiq.builder.eval_builder import WorkflowEvalBuilder
+
+        # Record the results as they complete so an interrupted evaluation can be resumed
+        self.open_checkpoint()
+        try:
+            async with WorkflowEvalBuilder.from_config(config=config) as eval_workflow:
+                # Evaluators that score items independently are fed while the workflow runs
+                evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
+                self._mean_of_items_evaluators = [
+                    name for name, evaluator in evaluators.items() if _averages_item_scores(evaluator)
+                ]
+                batch_evaluators = self.start_evaluator_stages(evaluators)
+
+                try:
+                    if self.config.endpoint:
+                        await self.run_workflow_remote()
+                    else:
+                        if not self.config.skip_workflow:
+                            if session_manager is None:
+                                session_manager = AIQSessionManager(
+                                    eval_workflow.build(), max_concurrency=self.eval_config.general.max_concurrency)
+                            await self.run_workflow_local(session_manager)
+
+                    await self.finish_evaluator_stages()
+                finally:
+                    await self.close_evaluator_stages()
+
+                # Evaluators that need the complete dataset
+                if batch_evaluators or not evaluators:
+                    await self.run_evaluators(batch_evaluators)
+        finally:
+            self.close_checkpoint()
+
     def apply_overrides(self):
         from aiq.cli.cli_utils.config_override import load_and_override_config
         from aiq.data_models.config import AIQConfig
-        from aiq.runtime.loader import PluginTypes
-        from aiq.runtime.loader import discover_and_register_plugins
+        from aiq.runtime.loader import register_plugins_for_config
         from aiq.utils.data_models.schema_validator import validate_schema
 
-        # Register plugins before validation
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
         config_dict = load_and_override_config(self.config.config_file, self.config.override)
+
+        # Register plugins before validation
+        register_plugins_for_config(config_dict)
         config = validate_schema(config_dict, AIQConfig)
         return config
 
+    def load_aiq_config(self) -> AIQConfig:
+        """Load the config file, applying the overrides if any"""
+        from aiq.runtime.loader import load_config
+
+        if self.config.override:
+            return self.apply_overrides()
+
+        return load_config(self.config.config_file)
+
+    async def run_shard(self, shard_index: int, num_shards: int, output_dir: Path) -> EvalShardResult:
+        """
+        Run the workflow and the evaluators on a single shard of the dataset, writing the shard's checkpoint and
+        profiler traces to `output_dir`. The shard is merged with the other shards by the coordinating process, which
+        is also responsible for profiling and writing the output files.
+        """
+        config = self.load_aiq_config()
+        self.eval_config = config.eval
+        self.eval_config.general.output_dir = output_dir
+        if self.eval_config.general.output:
+            self.eval_config.general.output.dir = output_dir
+
+        dataset_handler = DatasetHandler(dataset_config=self.eval_config.general.dataset, reps=self.config.reps)
+        eval_input = dataset_handler.get_eval_input_from_dataset(self.config.dataset)
+        indices = get_shard_indices(len(eval_input.eval_input_items), shard_index, num_shards)
+        if not indices:
+            return EvalShardResult(shard_index=shard_index)
+
+        self.eval_input = EvalInput(eval_input_items=[eval_input.eval_input_items[i] for i in indices])
+        logger.info("Evaluating shard %d of %d with %d items", shard_index, num_shards, len(indices))
+
+        await self.run_workflow_and_evaluators(config)
+
+        return EvalShardResult(shard_index=shard_index,
+                               indices=indices,
+                               eval_input_items=self.eval_input.eval_input_items,
+                               evaluation_results=self.evaluation_results,
+                               mean_of_items_evaluators=self._mean_of_items_evaluators,
+                               profiler_trace_path=self.profiler_trace_path,
+                               workflow_interrupted=self.workflow_interrupted)
+
+    async def run_shards(self):
+        """
+        Split the dataset into shards and evaluate each shard in a separate worker process, each with its own event
+        loop, workflow and evaluators. The shard results are merged back into this run.
+        """
+        num_shards = self.config.shards
+        num_workers = self.config.workers or get_default_num_workers(num_shards)
+        shard_config = self.config.model_copy(update={"shards": 1, "workers": None})
+        logger.info("Evaluating %d shards using %d worker processes", num_shards, num_workers)
+
+        # Worker processes are spawned rather than forked, a forked event loop is not safe to use
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=init_shard_worker,
+                                 initargs=(logging.getLogger().getEffectiveLevel(), )) as executor:
+            futures = [
+                loop.run_in_executor(executor,
+                                     run_eval_shard,
+                                     shard_config,
+                                     shard_index,
+                                     num_shards,
+                                     get_shard_output_dir(self.eval_config.general.output_dir, shard_index))
+                for shard_index in range(num_shards)
+            ]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+
+        self.merge_shard_results(results)
+
+    def merge_shard_results(self, results: list[EvalShardResult | BaseException]):
+        """Merge the workflow outputs, evaluator outputs and profiler traces of the shards"""
+        shard_results = []
+        for shard_index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error("Evaluation of shard %d failed: %s", shard_index, result, exc_info=result)
+                self.workflow_interrupted = True
+            else:
+                shard_results.append(result)
+
+        eval_input_items = self.eval_input.eval_input_items
+        evaluator_outputs: dict[str, list[tuple[EvalOutput, int]]] = {}
+        mean_of_items_evaluators = set()
+        for result in shard_results:
+            mean_of_items_evaluators.update(result.mean_of_items_evaluators)
+            for index, item in zip(result.indices, result.eval_input_items):
+                eval_input_items[index] = item
+            for evaluator_name, eval_output in result.evaluation_results:
+                evaluator_outputs.setdefault(evaluator_name, []).append((eval_output, len(result.indices)))
+            self.workflow_interrupted = self.workflow_interrupted or result.workflow_interrupted
+
+        item_order = {checkpoint_key(item.id): index for index, item in enumerate(eval_input_items)}
+        for evaluator_name, shard_outputs in evaluator_outputs.items():
+            merged_output = merge_eval_outputs(shard_outputs,
+                                               item_order,
+                                               mean_of_items=evaluator_name in mean_of_items_evaluators)
+            self.evaluation_results.append((evaluator_name, merged_output))
+
+        # The profiler re-uses the streamed traces only if every shard wrote the traces of all of its items
+        profiler_config = self.eval_config.general.profiler
+        if profiler_config and len(shard_results) == len(results) and all(
+                result.profiler_trace_path or not result.indices for result in shard_results):
+            from aiq.profiler.trace_writer import get_trace_path
+
+            trace_path = get_trace_path(self.eval_config.general.output_dir, compress=profiler_config.compress_traces)
+            num_requests = merge_profiler_traces(shard_results, trace_path, compress=profiler_config.compress_traces)
+            if num_requests == len(eval_input_items):
+                self.profiler_trace_path = trace_path
+
     async def run_and_evaluate(self,
                                session_manager: AIQSessionManager | None = None,
                                job_id: str | None = None) -> EvaluationRunOutput:
@@ -312,19 +667,13 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         """
         logger.info("Starting evaluation run with config file: %s", self.config.config_file)
 
-        from aiq.builder.eval_builder import WorkflowEvalBuilder
-        from aiq.runtime.loader import load_config
-
         # Load and override the config
-        if self.config.override:
-            config = self.apply_overrides()
-        else:
-            config = load_config(self.config.config_file)
+        config = self.load_aiq_config()
         self.eval_config = config.eval
         logger.debug("Loaded evaluation configuration: %s", self.eval_config)
 
-        # Cleanup the output directory
-        if self.eval_config.general.output:
+        # Cleanup the output directory, keeping the checkpoint of the run being resumed
+        if self.eval_config.general.output and not self.config.resume:
             self.cleanup_output_directory()
 
         # Generate a job_id if append_job_id_to_output_dir is enabled and no job_id provided
@@ -332,6 +681,8 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 and self.eval_config.general.output.job_management.append_job_id_to_output_dir and not job_id):
             job_id = "job_" + str(uuid4())
             logger.info("Generated job ID for output directory: %s", job_id)
+            if self.config.resume:
+                logger.warning("A new job ID was generated, the checkpoint of a previous job cannot be resumed.")
 
         # If a job id is provided keep the data per-job
         if job_id:
@@ -361,19 +712,10 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
             )
 
         # Run workflow and evaluate
-        async with WorkflowEvalBuilder.from_config(config=config) as eval_workflow:
-            if self.config.endpoint:
-                await self.run_workflow_remote()
-            else:
-                if not self.config.skip_workflow:
-                    if session_manager is None:
-                        session_manager = AIQSessionManager(eval_workflow.build(),
-                                                            max_concurrency=self.eval_config.general.max_concurrency)
-                    await self.run_workflow_local(session_manager)
-
-            # Evaluate
-            evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
-            await self.run_evaluators(evaluators)
+        if self.config.shards > 1:
+            await self.run_shards()
+        else:
+            await self.run_workflow_and_evaluators(config, session_manager)
 
         # Profile the workflow
         await self.profile_workflow()
@@ -26,6 +26,12 @@ from aiq.eval.evaluator.evaluator_model import EvalOutputItem
 from aiq.eval.utils.tqdm_position_registry import TqdmPositionRegistry
 
 
+def average_numeric_scores(output_items: list[EvalOutputItem]) -> float | None:
+    """Average the numeric scores of the output items rounded to 2 decimals, or None if no item has a numeric score"""
+    numeric_scores = [item.score for item in output_items if isinstance(item.score, (int, float))]
+    return round(sum(numeric_scores) / len(numeric_scores), 2) if numeric_scores else None
+
+
 class BaseEvaluator(ABC):
     """
     Base class for custom evaluators.
@@ -44,6 +50,21 @@ class BaseEvaluator(ABC):
         """Each evaluator must implement this for item-level evaluation"""
         pass
 
+    async def evaluate_item_with_limits(self, item: EvalInputItem) -> EvalOutputItem:
+        """
+        Evaluate a single item within the evaluator's concurrency limit. Errors are reported as an output item with a
+        score of 0.0 instead of being raised so one bad item does not fail the whole evaluation.
+        """
+        async with self.semaphore:
+            try:
+                return await self.evaluate_item(item)
+            except Exception as e:
+                return EvalOutputItem(id=item.id, score=0.0, reasoning={"error": f"Evaluator error: {str(e)}"})
+
+    def aggregate(self, output_items: list[EvalOutputItem]) -> EvalOutput:
+        """Combine item-level outputs into an EvalOutput, averaging the numeric scores"""
+        return EvalOutput(average_score=average_numeric_scores(output_items), eval_output_items=output_items)
+
     async def evaluate(self, eval_input: EvalInput) -> EvalOutput:
         pbar = None
         try:
@@ -51,23 +72,13 @@ class BaseEvaluator(ABC):
             pbar = tqdm(total=len(eval_input.eval_input_items), desc=self.tqdm_desc, position=tqdm_position)
 
             async def wrapped(item):
-                async with self.semaphore:
-                    try:
-                        output_item = await self.evaluate_item(item)
-                        pbar.update(1)
-                        return output_item
-                    except Exception as e:
-                        # If the evaluator fails, return an error item with a score of 0.0
-                        pbar.update(1)
-                        return EvalOutputItem(id=item.id, score=0.0, reasoning={"error": f"Evaluator error: {str(e)}"})
+                output_item = await self.evaluate_item_with_limits(item)
+                pbar.update(1)
+                return output_item
 
             output_items = await asyncio.gather(*[wrapped(item) for item in eval_input.eval_input_items])
         finally:
             pbar.close()
             TqdmPositionRegistry.release(tqdm_position)
 
-        # Compute average if possible
-        numeric_scores = [item.score for item in output_items if isinstance(item.score, (int, float))]
-        avg_score = round(sum(numeric_scores) / len(numeric_scores), 2) if numeric_scores else None
-
-        return EvalOutput(average_score=avg_score, eval_output_items=output_items)
+        return self.aggregate(output_items)
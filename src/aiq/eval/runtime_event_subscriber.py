@@ -32,9 +32,9 @@ def pull_intermediate() -> asyncio.Future[list[dict]]:
     intermediate_steps = []  # We'll store the dumped steps here.
     context = AIQContext.get()
 
-    def on_next_cb(item: IntermediateStep):
+    def on_batch_cb(items: list[IntermediateStep]):
         # Append each new intermediate step (dumped to dict) to the list.
-        intermediate_steps.append(item.model_dump())
+        intermediate_steps.extend(item.model_dump() for item in items)
 
     def on_error_cb(exc: Exception):
         logger.error("Hit on_error: %s", exc)
@@ -46,7 +46,9 @@ def pull_intermediate() -> asyncio.Future[list[dict]]:
         if not future.done():
             future.set_result(intermediate_steps)
 
-    # Subscribe with our callbacks.
-    context.intermediate_step_manager.subscribe(on_next=on_next_cb, on_error=on_error_cb, on_complete=on_complete_cb)
+    # Subscribe with our callbacks, the steps are received in batches to keep the dumping off the hot path.
+    context.intermediate_step_manager.subscribe_batch(on_batch=on_batch_cb,
+                                                      on_error=on_error_cb,
+                                                      on_complete=on_complete_cb)
 
     return future
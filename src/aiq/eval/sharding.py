@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from aiq.eval.config import EvaluationRunConfig
+from aiq.eval.evaluator.base_evaluator import average_numeric_scores
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+
+logger = logging.getLogger(__name__)
+
+
+class EvalShardResult(BaseModel):
+    """
+    Results of evaluating a single shard, returned from the shard's worker process to the coordinating process.
+    """
+    shard_index: int
+    # positions of the shard's items in the full dataset
+    indices: list[int] = []
+    eval_input_items: list[EvalInputItem] = []
+    evaluation_results: list[tuple[str, EvalOutput]] = []
+    # evaluators whose average score is the mean of their item scores, see `merge_eval_outputs`
+    mean_of_items_evaluators: list[str] = []
+    # profiler traces of the shard, numbered by the position of the item within the shard
+    profiler_trace_path: Path | None = None
+    workflow_interrupted: bool = False
+
+
+def get_shard_indices(num_items: int, shard_index: int, num_shards: int) -> list[int]:
+    """
+    Return the positions of the dataset items assigned to a shard. Items are assigned round-robin so the shards are
+    balanced, and the assignment only depends on the dataset order which keeps it stable across runs.
+    """
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(f"Shard index {shard_index} is out of range for {num_shards} shards")
+
+    return list(range(shard_index, num_items, num_shards))
+
+
+def get_shard_output_dir(output_dir: str | Path, shard_index: int) -> Path:
+    """
+    Return the output directory of a shard. Each shard keeps its checkpoint and traces under the run output directory.
+    """
+    return Path(output_dir) / "shards" / f"shard_{shard_index}"
+
+
+def merge_eval_outputs(shard_outputs: list[tuple[EvalOutput, int]],
+                       item_order: dict[str, int],
+                       mean_of_items: bool = False) -> EvalOutput:
+    """
+    Merge the output of an evaluator across shards.
+
+    `shard_outputs` holds the output of each shard along with the number of dataset items in that shard. The output
+    items are ordered by their position in the dataset as given by `item_order`.
+
+    If `mean_of_items` is set, the evaluator's average score is the mean of its numeric item scores as computed by
+    `BaseEvaluator.aggregate`, and the merged average is recomputed from the merged items the same way. Otherwise the
+    evaluator computes its average on its own, such as RAGAS or SWE-bench, and the merged average is the mean of the
+    shard averages weighted by the number of items each shard evaluated.
+    """
+    output_items = []
+    for eval_output, _ in shard_outputs:
+        output_items.extend(eval_output.eval_output_items)
+    output_items.sort(key=lambda item: item_order.get(str(item.id), len(item_order)))
+
+    if mean_of_items:
+        return EvalOutput(average_score=average_numeric_scores(output_items), eval_output_items=output_items)
+
+    weighted_sum = 0.0
+    total_weight = 0
+    for eval_output, num_items in shard_outputs:
+        weight = len(eval_output.eval_output_items) or num_items
+        if isinstance(eval_output.average_score, (int, float)) and weight:
+            weighted_sum += eval_output.average_score * weight
+            total_weight += weight
+    average_score = weighted_sum / total_weight if total_weight else None
+
+    return EvalOutput(average_score=average_score, eval_output_items=output_items)
+
+
+def merge_profiler_traces(shard_results: list[EvalShardResult], path: Path, compress: bool = False) -> int:
+    """
+    Merge the profiler traces streamed by each shard into a single trace file at `path`, renumbering the requests by
+    their position in the full dataset. Returns the number of requests written.
+    """
+    from aiq.profiler.trace_writer import ProfilerTraceWriter
+    from aiq.profiler.trace_writer import iter_profiler_traces
+
+    with ProfilerTraceWriter(path, compress=compress) as writer:
+        for result in shard_results:
+            if result.profiler_trace_path is None:
+                continue
+            for request_number, steps in iter_profiler_traces(result.profiler_trace_path):
+                writer.write_request(result.indices[request_number], steps)
+
+        return writer.num_requests
+
+
+def init_shard_worker(log_level: int):
+    """Worker processes are spawned without the logging configuration of the parent"""
+    logging.basicConfig(level=log_level)
+
+
+def run_eval_shard(config: EvaluationRunConfig, shard_index: int, num_shards: int, output_dir: Path) -> EvalShardResult:
+    """
+    Entry point of a shard's worker process. Each shard runs in its own event loop with its own workflow and
+    evaluator builders.
+    """
+    from aiq.eval.evaluate import EvaluationRun
+
+    return asyncio.run(EvaluationRun(config).run_shard(shard_index, num_shards, output_dir))
+
+
+def get_default_num_workers(num_shards: int) -> int:
+    """One worker per shard, limited to the number of CPUs"""
+    return max(1, min(num_shards, os.cpu_count() or 1))
@@ -37,4 +37,8 @@ async def register_trajectory_evaluator(config: TrajectoryEvaluatorConfig, build
 
     _evaluator = TrajectoryEvaluator(llm, tools, builder.get_max_concurrency())
 
-    yield EvaluatorInfo(config=config, evaluate_fn=_evaluator.evaluate, description="Trajectory Evaluator")
+    yield EvaluatorInfo(config=config,
+                        evaluate_fn=_evaluator.evaluate,
+                        description="Trajectory Evaluator",
+                        evaluate_item_fn=_evaluator.evaluate_item_with_limits,
+                        aggregate_fn=_evaluator.aggregate)
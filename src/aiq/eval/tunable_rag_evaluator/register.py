@@ -49,4 +49,8 @@ async def register_tunable_rag_evaluator(config: TunableRagEvaluatorConfig, buil
                                     config.default_scoring,
                                     config.default_score_weights)
 
-    yield EvaluatorInfo(config=config, evaluate_fn=evaluator.evaluate, description="Tunable RAG Evaluator")
+    yield EvaluatorInfo(config=config,
+                        evaluate_fn=evaluator.evaluate,
+                        description="Tunable RAG Evaluator",
+                        evaluate_item_fn=evaluator.evaluate_item_with_limits,
+                        aggregate_fn=evaluator.aggregate)
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from tqdm import tqdm
+
+from aiq.builder.evaluator import EvaluatorInfo
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+from aiq.eval.utils.tqdm_position_registry import TqdmPositionRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class EvaluatorStage:
+    """
+    Scores items with a single evaluator while the workflow is still running.
+
+    Finished items are submitted to a bounded queue which is drained by `max_concurrency` worker tasks. When the queue
+    is full `submit` blocks, applying backpressure to the workflow. Each item is identified by its index in the
+    dataset, and `finish` returns the aggregated output with the items in dataset order regardless of the order in
+    which they were scored.
+
+    Items listed in `completed` were scored by a previous run and are not evaluated again. `on_result` is called with
+    the index and output of every newly scored item.
+    """
+
+    def __init__(self,
+                 name: str,
+                 evaluator: EvaluatorInfo,
+                 queue_size: int,
+                 max_concurrency: int,
+                 total: int,
+                 completed: dict[int, EvalOutputItem] | None = None,
+                 on_result: Callable[[int, EvalOutputItem], None] | None = None):
+        if not evaluator.supports_streaming:
+            raise ValueError(f"Evaluator {name} does not support item-level evaluation")
+
+        self.name = name
+        self._evaluator = evaluator
+        self._queue: asyncio.Queue[tuple[int, EvalInputItem]] = asyncio.Queue(maxsize=queue_size)
+        self._max_concurrency = max_concurrency
+        self._total = total
+        self._results: dict[int, EvalOutputItem] = dict(completed or {})
+        self._completed = frozenset(self._results)
+        self._on_result = on_result
+        self._workers: list[asyncio.Task] = []
+        self._pbar: tqdm | None = None
+        self._tqdm_position: int | None = None
+
+    def start(self):
+        self._tqdm_position = TqdmPositionRegistry.claim()
+        self._pbar = tqdm(total=self._total,
+                          initial=len(self._completed),
+                          desc=f"Evaluating {self.name}",
+                          position=self._tqdm_position)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._max_concurrency)]
+
+    async def submit(self, index: int, item: EvalInputItem):
+        """Queue an item for evaluation, waiting for space in the queue if the evaluator is falling behind"""
+        if index in self._completed:
+            return
+
+        await self._queue.put((index, item))
+
+    async def _worker(self):
+        while True:
+            index, item = await self._queue.get()
+            try:
+                self._results[index] = await self._evaluator.evaluate_item_fn(item)
+            except Exception as e:
+                logger.exception("Evaluator %s failed on item %s: %s", self.name, item.id, e, exc_info=True)
+                self._results[index] = EvalOutputItem(id=item.id,
+                                                      score=0.0,
+                                                      reasoning={"error": f"Evaluator error: {str(e)}"})
+            try:
+                if self._on_result is not None:
+                    self._on_result(index, self._results[index])
+            except Exception as e:
+                logger.exception("Failed to record the result of evaluator %s: %s", self.name, e, exc_info=True)
+            finally:
+                self._pbar.update(1)
+                self._queue.task_done()
+
+    async def finish(self) -> EvalOutput:
+        """Wait for all submitted items to be scored and aggregate the results"""
+        await self._queue.join()
+        await self.close()
+
+        return self._evaluator.aggregate_fn([self._results[i] for i in sorted(self._results)])
+
+    async def close(self):
+        """Stop the worker tasks, discarding any items that were not scored yet. Safe to call more than once."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        if self._pbar is not None:
+            self._pbar.close()
+            self._pbar = None
+            TqdmPositionRegistry.release(self._tqdm_position)
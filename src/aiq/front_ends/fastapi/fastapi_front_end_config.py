@@ -176,6 +176,11 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
     max_running_async_jobs: int = Field(default=10,
                                         description="Maximum number of async jobs to run concurrently",
                                         ge=1)
+    job_store_path: str | None = Field(
+        default=None,
+        description=("Path of a SQLite database used to store async evaluation and generation jobs. Jobs stored in the "
+                     "database persist across restarts and are shared by all workers. If None, jobs are kept in "
+                     "memory by each worker."))
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
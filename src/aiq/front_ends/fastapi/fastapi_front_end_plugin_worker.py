@@ -27,6 +27,7 @@ from pathlib import Path
 from fastapi import BackgroundTasks
 from fastapi import Body
 from fastapi import FastAPI
+from fastapi import Query
 from fastapi import Request
 from fastapi import Response
 from fastapi.exceptions import HTTPException
@@ -52,6 +53,8 @@ from aiq.front_ends.fastapi.fastapi_front_end_config import AIQEvaluateStatusRes
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.job_store import JobInfo
 from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.front_ends.fastapi.job_store import SQLiteJobStore
 from aiq.front_ends.fastapi.response_helpers import generate_single_response
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
@@ -169,16 +172,16 @@ class RouteInfo(BaseModel):
 class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
     @staticmethod
-    async def _periodic_cleanup(name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    async def _periodic_cleanup(name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         while True:
             try:
-                job_store.cleanup_expired_jobs()
+                await asyncio.to_thread(job_store.cleanup_expired_jobs)
                 logger.debug("Expired %s jobs cleaned up", name)
             except Exception as e:
                 logger.error("Error during %s job cleanup: %s", name, e)
             await asyncio.sleep(sleep_time_sec)
 
-    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         # Schedule periodic cleanup of expired jobs on first job creation
         attr_name = f"{name}_cleanup_task"
 
@@ -194,6 +197,15 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                             self._periodic_cleanup(name=name, job_store=job_store, sleep_time_sec=sleep_time_sec)))
                     self._cleanup_tasks.append(attr_name)
 
+    def create_job_store(self, name: str) -> JobStoreBase:
+        """
+        Create the store tracking the async jobs of type `name`. Override to provide a different job store.
+        """
+        if self.front_end_config.job_store_path:
+            return SQLiteJobStore(self.front_end_config.job_store_path, namespace=name)
+
+        return JobStore()
+
     def get_step_adaptor(self) -> StepAdaptor:
 
         return StepAdaptor(self.front_end_config.step_adaptor)
@@ -235,7 +247,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking evaluation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store("async_evaluation")
         # Don't run multiple evaluations at the same time
         evaluation_lock = asyncio.Lock()
 
@@ -247,20 +259,20 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     eval_config = EvaluationRunConfig(config_file=Path(config_file), dataset=None, reps=reps)
 
                     # Create a new EvaluationRun with the evaluation-specific config
-                    job_store.update_status(job_id, "running")
+                    await asyncio.to_thread(job_store.update_status, job_id, "running")
                     eval_runner = EvaluationRun(eval_config)
                     output: EvaluationRunOutput = await eval_runner.run_and_evaluate(session_manager=session_manager,
                                                                                      job_id=job_id)
                     if output.workflow_interrupted:
-                        job_store.update_status(job_id, "interrupted")
+                        await asyncio.to_thread(job_store.update_status, job_id, "interrupted")
                     else:
                         parent_dir = os.path.dirname(
                             output.workflow_output_file) if output.workflow_output_file else None
 
-                        job_store.update_status(job_id, "success", output_path=str(parent_dir))
+                        await asyncio.to_thread(job_store.update_status, job_id, "success", output_path=str(parent_dir))
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, str(e))
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await asyncio.to_thread(job_store.update_status, job_id, "failure", error=str(e))
 
         async def start_evaluation(request: AIQEvaluateRequest,
                                    background_tasks: BackgroundTasks,
@@ -271,11 +283,14 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 # if job_id is present and already exists return the job info
                 if request.job_id:
-                    job = job_store.get_job(request.job_id)
+                    job = await asyncio.to_thread(job_store.get_job, request.job_id)
                     if job:
                         return AIQEvaluateResponse(job_id=job.job_id, status=job.status)
 
-                job_id = job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
+                job_id = await asyncio.to_thread(job_store.create_job,
+                                                 request.config_file,
+                                                 request.job_id,
+                                                 request.expiry_seconds)
                 await self.create_cleanup_task(app=app, name="async_evaluation", job_store=job_store)
                 background_tasks.add_task(run_evaluation, job_id, request.config_file, request.reps, session_manager)
 
@@ -298,7 +313,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await asyncio.to_thread(job_store.get_job, job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -311,24 +326,28 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_last_job()
+                job = await asyncio.to_thread(job_store.get_last_job)
                 if not job:
                     logger.warning("No jobs found when requesting last job status")
                     raise HTTPException(status_code=404, detail="No jobs found")
                 logger.info("Found last job %s with status %s", job.job_id, job.status)
                 return translate_job_to_response(job)
 
-        async def get_jobs(http_request: Request, status: str | None = None) -> list[AIQEvaluateStatusResponse]:
-            """Get all jobs, optionally filtered by status."""
+        async def get_jobs(
+            http_request: Request,
+            status: str | None = None,
+            limit: int | None = Query(default=None, ge=1),
+            offset: int = Query(default=0, ge=0)
+        ) -> list[AIQEvaluateStatusResponse]:
+            """Get all jobs, optionally filtered by status and paginated with limit and offset."""
 
             async with session_manager.session(request=http_request):
 
                 if status is None:
                     logger.info("Getting all jobs")
-                    jobs = job_store.get_all_jobs()
                 else:
                     logger.info("Getting jobs with status %s", status)
-                    jobs = job_store.get_jobs_by_status(status)
+                jobs = await asyncio.to_thread(job_store.list_jobs, status=status, limit=limit, offset=offset)
                 logger.info("Found %d jobs", len(jobs))
                 return [translate_job_to_response(job) for job in jobs]
 
@@ -431,7 +450,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking async generation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store("async_generation")
 
         # Run up to max_running_async_jobs jobs at the same time
         async_job_concurrency = asyncio.Semaphore(self._front_end_config.max_running_async_jobs)
@@ -543,14 +562,14 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     result = await generate_single_response(payload=payload,
                                                             session_manager=session_manager,
                                                             result_type=result_type)
-                    job_store.update_status(job_id, "success", output=result)
+                    await asyncio.to_thread(job_store.update_status, job_id, "success", output=result)
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, e)
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await asyncio.to_thread(job_store.update_status, job_id, "failure", error=str(e))
 
         def _job_status_to_response(job: JobInfo) -> AIQAsyncGenerationStatusResponse:
             job_output = job.output
-            if job_output is not None:
+            if isinstance(job_output, BaseModel):
                 job_output = job_output.model_dump()
             return AIQAsyncGenerationStatusResponse(job_id=job.job_id,
                                                     status=job.status,
@@ -571,11 +590,13 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     # if job_id is present and already exists return the job info
                     if request.job_id:
-                        job = job_store.get_job(request.job_id)
+                        job = await asyncio.to_thread(job_store.get_job, request.job_id)
                         if job:
                             return AIQAsyncGenerateResponse(job_id=job.job_id, status=job.status)
 
-                    job_id = job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
+                    job_id = await asyncio.to_thread(job_store.create_job,
+                                                     job_id=request.job_id,
+                                                     expiry_seconds=request.expiry_seconds)
                     await self.create_cleanup_task(app=app, name="async_generation", job_store=job_store)
 
                     # The fastapi/starlette background tasks won't begin executing until after the response is sent
@@ -595,7 +616,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     now = time.time()
                     sync_timeout = now + request.sync_timeout
                     while time.time() < sync_timeout:
-                        job = job_store.get_job(job_id)
+                        job = await asyncio.to_thread(job_store.get_job, job_id)
                         if job is not None and job.status not in job_store.ACTIVE_STATUS:
                             # If the job is done, return the result
                             response.status_code = 200
@@ -615,7 +636,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await asyncio.to_thread(job_store.get_job, job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
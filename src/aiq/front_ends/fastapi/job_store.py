@@ -13,10 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import os
 import shutil
+import sqlite3
 import threading
+import typing
+from abc import ABC
+from abc import abstractmethod
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -47,10 +52,24 @@ class JobInfo(BaseModel):
     created_at: datetime
     updated_at: datetime
     expiry_seconds: int
-    output: BaseModel | None = None
+    output: typing.Any = None
 
 
-class JobStore:
+def _remove_job_output(job: JobInfo):
+    if job.output_path:
+        logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
+        # If it is a file remove it
+        if os.path.isfile(job.output_path):
+            os.remove(job.output_path)
+        # If it is a directory remove it
+        elif os.path.isdir(job.output_path):
+            shutil.rmtree(job.output_path)
+
+
+class JobStoreBase(ABC):
+    """
+    Base class for stores tracking the status of async jobs.
+    """
 
     MIN_EXPIRY = 600  # 10 minutes
     MAX_EXPIRY = 86400  # 24 hours
@@ -59,6 +78,76 @@ class JobStore:
     # active jobs are exempt from expiry
     ACTIVE_STATUS = {"running", "submitted"}
 
+    def _clamp_expiry(self, job_id: str, expiry_seconds: int) -> int:
+        clamped_expiry = max(self.MIN_EXPIRY, min(expiry_seconds, self.MAX_EXPIRY))
+        if expiry_seconds != clamped_expiry:
+            logger.info("Clamped expiry_seconds from %d to %d for job %s", expiry_seconds, clamped_expiry, job_id)
+
+        return clamped_expiry
+
+    @abstractmethod
+    def create_job(self,
+                   config_file: str | None = None,
+                   job_id: str | None = None,
+                   expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+        pass
+
+    @abstractmethod
+    def update_status(self,
+                      job_id: str,
+                      status: str,
+                      error: str | None = None,
+                      output_path: str | None = None,
+                      output: BaseModel | None = None):
+        pass
+
+    def get_status(self, job_id: str) -> JobInfo | None:
+        return self.get_job(job_id)
+
+    @abstractmethod
+    def list_jobs(self, status: str | None = None, limit: int | None = None, offset: int = 0) -> list[JobInfo]:
+        """
+        List jobs ordered by creation time, optionally filtered by status and paginated with `limit` and `offset`.
+        """
+        pass
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> JobInfo | None:
+        """Get a job by its ID."""
+        pass
+
+    @abstractmethod
+    def get_last_job(self) -> JobInfo | None:
+        """Get the last created job."""
+        pass
+
+    def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status."""
+        return self.list_jobs(status=status)
+
+    def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store."""
+        return self.list_jobs()
+
+    def get_expires_at(self, job: JobInfo) -> datetime | None:
+        """Get the time for a job to expire."""
+        if job.status in self.ACTIVE_STATUS:
+            return None
+        return job.updated_at + timedelta(seconds=job.expiry_seconds)
+
+    @abstractmethod
+    def cleanup_expired_jobs(self):
+        """
+        Cleanup expired jobs, keeping the most recent one.
+        """
+        pass
+
+
+class JobStore(JobStoreBase):
+    """
+    In-memory job store, jobs are lost when the server restarts and are not shared between workers.
+    """
+
     def __init__(self):
         self._jobs = {}
         self._lock = threading.Lock()  # Ensure thread safety for job operations
@@ -66,13 +155,11 @@ class JobStore:
     def create_job(self,
                    config_file: str | None = None,
                    job_id: str | None = None,
-                   expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+                   expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
         if job_id is None:
             job_id = str(uuid4())
 
-        clamped_expiry = max(self.MIN_EXPIRY, min(expiry_seconds, self.MAX_EXPIRY))
-        if expiry_seconds != clamped_expiry:
-            logger.info("Clamped expiry_seconds from %d to %d for job %s", expiry_seconds, clamped_expiry, job_id)
+        clamped_expiry = self._clamp_expiry(job_id, expiry_seconds)
 
         job = JobInfo(job_id=job_id,
                       status=JobStatus.SUBMITTED,
@@ -106,13 +193,14 @@ class JobStore:
             job.updated_at = datetime.now(UTC)
             job.output = output
 
-    def get_status(self, job_id: str) -> JobInfo | None:
+    def list_jobs(self, status: str | None = None, limit: int | None = None, offset: int = 0) -> list[JobInfo]:
         with self._lock:
-            return self._jobs.get(job_id)
+            jobs = [job for job in self._jobs.values() if status is None or job.status == status]
 
-    def list_jobs(self):
-        with self._lock:
-            return self._jobs
+        jobs.sort(key=lambda job: job.created_at)
+        if limit is None:
+            return jobs[offset:]
+        return jobs[offset:offset + limit]
 
     def get_job(self, job_id: str) -> JobInfo | None:
         """Get a job by its ID."""
@@ -129,22 +217,6 @@ class JobStore:
             logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
             return last_job
 
-    def get_jobs_by_status(self, status: str) -> list[JobInfo]:
-        """Get all jobs with the specified status."""
-        with self._lock:
-            return [job for job in self._jobs.values() if job.status == status]
-
-    def get_all_jobs(self) -> list[JobInfo]:
-        """Get all jobs in the store."""
-        with self._lock:
-            return list(self._jobs.values())
-
-    def get_expires_at(self, job: JobInfo) -> datetime | None:
-        """Get the time for a job to expire."""
-        if job.status in self.ACTIVE_STATUS:
-            return None
-        return job.updated_at + timedelta(seconds=job.expiry_seconds)
-
     def cleanup_expired_jobs(self):
         """
         Cleanup expired jobs, keeping the most recent one.
@@ -169,15 +241,193 @@ class JobStore:
             if expires_at and now > expires_at:
                 expired_ids.append(job_id)
                 # cleanup output dir if present
-                if job.output_path:
-                    logger.info("Cleaning up output directory for job %s at %s", job_id, job.output_path)
-                    # If it is a file remove it
-                    if os.path.isfile(job.output_path):
-                        os.remove(job.output_path)
-                    # If it is a directory remove it
-                    elif os.path.isdir(job.output_path):
-                        shutil.rmtree(job.output_path)
+                _remove_job_output(job)
 
         with self._lock:
             for job_id in expired_ids:
                 del self._jobs[job_id]
+
+
+class SQLiteJobStore(JobStoreBase):
+    """
+    Job store persisted in a SQLite database using write-ahead logging.
+
+    Jobs survive server restarts and can be shared by several workers, or processes, using the same database file.
+    Jobs are indexed by status, creation time and expiry time, allowing paginated listing and expiry sweeps without
+    scanning every job. Several stores can share one database by using different `namespace` values.
+
+    The output of a job is stored as JSON, so jobs read back from the store hold the serialized output rather than
+    the original object.
+
+    Every method blocks on the database, for up to `busy_timeout` seconds while another worker holds the write lock,
+    async callers should therefore run them in a thread, e.g. with `asyncio.to_thread`.
+    """
+
+    def __init__(self, path: str | os.PathLike, namespace: str = "default", busy_timeout: float = 5.0):
+        self._path = str(path)
+        self._namespace = namespace
+        self._lock = threading.Lock()
+
+        if self._path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self._path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    namespace TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    config_file TEXT,
+                    error TEXT,
+                    output_path TEXT,
+                    output TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    expiry_seconds INTEGER NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (namespace, job_id)
+                );
+                CREATE INDEX IF NOT EXISTS jobs_created_at ON jobs (namespace, created_at);
+                CREATE INDEX IF NOT EXISTS jobs_status ON jobs (namespace, status, created_at);
+                CREATE INDEX IF NOT EXISTS jobs_expires_at ON jobs (namespace, expires_at) WHERE expires_at IS NOT NULL;
+                CREATE INDEX IF NOT EXISTS jobs_finished_updated_at ON jobs (namespace, updated_at)
+                    WHERE expires_at IS NOT NULL;
+                """)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, sql: str, parameters: typing.Sequence = ()) -> int:
+        """Execute a statement and return the number of rows it modified."""
+        with self._lock:
+            return self._conn.execute(sql, parameters).rowcount
+
+    def _fetchall(self, sql: str, parameters: typing.Sequence = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, parameters).fetchall()
+
+    def _fetchone(self, sql: str, parameters: typing.Sequence = ()) -> sqlite3.Row | None:
+        with self._lock:
+            return self._conn.execute(sql, parameters).fetchone()
+
+    @staticmethod
+    def _serialize_output(output: typing.Any) -> str | None:
+        if output is None:
+            return None
+        if isinstance(output, BaseModel):
+            return output.model_dump_json()
+        return json.dumps(output, default=str)
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> JobInfo:
+        return JobInfo(job_id=row["job_id"],
+                       status=row["status"],
+                       config_file=row["config_file"],
+                       error=row["error"],
+                       output_path=row["output_path"],
+                       output=json.loads(row["output"]) if row["output"] is not None else None,
+                       created_at=datetime.fromtimestamp(row["created_at"], UTC),
+                       updated_at=datetime.fromtimestamp(row["updated_at"], UTC),
+                       expiry_seconds=row["expiry_seconds"])
+
+    def create_job(self,
+                   config_file: str | None = None,
+                   job_id: str | None = None,
+                   expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        if job_id is None:
+            job_id = str(uuid4())
+
+        clamped_expiry = self._clamp_expiry(job_id, expiry_seconds)
+        now = datetime.now(UTC).timestamp()
+
+        self._execute(
+            "INSERT OR REPLACE INTO jobs (namespace, job_id, status, config_file, created_at, updated_at, "
+            "expiry_seconds) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self._namespace, job_id, JobStatus.SUBMITTED.value, config_file, now, now, clamped_expiry))
+
+        logger.info("Created new job %s with config %s", job_id, config_file)
+        return job_id
+
+    def update_status(self,
+                      job_id: str,
+                      status: str,
+                      error: str | None = None,
+                      output_path: str | None = None,
+                      output: BaseModel | None = None):
+        status = status.value if isinstance(status, JobStatus) else status
+        now = datetime.now(UTC).timestamp()
+        expires_at = None if status in self.ACTIVE_STATUS else now
+
+        # expires_at is offset by the expiry of the job within the statement
+        updated = self._execute(
+            "UPDATE jobs SET status = ?, error = ?, output_path = ?, output = ?, updated_at = ?, "
+            "expires_at = ? + expiry_seconds WHERE namespace = ? AND job_id = ?",
+            (status, error, output_path, self._serialize_output(output), now, expires_at, self._namespace, job_id))
+
+        if updated == 0:
+            raise ValueError(f"Job {job_id} not found")
+
+    def list_jobs(self, status: str | None = None, limit: int | None = None, offset: int = 0) -> list[JobInfo]:
+        sql = "SELECT * FROM jobs WHERE namespace = ?"
+        parameters: list = [self._namespace]
+        if status is not None:
+            sql += " AND status = ?"
+            parameters.append(status)
+
+        sql += " ORDER BY created_at LIMIT ? OFFSET ?"
+        parameters.extend([-1 if limit is None else limit, offset])
+
+        return [self._row_to_job(row) for row in self._fetchall(sql, parameters)]
+
+    def get_job(self, job_id: str) -> JobInfo | None:
+        row = self._fetchone("SELECT * FROM jobs WHERE namespace = ? AND job_id = ?", (self._namespace, job_id))
+        return self._row_to_job(row) if row is not None else None
+
+    def get_last_job(self) -> JobInfo | None:
+        row = self._fetchone("SELECT * FROM jobs WHERE namespace = ? ORDER BY created_at DESC LIMIT 1",
+                             (self._namespace, ))
+        if row is None:
+            logger.info("No jobs found in job store")
+            return None
+
+        last_job = self._row_to_job(row)
+        logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
+        return last_job
+
+    def cleanup_expired_jobs(self):
+        """
+        Cleanup expired jobs, keeping the most recently updated finished job.
+
+        The expired jobs are selected and deleted within a single transaction using the expiry index, when several
+        workers share the database only the worker deleting a job removes its output.
+        """
+        now = datetime.now(UTC).timestamp()
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT * FROM jobs WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at < ? "
+                    "AND job_id IS NOT (SELECT job_id FROM jobs WHERE namespace = ? AND expires_at IS NOT NULL "
+                    "ORDER BY updated_at DESC LIMIT 1)", (self._namespace, now, self._namespace)).fetchall()
+                self._conn.executemany("DELETE FROM jobs WHERE namespace = ? AND job_id = ?",
+                                       [(self._namespace, row["job_id"]) for row in rows])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        for row in rows:
+            _remove_job_output(self._row_to_job(row))
+
+        if rows:
+            logger.info("Removed %d expired jobs", len(rows))
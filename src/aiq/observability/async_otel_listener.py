@@ -13,21 +13,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextvars
+import dataclasses
 import json
 import logging
+import os
 import re
+import threading
+import time
 import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from contextlib import contextmanager
 from typing import Any
 
 from openinference.semconv.trace import OpenInferenceSpanKindValues
 from openinference.semconv.trace import SpanAttributes
-from pydantic import TypeAdapter
 
 from aiq.builder.context import AIQContextState
+from aiq.data_models.config import SpanOverflowPolicy
+from aiq.data_models.config import SpanQueueConfig
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.observability.payload_serializer import PayloadSerializer
+from aiq.observability.payload_serializer import get_payload_serializer
+from aiq.observability.sampling import TraceSampler
+from aiq.observability.sampling import get_trace_sampler
 from aiq.utils.optional_imports import TelemetryOptionalImportError
 from aiq.utils.optional_imports import try_import_opentelemetry
 
@@ -75,6 +88,51 @@ except TelemetryOptionalImportError:
     Span = DummySpan
     set_span_in_context = dummy_set_span_in_context
 
+_span_queue_config = SpanQueueConfig()
+
+_span_executor: ThreadPoolExecutor | None = None
+_span_executor_pid: int | None = None
+_span_executor_lock = threading.Lock()
+
+
+def get_span_queue_config() -> SpanQueueConfig:
+    """Return the queue configuration used by listeners which were not given one explicitly"""
+    return _span_queue_config
+
+
+def set_span_queue_config(config: SpanQueueConfig):
+    global _span_queue_config  # pylint: disable=global-statement
+
+    _span_queue_config = config
+
+
+@dataclasses.dataclass(frozen=True)
+class SpanListenerSettings:
+    """
+    Telemetry settings of a workflow, applied to the span listener of each of its runs. Settings which are not set
+    fall back to the process-wide defaults.
+    """
+    payload_serializer: PayloadSerializer | None = None
+    queue_config: SpanQueueConfig | None = None
+    sampler: TraceSampler | None = None
+
+
+def _get_span_executor() -> ThreadPoolExecutor:
+    """
+    Spans of every listener in the process are built by a single background thread, which keeps the events of a
+    listener in order. The executor is re-created in a forked child process since threads do not survive a fork.
+    """
+    global _span_executor, _span_executor_pid  # pylint: disable=global-statement
+
+    pid = os.getpid()
+    if _span_executor is None or _span_executor_pid != pid:
+        with _span_executor_lock:
+            if _span_executor is None or _span_executor_pid != pid:
+                _span_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aiq_span_listener")
+                _span_executor_pid = pid
+
+    return _span_executor
+
 
 def merge_dicts(dict1: dict, dict2: dict) -> dict:
     """
@@ -112,15 +170,50 @@ class AsyncOtelSpanListener:
     - On FUNCTION_END => close the function's top-level span
 
     This runs fully independently from the normal AIQ Toolkit workflow, so that
-    the workflow is not blocking or entangled by OTel calls.
+    the workflow is not blocking or entangled by OTel calls. Events are queued
+    and turned into spans on a background thread; when the bounded queue is
+    full the configured overflow policy drops events or blocks the emitting
+    thread. Events emitted from the event loop thread are never blocked on,
+    since that would stall every coroutine running on the loop, the block
+    policy drops them instead.
+
+    With tail sampling the events are buffered instead, and only turned into
+    spans once the workflow has finished if the sampler keeps its trace.
     """
 
-    def __init__(self, context_state: AIQContextState | None = None):
+    def __init__(self,
+                 context_state: AIQContextState | None = None,
+                 payload_serializer: PayloadSerializer | None = None,
+                 queue_config: SpanQueueConfig | None = None,
+                 sampler: TraceSampler | None = None):
         """
         :param context_state: Optionally supply a specific AIQContextState.
                               If None, uses the global singleton.
+        :param payload_serializer: Optionally supply the serializer used for span payloads.
+                                   If None, uses the process-wide default serializer.
+        :param queue_config: Optionally supply how events are queued before being turned into spans.
+                             If None, uses the process-wide default configuration.
+        :param sampler: Optionally supply the sampler deciding whether the trace is exported once finished.
+                        If None, uses the process-wide default sampler.
         """
         self._context_state = context_state or AIQContextState.get()
+        self._payload_serializer = payload_serializer
+        self._queue_config = queue_config or get_span_queue_config()
+        self._sampler = sampler or get_trace_sampler()
+
+        # Events held back until the tail sampling decision, None when tail sampling is disabled
+        self._tail_buffer: list[tuple[IntermediateStep, contextvars.Context | None]] | None = None
+
+        # Events waiting to be processed by the background thread, along with the context they were emitted in
+        self._queue: deque[tuple[IntermediateStep, contextvars.Context | None]] = deque()
+        self._drain_scheduled = False
+        self._space_available = threading.Event()
+
+        # Events dropped because the queue was full, and the steps whose start event was dropped
+        self._dropped_events = 0
+        # Events dropped by the block policy because they were emitted on the event loop thread, which is never blocked
+        self._dropped_on_loop_events = 0
+        self._dropped_uuids: set[str] = set()
 
         # Maintain a subscription so we can unsubscribe on shutdown
         self._subscription = None
@@ -154,16 +247,159 @@ class AsyncOtelSpanListener:
                 # Weave is not initialized, so we don't do anything
                 pass
 
+    @property
+    def dropped_events(self) -> int:
+        """Number of events which were not turned into spans because the queue was full"""
+        return self._dropped_events
+
     def _on_next(self, step: IntermediateStep) -> None:
+        """
+        Queue the step to be processed by the background thread, or process it inline if background processing is
+        disabled.
+        """
+        # Weave links its calls to the caller's current call, which is tracked in a context variable
+        context = contextvars.copy_context() if self.gc is not None else None
+
+        if self._tail_buffer is not None:
+            self._tail_buffer.append((step, context))
+            return
+
+        if not self._queue_config.background:
+            self._process_step(step)
+            return
+
+        queue = self._queue
+        if len(queue) >= self._queue_config.max_queue_size:
+            policy = self._queue_config.overflow_policy
+            if policy == SpanOverflowPolicy.BLOCK and self._wait_for_space():
+                pass
+            elif policy == SpanOverflowPolicy.DROP_OLDEST:
+                try:
+                    self._drop(queue.popleft()[0])
+                except IndexError:
+                    pass
+            else:
+                # the block policy falls back to dropping the new event on the event loop thread
+                if policy == SpanOverflowPolicy.BLOCK:
+                    self._dropped_on_loop_events += 1
+                self._drop(step)
+                return
+
+        queue.append((step, context))
+
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            _get_span_executor().submit(self._drain)
+
+    def _wait_for_space(self) -> bool:
+        """
+        Block the calling thread until the queue has space. Returns False without waiting when called from the thread
+        running the event loop, where waiting would stall every request served by the loop, not just the one emitting
+        the event. The caller then drops the event so the queue stays bounded.
+        """
+        try:
+            asyncio.get_running_loop()
+            return False
+        except RuntimeError:
+            pass
+
+        while len(self._queue) >= self._queue_config.max_queue_size:
+            self._space_available.clear()
+            # re-check after clearing, the background thread may have made space in between
+            if len(self._queue) < self._queue_config.max_queue_size:
+                break
+            self._space_available.wait(timeout=0.1)
+
+        return True
+
+    def _drop(self, step: IntermediateStep):
+        self._dropped_events += 1
+        if step.event_state == IntermediateStepState.START:
+            self._dropped_uuids.add(step.UUID)
+
+    def _drain(self):
+        """
+        Runs on the background thread, processing queued events until the queue is empty.
+        """
+        queue = self._queue
+        notify = self._queue_config.overflow_policy == SpanOverflowPolicy.BLOCK
+
+        while True:
+            try:
+                step, context = queue.popleft()
+            except IndexError:
+                self._drain_scheduled = False
+                # an event may have been queued after the queue was found empty but before the flag was cleared
+                if not queue:
+                    return
+                self._drain_scheduled = True
+                continue
+
+            if notify:
+                self._space_available.set()
+
+            try:
+                if context is None:
+                    self._process_step(step)
+                else:
+                    context.run(self._process_step, step)
+            except Exception as e:
+                logger.exception("Failed to create a span for step %s: %s", step.UUID, e)
+
+    async def _flush(self):
+        """
+        Wait until every queued event has been processed.
+        """
+        if not (self._queue or self._drain_scheduled):
+            return
+
+        # the executor has a single thread, so this runs after any drain which is already scheduled
+        await asyncio.wrap_future(_get_span_executor().submit(self._drain))
+
+    def _replay(self, buffer: list[tuple[IntermediateStep, contextvars.Context | None]]):
+        """
+        Process the events held back for tail sampling, in the order they were emitted.
+        """
+        for step, context in buffer:
+            try:
+                if context is None:
+                    self._process_step(step)
+                else:
+                    context.run(self._process_step, step)
+            except Exception as e:
+                logger.exception("Failed to create a span for step %s: %s", step.UUID, e)
+
+    async def _finish_tail_sampling(self, duration: float, errored: bool):
+        buffer = self._tail_buffer
+        self._tail_buffer = None
+
+        if not buffer or not self._sampler.keep_trace((step for step, _ in buffer), duration, errored):
+            return
+
+        if self._queue_config.background:
+            await asyncio.wrap_future(_get_span_executor().submit(self._replay, buffer))
+        else:
+            self._replay(buffer)
+
+    def _process_step(self, step: IntermediateStep) -> None:
         """
         The main logic that reacts to each IntermediateStep.
         """
         if (step.event_state == IntermediateStepState.START):
 
+            # Children of a dropped step are dropped as well, they have no parent span to attach to
+            if self._dropped_uuids and step.function_ancestry.parent_id in self._dropped_uuids:
+                self._dropped_uuids.add(step.UUID)
+                return
+
             self._process_start_event(step)
 
         elif (step.event_state == IntermediateStepState.END):
 
+            if self._dropped_uuids and step.UUID in self._dropped_uuids:
+                self._dropped_uuids.discard(step.UUID)
+                return
+
             self._process_end_event(step)
 
     def _on_error(self, exc: Exception) -> None:
@@ -185,6 +421,12 @@ class AsyncOtelSpanListener:
 
         This sets up the subscription to the AIQ Toolkit event stream and starts the background loop.
         """
+        if self._sampler.tail_sampling:
+            self._tail_buffer = []
+
+        start_time = time.monotonic()
+        errored = False
+
         try:
             # Subscribe to the event stream
             subject = self._context_state.event_stream.get()
@@ -198,16 +440,24 @@ class AsyncOtelSpanListener:
 
             yield  # let the caller do their workflow
 
+        except BaseException:
+            errored = True
+            raise
+
         finally:
             # Cleanup
             self._running = False
-            # Close out any running spans
-            await self._cleanup()
 
             if self._subscription:
                 self._subscription.unsubscribe()
             self._subscription = None
 
+            # Wait for the queued events, then close out any running spans
+            if self._tail_buffer is not None:
+                await self._finish_tail_sampling(time.monotonic() - start_time, errored)
+            await self._flush()
+            await self._cleanup()
+
     async def _cleanup(self):
         """
         Close any remaining open spans.
@@ -224,6 +474,19 @@ class AsyncOtelSpanListener:
 
         self._span_stack.clear()
 
+        if self._dropped_events:
+            logger.warning(
+                "Dropped %d intermediate step events because the span queue was full. Increase "
+                "`general.telemetry.span_queue.max_queue_size` or change its overflow policy to keep them.",
+                self._dropped_events)
+        if self._dropped_on_loop_events:
+            logger.warning(
+                "%d of the dropped events were emitted on the event loop thread, which the block overflow policy never "
+                "waits on since that would stall every request served by the event loop.",
+                self._dropped_on_loop_events)
+            self._dropped_on_loop_events = 0
+        self._dropped_uuids.clear()
+
         # Clean up any lingering Weave calls if Weave is available and initialized
         if self.gc is not None and self._weave_calls:
             for _, call in list(self._weave_calls.items()):
@@ -235,11 +498,7 @@ class AsyncOtelSpanListener:
         Serialize the input value to a string. Returns a tuple with the serialized value and a boolean indicating if the
         serialization is JSON or a string
         """
-        try:
-            return TypeAdapter(type(input_value)).dump_json(input_value).decode('utf-8'), True
-        except Exception:
-            # Fallback to string representation if we can't serialize using pydantic
-            return str(input_value), False
+        return (self._payload_serializer or get_payload_serializer()).serialize(input_value)
 
     def _process_start_event(self, step: IntermediateStep):
 
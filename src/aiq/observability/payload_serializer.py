@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import logging
+import typing
+
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_TYPES = 512
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_TYPES)
+def get_type_adapter(value_type: type) -> TypeAdapter | None:
+    """
+    Return a TypeAdapter for `value_type`, or None if pydantic cannot build a schema for it.
+
+    Building a TypeAdapter compiles a pydantic-core schema which is far more expensive than using it, adapters are
+    therefore cached per type and shared by every serializer. Types without a schema are cached as well so the failed
+    schema generation is not repeated for every payload.
+    """
+    try:
+        return TypeAdapter(value_type)
+    except Exception:
+        logger.debug("Unable to build a TypeAdapter for %s, falling back to str()", value_type)
+        return None
+
+
+class PayloadSerializer:
+    """
+    Serializes span input and output payloads to strings.
+
+    Values are dumped to JSON with a cached TypeAdapter for their type, falling back to `str()` for values pydantic
+    cannot serialize. Large payloads can be bounded before they are encoded: strings are cut to `max_length`
+    characters and only the first `max_items` elements of lists and tuples are serialized. Encoded payloads longer
+    than `max_length` are truncated as well, truncated payloads are reported as plain text since they are no longer
+    valid JSON.
+    """
+
+    def __init__(self, max_length: int | None = None, max_items: int | None = None):
+        self._max_length = max_length
+        self._max_items = max_items
+
+    @property
+    def max_length(self) -> int | None:
+        return self._max_length
+
+    @property
+    def max_items(self) -> int | None:
+        return self._max_items
+
+    def _truncate(self, text: str) -> str:
+        return f"{text[:self._max_length]}... [truncated {len(text) - self._max_length} characters]"
+
+    def serialize(self, value: typing.Any) -> tuple[str, bool]:
+        """
+        Serialize the value to a string. Returns a tuple with the serialized value and a boolean indicating if the
+        serialization is JSON or a string
+        """
+        if self._max_length is not None and isinstance(value, str) and len(value) > self._max_length:
+            return self._truncate(value), False
+
+        if self._max_items is not None and isinstance(value, (list, tuple)) and len(value) > self._max_items:
+            value = value[:self._max_items]
+
+        adapter = get_type_adapter(type(value))
+        if adapter is None:
+            serialized, is_json = str(value), False
+        else:
+            try:
+                serialized, is_json = adapter.dump_json(value).decode('utf-8'), True
+            except Exception:
+                # Fallback to string representation if we can't serialize using pydantic
+                serialized, is_json = str(value), False
+
+        if self._max_length is not None and len(serialized) > self._max_length:
+            return self._truncate(serialized), False
+
+        return serialized, is_json
+
+
+_payload_serializer = PayloadSerializer()
+
+
+def get_payload_serializer() -> PayloadSerializer:
+    """Return the serializer used by span listeners which were not given one explicitly"""
+    return _payload_serializer
+
+
+def set_payload_serializer(serializer: PayloadSerializer):
+    global _payload_serializer  # pylint: disable=global-statement
+
+    _payload_serializer = serializer
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from collections.abc import Iterable
+
+from aiq.data_models.config import TraceSamplingConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+
+
+def count_tokens(steps: Iterable[IntermediateStep]) -> int:
+    """Total number of tokens reported by the LLM calls among the steps"""
+    total = 0
+    for step in steps:
+        if step.event_type == IntermediateStepType.LLM_END and step.payload.usage_info is not None:
+            total += step.payload.usage_info.token_usage.total_tokens
+
+    return total
+
+
+class TraceSampler:
+    """
+    Decides which workflow requests are traced.
+
+    `sample_head` is called when a request starts, requests which are not sampled are not traced at all. When tail
+    sampling is configured the steps of sampled requests are buffered, and `keep_trace` decides once the request has
+    finished whether its trace is exported.
+    """
+
+    def __init__(self, config: TraceSamplingConfig | None = None, rng: random.Random | None = None):
+        self._config = config or TraceSamplingConfig()
+        self._rng = rng or random.Random()
+
+    @property
+    def config(self) -> TraceSamplingConfig:
+        return self._config
+
+    @property
+    def tail_sampling(self) -> bool:
+        return self._config.tail is not None
+
+    def sample_head(self) -> bool:
+        rate = self._config.head_rate
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+
+        return self._rng.random() < rate
+
+    def keep_trace(self, steps: Iterable[IntermediateStep], duration: float, errored: bool) -> bool:
+        """
+        Return True if the trace of a finished request should be exported. `duration` is the request's latency in
+        seconds and `errored` is set if the request raised an error.
+        """
+        tail = self._config.tail
+        if tail is None:
+            return True
+
+        if errored and tail.keep_errors:
+            return True
+
+        if tail.latency_threshold is not None and duration > tail.latency_threshold:
+            return True
+
+        if tail.token_threshold is not None and count_tokens(steps) > tail.token_threshold:
+            return True
+
+        return False
+
+
+_trace_sampler = TraceSampler()
+
+
+def get_trace_sampler() -> TraceSampler:
+    """Return the sampler used by workflow runs which were not given one, it traces every request unless changed"""
+    return _trace_sampler
+
+
+def set_trace_sampler(sampler: TraceSampler):
+    global _trace_sampler  # pylint: disable=global-statement
+
+    _trace_sampler = sampler
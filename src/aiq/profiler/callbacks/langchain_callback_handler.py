@@ -39,6 +39,7 @@ from aiq.data_models.intermediate_step import TraceMetadata
 from aiq.data_models.intermediate_step import UsageInfo
 from aiq.profiler.callbacks.base_callback_class import BaseProfilerCallback
 from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.utils.uuid_utils import uuid4_str
 
 logger = logging.getLogger(__name__)
 
@@ -169,28 +170,33 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):  # p
 
     async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
         """Collect stats for just the token"""
+        # Called for every streamed token, avoid repeated lookups and only generate an ID when there is no run ID
+        run_id = str(kwargs["run_id"]) if "run_id" in kwargs else None
+        chunk = kwargs.get("chunk")
+
         model_name = ""
         try:
-            model_name = self._run_id_to_model_name.get(str(kwargs.get("run_id", "")), "")
+            model_name = self._run_id_to_model_name.get(run_id or "", "")
         except Exception as e:
             logger.exception("Error getting model name: %s", e, exc_info=True)
 
         usage_metadata = {}
         try:
-            usage_metadata = kwargs.get("chunk").message.usage_metadata if kwargs.get("chunk") else {}
+            usage_metadata = chunk.message.usage_metadata if chunk else {}
         except Exception as e:
             logger.exception("Error getting usage metadata: %s", e, exc_info=True)
 
-        stats = IntermediateStepPayload(
-            event_type=IntermediateStepType.LLM_NEW_TOKEN,
-            framework=LLMFrameworkEnum.LANGCHAIN,
-            name=model_name,
-            UUID=str(kwargs.get("run_id", str(uuid4()))),
-            data=StreamEventData(input=self._run_id_to_llm_input.get(str(kwargs.get("run_id", "")), ""), chunk=token),
-            usage_info=UsageInfo(token_usage=self._extract_token_base_model(usage_metadata),
-                                 num_llm_calls=1,
-                                 seconds_between_calls=int(time.time() - self.last_call_ts)),
-            metadata=TraceMetadata(chat_responses=[kwargs.get("chunk")] if kwargs.get("chunk") else []))
+        stats = IntermediateStepPayload(event_type=IntermediateStepType.LLM_NEW_TOKEN,
+                                        framework=LLMFrameworkEnum.LANGCHAIN,
+                                        name=model_name,
+                                        UUID=run_id if run_id is not None else uuid4_str(),
+                                        data=StreamEventData(input=self._run_id_to_llm_input.get(run_id or "", ""),
+                                                             chunk=token),
+                                        usage_info=UsageInfo(token_usage=self._extract_token_base_model(usage_metadata),
+                                                             num_llm_calls=1,
+                                                             seconds_between_calls=int(time.time() -
+                                                                                       self.last_call_ts)),
+                                        metadata=TraceMetadata(chat_responses=[chunk] if chunk else []))
 
         self.step_manager.push_intermediate_step(stats)
 
@@ -17,6 +17,7 @@
 
 import logging
 
+from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.forecasting.config import DEFAULT_MODEL_TYPE
 from aiq.profiler.forecasting.models import ForecastingBaseModel
 from aiq.profiler.forecasting.models import LinearModel
@@ -55,20 +56,22 @@ class ModelTrainer:
         self.model_type = model_type
         self._model = create_model(self.model_type)
 
-    def train(self, raw_stats: list[list[IntermediatePropertyAdaptor]]) -> ForecastingBaseModel:
+    def train(self, raw_stats: list[list[IntermediateStep]]) -> ForecastingBaseModel:
         """
         Train the model using the `raw_stats` training data.
 
         Parameters
         ----------
-        raw_stats: list[list[IntermediatePropertyAdaptor]]
-            Stats collected by the profiler.
+        raw_stats: list[list[IntermediateStep]]
+            Stats collected by the profiler, either live or loaded from saved traces with `load_profiler_traces`.
 
         Returns
         -------
         ForecastingBaseModel
             A fitted model.
         """
+        raw_stats = [[IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps]
+                     for steps in raw_stats]
 
         self._model.fit(raw_stats)
 
@@ -39,7 +39,7 @@ from aiq.profiler.inference_optimization.data_models import CallNode
 from aiq.profiler.inference_optimization.data_models import ConcurrencyDistribution
 from aiq.profiler.inference_optimization.data_models import NestedCallProfilingResult
 from aiq.profiler.inference_optimization.data_models import NodeMetrics
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.utils import get_standardized_dataframe
 
 logger = logging.getLogger(__name__)
 
@@ -140,7 +140,7 @@ def build_call_tree_for_example(example_df: pd.DataFrame) -> list[CallNode]:
     return roots
 
 
-def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list[CallNode]:
+def build_call_tree_per_example(all_steps: list[list[IntermediateStep]] | pd.DataFrame) -> list[CallNode]:
     """
     1) Group the DataFrame by example_number.
     2) For each example, build a separate stack-based call tree.
@@ -148,7 +148,7 @@ def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list
 
     This ensures no cross-example nesting.
     """
-    df = create_standardized_dataframe(all_steps)
+    df = get_standardized_dataframe(all_steps)
     required = {"example_number", "event_type", "UUID", "event_timestamp"}
     missing = required - set(df.columns)
     if missing:
@@ -439,7 +439,7 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
                                      textual_report=report_text)
 
 
-def multi_example_call_profiling(all_steps: list[list[IntermediateStep]],
+def multi_example_call_profiling(all_steps: list[list[IntermediateStep]] | pd.DataFrame,
                                  output_dir: str | None = None) -> NestedCallProfilingResult:
     """
     The high-level function:
@@ -449,7 +449,7 @@ def multi_example_call_profiling(all_steps: list[list[IntermediateStep]],
     3. Return a NestedCallProfilingResult with concurrency distribution, node metrics, top bottlenecks, and textual
        report. Optionally saves a Gantt chart.
 
-    :param all_steps: Intermediate steps for each example.
+    :param all_steps: Intermediate steps for each example, or the standardized DataFrame built from them.
     :param output_dir: Directory path to save gantt_chart.png (if provided)
     :return: NestedCallProfilingResult (pydantic)
     """
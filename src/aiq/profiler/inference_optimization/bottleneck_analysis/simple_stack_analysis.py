@@ -31,13 +31,13 @@ import pandas as pd
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import SimpleBottleneckReport
 from aiq.profiler.inference_optimization.data_models import SimpleOperationStats
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.utils import get_standardized_dataframe
 
 
 # ----------------------------------------------------------------------
 # Main Function
 # ----------------------------------------------------------------------
-def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]]) -> SimpleBottleneckReport:
+def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]] | pd.DataFrame) -> SimpleBottleneckReport:
     """
     Perform advanced bottleneck profiling on a workflow dataframe.
 
@@ -48,14 +48,14 @@ def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]]) -> Sim
 
     Parameters
     ----------
-    all_steps : Intermediate Steps
+    all_steps : Intermediate Steps, or the standardized DataFrame built from them
 
     Returns
     -------
     SimpleBottleneckReport
         Contains detailed stats per operation and a textual summary of top bottlenecks.
     """
-    df = create_standardized_dataframe(all_steps)
+    df = get_standardized_dataframe(all_steps)
     # -------------------------------------------------------------
     # 1) Separate events by operation type and match start/end
     # -------------------------------------------------------------
@@ -39,7 +39,7 @@ from aiq.profiler.inference_optimization.data_models import ConcurrencyAnalysisR
 from aiq.profiler.inference_optimization.data_models import ConcurrencyCallNode
 from aiq.profiler.inference_optimization.data_models import ConcurrencyCorrelationStats
 from aiq.profiler.inference_optimization.data_models import ConcurrencySpikeInfo
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.utils import get_standardized_dataframe
 
 # --------------------------------------------------------------------------------
 # 1) Building the Per-Example Call Trees
@@ -359,7 +359,7 @@ def average_latency_by_midpoint_concurrency(roots: list[ConcurrencyCallNode]) ->
 
 
 def concurrency_spike_analysis(
-    all_steps: list[list[IntermediateStep]],
+    all_steps: list[list[IntermediateStep]] | pd.DataFrame,
     concurrency_spike_threshold: int | None = None,
 ) -> ConcurrencyAnalysisResult:
     """
@@ -371,7 +371,7 @@ def concurrency_spike_analysis(
     6) Also compute average latency by concurrency and add to report.
     7) Return a Pydantic object with everything, plus a textual report.
     """
-    df = create_standardized_dataframe(all_steps)
+    df = get_standardized_dataframe(all_steps)
     required_cols = {
         "framework",
         "llm_name",
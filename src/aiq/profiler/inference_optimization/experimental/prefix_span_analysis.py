@@ -36,7 +36,7 @@ from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import FrequentPattern
 from aiq.profiler.inference_optimization.data_models import PrefixCallNode
 from aiq.profiler.inference_optimization.data_models import PrefixSpanSubworkflowResult
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.utils import get_standardized_dataframe
 
 logger = logging.getLogger(__name__)
 
@@ -322,7 +322,7 @@ def compute_coverage_and_duration(sequences_map: dict[int, list[PrefixCallNode]]
 
 
 def prefixspan_subworkflow_with_text(  # pylint: disable=too-many-positional-arguments
-        all_steps: list[list[IntermediateStep]],
+        all_steps: list[list[IntermediateStep]] | pd.DataFrame,
         min_support: int | float = 2,
         top_k: int = 10,
         min_coverage: float = 0.0,
@@ -334,14 +334,14 @@ def prefixspan_subworkflow_with_text(  # pylint: disable=too-many-positional-arg
     3) Compute coverage & average duration for each pattern, filter by min_coverage, pick top_k.
     4) Return Pydantic model with final patterns & textual report.
 
-    :param all_steps: Intermediate steps
+    :param all_steps: Intermediate steps, or the standardized DataFrame built from them
     :param min_support: minimal # of times (int) or fraction (float) for prefixspan
     :param top_k: how many patterns to keep
     :param min_coverage: discard patterns that appear in fewer than this fraction of examples
     :param max_text_len: how many chars of llm_text_input to incorporate in the token
     :param prefix_list: list of prefixes to filter on and exclude from pattern matching
     """
-    df = create_standardized_dataframe(all_steps)
+    df = get_standardized_dataframe(all_steps)
     # Validate columns
     required_cols = {
         "framework",
@@ -17,7 +17,7 @@ import numpy as np
 import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.utils import get_standardized_dataframe
 
 
 class LLMMetrics:
@@ -26,7 +26,7 @@ class LLMMetrics:
     """
 
     @staticmethod
-    def compute_profiling_metrics(all_steps: list[list[IntermediateStep]]) -> pd.DataFrame:
+    def compute_profiling_metrics(all_steps: list[list[IntermediateStep]] | pd.DataFrame) -> pd.DataFrame:
         """
         Compute and append the following columns to the provided DataFrame:
 
@@ -71,11 +71,14 @@ class LLMMetrics:
         - The DataFrame may have additional columns such as 'llm_text_input', 'llm_text_output',
            'function_id', 'parent_function_name', 'parent_function_id', etc.
 
-        :param all_steps: All intermediate steps for each example.
+        :param all_steps: All intermediate steps for each example, or the standardized DataFrame built from them.
+                          A provided DataFrame is copied and left unmodified.
         :return:   The same DataFrame with the six NOVA- columns appended.
         """
 
-        df = create_standardized_dataframe(all_steps)
+        df = get_standardized_dataframe(all_steps)
+        if df is all_steps:
+            df = df.copy()
 
         if df.empty:
             return df
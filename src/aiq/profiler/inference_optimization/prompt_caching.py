@@ -13,82 +13,107 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+import re
+from collections.abc import Callable
+from collections.abc import Sequence
+
+import pandas as pd
+
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import CommonPrefixesOutput
 from aiq.profiler.inference_optimization.data_models import FrameworkLLMPrefixData
 from aiq.profiler.inference_optimization.data_models import PrefixInfo
-from aiq.profiler.utils import create_standardized_dataframe
-
+from aiq.profiler.utils import get_standardized_dataframe
 
 # -----------------------------------------------------------
-# 1. Helper: Build a prefix trie
+# 1. Helpers: Tokenization and longest common prefix
 # -----------------------------------------------------------
-def build_prefix_trie(strings: list[str]) -> dict:
+_TOKEN_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+def tokenize_text(text: str) -> list[str]:
+    """
+    Split text into word, whitespace and punctuation tokens. Joining the tokens reproduces the original text, which
+    allows prefixes found at the token level to be reported as text.
     """
-    Build a trie from a list of strings.
+    return _TOKEN_PATTERN.findall(text)
 
-    Returns a nested dictionary with::
 
-        {
-            'count': int,         # number of strings passing through this node
-            'children': dict[str, TrieNode]
-        }
+def _common_prefix_length(a: Sequence, b: Sequence) -> int:
+    """
+    Length of the longest common prefix of two strings or token sequences.
 
+    Uses a binary search over slice comparisons, which are performed in C, rather than comparing element by element.
     """
-    root = {'count': 0, 'children': {}}
-    for s in strings:
-        node = root
-        node['count'] += 1  # every string passes through the root
-        for ch in s:
-            if ch not in node['children']:
-                node['children'][ch] = {'count': 0, 'children': {}}
-            node = node['children'][ch]
-            node['count'] += 1
-    return root
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
 
 
 # -----------------------------------------------------------
-# 2. Helper: Iterative traversal of the trie
+# 2. Helper: Enumerate the nodes of a compacted prefix trie
 # -----------------------------------------------------------
-def collect_prefixes_iterative(root: dict, total_calls: int) -> list[dict]:
+def collect_prefix_nodes(sequences: list[Sequence], min_count: int = 1) -> list[tuple[Sequence, int]]:
     """
-    Iteratively traverse the trie to collect prefix statistics,
-    avoiding recursion depth limits.
+    Enumerate the nodes of the compacted (radix) prefix trie of `sequences` without building the trie.
 
-    :param root: Trie node with 'count' and 'children'
-    :param total_calls: Number of total calls in this group (denominator for percentages)
-    :return: A list of dicts, each dict containing prefix info
-    """
-    results = []
-    # stack holds (node, prefix_so_far)
-    stack = [(root, "")]
+    The sequences are sorted, after which every internal node of the trie corresponds to an interval of adjacent
+    sequences sharing a common prefix, found in a single pass over the longest common prefixes (LCP) of neighboring
+    sequences. Memory use is linear in the number of sequences rather than in the total length of the text.
 
-    while stack:
-        node, prefix = stack.pop()
+    Along a compacted edge the number of sequences passing through every prefix is constant, so each node represents
+    the longest prefix of its edge. Nodes with fewer than `min_count` sequences passing through them are pruned.
 
-        # Skip storing the empty root prefix
-        if prefix:
-            calls_count = node['count']
-            calls_percentage = calls_count / total_calls
-            results.append({
-                'prefix': prefix,
-                'prefix_length': len(prefix),
-                'calls_count': calls_count,
-                'calls_percentage': calls_percentage
-            })
-
-        # Add children to the stack
-        for ch, child_node in node['children'].items():
-            stack.append((child_node, prefix + ch))
-
-    return results
+    :param sequences: Strings, or token sequences supporting slicing and comparison such as tuples.
+    :param min_count: Minimum number of sequences sharing a prefix for it to be returned.
+    :return: A list of (prefix, count) tuples, where count is the number of sequences starting with the prefix.
+    """
+    seqs = sorted(sequences)
+    n = len(seqs)
+    if n == 0:
+        return []
+
+    lcps = [0] * (n + 1)  # lcps[i] = LCP(seqs[i - 1], seqs[i]), with sentinels at both ends
+    for i in range(1, n):
+        lcps[i] = _common_prefix_length(seqs[i - 1], seqs[i])
+
+    nodes = []
+
+    # Leaf nodes: sequences which are not a prefix of any other sequence and are not duplicated
+    if min_count <= 1:
+        for i, seq in enumerate(seqs):
+            if seq and lcps[i] < len(seq) and lcps[i + 1] < len(seq):
+                nodes.append((seq, 1))
+
+    # Internal nodes: LCP intervals, enumerated bottom-up with a stack of (lcp, left_bound)
+    stack = [(0, 0)]
+    for i in range(1, n + 1):
+        lcp = lcps[i] if i < n else 0
+        left_bound = i - 1
+        while lcp < stack[-1][0]:
+            node_lcp, left_bound = stack.pop()
+            count = i - left_bound
+            if count >= min_count:
+                nodes.append((seqs[left_bound][:node_lcp], count))
+        if lcp > stack[-1][0]:
+            stack.append((lcp, left_bound))
+
+    return nodes
 
 
 # -----------------------------------------------------------
 # 3. Main Function
 # -----------------------------------------------------------
-def get_common_prefixes(all_steps: list[list[IntermediateStep]],
-                        min_call_percentage: float = 0.0) -> CommonPrefixesOutput:
+def get_common_prefixes(all_steps: list[list[IntermediateStep]] | pd.DataFrame,
+                        min_call_percentage: float = 0.0,
+                        tokenizer: Callable[[str], Sequence[str]] | None = None,
+                        max_prefix_length: int | None = None) -> CommonPrefixesOutput:
     """
     Given a pandas DataFrame with columns 'framework', 'llm_name',
     and 'llm_text_input', return a Pydantic-validated RootModel
@@ -100,15 +125,20 @@ def get_common_prefixes(all_steps: list[list[IntermediateStep]],
        that already meets the threshold and is retained.
     3) Optionally writes the resulting dictionary to JSON if `output_path` is provided.
 
-    :param all_steps: Intermediate Steps
+    :param all_steps: Intermediate Steps, or the standardized DataFrame built from them
     :param min_call_percentage: Exclude prefixes that appear in fewer than this fraction
                                 of total calls. (Default 0.0 = no filtering)
+    :param tokenizer: Optional callable splitting a text input into tokens, prefixes are then only reported on token
+                      boundaries. The tokens of a text must join to form the text, for example `tokenize_text`.
+                      (Default None = character level prefixes)
+    :param max_prefix_length: Optional maximum prefix length, in characters or tokens, bounding the time and memory
+                              spent on very long prompts. (Default None = unbounded)
 
     Sorting: primarily by prefix length (descending),
              secondarily by frequency (descending).
     """
     # Validate necessary columns
-    df = create_standardized_dataframe(all_steps)
+    df = get_standardized_dataframe(all_steps)
 
     required_cols = {'framework', 'llm_name', 'llm_text_input'}
     if not required_cols.issubset(df.columns):
@@ -126,17 +156,36 @@ def get_common_prefixes(all_steps: list[list[IntermediateStep]],
         text_inputs = group_df['llm_text_input'].astype(str).tolist()
         total_calls = len(text_inputs)
 
-        # Build trie for all text inputs
-        trie = build_prefix_trie(text_inputs)
+        if tokenizer is None:
+            sequences = text_inputs
+        else:
+            sequences = [tuple(tokenizer(text)) for text in text_inputs]
+
+        if max_prefix_length is not None:
+            sequences = [seq[:max_prefix_length] for seq in sequences]
+
+        # 1) Collect the nodes of the prefix trie, pruning prefixes below min_call_percentage
+        min_count = max(math.floor(min_call_percentage * total_calls), 1)
+        results_filtered = []
+        for prefix, calls_count in collect_prefix_nodes(sequences, min_count=min_count):
+            calls_percentage = calls_count / total_calls
+            if calls_percentage < min_call_percentage:
+                continue
 
-        # Collect prefix info using iterative traversal
-        results = collect_prefixes_iterative(trie, total_calls=total_calls)
+            if tokenizer is not None:
+                prefix = "".join(prefix)
 
-        # 1) Filter out prefixes below min_call_percentage
-        results_filtered = [r for r in results if r['calls_percentage'] >= min_call_percentage]
+            results_filtered.append({
+                'prefix': prefix,
+                'prefix_length': len(prefix),
+                'calls_count': calls_count,
+                'calls_percentage': calls_percentage
+            })
 
         # 2) Sort results: prefix_length desc, then calls_count desc
-        results_sorted = sorted(results_filtered, key=lambda x: (x['prefix_length'], x['calls_count']), reverse=True)
+        results_sorted = sorted(results_filtered,
+                                key=lambda x: (x['prefix_length'], x['calls_count'], x['prefix']),
+                                reverse=True)
 
         # 3) Substring filtering:
         #    Because results_sorted is in descending length order,
@@ -16,17 +16,19 @@
 import re
 
 import numpy as np
+import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import LLMUniquenessMetrics
 from aiq.profiler.inference_optimization.data_models import LLMUniquenessMetricsByLLM
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.utils import get_standardized_dataframe
 
 
 # ----------------------------------------------------------------
 # 1. Main Function
 # ----------------------------------------------------------------
-def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[IntermediateStep]]) -> LLMUniquenessMetricsByLLM:
+def compute_inter_query_token_uniqueness_by_llm(
+        all_steps: list[list[IntermediateStep]] | pd.DataFrame) -> LLMUniquenessMetricsByLLM:
     """
     Computes p90, p95, and p99 of 'new words added' between consecutive llm_start events,
     grouped by (llm_name, example_number).
@@ -41,7 +43,7 @@ def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[Intermediat
 
          { llm_name -> LLMUniquenessMetrics(p90, p95, p99) }.
     """
-    df = create_standardized_dataframe(all_steps)
+    df = get_standardized_dataframe(all_steps)
     # Validate that the necessary columns exist
     required_cols = {'event_type', 'llm_name', 'example_number', 'event_timestamp', 'llm_text_input'}
     missing = required_cols - set(df.columns)
@@ -14,13 +14,14 @@
 # limitations under the License.
 
 import numpy as np
+import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import WorkflowRuntimeMetrics
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.utils import get_standardized_dataframe
 
 
-def compute_workflow_runtime_metrics(all_steps: list[list[IntermediateStep]]) -> WorkflowRuntimeMetrics:
+def compute_workflow_runtime_metrics(all_steps: list[list[IntermediateStep]] | pd.DataFrame) -> WorkflowRuntimeMetrics:
     """
     Computes the p90, p95, and p99 of workflow runtime for each example_number.
 
@@ -32,7 +33,8 @@ def compute_workflow_runtime_metrics(all_steps: list[list[IntermediateStep]]) ->
 
     Parameters
     ----------
-    all_steps : IntermediateStep
+    all_steps : list[list[IntermediateStep]] | pd.DataFrame
+        Intermediate steps, or the standardized DataFrame built from them.
         Must contain at least two columns:
           - 'example_number'
           - 'event_timestamp'
@@ -42,7 +44,7 @@ def compute_workflow_runtime_metrics(all_steps: list[list[IntermediateStep]]) ->
     WorkflowRuntimeMetrics
         A Pydantic model with 'p90', 'p95', and 'p99' attributes.
     """
-    df = create_standardized_dataframe(all_steps)
+    df = get_standardized_dataframe(all_steps)
     required_cols = {"example_number", "event_timestamp"}
     missing = required_cols - set(df.columns)
     if missing:
@@ -24,9 +24,14 @@ class IntermediatePropertyAdaptor(IntermediateStep):
     def from_intermediate_step(cls, step: IntermediateStep) -> "IntermediatePropertyAdaptor":
         """
         Create an adaptor instance from an existing IntermediateStep.
-        Uses the dict() representation of the instance to initialize the adaptor.
+        The step has already been validated, so its fields are shared with the adaptor without re-validation.
         """
-        return cls(**step.model_dump())
+        if isinstance(step, cls):
+            return step
+
+        return cls.model_construct(_fields_set=step.model_fields_set,
+                                   **{name: getattr(step, name)
+                                      for name in IntermediateStep.model_fields})
 
     @property
     def token_usage(self) -> TokenUsageBaseModel:
@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Parquet export and reload of profiler data.
+
+Low-cardinality columns (event type, LLM, function and framework names) are dictionary-encoded, which keeps the files
+small and fast to scan for offline analysis of large traces.
+"""
+
+import json
+import logging
+from enum import Enum
+from pathlib import Path
+from types import ModuleType
+
+import pandas as pd
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+
+logger = logging.getLogger(__name__)
+
+STANDARDIZED_DATA_FILE_NAME = "standardized_data_all.parquet"
+TRACE_PARQUET_FILE_NAME = "all_requests_profiler_traces.parquet"
+
+# Columns of the standardized DataFrame which are stored dictionary-encoded
+DICTIONARY_COLUMNS = ("event_type", "llm_name", "function_name", "framework")
+
+# Columns of the intermediate steps file which are stored dictionary-encoded
+_STEP_DICTIONARY_COLUMNS = ("event_type", "framework", "name", "function_name", "parent_name")
+
+_METADATA_ADAPTER = TypeAdapter(IntermediateStepPayload.model_fields["metadata"].annotation)
+
+
+def _import_pyarrow() -> tuple[ModuleType, ModuleType]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        logger.error("pyarrow is not installed. Please install pyarrow to read or write profiler data as Parquet.")
+
+        raise
+
+    return pa, pq
+
+
+def _step_column_types() -> dict:
+    pa, _ = _import_pyarrow()
+
+    return {
+        "request_number": pa.int64(),
+        "step_index": pa.int64(),
+        "event_type": pa.string(),
+        "event_timestamp": pa.float64(),
+        "span_event_timestamp": pa.float64(),
+        "framework": pa.string(),
+        "name": pa.string(),
+        "tags": pa.list_(pa.string()),
+        "uuid": pa.string(),
+        "function_name": pa.string(),
+        "function_id": pa.string(),
+        "parent_name": pa.string(),
+        "parent_id": pa.string(),
+        "num_llm_calls": pa.int64(),
+        "seconds_between_calls": pa.int64(),
+        "prompt_tokens": pa.int64(),
+        "completion_tokens": pa.int64(),
+        "total_tokens": pa.int64(),
+        "data": pa.large_string(),
+        "metadata": pa.large_string(),
+        "payload_extra": pa.large_string(),
+    }
+
+
+def _enum_value(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+def write_standardized_dataframe_parquet(df: pd.DataFrame, path: str | Path) -> Path:
+    """
+    Write a standardized DataFrame, as produced by `create_standardized_dataframe`, to a Parquet file.
+    """
+    pa, pq = _import_pyarrow()
+
+    df = df.copy()
+    for column in DICTIONARY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].map(_enum_value).astype("category")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path)
+
+    return path
+
+
+def read_standardized_dataframe_parquet(path: str | Path) -> pd.DataFrame:
+    """
+    Read a standardized DataFrame written by `write_standardized_dataframe_parquet`.
+
+    Dictionary-encoded columns are restored to plain object columns and `event_type` values are converted back to
+    `IntermediateStepType`, so the result can be passed directly to the profiler analyses.
+    """
+    _, pq = _import_pyarrow()
+
+    df = pq.read_table(path).to_pandas()
+    for column in DICTIONARY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype(object).where(df[column].notna(), None)
+
+    if "event_type" in df.columns:
+        df["event_type"] = df["event_type"].map(IntermediateStepType)
+
+    return df
+
+
+def _to_json(value) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    return json.dumps(value, default=str)
+
+
+def _step_from_columns(columns: dict[str, list], row: int) -> IntermediateStep:
+    function_name = columns["function_name"][row]
+    ancestry = None
+    if function_name is not None:
+        ancestry = InvocationNode.model_construct(function_name=function_name,
+                                                  function_id=columns["function_id"][row],
+                                                  parent_name=columns["parent_name"][row],
+                                                  parent_id=columns["parent_id"][row])
+
+    usage_info = None
+    if columns["num_llm_calls"][row] is not None:
+        token_usage = TokenUsageBaseModel.model_construct(prompt_tokens=columns["prompt_tokens"][row],
+                                                          completion_tokens=columns["completion_tokens"][row],
+                                                          total_tokens=columns["total_tokens"][row])
+        usage_info = UsageInfo.model_construct(token_usage=token_usage,
+                                               num_llm_calls=columns["num_llm_calls"][row],
+                                               seconds_between_calls=columns["seconds_between_calls"][row])
+
+    data = columns["data"][row]
+    metadata = columns["metadata"][row]
+    payload_extra = columns["payload_extra"][row]
+    framework = columns["framework"][row]
+    payload = IntermediateStepPayload.model_construct(
+        event_type=IntermediateStepType(columns["event_type"][row]),
+        event_timestamp=columns["event_timestamp"][row],
+        span_event_timestamp=columns["span_event_timestamp"][row],
+        framework=LLMFrameworkEnum(framework) if framework is not None else None,
+        name=columns["name"][row],
+        tags=columns["tags"][row],
+        metadata=_METADATA_ADAPTER.validate_json(metadata) if metadata is not None else None,
+        data=StreamEventData.model_validate_json(data) if data is not None else None,
+        usage_info=usage_info,
+        UUID=columns["uuid"][row],
+        **(json.loads(payload_extra) if payload_extra is not None else {}))
+
+    return IntermediateStep.model_construct(function_ancestry=ancestry, payload=payload)
+
+
+def write_intermediate_steps_parquet(all_steps: list[list[IntermediateStep]], path: str | Path) -> Path:
+    """
+    Write the raw intermediate steps of every request to a Parquet file, one row per step.
+
+    Every field of a step is stored in its own typed column, names and event types dictionary-encoded, so the file can
+    be scanned and filtered without deserializing the steps. Only the free-form `data` and `metadata` payloads, and
+    any extra payload fields, are stored as JSON.
+    """
+    pa, pq = _import_pyarrow()
+
+    column_types = _step_column_types()
+    columns: dict[str, list] = {name: [] for name in column_types}
+    for request_number, steps in enumerate(all_steps):
+        for step_index, step in enumerate(steps):
+            payload = step.payload
+            ancestry = step.function_ancestry
+            usage_info = payload.usage_info
+            token_usage = usage_info.token_usage if usage_info else None
+
+            columns["request_number"].append(request_number)
+            columns["step_index"].append(step_index)
+            columns["event_type"].append(payload.event_type.value)
+            columns["event_timestamp"].append(payload.event_timestamp)
+            columns["span_event_timestamp"].append(payload.span_event_timestamp)
+            columns["framework"].append(_enum_value(payload.framework))
+            columns["name"].append(payload.name)
+            columns["tags"].append(payload.tags)
+            columns["uuid"].append(payload.UUID)
+            columns["function_name"].append(ancestry.function_name if ancestry else None)
+            columns["function_id"].append(ancestry.function_id if ancestry else None)
+            columns["parent_name"].append(ancestry.parent_name if ancestry else None)
+            columns["parent_id"].append(ancestry.parent_id if ancestry else None)
+            columns["num_llm_calls"].append(usage_info.num_llm_calls if usage_info else None)
+            columns["seconds_between_calls"].append(usage_info.seconds_between_calls if usage_info else None)
+            columns["prompt_tokens"].append(token_usage.prompt_tokens if token_usage else None)
+            columns["completion_tokens"].append(token_usage.completion_tokens if token_usage else None)
+            columns["total_tokens"].append(token_usage.total_tokens if token_usage else None)
+            columns["data"].append(_to_json(payload.data))
+            columns["metadata"].append(_to_json(payload.metadata))
+            columns["payload_extra"].append(_to_json(payload.model_extra or None))
+
+    arrays = {}
+    for name, values in columns.items():
+        array = pa.array(values, type=column_types[name])
+        arrays[name] = array.dictionary_encode() if name in _STEP_DICTIONARY_COLUMNS else array
+
+    table = pa.table(arrays)
+    # Requests without any steps have no rows, store the number of requests to restore them when reading
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"num_requests": str(len(all_steps))})
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path)
+
+    return path
+
+
+def read_intermediate_steps_parquet(path: str | Path) -> list[list[IntermediateStep]]:
+    """
+    Read the intermediate steps written by `write_intermediate_steps_parquet`, grouped by request number.
+
+    The steps are rebuilt from the typed columns without re-validating them, only the JSON `data` and `metadata`
+    payloads are parsed and validated.
+    """
+    _, pq = _import_pyarrow()
+
+    table = pq.read_table(path)
+    metadata = table.schema.metadata or {}
+    table = table.sort_by([("request_number", "ascending"), ("step_index", "ascending")])
+    columns = {name: table.column(name).to_pylist() for name in table.column_names}
+
+    all_steps: dict[int, list[IntermediateStep]] = {}
+    for row in range(table.num_rows):
+        all_steps.setdefault(columns["request_number"][row], []).append(_step_from_columns(columns, row))
+
+    num_requests = int(metadata.get(b"num_requests", max(all_steps, default=-1) + 1))
+
+    return [all_steps.get(i, []) for i in range(num_requests)]
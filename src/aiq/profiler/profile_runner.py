@@ -27,6 +27,8 @@ from aiq.data_models.evaluate import ProfilerConfig
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.forecasting.model_trainer import ModelTrainer
 from aiq.profiler.inference_metrics_model import InferenceMetricsModel
+from aiq.profiler.trace_writer import ProfilerTraceWriter
+from aiq.profiler.trace_writer import get_trace_path
 from aiq.profiler.utils import create_standardized_dataframe
 from aiq.utils.type_converter import TypeConverter
 
@@ -57,8 +59,8 @@ class ProfilerRunner:
 
     Updated version with additional metrics:
 
-    - For each request, we collect a list of UsageStatistic objects, store them individually,
-      and also keep a final large JSON of all requests.
+    - For each request, we collect a list of UsageStatistic objects and stream them, one request at a time,
+      to a JSON Lines trace file.
     - We then compute:
        1. 90, 95, 99% confidence intervals for the mean total workflow run time.
        2. 90, 95, 99% confidence intervals for the mean LLM latency.
@@ -72,19 +74,25 @@ class ProfilerRunner:
         self.output_dir = output_dir
         self._converter = TypeConverter([])
 
-        # Holds per-request data (prompt, output, usage_stats, etc.)
-        # This will be saved at the end to a big JSON file
-        self.all_requests_data: list[dict] = []
         self.all_steps = []
 
+        # Path of the JSON Lines file holding the raw traces of every request
+        self.trace_path: Path | None = None
+
         # Ensure output directory
         os.makedirs(output_dir, exist_ok=True)
 
-    async def run(self, all_steps: list[list[IntermediateStep]]):
+    async def run(self, all_steps: list[list[IntermediateStep]], trace_path: Path | None = None):
         """
         Main entrypoint: Works on Input DataFrame generated from eval to fit forecasting model,
-        writes out combined requests JSON, then computes and saves additional metrics,
+        writes out the request traces, then computes and saves additional metrics,
         and optionally fits a forecasting model.
+
+        If `trace_path` is provided the traces for `all_steps` have already been streamed to that file (for example
+        by the evaluation while the workflow was running) and are not written again.
+
+        Only writing the traces is streamed. The analyses, the standardized DataFrame they share and the forecasting
+        model all work on every step of every request at once, so peak memory still grows with the size of the dataset.
         """
         from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import \
             multi_example_call_profiling
@@ -96,6 +104,7 @@ class ProfilerRunner:
             prefixspan_subworkflow_with_text
         from aiq.profiler.inference_optimization.llm_metrics import LLMMetrics
         from aiq.profiler.inference_optimization.prompt_caching import get_common_prefixes
+        from aiq.profiler.inference_optimization.prompt_caching import tokenize_text
         from aiq.profiler.inference_optimization.token_uniqueness import compute_inter_query_token_uniqueness_by_llm
         from aiq.profiler.inference_optimization.workflow_runtimes import compute_workflow_runtime_metrics
         from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
@@ -105,26 +114,24 @@ class ProfilerRunner:
                      for steps in all_steps]  # Add adapter properties to each step
 
         self.all_steps = all_steps
-        self.all_requests_data = []
-        for i, steps in enumerate(all_steps):
-            request_data = []
-            for step in steps:
-                request_data.append(step.model_dump())
-            self.all_requests_data.append({"request_number": i, "intermediate_steps": request_data})
-
-        # Write the final big JSON (all requests)
-        final_path = os.path.join(self.output_dir, "all_requests_profiler_traces.json")
-        with open(final_path, 'w', encoding='utf-8') as f:
-            json.dump(self.all_requests_data, f, indent=2, default=str)
-        logger.info("Wrote combined data to: %s", final_path)
+
+        if trace_path is None:
+            # Stream the traces one request at a time rather than materializing every request at once
+            trace_path = get_trace_path(self.output_dir, compress=self.profile_config.compress_traces)
+            with ProfilerTraceWriter(trace_path, compress=self.profile_config.compress_traces) as trace_writer:
+                for i, steps in enumerate(all_steps):
+                    trace_writer.write_request(i, steps)
+
+        self.trace_path = Path(trace_path)
 
         # ------------------------------------------------------------
-        # Generate one standardized dataframe for all usage stats
+        # Generate one standardized dataframe for all usage stats, this is shared by all of the analyses below
         # ------------------------------------------------------------
-        merged_df = create_standardized_dataframe(all_steps)
+        standardized_df = create_standardized_dataframe(all_steps)
+        merged_df = standardized_df
 
         if self.profile_config.compute_llm_metrics and not merged_df.empty:
-            merged_df = LLMMetrics.compute_profiling_metrics(all_steps)
+            merged_df = LLMMetrics.compute_profiling_metrics(standardized_df)
 
         output_df = merged_df.copy()
 
@@ -137,6 +144,19 @@ class ProfilerRunner:
         output_df.to_csv(csv_path, index=False, encoding='utf-8')
         logger.info("Wrote merged standardized DataFrame to %s", csv_path)
 
+        if self.profile_config.export_parquet:
+            from aiq.profiler.parquet_io import STANDARDIZED_DATA_FILE_NAME
+            from aiq.profiler.parquet_io import TRACE_PARQUET_FILE_NAME
+            from aiq.profiler.parquet_io import write_intermediate_steps_parquet
+            from aiq.profiler.parquet_io import write_standardized_dataframe_parquet
+
+            parquet_path = write_standardized_dataframe_parquet(merged_df,
+                                                                Path(self.output_dir) / STANDARDIZED_DATA_FILE_NAME)
+            logger.info("Wrote merged standardized DataFrame to %s", parquet_path)
+
+            parquet_path = write_intermediate_steps_parquet(all_steps, Path(self.output_dir) / TRACE_PARQUET_FILE_NAME)
+            logger.info("Wrote profiler traces to %s", parquet_path)
+
         # ------------------------------------------------------------
         # Compute and save additional performance metrics
         # ------------------------------------------------------------
@@ -160,7 +180,11 @@ class ProfilerRunner:
             # Compute and save common prefixes
             # ------------------------------------------------------------
 
-            prefixes = get_common_prefixes(all_steps, self.profile_config.prompt_caching_prefixes.min_frequency)
+            prompt_caching_config = self.profile_config.prompt_caching_prefixes
+            prefixes = get_common_prefixes(standardized_df,
+                                           prompt_caching_config.min_frequency,
+                                           tokenizer=tokenize_text if prompt_caching_config.token_level else None,
+                                           max_prefix_length=prompt_caching_config.max_prefix_length)
             common_prefix_results = prefixes
 
         if self.profile_config.token_uniqueness_forecast:
@@ -168,7 +192,7 @@ class ProfilerRunner:
             # Compute and save inter-query token uniqueness
             # ------------------------------------------------------------
 
-            uniqueness = compute_inter_query_token_uniqueness_by_llm(all_steps)
+            uniqueness = compute_inter_query_token_uniqueness_by_llm(standardized_df)
             token_uniqueness_results = uniqueness
 
         if self.profile_config.workflow_runtime_forecast:
@@ -176,7 +200,7 @@ class ProfilerRunner:
             # Compute and save workflow runtime metrics
             # ------------------------------------------------------------
 
-            workflow_runtimes = compute_workflow_runtime_metrics(all_steps)
+            workflow_runtimes = compute_workflow_runtime_metrics(standardized_df)
             workflow_runtimes_results = workflow_runtimes
 
         inference_optimization_results = InferenceOptimizationHolder(confidence_intervals=simple_metrics,
@@ -199,7 +223,7 @@ class ProfilerRunner:
             # Profile workflow bottlenecks
             # ------------------------------------------------------------
 
-            workflow_bottlenecks = profile_workflow_bottlenecks(all_steps)
+            workflow_bottlenecks = profile_workflow_bottlenecks(standardized_df)
             workflow_bottlenecks = workflow_bottlenecks.model_dump()
             workflow_profiling_reports += "\n\n\n" + workflow_bottlenecks["summary"]
             workflow_profiling_metrics["simple_stack_analysis"] = workflow_bottlenecks["stats"]
@@ -209,7 +233,7 @@ class ProfilerRunner:
             # ------------------------------------------------------------
             # Profile workflow bottlenecks with nested stack analysis
             # ------------------------------------------------------------
-            nested_bottlenecks = multi_example_call_profiling(all_steps, output_dir=str(self.output_dir))
+            nested_bottlenecks = multi_example_call_profiling(standardized_df, output_dir=str(self.output_dir))
             workflow_profiling_reports += "\n\n\n" + nested_bottlenecks.textual_report
             workflow_profiling_metrics["nested_stack_analysis"] = nested_bottlenecks.model_dump(
                 exclude=["textual_report"])
@@ -220,7 +244,7 @@ class ProfilerRunner:
             # Profile concurrency spikes
             # ------------------------------------------------------------
             concurrency_metrics = concurrency_spike_analysis(
-                all_steps, self.profile_config.concurrency_spike_analysis.spike_threshold)
+                standardized_df, self.profile_config.concurrency_spike_analysis.spike_threshold)
             workflow_profiling_reports += "\n\n\n" + concurrency_metrics.textual_report
             workflow_profiling_metrics["concurrency_spike_analysis"] = concurrency_metrics.model_dump(
                 exclude=["textual_report"])
@@ -239,7 +263,7 @@ class ProfilerRunner:
                         prefix_list.append(prefix_data["prefix"])
 
             prefix_span_analysis = prefixspan_subworkflow_with_text(
-                all_steps,
+                standardized_df,
                 **self.profile_config.prefix_span_analysis.model_dump(exclude=["enable", "chain_with_common_prefixes"]),
                 prefix_list=prefix_list)
 
@@ -356,7 +380,7 @@ class ProfilerRunner:
             # Can't compute a meaningful throughput if time <= 0
             return InferenceMetricsModel()
 
-        total_requests = len(self.all_requests_data)
+        total_requests = len(self.all_steps)
         # Single estimate of throughput
         throughput_value = total_requests / total_time
 
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import typing
+from collections.abc import Iterator
+from pathlib import Path
+
+from aiq.data_models.intermediate_step import IntermediateStep
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE_NAME = "all_requests_profiler_traces.jsonl"
+ZSTD_SUFFIX = ".zst"
+
+
+def _zstd_open(path: Path, mode: str) -> typing.TextIO:
+    try:
+        import zstandard
+    except ImportError:
+        logger.error("zstandard is not installed. Please install zstandard to read or write compressed profiler "
+                     "traces.")
+
+        raise
+
+    return zstandard.open(path, mode, encoding="utf-8")
+
+
+def get_trace_path(output_dir: str | Path, compress: bool = False) -> Path:
+    """
+    Return the path of the profiler trace file within `output_dir`.
+    """
+    trace_path = Path(output_dir) / TRACE_FILE_NAME
+    if compress:
+        trace_path = trace_path.with_name(trace_path.name + ZSTD_SUFFIX)
+
+    return trace_path
+
+
+class ProfilerTraceWriter:
+    """
+    Append-only writer for profiler traces.
+
+    Each request is written as a single JSON Lines record as soon as it is available::
+
+        {"request_number": 0, "intermediate_steps": [...]}
+
+    Only one request is held in memory at a time, allowing traces to be written while an evaluation is still running.
+    When `compress` is set the file is zstd-compressed, this requires the `zstandard` package.
+    """
+
+    def __init__(self, path: str | Path, compress: bool = False):
+        self._path = Path(path)
+        self._compress = compress
+        self._file: typing.TextIO | None = None
+        self._num_requests = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def num_requests(self) -> int:
+        """
+        Number of requests written so far.
+        """
+        return self._num_requests
+
+    def open(self) -> "ProfilerTraceWriter":
+        if self._file is not None:
+            return self
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._compress:
+            self._file = _zstd_open(self._path, "wt")
+        else:
+            self._file = open(self._path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+
+        return self
+
+    def write_request(self, request_number: int, steps: list[IntermediateStep]):
+        """
+        Serialize the intermediate steps of a single request and append them to the trace file.
+        """
+        if self._file is None:
+            raise RuntimeError("ProfilerTraceWriter must be opened before writing")
+
+        record = {"request_number": request_number, "intermediate_steps": [step.model_dump() for step in steps]}
+        self._file.write(json.dumps(record, default=str))
+        self._file.write("\n")
+        self._num_requests += 1
+
+    def close(self):
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+        logger.info("Wrote %d profiler traces to: %s", self._num_requests, self._path)
+
+    def __enter__(self) -> "ProfilerTraceWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_profiler_traces(path: str | Path) -> Iterator[tuple[int, list[IntermediateStep]]]:
+    """
+    Lazily read a trace file written by `ProfilerTraceWriter`, yielding `(request_number, steps)` for one request at
+    a time. Records are yielded in the order they were written, which is not necessarily ordered by request number.
+    Files ending in `.zst` are decompressed on the fly.
+    """
+    path = Path(path)
+
+    if path.suffix == ZSTD_SUFFIX:
+        f = _zstd_open(path, "rt")
+    else:
+        f = open(path, "r", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            steps = [IntermediateStep.model_validate(step) for step in record["intermediate_steps"]]
+            yield record["request_number"], steps
+
+
+def load_profiler_traces(path: str | Path) -> list[list[IntermediateStep]]:
+    """
+    Load saved profiler traces, ordered by request number, so the profiler analyses and forecasting models can be
+    re-run without re-running the workflow. Both the JSON Lines trace files (optionally zstd-compressed) and Parquet
+    trace files are supported.
+    """
+    path = Path(path)
+
+    if path.suffix == ".parquet":
+        from aiq.profiler.parquet_io import read_intermediate_steps_parquet
+        return read_intermediate_steps_parquet(path)
+
+    traces = dict(iter_profiler_traces(path))
+    return [traces.get(i, []) for i in range(max(traces, default=-1) + 1)]
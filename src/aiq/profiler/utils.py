@@ -17,6 +17,7 @@ import inspect
 import logging
 import re
 from collections.abc import Callable
+from enum import Enum
 from typing import Any
 
 import pandas as pd
@@ -145,40 +146,66 @@ def detect_llm_frameworks_in_build_fn(registration: RegisteredFunctionInfo) -> l
 # -------------------------------------------------------------------
 # Create a single standardized DataFrame for all usage stats
 # -------------------------------------------------------------------
+def _as_text(value: Any) -> str | None:
+    """Mirror `DataFrameRow.cast_to_str` without the per-row validation overhead."""
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
 def create_standardized_dataframe(requests_data: list[list[IntermediateStep]]) -> pd.DataFrame:
     """
     Merge usage stats for *all* requests into one DataFrame, each row representing a usage_stats entry.
     - Include a column 'example_number' to mark which request it originated from.
+
+    The frame is built column-wise, the columns (and their order) are those of `DataFrameRow`. Values are not
+    validated row-by-row; text columns are cast to `str` and the framework is stored as its string value, matching
+    the output of `DataFrameRow.model_dump()`.
     """
-    all_rows = []
+    columns: dict[str, list[Any]] = {name: [] for name in DataFrameRow.model_fields}
     try:
         for i, steps in enumerate(requests_data):
             for step in steps:
-                # Create a DataFrameRow
-                all_rows.append(
-                    DataFrameRow(event_timestamp=step.event_timestamp,
-                                 example_number=i,
-                                 prompt_tokens=step.token_usage.prompt_tokens,
-                                 completion_tokens=step.token_usage.completion_tokens,
-                                 total_tokens=step.token_usage.total_tokens,
-                                 llm_text_input=step.llm_text_input,
-                                 llm_text_output=step.llm_text_output,
-                                 llm_new_token=step.llm_text_chunk,
-                                 llm_name=step.llm_name,
-                                 tool_name=step.tool_name,
-                                 function_name=step.function_name,
-                                 function_id=step.function_id,
-                                 parent_function_name=step.parent_function_name,
-                                 parent_function_id=step.parent_function_id,
-                                 UUID=step.payload.UUID,
-                                 framework=step.framework,
-                                 event_type=step.event_type).model_dump(), )
+                token_usage = step.token_usage
+                columns["event_type"].append(step.event_type)
+                columns["event_timestamp"].append(step.event_timestamp)
+                columns["example_number"].append(i)
+                columns["prompt_tokens"].append(token_usage.prompt_tokens)
+                columns["completion_tokens"].append(token_usage.completion_tokens)
+                columns["total_tokens"].append(token_usage.total_tokens)
+                columns["llm_text_input"].append(_as_text(step.llm_text_input))
+                columns["llm_text_output"].append(_as_text(step.llm_text_output))
+                columns["llm_new_token"].append(_as_text(step.llm_text_chunk))
+                columns["llm_name"].append(step.llm_name)
+                columns["tool_name"].append(step.tool_name)
+                columns["function_name"].append(step.function_name)
+                columns["function_id"].append(step.function_id)
+                columns["parent_function_name"].append(step.parent_function_name)
+                columns["parent_function_id"].append(step.parent_function_id)
+                columns["UUID"].append(step.payload.UUID)
+                columns["framework"].append(_enum_value(step.framework))
 
     except Exception as e:
         logger.exception("Error creating standardized DataFrame: %s", e, exc_info=True)
         return pd.DataFrame()
 
-    if not all_rows:
+    if not columns["event_type"]:
         return pd.DataFrame()
 
-    return pd.DataFrame.from_records(all_rows)
+    return pd.DataFrame(columns)
+
+
+def get_standardized_dataframe(data: list[list[IntermediateStep]] | pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the standardized DataFrame for `data`.
+
+    Analyses accept either the raw intermediate steps or a DataFrame previously produced by
+    `create_standardized_dataframe`, this allows the profiler to build the frame once and share it across all of
+    the analyses. A DataFrame is returned as-is, callers which need to modify it are responsible for copying it.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+
+    return create_standardized_dataframe(data)
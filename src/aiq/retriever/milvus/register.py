@@ -48,6 +48,10 @@ class MilvusRetrieverConfig(RetrieverBaseConfig, name="milvus_retriever"):
     description: str | None = Field(default=None,
                                     description="If present it will be used as the tool description",
                                     alias="collection_description")
+    collection_cache_ttl: float = Field(
+        default=300,
+        ge=0,
+        description="Number of seconds the schemas of the collections are cached before they are described again.")
 
 
 @register_retriever_provider(config_type=MilvusRetrieverConfig)
@@ -69,6 +73,7 @@ async def milvus_retriever_client(config: MilvusRetrieverConfig, builder: Builde
         client=milvus_client,
         embedder=embedder,
         content_field=config.content_field,
+        collection_cache_ttl=config.collection_cache_ttl,
     )
 
     # Using parameters in the config to set default values which can be overridden during the function call.
@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+import time
 from functools import partial
 
 from langchain_core.embeddings import Embeddings
@@ -35,6 +37,10 @@ class CollectionNotFoundError(RetrieverError):
 class MilvusRetriever(AIQRetriever):
     """
     Client for retrieving document chunks from a Milvus vectorstore
+
+    The MilvusClient is synchronous, its calls are run in a worker thread so searches do not block the event loop. The
+    fields of each collection are cached for `collection_cache_ttl` seconds, so a search only embeds the query and
+    queries the vectorstore.
     """
 
     def __init__(
@@ -43,6 +49,7 @@ class MilvusRetriever(AIQRetriever):
         embedder: Embeddings,
         content_field: str = "text",
         use_iterator: bool = False,
+        collection_cache_ttl: float = 300,
     ) -> None:
         """
         Initialize the Milvus Retriever using a preconfigured MilvusClient
@@ -56,9 +63,12 @@ class MilvusRetriever(AIQRetriever):
         if use_iterator and "search_iterator" not in dir(self._client):
             raise ValueError("This version of the pymilvus.MilvusClient does not support the search iterator.")
 
+        self._use_iterator = use_iterator
         self._search_func = self._search if not use_iterator else self._search_with_iterator
-        self._default_params = None
+        self._default_params = {}
         self._bound_params = []
+        self._collection_fields: dict[str, tuple[list[str], float]] = {}
+        self.collection_cache_ttl = collection_cache_ttl
         self.content_field = content_field
         logger.info("Mivlus Retriever using %s for search.", self._search_func.__name__)
 
@@ -72,6 +82,7 @@ class MilvusRetriever(AIQRetriever):
         if "query" in kwargs:
             kwargs = {k: v for k, v in kwargs.items() if k != "query"}
         self._search_func = partial(self._search_func, **kwargs)
+        self._default_params.update(kwargs)
         self._bound_params = list(kwargs.keys())
         logger.debug("Binding paramaters for search function: %s", kwargs)
 
@@ -84,9 +95,67 @@ class MilvusRetriever(AIQRetriever):
     def _validate_collection(self, collection_name: str) -> bool:
         return collection_name in self._client.list_collections()
 
+    async def _get_collection_fields(self, collection_name: str) -> list[str]:
+        """
+        Returns the names of the fields of the collection, raising `CollectionNotFoundError` if it does not exist.
+        The fields are cached, collections which do not exist are looked up again by the next search.
+        """
+        cached = self._collection_fields.get(collection_name)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        if not await asyncio.to_thread(self._validate_collection, collection_name):
+            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
+
+        collection_schema = await asyncio.to_thread(self._client.describe_collection, collection_name)
+        fields = [field.get("name") for field in collection_schema.get("fields", [])]
+        self._collection_fields[collection_name] = (fields, time.monotonic() + self.collection_cache_ttl)
+
+        return fields
+
+    def invalidate_collections(self):
+        """Clears the cached fields of the collections"""
+        self._collection_fields.clear()
+
+    async def _get_output_fields(self,
+                                 collection_name: str,
+                                 output_fields: list[str] | None,
+                                 vector_field_name: str | None) -> list[str]:
+        available_fields = await self._get_collection_fields(collection_name)
+
+        if self.content_field not in available_fields:
+            raise ValueError(f"The specified content field: {self.content_field} is not part of the schema.")
+
+        if vector_field_name not in available_fields:
+            raise ValueError(f"The specified vector field name: {vector_field_name} is not part of the schema.")
+
+        # If no output fields are specified, return all of them
+        if not output_fields:
+            output_fields = [field for field in available_fields if field != vector_field_name]
+        else:
+            # the output fields may be bound to the search, they must not be modified
+            output_fields = list(output_fields)
+
+        if self.content_field not in output_fields:
+            output_fields.append(self.content_field)
+
+        return output_fields
+
     async def search(self, query: str, **kwargs):
         return await self._search_func(query=query, **kwargs)
 
+    async def search_many(self, queries: list[str], **kwargs) -> list[RetrieverOutput]:
+        """
+        Retrieve document chunks for several queries, returning the results in the order of the queries. The queries
+        are embedded concurrently and searched with a single request to the vectorstore. The keyword arguments are
+        passed to every search, as with `search`.
+        """
+        if self._use_iterator:
+            # the search iterator only accepts a single vector
+            return list(await asyncio.gather(*(self.search(query, **kwargs) for query in queries)))
+
+        return await self._search_many(queries, **{**self._default_params, **kwargs})
+
     async def _search_with_iterator(self,
                                     query: str,
                                     *,
@@ -108,34 +177,30 @@ class MilvusRetriever(AIQRetriever):
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
-            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
+        available_fields = await self._get_collection_fields(collection_name)
 
         # If no output fields are specified, return all of them
         if not output_fields:
-            collection_schema = self._client.describe_collection(collection_name)
-            output_fields = [
-                field["name"] for field in collection_schema.get("fields") if field["name"] != vector_field_name
-            ]
-
-        search_vector = self._embedder.embed_query(query)
-
-        search_iterator = self._client.search_iterator(
-            collection_name=collection_name,
-            data=[search_vector],
-            batch_size=kwargs.get("batch_size", 1000),
-            filter=filters,
-            limit=top_k,
-            output_fields=output_fields,
-            search_params=search_params if search_params else {"metric_type": "L2"},
-            timeout=timeout,
-            anns_field=vector_field_name,
-            round_decimal=kwargs.get("round_decimal", -1),
-            partition_names=kwargs.get("partition_names", None),
-        )
+            output_fields = [field for field in available_fields if field != vector_field_name]
 
-        results = []
-        try:
+        search_vector = await self._embedder.aembed_query(query)
+
+        def _iterate_results() -> list[Hit]:
+            search_iterator = self._client.search_iterator(
+                collection_name=collection_name,
+                data=[search_vector],
+                batch_size=kwargs.get("batch_size", 1000),
+                filter=filters,
+                limit=top_k,
+                output_fields=output_fields,
+                search_params=search_params if search_params else {"metric_type": "L2"},
+                timeout=timeout,
+                anns_field=vector_field_name,
+                round_decimal=kwargs.get("round_decimal", -1),
+                partition_names=kwargs.get("partition_names", None),
+            )
+
+            results = []
             while True:
                 _res = search_iterator.next()
                 res = _res.get_res()
@@ -148,10 +213,16 @@ class MilvusRetriever(AIQRetriever):
                         if res[0][i].distance > distance_cutoff:
                             break
                         results.append(res[0][i])
+                    search_iterator.close()
                     break
                 results.extend(res[0])
 
-                return _wrap_milvus_results(results, content_field=self.content_field)
+            return results
+
+        try:
+            # iterating over the results makes a blocking request to Milvus for each batch
+            results = await asyncio.to_thread(_iterate_results)
+            return _wrap_milvus_results(results, content_field=self.content_field)
 
         except Exception as e:
             logger.exception("Exception when retrieving results from milvus for query %s: %s", query, e)
@@ -176,28 +247,50 @@ class MilvusRetriever(AIQRetriever):
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
-            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
+        output_fields = await self._get_output_fields(collection_name, output_fields, vector_field_name)
 
-        available_fields = [v.get("name") for v in self._client.describe_collection(collection_name).get("fields", {})]
+        search_vector = await self._embedder.aembed_query(query)
+        res = await asyncio.to_thread(
+            self._client.search,
+            collection_name=collection_name,
+            data=[search_vector],
+            filter=filters,
+            output_fields=output_fields,
+            search_params=search_params if search_params else {"metric_type": "L2"},
+            timeout=timeout,
+            anns_field=vector_field_name,
+            limit=top_k,
+        )
 
-        if self.content_field not in available_fields:
-            raise ValueError(f"The specified content field: {self.content_field} is not part of the schema.")
+        return _wrap_milvus_results(res[0], content_field=self.content_field)
 
-        if vector_field_name not in available_fields:
-            raise ValueError(f"The specified vector field name: {vector_field_name} is not part of the schema.")
+    async def _search_many(self,
+                           queries: list[str],
+                           *,
+                           collection_name: str,
+                           top_k: int,
+                           filters: str | None = None,
+                           output_fields: list[str] | None = None,
+                           search_params: dict | None = None,
+                           timeout: float | None = None,
+                           vector_field_name: str | None = "vector",
+                           **kwargs) -> list[RetrieverOutput]:
+        logger.debug("MilvusRetriever searching %d queries, for collection: %s. Returning max %s results per query",
+                     len(queries),
+                     collection_name,
+                     top_k)
 
-        # If no output fields are specified, return all of them
-        if not output_fields:
-            output_fields = [field for field in available_fields if field != vector_field_name]
+        if not queries:
+            return []
 
-        if self.content_field not in output_fields:
-            output_fields.append(self.content_field)
+        output_fields = await self._get_output_fields(collection_name, output_fields, vector_field_name)
 
-        search_vector = self._embedder.embed_query(query)
-        res = self._client.search(
+        # queries are embedded with embed_query, embedding models may encode queries and documents differently
+        search_vectors = await asyncio.gather(*(self._embedder.aembed_query(query) for query in queries))
+        res = await asyncio.to_thread(
+            self._client.search,
             collection_name=collection_name,
-            data=[search_vector],
+            data=list(search_vectors),
             filter=filters,
             output_fields=output_fields,
             search_params=search_params if search_params else {"metric_type": "L2"},
@@ -206,7 +299,7 @@ class MilvusRetriever(AIQRetriever):
             limit=top_k,
         )
 
-        return _wrap_milvus_results(res[0], content_field=self.content_field)
+        return [_wrap_milvus_results(hits, content_field=self.content_field) for hits in res]
 
 
 def _wrap_milvus_results(res: list[Hit], content_field: str):
@@ -38,6 +38,10 @@ class NemoRetrieverConfig(RetrieverBaseConfig, name="nemo_retriever"):
         description="API key used to authenticate with the service. If 'None', will use ENV Variable 'NVIDIA_API_KEY'",
         default=None,
     )
+    collection_cache_ttl: float = Field(
+        default=300,
+        ge=0,
+        description="Number of seconds the ids of the collections are cached before the collections are listed again.")
 
 
 @register_retriever_provider(config_type=NemoRetrieverConfig)
@@ -50,11 +54,12 @@ async def nemo_retriever(retriever_config: NemoRetrieverConfig, builder: Builder
 async def nemo_retriever_client(config: NemoRetrieverConfig, builder: Builder):
     from aiq.retriever.nemo_retriever.retriever import NemoRetriever
 
-    retriever = NemoRetriever(**config.model_dump(exclude={"type", "top_k", "collection_name"}))
-    optional_fields = ["collection_name", "top_k", "output_fields"]
-    model_dict = config.model_dump()
-    optional_args = {field: model_dict[field] for field in optional_fields if model_dict[field] is not None}
+    # the retriever's connections are closed when the builder exits
+    async with NemoRetriever(**config.model_dump(exclude={"type", "top_k", "collection_name"})) as retriever:
+        optional_fields = ["collection_name", "top_k", "output_fields"]
+        model_dict = config.model_dump()
+        optional_args = {field: model_dict[field] for field in optional_fields if model_dict[field] is not None}
 
-    retriever.bind(**optional_args)
+        retriever.bind(**optional_args)
 
-    yield retriever
+        yield retriever
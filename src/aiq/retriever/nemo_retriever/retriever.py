@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import logging
 import os
+import time
 import typing
 from functools import partial
 from urllib.parse import urljoin
@@ -54,18 +56,51 @@ class CollectionUnavailableError(RetrieverError):
 class NemoRetriever(AIQRetriever):
     """
     Client for retrieving document chunks from a Nemo Retriever service.
+
+    Requests share a pooled HTTP client which keeps its connections open between queries, it is created on first use
+    and released by `aclose`, or when leaving the retriever's `async with` block. The ids of the collections are cached
+    for `collection_cache_ttl` seconds so a search is a single request to the service.
     """
 
-    def __init__(self, uri: str | HttpUrl, timeout: int = 60, nvidia_api_key: str = None, **kwargs):
+    def __init__(self,
+                 uri: str | HttpUrl,
+                 timeout: int = 60,
+                 nvidia_api_key: str = None,
+                 collection_cache_ttl: float = 300,
+                 **kwargs):
 
         self.base_url = str(uri)
         self.timeout = timeout
+        self.collection_cache_ttl = collection_cache_ttl
         self._search_func = self._search
         self.api_key = nvidia_api_key if nvidia_api_key else os.getenv('NVIDIA_API_KEY')
         self._bound_params = []
+        self._client: httpx.AsyncClient | None = None
+        self._collections: dict[str, Collection] = {}
+        self._collections_expire_at = 0.0
+        self._collections_lock = asyncio.Lock()
         if not self.api_key:
             logger.warning("No API key was specified as part of configuration or as an environment variable.")
 
+    async def __aenter__(self) -> "NemoRetriever":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client used for every request to the service"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(headers={"Authorization": f"Bearer {self.api_key}"}, timeout=self.timeout)
+        return self._client
+
+    async def aclose(self):
+        """Closes the connections to the service"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def bind(self, **kwargs) -> None:
         """
         Bind default values to the search method. Cannot bind the 'query' parameter.
@@ -85,10 +120,11 @@ class NemoRetriever(AIQRetriever):
         """
         return [param for param in ["query", "collection_name", "top_k"] if param not in self._bound_params]
 
-    async def get_collections(self, client) -> list[Collection]:
+    async def get_collections(self, client: httpx.AsyncClient | None = None) -> list[Collection]:
         """
         Get a list of all available collections as pydantic `Collection` objects
         """
+        client = client or self.client
         collection_response = await client.get(urljoin(self.base_url, "/v1/collections"))
         collection_response.raise_for_status()
         if not collection_response or len(collection_response.json().get('collections', [])) == 0:
@@ -100,7 +136,7 @@ class NemoRetriever(AIQRetriever):
 
         return collections
 
-    async def get_collection_by_name(self, collection_name, client) -> Collection:
+    async def get_collection_by_name(self, collection_name, client: httpx.AsyncClient | None = None) -> Collection:
         """
         Retrieve a collection using it's name. Will return the first collection found if the name is ambiguous.
         """
@@ -109,9 +145,45 @@ class NemoRetriever(AIQRetriever):
             raise CollectionUnavailableError(f"Collection {collection_name} not found")
         return collection
 
+    async def get_cached_collection(self, collection_name: str) -> Collection:
+        """
+        Retrieve a collection using its name from the cache of collections, listing the collections of the service when
+        the cache has expired or the collection is unknown.
+        """
+        collection = self._collections.get(collection_name)
+        if collection is not None and time.monotonic() < self._collections_expire_at:
+            return collection
+
+        # concurrent searches wait for a single listing of the collections
+        async with self._collections_lock:
+            collection = self._collections.get(collection_name)
+            if collection is None or time.monotonic() >= self._collections_expire_at:
+                collections = {}
+                for c in await self.get_collections():
+                    collections.setdefault(c.name, c)
+                self._collections = collections
+                self._collections_expire_at = time.monotonic() + self.collection_cache_ttl
+                collection = self._collections.get(collection_name)
+
+        if collection is None:
+            raise CollectionUnavailableError(f"Collection {collection_name} not found")
+        return collection
+
+    def invalidate_collections(self):
+        """Clears the cache of collections, the collections are listed again by the next search"""
+        self._collections = {}
+        self._collections_expire_at = 0.0
+
     async def search(self, query: str, **kwargs):
         return await self._search_func(query=query, **kwargs)
 
+    async def search_many(self, queries: list[str], **kwargs) -> list[RetrieverOutput]:
+        """
+        Run several queries concurrently over the pooled connections, returning the results in the order of the
+        queries. The keyword arguments are passed to every search.
+        """
+        return list(await asyncio.gather(*(self.search(query, **kwargs) for query in queries)))
+
     async def _search(
         self,
         query: str,
@@ -124,23 +196,29 @@ class NemoRetriever(AIQRetriever):
         """
         output = []
         try:
-            async with httpx.AsyncClient(headers={"Authorization": f"Bearer {self.api_key}"},
-                                         timeout=self.timeout) as client:
-                collection = await self.get_collection_by_name(collection_name, client)
-                url = urljoin(self.base_url, f"/v1/collections/{collection.id}/search")
+            payload = RetrieverPayload(query=query, top_k=top_k)
+            content = json.dumps(payload.model_dump(mode="python"))
 
-                payload = RetrieverPayload(query=query, top_k=top_k)
-                response = await client.post(url, content=json.dumps(payload.model_dump(mode="python")))
+            collection = await self.get_cached_collection(collection_name)
+            response = await self.client.post(urljoin(self.base_url, f"/v1/collections/{collection.id}/search"),
+                                              content=content)
+            if response.status_code == httpx.codes.NOT_FOUND:
+                # the cached collection may have been deleted or re-created with a new id since it was listed
+                logger.debug("Collection %s not found, refreshing the collections", collection_name)
+                self.invalidate_collections()
+                collection = await self.get_cached_collection(collection_name)
+                response = await self.client.post(urljoin(self.base_url, f"/v1/collections/{collection.id}/search"),
+                                                  content=content)
 
-                logger.debug("response.status_code=%s", response.status_code)
+            logger.debug("response.status_code=%s", response.status_code)
 
-                response.raise_for_status()
-                output = response.json().get("chunks")
+            response.raise_for_status()
+            output = response.json().get("chunks")
 
-                # Handle output fields
-                output = [_flatten(chunk, output_fields) for chunk in output]
+            # Handle output fields
+            output = [_flatten(chunk, output_fields) for chunk in output]
 
-                return _wrap_nemo_results(output=output, content_field="content")
+            return _wrap_nemo_results(output=output, content_field="content")
 
         except Exception as e:
             logger.exception("Encountered an error when retrieving results from Nemo Retriever: %s", e)
@@ -17,16 +17,26 @@ from __future__ import annotations
 
 import importlib.metadata
 import logging
+import threading
 import time
+import typing
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
 from enum import IntFlag
 from enum import auto
 from functools import reduce
 
-from aiq.builder.workflow_builder import WorkflowBuilder
 from aiq.cli.type_registry import GlobalTypeRegistry
 from aiq.data_models.config import AIQConfig
-from aiq.runtime.session import AIQSessionManager
+from aiq.runtime.plugin_manifest import PluginManifest
+from aiq.runtime.plugin_manifest import PluginManifestEntry
+from aiq.runtime.plugin_manifest import compute_fingerprint
+from aiq.runtime.plugin_manifest import entry_point_key
+from aiq.runtime.plugin_manifest import get_config_type_names
+from aiq.runtime.plugin_manifest import get_manifest_path
+from aiq.runtime.plugin_manifest import load_manifest
+from aiq.runtime.plugin_manifest import remove_manifest
+from aiq.runtime.plugin_manifest import save_manifest
 from aiq.utils.data_models.schema_validator import validate_schema
 from aiq.utils.debugging_utils import is_debugger_attached
 from aiq.utils.io.yaml_tools import yaml_load
@@ -34,6 +44,11 @@ from aiq.utils.type_utils import StrPath
 
 logger = logging.getLogger(__name__)
 
+# Entry points which have been imported by this process, keyed by `entry_point_key`
+_loaded_entry_points: set[str] = set()
+_plugin_manifest: PluginManifest | None = None
+_plugin_lock = threading.RLock()
+
 
 class PluginTypes(IntFlag):
     COMPONENT = auto()
@@ -63,8 +78,8 @@ class PluginTypes(IntFlag):
 
 def load_config(config_file: StrPath) -> AIQConfig:
     """
-    This is the primary entry point for loading an AIQ Toolkit configuration file. It ensures that all plugins are
-    loaded and then validates the configuration file against the AIQConfig schema.
+    This is the primary entry point for loading an AIQ Toolkit configuration file. It ensures that the plugins used by
+    the configuration are loaded and then validates the configuration file against the AIQConfig schema.
 
     Parameters
     ----------
@@ -77,11 +92,11 @@ def load_config(config_file: StrPath) -> AIQConfig:
         The validated AIQConfig object
     """
 
-    # Ensure all of the plugins are loaded
-    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
     config_yaml = yaml_load(config_file)
 
+    # Ensure the plugins used by the configuration are loaded
+    register_plugins_for_config(config_yaml)
+
     # Validate configuration adheres to AIQ Toolkit schemas
     validated_aiq_config = validate_schema(config_yaml, AIQConfig)
 
@@ -103,6 +118,10 @@ async def load_workflow(config_file: StrPath, max_concurrency: int = -1):
         count, by default -1
     """
 
+    # Imported here since the builder pulls in most of the toolkit, which commands that only load a config do not need
+    from aiq.builder.workflow_builder import WorkflowBuilder
+    from aiq.runtime.session import AIQSessionManager
+
     # Load the config object
     config = load_config(config_file)
 
@@ -146,43 +165,160 @@ def discover_and_register_plugins(plugin_type: PluginTypes):
     # Get the entry points for the specified groups
     aiq_plugins = discover_entrypoints(plugin_type)
 
-    count = 0
-
     # Pause registration hooks for performance. This is useful when loading a large number of plugins.
-    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
+    with _plugin_lock, GlobalTypeRegistry.get().pause_registration_changed_hooks():
 
         for entry_point in aiq_plugins:
-            try:
-                logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+            _load_entry_point(entry_point)
+
+
+def _load_entry_point(entry_point: importlib.metadata.EntryPoint) -> bool:
+    """
+    Import a plugin's entry point unless it was already imported by this process. Returns True if it was imported.
+    """
+    key = entry_point_key(entry_point)
+    if (key in _loaded_entry_points):
+        return False
+
+    _loaded_entry_points.add(key)
+
+    try:
+        logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+
+        start_time = time.time()
+
+        entry_point.load()
+
+        elapsed_time = (time.time() - start_time) * 1000
+
+        logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
+                     entry_point.module,
+                     entry_point.name,
+                     elapsed_time)
+
+        # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
+        # The threshold is 300 ms for the first plugin, and 100 ms otherwise. Triple the threshold if a debugger is
+        # attached.
+        if (elapsed_time > (300.0 if len(_loaded_entry_points) == 1 else 100.0) * (3 if is_debugger_attached() else 1)):
+            logger.warning(
+                "Loading module '%s' from entry point '%s' took a long time (%f ms). "
+                "Ensure all imports are inside your registered functions.",
+                entry_point.module,
+                entry_point.name,
+                elapsed_time)
+
+    except ImportError:
+        logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
+        # Optionally, you can mark the plugin as unavailable or take other actions
+
+    except Exception:
+        logger.exception("An error occurred while loading plugin '%s': {e}", entry_point.name, exc_info=True)
+
+    return True
+
+
+def get_plugin_manifest() -> PluginManifest:
+    """
+    Return the index of the registrations provided by each installed plugin. The index is read from the cached
+    manifest if it matches the installed plugins, otherwise every plugin is imported to rebuild it.
+    """
+    global _plugin_manifest  # pylint: disable=global-statement
+
+    with _plugin_lock:
+        if (_plugin_manifest is not None):
+            return _plugin_manifest
+
+        entry_points = discover_entrypoints(PluginTypes.ALL)
+        fingerprint = compute_fingerprint(entry_points)
+        manifest_path = get_manifest_path()
 
-                start_time = time.time()
+        _plugin_manifest = load_manifest(manifest_path, fingerprint)
 
-                entry_point.load()
+        if (_plugin_manifest is None):
+            logger.debug("Building the plugin manifest at %s", manifest_path)
+            _plugin_manifest = _build_plugin_manifest(entry_points, fingerprint)
+            save_manifest(_plugin_manifest, manifest_path)
+
+        return _plugin_manifest
+
+
+def _build_plugin_manifest(entry_points: Iterable[importlib.metadata.EntryPoint], fingerprint: str) -> PluginManifest:
+    """
+    Import every plugin, recording what each one registers.
+    """
+    registry = GlobalTypeRegistry.get()
+    entries: list[PluginManifestEntry] = []
+
+    with registry.pause_registration_changed_hooks():
+        for entry_point in entry_points:
+            registered_before = registry.get_registered_names()
+
+            # What a plugin registers is unknown if it was imported before the manifest was built
+            provides = None
+            if (_load_entry_point(entry_point)):
+                provides = sorted(registry.get_registered_names() - registered_before)
+
+            entries.append(
+                PluginManifestEntry(group=entry_point.group,
+                                    name=entry_point.name,
+                                    value=entry_point.value,
+                                    provides=provides))
+
+    return PluginManifest(fingerprint=fingerprint, entries=entries)
+
+
+def _load_manifest_entries(entries: Iterable[PluginManifestEntry]) -> bool:
+    """
+    Import the entry points of the manifest entries, returns True if any were imported.
+    """
+    loaded = False
+
+    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
+        for entry in entries:
+            entry_point = importlib.metadata.EntryPoint(name=entry.name, value=entry.value, group=entry.group)
+            loaded = _load_entry_point(entry_point) or loaded
+
+    return loaded
+
+
+def load_plugins_providing(name: str) -> bool:
+    """
+    Import the plugins which provide a registration, as listed by `TypeRegistry.get_registered_names`. Returns True
+    if any plugin was imported. Installed as the lazy loader of the global type registry so clients and tool wrappers
+    are imported the first time the builder needs them.
+    """
+    with _plugin_lock:
+        entries, _ = get_plugin_manifest().find_entries([name])
+
+        return _load_manifest_entries(entries)
+
+
+def register_plugins_for_config(config: dict[str, typing.Any]):
+    """
+    Import the plugins providing the component types used by a configuration dictionary. The plugins registering the
+    clients and tool wrappers of other LLM frameworks are imported on demand when the workflow is built.
+
+    If the plugin manifest does not list one of the component types, every plugin is imported so the configuration is
+    validated against all registered types.
+    """
+    registry = GlobalTypeRegistry.get()
 
-                elapsed_time = (time.time() - start_time) * 1000
+    with _plugin_lock:
+        registry.set_lazy_loader(load_plugins_providing)
 
-                logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
-                             entry_point.module,
-                             entry_point.name,
-                             elapsed_time)
+        missing_names = get_config_type_names(config) - registry.get_registered_names()
+        if (not missing_names):
+            return
 
-                # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
-                # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
-                # if a debugger is attached.
-                if (elapsed_time > (300.0 if count == 0 else 100.0) * (3 if is_debugger_attached() else 1)):
-                    logger.warning(
-                        "Loading module '%s' from entry point '%s' took a long time (%f ms). "
-                        "Ensure all imports are inside your registered functions.",
-                        entry_point.module,
-                        entry_point.name,
-                        elapsed_time)
+        manifest = get_plugin_manifest()
+        entries, unknown_names = manifest.find_entries(missing_names)
 
-            except ImportError:
-                logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
-                # Optionally, you can mark the plugin as unavailable or take other actions
+        _load_manifest_entries(entries)
 
-            except Exception:
-                logger.exception("An error occurred while loading plugin '%s': {e}", entry_point.name, exc_info=True)
+        if (unknown_names):
+            logger.debug("Component types %s are not listed by the plugin manifest, loading all plugins", unknown_names)
+            discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
 
-            finally:
-                count += 1
+            # The manifest is out of date if the types were provided by one of the plugins
+            if (unknown_names & registry.get_registered_names()):
+                remove_manifest(get_manifest_path())
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import importlib.metadata
+import logging
+import os
+import typing
+from collections.abc import Iterable
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+from aiq.cli.type_registry import registration_name
+from aiq.data_models.component import AIQComponentEnum
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "plugin_manifest.json"
+MANIFEST_VERSION = 1
+
+# Sections of the configuration file whose entries are components selected by their `_type`
+_COMPONENT_SECTIONS = {
+    "functions": AIQComponentEnum.FUNCTION,
+    "llms": AIQComponentEnum.LLM_PROVIDER,
+    "embedders": AIQComponentEnum.EMBEDDER_PROVIDER,
+    "memory": AIQComponentEnum.MEMORY,
+    "retrievers": AIQComponentEnum.RETRIEVER_PROVIDER,
+}
+
+
+class PluginManifestEntry(BaseModel):
+    """
+    An entry point along with the names of the registrations made when it was imported, as listed by
+    `TypeRegistry.get_registered_names`. `provides` is None if the entry point was already imported when the manifest
+    was built, in which case what it provides is unknown.
+    """
+    group: str
+    name: str
+    value: str
+    provides: list[str] | None = None
+
+    @property
+    def key(self) -> str:
+        return entry_point_key(self)
+
+
+class PluginManifest(BaseModel):
+    """
+    Index of the registrations provided by each installed plugin, used to only import the plugins a configuration
+    needs. The manifest is only valid for the set of installed plugins it was built from, identified by `fingerprint`.
+    """
+    version: int = MANIFEST_VERSION
+    fingerprint: str
+    entries: list[PluginManifestEntry] = []
+
+    def find_entries(self, names: Iterable[str]) -> tuple[list[PluginManifestEntry], set[str]]:
+        """
+        Returns the entries providing any of the names, and the names which no entry is known to provide. Entries with
+        unknown registrations are returned whenever a name is not provided by any other entry.
+        """
+        providers: dict[str, list[PluginManifestEntry]] = {}
+        for entry in self.entries:
+            for provided in entry.provides or []:
+                providers.setdefault(provided, []).append(entry)
+
+        found: dict[str, PluginManifestEntry] = {}
+        missing: set[str] = set()
+        for name in names:
+            entries = providers.get(name)
+            if entries is None:
+                missing.add(name)
+                continue
+            for entry in entries:
+                found.setdefault(entry.key, entry)
+
+        if missing:
+            for entry in self.entries:
+                if entry.provides is None:
+                    found.setdefault(entry.key, entry)
+
+        return list(found.values()), missing
+
+
+def entry_point_key(entry_point: typing.Any) -> str:
+    return f"{entry_point.group}:{entry_point.name}"
+
+
+def get_manifest_path() -> Path:
+    """The manifest is cached in the `AIQ_CACHE_DIR` directory, defaulting to the user's cache directory"""
+    return Path(os.getenv("AIQ_CACHE_DIR", user_cache_dir(appname="aiq"))) / MANIFEST_FILE_NAME
+
+
+def compute_fingerprint(entry_points: Iterable[importlib.metadata.EntryPoint]) -> str:
+    """
+    Identifies the installed plugins. The fingerprint changes whenever a plugin is installed, removed or upgraded, or
+    an entry point is added or changed.
+    """
+    items = []
+    for entry_point in entry_points:
+        dist = entry_point.dist
+        items.append("|".join((entry_point.group,
+                               entry_point.name,
+                               entry_point.value,
+                               dist.name if dist is not None else "",
+                               dist.version if dist is not None else "")))
+
+    return hashlib.sha256("\n".join(sorted(items)).encode("utf-8")).hexdigest()
+
+
+def load_manifest(path: Path, fingerprint: str) -> PluginManifest | None:
+    """Returns the manifest cached at `path`, or None if there is none or it was built for other plugins"""
+    try:
+        manifest = PluginManifest.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        logger.debug("Ignoring unreadable plugin manifest %s: %s", path, e)
+        return None
+
+    if manifest.version != MANIFEST_VERSION or manifest.fingerprint != fingerprint:
+        logger.debug("Plugin manifest %s is out of date", path)
+        return None
+
+    return manifest
+
+
+def save_manifest(manifest: PluginManifest, path: Path):
+    """
+    Writes the manifest, replacing any previous one atomically since several processes may start at once. Failing to
+    cache the manifest is not an error, it is rebuilt by the next process.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(manifest.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Unable to cache the plugin manifest at %s: %s", path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def remove_manifest(path: Path):
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug("Unable to remove the plugin manifest at %s: %s", path, e)
+
+
+def get_config_type_names(config: dict[str, typing.Any]) -> set[str]:
+    """
+    Returns the registered component types selected in a configuration dictionary with the `_type` key, or its `type`
+    alias, named as by `TypeRegistry.get_registered_names`. Only the sections of the configuration which hold
+    registered components are inspected, other sections such as the evaluation dataset use `_type` to select between
+    built-in models.
+    """
+    names: set[str] = set()
+
+    def _get(value: typing.Any, key: str) -> typing.Any:
+        return value.get(key) if isinstance(value, dict) else None
+
+    def _values(value: typing.Any) -> Iterable[typing.Any]:
+        return value.values() if isinstance(value, dict) else ()
+
+    def _add(component_type: AIQComponentEnum, component: typing.Any):
+        for key in ("_type", "type"):
+            if isinstance(_get(component, key), str):
+                names.add(registration_name(component_type, component[key]))
+                break
+
+    for section, component_type in _COMPONENT_SECTIONS.items():
+        for component in _values(_get(config, section)):
+            _add(component_type, component)
+
+    _add(AIQComponentEnum.FUNCTION, _get(config, "workflow"))
+
+    general = _get(config, "general")
+    _add(AIQComponentEnum.FRONT_END, _get(general, "front_end"))
+    for component_type in (AIQComponentEnum.LOGGING, AIQComponentEnum.TRACING):
+        for component in _values(_get(_get(general, "telemetry"), component_type.value)):
+            _add(component_type, component)
+
+    for component in _values(_get(_get(config, "eval"), "evaluators")):
+        _add(AIQComponentEnum.EVALUATOR, component)
+
+    return names
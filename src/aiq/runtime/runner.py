@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import logging
 import typing
 from enum import Enum
@@ -22,6 +23,8 @@ from aiq.builder.context import AIQContextState
 from aiq.builder.function import Function
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.observability.async_otel_listener import AsyncOtelSpanListener
+from aiq.observability.async_otel_listener import SpanListenerSettings
+from aiq.observability.sampling import get_trace_sampler
 from aiq.utils.reactive.subject import Subject
 
 logger = logging.getLogger(__name__)
@@ -44,7 +47,11 @@ _T = typing.TypeVar("_T")
 
 class AIQRunner:
 
-    def __init__(self, input_message: typing.Any, entry_fn: Function, context_state: AIQContextState):
+    def __init__(self,
+                 input_message: typing.Any,
+                 entry_fn: Function,
+                 context_state: AIQContextState,
+                 span_listener_settings: SpanListenerSettings | None = None):
         """
         The AIQRunner class is used to run a workflow. It handles converting input and output data types and running the
         workflow with the specified concurrency.
@@ -57,6 +64,8 @@ class AIQRunner:
             The entry function to the workflow
         context_state : AIQContextState
             The context state to use
+        span_listener_settings : SpanListenerSettings | None, optional
+            The telemetry settings of the workflow, by default the process-wide defaults are used
         """
 
         if (entry_fn is None):
@@ -73,12 +82,31 @@ class AIQRunner:
         # Before we start, we need to convert the input message to the workflow input type
         self._input_message = input_message
 
-        self._span_manager = AsyncOtelSpanListener(context_state=context_state)
+        # Requests which are not sampled are not traced at all, they don't pay for listening to the event stream
+        self._span_manager: AsyncOtelSpanListener | None = None
+        settings = span_listener_settings or SpanListenerSettings()
+        sampler = settings.sampler or get_trace_sampler()
+        if sampler.sample_head():
+            self._span_manager = AsyncOtelSpanListener(context_state=context_state,
+                                                       payload_serializer=settings.payload_serializer,
+                                                       queue_config=settings.queue_config,
+                                                       sampler=sampler)
 
     @property
     def context(self) -> AIQContext:
         return self._context
 
+    @property
+    def trace_sampled(self) -> bool:
+        """Whether the spans of this run are recorded"""
+        return self._span_manager is not None
+
+    def _trace(self) -> typing.AsyncContextManager:
+        if self._span_manager is None:
+            return contextlib.nullcontext()
+
+        return self._span_manager.start()
+
     def convert(self, value: typing.Any, to_type: type[_T]) -> _T:
         return self._entry_fn.convert(value, to_type)
 
@@ -130,7 +158,7 @@ class AIQRunner:
             if (not self._entry_fn.has_single_output):
                 raise ValueError("Workflow does not support single output")
 
-            async with self._span_manager.start():
+            async with self._trace():
                 # Run the workflow
                 result = await self._entry_fn.ainvoke(self._input_message, to_type=to_type)
 
@@ -159,7 +187,7 @@ class AIQRunner:
                 raise ValueError("Workflow does not support streaming output")
 
             # Run the workflow
-            async with self._span_manager.start():
+            async with self._trace():
                 async for m in self._entry_fn.astream(self._input_message, to_type=to_type):
                     yield m
 
@@ -24,17 +24,15 @@ from copy import deepcopy
 from platformdirs import user_config_dir
 from pydantic import ConfigDict
 from pydantic import Discriminator
-from pydantic import Tag
 from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
 from pydantic import field_validator
 
 from aiq.cli.type_registry import GlobalTypeRegistry
-from aiq.cli.type_registry import RegisteredInfo
 from aiq.data_models.common import HashableBaseModel
 from aiq.data_models.common import TypedBaseModel
-from aiq.data_models.common import TypedBaseModelT
+from aiq.data_models.common import rebuild_model
 from aiq.data_models.registry_handler import RegistryHandlerBaseConfig
 
 logger = logging.getLogger(__name__)
@@ -97,35 +95,11 @@ class Settings(HashableBaseModel):
     @classmethod
     def rebuild_annotations(cls):
 
-        def compute_annotation(cls: type[TypedBaseModelT], registrations: list[RegisteredInfo[TypedBaseModelT]]):
+        type_registry = GlobalTypeRegistry.get()
 
-            while (len(registrations) < 2):
-                registrations.append(RegisteredInfo[TypedBaseModelT](full_type=f"_ignore/{len(registrations)}",
-                                                                     config_type=cls))
-
-            short_names: dict[str, int] = {}
-            type_list: list[tuple[str, type[TypedBaseModelT]]] = []
-
-            # For all keys in the list, split the key by / and increment the count of the last element
-            for key in registrations:
-                short_names[key.local_name] = short_names.get(key.local_name, 0) + 1
-
-                type_list.append((key.full_type, key.config_type))
-
-            # Now loop again and if the short name is unique, then create two entries, for the short and full name
-            for key in registrations:
-
-                if (short_names[key.local_name] == 1):
-                    type_list.append((key.local_name, key.config_type))
-
-            # pylint: disable=consider-alternative-union-syntax
-            return typing.Union[tuple(typing.Annotated[x_type, Tag(x_id)] for x_id, x_type in type_list)]
-
-        RegistryHandlerAnnotation = dict[
-            str,
-            typing.Annotated[compute_annotation(RegistryHandlerBaseConfig,
-                                                GlobalTypeRegistry.get().get_registered_registry_handlers()),
-                             Discriminator(TypedBaseModel.discriminator)]]
+        RegistryHandlerAnnotation = dict[str,
+                                         typing.Annotated[type_registry.compute_annotation(RegistryHandlerBaseConfig),
+                                                          Discriminator(TypedBaseModel.discriminator)]]
 
         should_rebuild = False
 
@@ -135,7 +109,9 @@ class Settings(HashableBaseModel):
             should_rebuild = True
 
         if (should_rebuild):
-            cls.model_rebuild(force=True)
+            return rebuild_model(cls, type_registry.get_schema_fingerprint())
+
+        return False
 
     @property
     def channel_names(self) -> list:
@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import abc
+import asyncio
 import json
 import logging
+import weakref
 from urllib.parse import urljoin
 
+import httpx
 import requests
 from pydantic import HttpUrl
 
@@ -36,20 +39,85 @@ class Sandbox(abc.ABC):
             Can also be specified through NEMO_SKILLS_SSH_SERVER env var.
         ssh_key_path: Optional[str] = None - Path to the ssh key for tunneling.
             Can also be specified through NEMO_SKILLS_SSH_KEY_PATH env var.
+        max_concurrency: int = 64 - Maximum number of in-flight requests to the sandbox server, further requests
+            wait for a slot. This also bounds the size of the connection pool.
+        max_retries: int = 3 - Number of times a request is retried when the server responds with a 502.
+        retry_backoff: float = 0.5 - Initial delay in seconds between retries, doubled after each attempt.
+        use_async_client: bool = True - Send requests with a pooled asynchronous HTTP client. When disabled the
+            blocking `requests` session is used as a fallback, running in a worker thread.
     """
 
     def __init__(
         self,
         *,
         uri: HttpUrl,
+        max_concurrency: int = 64,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        use_async_client: bool = True,
     ):
         self.url = self._get_execute_url(uri)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.use_async_client = use_async_client
+
+        # The async client and the concurrency limit are bound to an event loop, one of each is kept per loop
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
         session = requests.Session()
         adapter = requests.adapters.HTTPAdapter(pool_maxsize=1500, pool_connections=1500, max_retries=3)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
         self.http_session = session
 
+    def _get_async_client(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+            client = (httpx.AsyncClient(limits=limits, headers={"Content-Type": "application/json"}),
+                      asyncio.Semaphore(self.max_concurrency))
+            self._async_clients[loop] = client
+
+        return client
+
+    async def _async_send_request(self, request, timeout):
+        client, semaphore = self._get_async_client()
+        content = json.dumps(request)
+
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                output = await client.post(url=self.url, content=content, timeout=timeout)
+                if output.status_code != 502:
+                    return self._parse_request_output(output)
+
+                if attempt < self.max_retries:
+                    delay = self.retry_backoff * (2**attempt)
+                    logger.warning("Sandbox responded with 502, retrying in %.2fs", delay)
+                    await asyncio.sleep(delay)
+
+        # retries exhausted on 502 errors
+        raise httpx.TimeoutException("Sandbox responded with 502")
+
+    async def aclose(self):
+        """
+        Close the connection pools held by the sandbox client. The async client of each event loop is closed on the
+        loop it belongs to, the clients of loops which have already been closed can no longer be closed.
+        """
+        current_loop = asyncio.get_running_loop()
+        clients = list(self._async_clients.items())
+        self._async_clients.clear()
+        for loop, (client, _) in clients:
+            if loop is current_loop:
+                await client.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+            else:
+                logger.debug("Unable to close the sandbox client of an event loop which is no longer running")
+
+        self.http_session.close()
+
     def _send_request(self, request, timeout):
         output = self.http_session.post(
             url=self.url,
@@ -122,8 +190,11 @@ print(json.dumps(output))
 """
         request = self._prepare_request(code_to_execute, timeout)
         try:
-            output = self._send_request(request, timeout)
-        except requests.exceptions.Timeout:
+            if self.use_async_client:
+                output = await self._async_send_request(request, timeout)
+            else:
+                output = await asyncio.to_thread(self._send_request, request, timeout)
+        except (httpx.TimeoutException, requests.exceptions.Timeout):
             output = {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
         return output
 
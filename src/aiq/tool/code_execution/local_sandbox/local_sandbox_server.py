@@ -14,8 +14,11 @@
 
 import logging
 import multiprocessing
+import os
+import queue
 import resource
 import sys
+import threading
 from io import StringIO
 
 from flask import Flask
@@ -23,6 +26,16 @@ from flask import request
 
 app = Flask(__name__)
 
+# Number of worker processes kept ready by each server process. When served by uWSGI every uWSGI process owns its own
+# pool, so the total number of ready workers is UWSGI_PROCESSES * SANDBOX_POOL_SIZE.
+POOL_SIZE = int(os.environ.get("SANDBOX_POOL_SIZE", os.cpu_count() or 1))
+# Modules imported once by the fork server, workers forked from it start with them already imported
+PRELOAD_MODULES = [m for m in os.environ.get("SANDBOX_PRELOAD_MODULES", "numpy,pandas").split(",") if m]
+# need to memory-limit to avoid common errors of allocating too much
+# but this has to be done in a subprocess to not crush server itself
+# 10gb - somehow with a smaller limit the server dies when numpy is used
+MEMORY_LIMIT = int(os.environ.get("SANDBOX_MEMORY_LIMIT", 1024 * 1024 * 1024 * 10))
+
 
 @app.after_request
 def add_hsts_header(response):
@@ -34,35 +47,112 @@ def add_hsts_header(response):
     return response
 
 
-def execute_python(generated_code, timeout):
-    # running in a separate process to ensure any kind of crashes are properly handled
-    queue = multiprocessing.Queue()
-    process = multiprocessing.Process(target=execute_code_subprocess, args=(generated_code, queue))
-    process.start()
-    process.join(timeout=timeout)
+def _get_mp_context():
+    # workers are forked from a single threaded fork server which has already imported the common modules, instead of
+    # being forked from the multi-threaded server process or paying the imports on every execution
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        # importing this module lets the workers unpickle their target without importing flask again
+        ctx.set_forkserver_preload([__name__] + PRELOAD_MODULES)
+        return ctx
+    return multiprocessing.get_context()
 
-    if process.is_alive():  # didn't finish successfully
-        process.kill()
-        return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
-    return queue.get()
+def worker_main(conn):
+    """
+    Entry point of a pool worker, executes a single piece of code received over `conn` and exits.
+    """
+    resource.setrlimit(resource.RLIMIT_AS, (MEMORY_LIMIT, MEMORY_LIMIT))
+    resource.setrlimit(resource.RLIMIT_DATA, (MEMORY_LIMIT, MEMORY_LIMIT))
 
+    try:
+        generated_code = conn.recv()
+    except EOFError:
+        return
+
+    conn.send(execute_code_in_worker(generated_code))
 
-# need to memory-limit to avoid common errors of allocating too much
-# but this has to be done in a subprocess to not crush server itself
-def execute_code_subprocess(generated_code, queue):
-    limit = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
-    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
-    resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
 
+def execute_code_in_worker(generated_code):
     # this can be overriden inside generated code, so it's not a guaranteed protection
     sys.stdout = StringIO()
     try:
         exec(generated_code, {})  # pylint: disable=W0122
-        queue.put(sys.stdout.getvalue())
+        return sys.stdout.getvalue()
     except Exception as e:
         print(f"Error: {str(e)}")
-        queue.put({"process_status": "error", "stdout": "", "stderr": str(e) + "\n"})
+        return {"process_status": "error", "stdout": "", "stderr": str(e) + "\n"}
+
+
+class _Worker:
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=worker_main, args=(child_conn, ), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def stop(self):
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+
+
+class WorkerPool:
+    """
+    Pool of worker processes started ahead of time to execute python code.
+
+    Running each execution in a separate process ensures any kind of crashes are properly handled, and that nothing
+    done by the executed code leaks into the next execution. Every worker executes a single piece of code, workers are
+    forked ahead of time with common modules imported so that requests do not wait for a process to start. A
+    replacement worker is started as soon as a worker is taken from the pool.
+    """
+
+    def __init__(self, size: int):
+        self._ctx = _get_mp_context()
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        for _ in range(size):
+            self._idle.put(_Worker(self._ctx))
+
+    def execute(self, generated_code, timeout):
+        worker = self._idle.get()
+        self._idle.put(_Worker(self._ctx))
+        try:
+            worker.conn.send(generated_code)
+            if not worker.conn.poll(timeout):  # didn't finish successfully
+                return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            return {"process_status": "error", "stdout": "", "stderr": "Worker process exited unexpectedly\n"}
+        finally:
+            worker.stop()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+_pool: WorkerPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    # created lazily so that each process forked by the server (e.g. uWSGI workers) owns its own pool
+    global _pool, _pool_pid  # pylint: disable=global-statement
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = WorkerPool(size=POOL_SIZE)
+            _pool_pid = os.getpid()
+    return _pool
+
+
+def execute_python(generated_code, timeout):
+    return get_worker_pool().execute(generated_code, timeout)
 
 
 # Main Flask endpoint to handle execution requests
@@ -80,4 +170,5 @@ def execute():
 if __name__ == '__main__':
     log = logging.getLogger('werkzeug')
     log.setLevel(logging.WARNING)
+    get_worker_pool()
     app.run(port=6000)
@@ -37,6 +37,12 @@ class CodeExecutionToolConfig(FunctionBaseConfig, name="code_execution"):
     sandbox_type: Literal["local", "piston"] = Field(default="local", description="The type of code execution sandbox")
     timeout: float = Field(default=10.0, description="Number of seconds to wait for a code execution request")
     max_output_characters: int = Field(default=1000, description="Maximum number of characters that can be returned")
+    max_concurrency: int = Field(default=64,
+                                 description="Maximum number of concurrent code execution requests to the sandbox")
+    max_retries: int = Field(default=3, description="Number of retries when the sandbox responds with a 502 error")
+    use_async_client: bool = Field(default=True,
+                                   description="Use a pooled asynchronous HTTP client, when disabled a blocking "
+                                   "client running in a worker thread is used instead")
 
 
 @register_function(config_type=CodeExecutionToolConfig)
@@ -46,7 +52,11 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
     class CodeExecutionInputSchema(BaseModel):
         generated_code: str = Field(description="String containing the code to be executed")
 
-    sandbox = get_sandbox(sandbox_type=config.sandbox_type, uri=config.uri)
+    sandbox = get_sandbox(sandbox_type=config.sandbox_type,
+                          uri=config.uri,
+                          max_concurrency=config.max_concurrency,
+                          max_retries=config.max_retries,
+                          use_async_client=config.use_async_client)
 
     async def _execute_code(generated_code: str) -> dict:
         logger.info("Executing code in the sandbox at %s", config.uri)
@@ -62,9 +72,12 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
             return {"process_status": "error", "stdout": "", "stderr": e}
         return output
 
-    yield FunctionInfo.from_fn(
-        fn=_execute_code,
-        input_schema=CodeExecutionInputSchema,
-        description="""Executes the provied 'generated_code' in a python sandbox environment and returns
+    try:
+        yield FunctionInfo.from_fn(
+            fn=_execute_code,
+            input_schema=CodeExecutionInputSchema,
+            description="""Executes the provied 'generated_code' in a python sandbox environment and returns
         a dictionary containing stdout, stderr, and the execution status, as well as a session_id. The
         session_id can be used to append to code that was previously executed.""")
+    finally:
+        await sandbox.aclose()
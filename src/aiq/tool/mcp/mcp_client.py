@@ -15,13 +15,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from enum import Enum
 from typing import Any
 
+import anyio
 from mcp import ClientSession
 from mcp.client.sse import sse_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+from mcp.types import CallToolResult
+from mcp.types import ListToolsResult
 from mcp.types import TextContent
 from pydantic import BaseModel
 from pydantic import Field
@@ -116,27 +123,185 @@ class MCPSSEClient:
                 yield session
 
 
+def _is_connection_error(e: Exception) -> bool:
+    if isinstance(e, McpError):
+        return e.error.code == CONNECTION_CLOSED
+    return isinstance(e, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream))
+
+
+class MCPSessionManager(MCPSSEClient):
+    """
+    Long-lived session with an MCP SSE server.
+
+    The session is established on first use and shared by all callers, concurrent requests are multiplexed over the
+    single connection. When `health_check_interval` is set the server is pinged periodically and the session is torn
+    down if the ping fails. Requests failing because the connection was lost are retried once on a new session.
+
+    Args:
+        url (str): The url of the MCP server
+        health_check_interval (float | None): Seconds between pings of the server, `None` disables health checks
+    """
+
+    def __init__(self, url: str, health_check_interval: float | None = 30.0):
+        super().__init__(url)
+        self._health_check_interval = health_check_interval
+        self._session: ClientSession | None = None
+        self._session_task: asyncio.Task | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._lock = asyncio.Lock()
+        self._num_connections = 0
+
+    @property
+    def num_connections(self) -> int:
+        """
+        Number of sessions established with the server so far.
+        """
+        return self._num_connections
+
+    @property
+    def is_connected(self) -> bool:
+        return self._session is not None
+
+    async def _run_session(self, ready: asyncio.Future, stop_event: asyncio.Event):
+        # The SSE transport must be entered and exited from the same task, so the session lives in its own task
+        try:
+            async with self.connect_to_sse_server() as session:
+                self._session = session
+                self._num_connections += 1
+                ready.set_result(session)
+
+                while not stop_event.is_set():
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=self._health_check_interval)
+                    except asyncio.TimeoutError:
+                        await session.send_ping()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("Lost connection to the MCP server at %s: %s", self.url, e)
+        finally:
+            self._session = None
+
+    async def get_session(self) -> ClientSession:
+        """
+        Return the shared session, connecting to the server if needed.
+        """
+        async with self._lock:
+            if self._session is not None and self._session_task is not None and not self._session_task.done():
+                return self._session
+
+            ready = asyncio.get_running_loop().create_future()
+            self._stop_event = asyncio.Event()
+            self._session_task = asyncio.create_task(self._run_session(ready, self._stop_event))
+
+            return await ready
+
+    async def _invalidate(self, session: ClientSession):
+        async with self._lock:
+            if self._session is session:
+                await self._stop_session()
+
+    async def _stop_session(self):
+        if self._session_task is None:
+            return
+
+        self._stop_event.set()
+        try:
+            await self._session_task
+        except Exception:
+            logger.debug("Error closing the MCP session with %s", self.url, exc_info=True)
+        finally:
+            self._session_task = None
+            self._session = None
+
+    async def _request(self, method: str, *args, **kwargs):
+        session = await self.get_session()
+        try:
+            return await getattr(session, method)(*args, **kwargs)
+        except Exception as e:
+            if not _is_connection_error(e):
+                raise
+
+            logger.info("Connection to the MCP server at %s was closed, reconnecting", self.url)
+            await self._invalidate(session)
+
+        session = await self.get_session()
+        return await getattr(session, method)(*args, **kwargs)
+
+    async def list_tools(self) -> ListToolsResult:
+        return await self._request("list_tools")
+
+    async def call_tool(self, tool_name: str, tool_args: dict | None) -> CallToolResult:
+        return await self._request("call_tool", tool_name, tool_args)
+
+    async def aclose(self):
+        """
+        Close the session with the server.
+        """
+        async with self._lock:
+            await self._stop_session()
+
+
+_shared_session_managers: dict[tuple[str, asyncio.AbstractEventLoop], tuple[MCPSessionManager, int]] = {}
+
+
+@asynccontextmanager
+async def shared_session_manager(url: str,
+                                 health_check_interval: float | None = 30.0) -> AsyncGenerator[MCPSessionManager]:
+    """
+    Provide the session manager shared by all users of the MCP server at `url` within the running event loop. The
+    session is closed once the last user exits. The `health_check_interval` of the first user is applied.
+    """
+    key = (url, asyncio.get_running_loop())
+    manager, users = _shared_session_managers.get(key, (None, 0))
+    if manager is None:
+        manager = MCPSessionManager(url, health_check_interval=health_check_interval)
+    _shared_session_managers[key] = (manager, users + 1)
+
+    try:
+        yield manager
+    finally:
+        manager, users = _shared_session_managers[key]
+        if users == 1:
+            del _shared_session_managers[key]
+            await manager.aclose()
+        else:
+            _shared_session_managers[key] = (manager, users - 1)
+
+
 class MCPBuilder(MCPSSEClient):
     """
     Builder class used to connect to an MCP Server and generate ToolClients
 
     Args:
         url (str): The url of the MCP server
+        session_manager (MCPSessionManager | None): Session shared by the builder and the tool clients it creates. When
+            not provided a new session is established for every request.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session_manager: MCPSessionManager | None = None):
         super().__init__(url)
         self._tools = None
+        self._session_manager = session_manager
 
     async def get_tools(self):
         """
         Retrieve a dictionary of all tools served by the MCP server.
         """
-        async with self.connect_to_sse_server() as session:
-            response = await session.list_tools()
+        if self._session_manager is not None:
+            response = await self._session_manager.list_tools()
+        else:
+            async with self.connect_to_sse_server() as session:
+                response = await session.list_tools()
 
         return {
-            tool.name: MCPToolClient(self.url, tool.name, tool.description, tool_input_schema=tool.inputSchema)
+            tool.name:
+                MCPToolClient(self.url,
+                              tool.name,
+                              tool.description,
+                              tool_input_schema=tool.inputSchema,
+                              session_manager=self._session_manager)
             for tool in response.tools
         }
 
@@ -162,6 +327,9 @@ class MCPBuilder(MCPSSEClient):
         return tool
 
     async def call_tool(self, tool_name: str, tool_args: dict | None):
+        if self._session_manager is not None:
+            return await self._session_manager.call_tool(tool_name, tool_args)
+
         async with self.connect_to_sse_server() as session:
             result = await session.call_tool(tool_name, tool_args)
             return result
@@ -176,10 +344,18 @@ class MCPToolClient(MCPSSEClient):
         tool_name (str): The name of the tool to wrap
         tool_description (str): The description of the tool provided by the MCP server.
         tool_input_schema (dict): The input schema for the tool.
+        session_manager (MCPSessionManager | None): Session used to call the tool. When not provided a new session is
+            established for every call.
     """
 
-    def __init__(self, url: str, tool_name: str, tool_description: str | None, tool_input_schema: dict | None = None):
+    def __init__(self,
+                 url: str,
+                 tool_name: str,
+                 tool_description: str | None,
+                 tool_input_schema: dict | None = None,
+                 session_manager: MCPSessionManager | None = None):
         super().__init__(url)
+        self._session_manager = session_manager
         self._tool_name = tool_name
         self._tool_description = tool_description
         self._input_schema = model_from_mcp_schema(self._tool_name, tool_input_schema) if tool_input_schema else None
@@ -218,8 +394,11 @@ class MCPToolClient(MCPSSEClient):
         Args:
             tool_args (dict[str, Any]): A dictionary of key value pairs to serve as inputs for the MCP tool.
         """
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(self._tool_name, tool_args)
+        if self._session_manager is not None:
+            result = await self._session_manager.call_tool(self._tool_name, tool_args)
+        else:
+            async with self.connect_to_sse_server() as session:
+                result = await session.call_tool(self._tool_name, tool_args)
 
         output = []
         for res in result.content:
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import logging
 
 from pydantic import BaseModel
@@ -45,6 +46,16 @@ class MCPToolConfig(FunctionBaseConfig, name="mcp_tool_wrapper"):
         If true, the tool will return the exception message if the tool call fails.
         If false, raise the exception.
         """)
+    reuse_session: bool = Field(default=True,
+                                description="""
+        If true, a single long-lived session is shared by all tools using the same MCP server. If false, a new session
+        is established for every tool call.
+        """)
+    health_check_interval: float | None = Field(default=30.0,
+                                                description="""
+        Seconds between health checks of the shared session, set to null to disable health checks. Only used when
+        `reuse_session` is true.
+        """)
 
 
 @register_function(config_type=MCPToolConfig)
@@ -55,41 +66,48 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
 
     from aiq.tool.mcp.mcp_client import MCPBuilder
     from aiq.tool.mcp.mcp_client import MCPToolClient
+    from aiq.tool.mcp.mcp_client import shared_session_manager
 
-    client = MCPBuilder(url=str(config.url))
+    async with contextlib.AsyncExitStack() as stack:
+        session_manager = None
+        if config.reuse_session:
+            session_manager = await stack.enter_async_context(
+                shared_session_manager(str(config.url), health_check_interval=config.health_check_interval))
 
-    tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
-    if config.description:
-        tool.set_description(description=config.description)
+        client = MCPBuilder(url=str(config.url), session_manager=session_manager)
 
-    logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
+        tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
+        if config.description:
+            tool.set_description(description=config.description)
 
-    def _convert_from_str(input_str: str) -> tool.input_schema:
-        return tool.input_schema.model_validate_json(input_str)
+        logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
 
-    async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
-        # Run the tool, catching any errors and sending to agent for correction
-        try:
-            if tool_input:
-                args = tool_input.model_dump()
-                return await tool.acall(args)
+        def _convert_from_str(input_str: str) -> tool.input_schema:
+            return tool.input_schema.model_validate_json(input_str)
 
-            _ = tool.input_schema.model_validate(kwargs)
-            return await tool.acall(kwargs)
-        except Exception as e:
-            if config.return_exception:
+        async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
+            # Run the tool, catching any errors and sending to agent for correction
+            try:
                 if tool_input:
-                    logger.warning("Error calling tool %s with serialized input: %s",
-                                   tool.name,
-                                   tool_input.model_dump(),
-                                   exc_info=True)
-                else:
-                    logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
-                return str(e)
-            # If the tool call fails, raise the exception.
-            raise
-
-    yield FunctionInfo.create(single_fn=_response_fn,
-                              description=tool.description,
-                              input_schema=tool.input_schema,
-                              converters=[_convert_from_str])
+                    args = tool_input.model_dump()
+                    return await tool.acall(args)
+
+                _ = tool.input_schema.model_validate(kwargs)
+                return await tool.acall(kwargs)
+            except Exception as e:
+                if config.return_exception:
+                    if tool_input:
+                        logger.warning("Error calling tool %s with serialized input: %s",
+                                       tool.name,
+                                       tool_input.model_dump(),
+                                       exc_info=True)
+                    else:
+                        logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
+                    return str(e)
+                # If the tool call fails, raise the exception.
+                raise
+
+        yield FunctionInfo.create(single_fn=_response_fn,
+                                  description=tool.description,
+                                  input_schema=tool.input_schema,
+                                  converters=[_convert_from_str])
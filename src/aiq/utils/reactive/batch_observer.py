@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from typing import TypeVar
+
+from aiq.utils.reactive.observer import Observer
+from aiq.utils.reactive.observer import OnComplete
+from aiq.utils.reactive.observer import OnError
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")  # pylint: disable=invalid-name
+
+OnBatch = Callable[[list[_T]], None]
+
+
+class BatchObserver(Observer[_T]):
+    """
+    Observer which buffers events and delivers them to `on_batch` in micro-batches.
+
+    Receiving an event only appends it to a buffer. When called from a running event loop the buffered events are
+    delivered once the producer yields to the loop, or as soon as `max_batch_size` events are buffered. Without a
+    running event loop events are delivered immediately. Pending events are always delivered before `on_error` and
+    `on_complete`.
+    """
+
+    def __init__(self,
+                 on_batch: OnBatch | None = None,
+                 on_error: OnError | None = None,
+                 on_complete: OnComplete | None = None,
+                 max_batch_size: int = 64) -> None:
+        super().__init__(on_error=on_error, on_complete=on_complete)
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self._on_batch = on_batch
+        self._max_batch_size = max_batch_size
+        self._buffer: deque[_T] = deque()
+        self._flush_scheduled = False
+
+    def on_next(self, value: _T) -> None:
+        if self._stopped:
+            return
+
+        self._buffer.append(value)
+
+        if len(self._buffer) >= self._max_batch_size:
+            self.flush()
+            return
+
+        if not self._flush_scheduled:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.flush()
+                return
+
+            self._flush_scheduled = True
+            loop.call_soon(self._scheduled_flush)
+
+    def _scheduled_flush(self) -> None:
+        self._flush_scheduled = False
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Deliver all buffered events.
+        """
+        batch = []
+        try:
+            while True:
+                batch.append(self._buffer.popleft())
+        except IndexError:
+            pass
+
+        if not batch or self._on_batch is None:
+            return
+
+        try:
+            self._on_batch(batch)
+        except Exception as exc:
+            # If the callback itself raises, treat that as an error
+            self.on_error(exc)
+
+    def on_error(self, exc: Exception) -> None:
+        self.flush()
+        super().on_error(exc)
+
+    def on_complete(self) -> None:
+        self.flush()
+        super().on_complete()
@@ -32,8 +32,10 @@ OnComplete = Callable[[], None]
 class Subject(Observable[T], Observer[T], SubjectBase[T]):
     """
     A Subject is both an Observer (receives events) and an Observable (sends events).
-    - Maintains a list of ObserverBase[T].
-    - No internal buffering or replay; events are only delivered to current subscribers.
+    - Maintains a copy-on-write tuple of ObserverBase[T]. Subscribing and unsubscribing replace the tuple under a
+      lock, while emitting reads the current snapshot without taking the lock.
+    - No internal buffering or replay; events are only delivered to current subscribers. Observers wanting to
+      receive events in batches can subscribe with a `BatchObserver`.
     - Thread-safe via a lock.
 
     Once on_error or on_complete is called, the Subject is closed.
@@ -44,7 +46,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         self._lock = threading.RLock()
         self._closed = False
         self._error: Exception | None = None
-        self._observers: list[Observer[T]] = []
+        self._observers: tuple[Observer[T], ...] = ()
         self._disposed = False
 
     # ==========================================================================
@@ -60,7 +62,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
                 # Already disposed => no subscription
                 return Subscription(self, None)
 
-            self._observers.append(observer)
+            self._observers = (*self._observers, observer)
             return Subscription(self, observer)
 
     # ==========================================================================
@@ -71,14 +73,11 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         Called by producers to emit an item. Delivers synchronously to each observer.
         If closed or disposed, do nothing.
         """
-        with self._lock:
-            if self._closed or self._disposed:
-                return
-            # Copy the current observers to avoid mutation issues
-            current_observers = list(self._observers)
+        # Hot path, the observers are an immutable snapshot so no lock or copy is needed
+        if self._closed:
+            return
 
-        # Deliver outside the lock
-        for obs in current_observers:
+        for obs in self._observers:
             obs.on_next(value)
 
     def on_error(self, exc: Exception) -> None:
@@ -88,7 +87,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_obs = list(self._observers)
+            current_obs = self._observers
 
         for obs in current_obs:
             obs.on_error(exc)
@@ -101,7 +100,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_observers = list(self._observers)
+            current_observers = self._observers
             self.dispose()
 
         for obs in current_observers:
@@ -113,7 +112,9 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     def _unsubscribe_observer(self, observer: Observer[T]) -> None:
         with self._lock:
             if not self._disposed and observer in self._observers:
-                self._observers.remove(observer)
+                observers = list(self._observers)
+                observers.remove(observer)
+                self._observers = tuple(observers)
 
     # ==========================================================================
     # Disposal
@@ -126,6 +127,6 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if not self._disposed:
                 self._disposed = True
-                self._observers.clear()
+                self._observers = ()
                 self._closed = True
                 self._error = None
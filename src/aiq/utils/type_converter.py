@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import logging
 import typing
 from collections import OrderedDict
@@ -30,6 +31,20 @@ class ConvertException(Exception):
     pass
 
 
+@dataclasses.dataclass
+class _ConversionPath:
+    """
+    The converters resolved for a (source type, target type) pair. Direct candidates are tried in order, including the
+    parent's, since a converter may still reject a value with `ConvertException`.
+    """
+    is_instance: bool
+    direct: tuple[Callable, ...]
+    # the chain of converters found by the last successful indirect search in this converter
+    indirect: tuple[Callable, ...] | None = None
+    # set once an indirect search failed without any converter rejecting the value, no chain exists
+    no_indirect: bool = False
+
+
 class TypeConverter:
     _global_initialized = False
 
@@ -43,6 +58,12 @@ class TypeConverter:
         self._converters: OrderedDict[type, OrderedDict[type, Callable]] = OrderedDict()
         self._indirect_warnings_shown: set[tuple[type, type]] = set()
 
+        # Resolved conversion paths keyed by (source type, target type), valid while the registry of this converter and
+        # its parents is unchanged
+        self._paths: dict[tuple[type, typing.Any], _ConversionPath] = {}
+        self._version = 0
+        self._paths_version = 0
+
         for converter in converters:
             self.add_converter(converter)
 
@@ -68,22 +89,59 @@ class TypeConverter:
             raise ValueError("Converter's argument must have a data type.")
 
         self._converters.setdefault(to_type, OrderedDict())[from_type] = converter
+        self._version += 1
         # to do(MDD): If needed, sort by specificity here.
 
+    def _registry_version(self) -> int:
+        """Changes whenever a converter is added to this converter or one of its parents"""
+        version = self._version
+        parent = self._parent
+        while parent is not None:
+            version += parent._version
+            parent = parent._parent
+
+        return version
+
+    def _get_path(self, data, to_type: type) -> _ConversionPath:
+        version = self._registry_version()
+        if self._paths_version != version:
+            self._paths.clear()
+            self._paths_version = version
+
+        key = (type(data), to_type)
+        try:
+            path = self._paths.get(key)
+        except TypeError:
+            # the target type is not hashable, e.g. annotated with unhashable metadata
+            return self._resolve_path(data, to_type)
+
+        if path is None:
+            path = self._resolve_path(data, to_type)
+            self._paths[key] = path
+
+        return path
+
+    def _resolve_path(self, data, to_type: type) -> _ConversionPath:
+        decomposed = DecomposedType(to_type)
+
+        return _ConversionPath(is_instance=decomposed.is_instance((data, to_type)),
+                               direct=self._get_direct_converters(data, decomposed.root))
+
     def try_convert(self, data, to_type: type[_T]) -> _T | None:
         """
         Attempts to convert `data` into `to_type`. Returns None if no path is found.
         """
-        decomposed = DecomposedType(to_type)
+        if to_type is None:
+            return data
+
+        path = self._get_path(data, to_type)
 
         # 1) If data is already correct type, return it
-        if to_type is None or decomposed.is_instance((data, to_type)):
+        if path.is_instance:
             return data
 
-        root = decomposed.root
-
         # 2) Attempt direct in *this* converter
-        direct_result = self._try_direct_conversion(data, root)
+        direct_result = self._try_direct_conversion(data, path.direct)
         if direct_result is not None:
             return direct_result
 
@@ -112,25 +170,37 @@ class TypeConverter:
     # -------------------------------------------------
     # INTERNAL DIRECT CONVERSION (with parent fallback)
     # -------------------------------------------------
-    def _try_direct_conversion(self, data, target_root_type: type) -> typing.Any | None:
+    def _get_direct_converters(self, data, target_root_type: type) -> tuple[Callable, ...]:
         """
-        Tries direct conversion in *this* converter's registry.
-        If no match here, we forward to parent's direct conversion
+        Returns the converters of *this* converter's registry which can
+        convert `data` directly, followed by the parent's candidates
         for recursion up the chain.
         """
+        candidates = []
         for convert_to_type, to_type_converters in self._converters.items():
             # e.g. if Derived is a subclass of Base, this is valid
             if issubclass(DecomposedType(convert_to_type).root, target_root_type):
                 for convert_from_type, from_type_converter in to_type_converters.items():
                     if isinstance(data, DecomposedType(convert_from_type).root):
-                        try:
-                            return from_type_converter(data)
-                        except ConvertException:
-                            pass
+                        candidates.append(from_type_converter)
 
         # If we can't convert directly here, try parent
         if self._parent is not None:
-            return self._parent._try_direct_conversion(data, target_root_type)
+            candidates.extend(self._parent._get_direct_converters(data, target_root_type))
+
+        return tuple(candidates)
+
+    @staticmethod
+    def _try_direct_conversion(data, converters: tuple[Callable, ...]) -> typing.Any | None:
+        """
+        Tries the direct converters in order, the first one which does not
+        reject the data with a `ConvertException` wins.
+        """
+        for converter in converters:
+            try:
+                return converter(data)
+            except ConvertException:
+                pass
 
         return None
 
@@ -142,8 +212,7 @@ class TypeConverter:
         Attempt indirect conversion (DFS) in *this* converter.
         If no success, fallback to parent's indirect attempt.
         """
-        visited = set()
-        final = self._try_indirect_conversion(data, to_type, visited)
+        final = self._try_cached_indirect_conversion(data, to_type)
         if final is not None:
             # Warn once if found a chain
             self._maybe_warn_indirect(type(data), to_type)
@@ -158,10 +227,57 @@ class TypeConverter:
 
         return None
 
-    def _try_indirect_conversion(self, data: typing.Any, to_type: type[_T], visited: set[type]) -> _T | None:
+    def _try_cached_indirect_conversion(self, data: typing.Any, to_type: type[_T]) -> _T | None:
+        """
+        Replays the chain of conversions previously found for type(data),
+        only searching again if there is no chain yet or the data was
+        rejected by one of its converters.
+        """
+        path = self._get_path(data, to_type)
+
+        if path.indirect is not None:
+            result = self._apply_chain(data, to_type, path.indirect)
+            if result is not None:
+                return result
+
+        if path.no_indirect:
+            return None
+
+        chain: list[Callable] = []
+        rejected: list[ConvertException] = []
+        result = self._try_indirect_conversion(data, to_type, set(), chain, rejected)
+        if result is not None:
+            path.indirect = tuple(chain)
+        else:
+            # a converter rejecting this data may accept other data of the same type
+            path.no_indirect = not rejected
+
+        return result
+
+    @staticmethod
+    def _apply_chain(data: typing.Any, to_type: type[_T], chain: tuple[Callable, ...]) -> _T | None:
+        try:
+            for converter in chain:
+                data = converter(data)
+        except ConvertException:
+            return None
+
+        if isinstance(data, to_type):
+            return data
+
+        return None
+
+    def _try_indirect_conversion(self,
+                                 data: typing.Any,
+                                 to_type: type[_T],
+                                 visited: set[type],
+                                 chain: list[Callable] | None = None,
+                                 rejected: list[ConvertException] | None = None) -> _T | None:
         """
         DFS attempt to find a chain of conversions from type(data) to to_type,
-        ignoring parent. If not found, returns None.
+        ignoring parent. If not found, returns None. The converters of the
+        chain are appended to `chain`, and any `ConvertException` raised
+        along the way to `rejected`.
         """
         # 1) If data is already correct type
         if isinstance(data, to_type):
@@ -179,14 +295,19 @@ class TypeConverter:
                 if isinstance(data, convert_from_type):
                     try:
                         next_data = from_type_converter(data)
+                        if chain is not None:
+                            chain.append(from_type_converter)
                         if isinstance(next_data, to_type):
                             return next_data
                         # else keep going
-                        deeper = self._try_indirect_conversion(next_data, to_type, visited)
+                        deeper = self._try_indirect_conversion(next_data, to_type, visited, chain, rejected)
                         if deeper is not None:
                             return deeper
-                    except ConvertException:
-                        pass
+                        if chain is not None:
+                            chain.pop()
+                    except ConvertException as e:
+                        if rejected is not None:
+                            rejected.append(e)
 
         return None
 
@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.messages import SystemMessage
+from langchain_core.messages.tool import ToolMessage
+
+from aiq.agent.context_manager import CONTEXT_COMPACTION_STEP_NAME
+from aiq.agent.context_manager import TOKENS_PER_MESSAGE
+from aiq.agent.context_manager import AgentContextManager
+from aiq.agent.context_manager import approximate_token_count
+from aiq.agent.context_manager import get_token_counter
+from aiq.builder.context import AIQContext
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+
+
+def _count_words(text: str) -> int:
+    return len(text.split())
+
+
+def _words(count: int, word: str = "word") -> str:
+    return " ".join([word] * count)
+
+
+@pytest.fixture(name="steps")
+def steps_fixture() -> list[IntermediateStep]:
+    steps = []
+    subscription = AIQContext.get().intermediate_step_manager.subscribe(steps.append)
+    yield steps
+    subscription.unsubscribe()
+
+
+def test_approximate_token_count():
+    assert approximate_token_count("") == 0
+    assert approximate_token_count("abcd") == 1
+    assert approximate_token_count("abcde") == 2
+    assert get_token_counter() is approximate_token_count
+
+
+def test_count_tokens_cached():
+    counted = []
+
+    def _counter(text: str) -> int:
+        counted.append(text)
+        return _count_words(text)
+
+    context_manager = AgentContextManager(token_counter=_counter)
+    messages = [HumanMessage(content="one two"), AIMessage(content="three")]
+
+    assert context_manager.count_tokens(messages) == 3 + 2 * TOKENS_PER_MESSAGE
+    assert context_manager.count_tokens(messages) == 3 + 2 * TOKENS_PER_MESSAGE
+    assert counted == ["one two", "three"]
+
+
+def test_truncate():
+    context_manager = AgentContextManager(token_counter=_count_words)
+
+    assert context_manager.truncate("a b c", 3) == "a b c"
+
+    truncated = context_manager.truncate(_words(100), 10)
+    assert truncated.startswith(_words(10))
+    assert truncated.endswith("[truncated 90 tokens]")
+
+
+async def test_fit_disabled(steps: list[IntermediateStep]):
+    context_manager = AgentContextManager(token_counter=_count_words)
+    fixed = [HumanMessage(content="question")]
+    turns = [[AIMessage(content="thought"), HumanMessage(content=_words(100))]]
+
+    assert not context_manager.enabled
+    assert await context_manager.fit(fixed, turns) == fixed + turns[0]
+    assert not steps
+
+
+async def test_fit_compacts_old_observations(steps: list[IntermediateStep]):
+    context_manager = AgentContextManager(token_counter=_count_words, max_observation_tokens=10)
+    fixed = [HumanMessage(content="question")]
+    turns = [[AIMessage(content="first"), ToolMessage(content=_words(100), tool_call_id="a")],
+             [AIMessage(content="second"), ToolMessage(content=_words(100), tool_call_id="b")]]
+
+    messages = await context_manager.fit(fixed, turns)
+
+    # the observation of the most recent turn is kept whole
+    assert len(messages) == 5
+    assert messages[2].content == context_manager.truncate(_words(100), 10)
+    assert isinstance(messages[2], ToolMessage)
+    assert messages[2].tool_call_id == "a"
+    assert messages[4] is turns[1][1]
+
+    assert [step.event_type for step in steps] == [IntermediateStepType.CUSTOM_START, IntermediateStepType.CUSTOM_END]
+    assert steps[-1].payload.name == CONTEXT_COMPACTION_STEP_NAME
+    assert steps[-1].payload.metadata["compacted_observations"] == 1
+    assert steps[-1].payload.metadata["tokens_after"] < steps[-1].payload.metadata["tokens_before"]
+
+
+async def test_fit_drops_old_turns(steps: list[IntermediateStep]):
+    context_manager = AgentContextManager(token_counter=_count_words, max_tokens=50)
+    fixed = [HumanMessage(content=_words(10, "question"))]
+    turns = [[AIMessage(content=_words(10, str(index))), HumanMessage(content=_words(10))] for index in range(3)]
+
+    messages = await context_manager.fit(fixed, turns)
+
+    assert messages == fixed + turns[2]
+    assert context_manager.count_tokens(messages) <= 50
+    assert steps[-1].payload.metadata["dropped_turns"] == 2
+
+    # the most recent turn is kept even if it does not fit
+    context_manager.max_tokens = 10
+    assert await context_manager.fit(fixed, turns) == fixed + turns[2]
+
+
+async def test_fit_summarizes_observations():
+    summarized = []
+
+    async def _summarize(observation: str, max_tokens: int) -> str:
+        summarized.append(observation)
+        return _words(max_tokens * 2, "summary")
+
+    context_manager = AgentContextManager(token_counter=_count_words,
+                                          max_observation_tokens=5,
+                                          compaction="summarize",
+                                          summarizer=_summarize)
+    turns = [[AIMessage(content="first"), HumanMessage(content=_words(100))], [AIMessage(content="second")]]
+
+    for _ in range(2):
+        messages = await context_manager.fit([], turns)
+        # summaries longer than the budget are truncated
+        assert messages[1].content == context_manager.truncate(_words(10, "summary"), 5)
+
+    # the summary of an observation is cached
+    assert summarized == [_words(100)]
+
+
+async def test_fit_summarize_error():
+
+    async def _summarize(observation: str, max_tokens: int) -> str:
+        raise RuntimeError("summarizer failed")
+
+    context_manager = AgentContextManager(token_counter=_count_words,
+                                          max_observation_tokens=5,
+                                          compaction="summarize",
+                                          summarizer=_summarize)
+    turns = [[AIMessage(content="first"), HumanMessage(content=_words(100))], [AIMessage(content="second")]]
+
+    messages = await context_manager.fit([], turns)
+    assert messages[1].content == context_manager.truncate(_words(100), 5)
+
+
+def test_init_errors():
+    with pytest.raises(ValueError):
+        AgentContextManager(compaction="summarize")
+    with pytest.raises(ValueError):
+        AgentContextManager(keep_recent_turns=0)
+
+
+def test_trim_history(steps: list[IntermediateStep]):
+    context_manager = AgentContextManager(token_counter=_count_words, max_tokens=30)
+    messages = [
+        SystemMessage(content="system"),
+        HumanMessage(content=_words(20)),
+        AIMessage(content=_words(20)),
+        HumanMessage(content=_words(10)),
+    ]
+
+    assert context_manager.trim_history(messages) == [messages[0], messages[3]]
+    assert steps[-1].payload.metadata["dropped_messages"] == 2
+
+    # the last message is kept even if it does not fit
+    context_manager.max_tokens = 5
+    assert context_manager.trim_history(messages[1:2]) == messages[1:2]
+
+    context_manager.max_tokens = None
+    assert context_manager.trim_history(messages) == messages
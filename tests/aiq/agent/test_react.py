@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 import pytest
 from langchain_core.agents import AgentAction
 from langchain_core.messages import AIMessage
@@ -21,8 +23,10 @@ from langchain_core.messages.tool import ToolMessage
 from langgraph.graph.graph import CompiledGraph
 
 from aiq.agent.base import AgentDecision
+from aiq.agent.context_manager import AgentContextManager
 from aiq.agent.react_agent.agent import NO_INPUT_ERROR_MESSAGE
 from aiq.agent.react_agent.agent import TOOL_NOT_FOUND_ERROR_MESSAGE
+from aiq.agent.react_agent.agent import TOOL_TIMEOUT_ERROR_MESSAGE
 from aiq.agent.react_agent.agent import ReActAgentGraph
 from aiq.agent.react_agent.agent import ReActGraphState
 from aiq.agent.react_agent.agent import create_react_agent_prompt
@@ -31,6 +35,7 @@ from aiq.agent.react_agent.output_parser import MISSING_ACTION_AFTER_THOUGHT_ERR
 from aiq.agent.react_agent.output_parser import MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE
 from aiq.agent.react_agent.output_parser import ReActOutputParser
 from aiq.agent.react_agent.output_parser import ReActOutputParserException
+from aiq.agent.react_agent.prompt import PARALLEL_ACTIONS_PROMPT
 from aiq.agent.react_agent.register import ReActAgentWorkflowConfig
 
 
@@ -439,3 +444,196 @@ def test_react_custom_system_prompt(mock_llm, mock_tool):
     agent = ReActAgentGraph(llm=mock_llm, prompt=prompt, tools=tools, detailed_logs=config_react_agent.verbose)
     assert isinstance(agent, ReActAgentGraph)
     assert "Refuse" in agent.agent.get_prompts()[0].messages[0].prompt.template
+
+
+@pytest.fixture(name='mock_parallel_react_agent', scope="module")
+def mock_parallel_agent(mock_llm, mock_tool):
+    config_react_agent = ReActAgentWorkflowConfig(tool_names=['test'],
+                                                  llm_name='test',
+                                                  retry_parsing_errors=False,
+                                                  parallel_actions=True)
+    tools = [mock_tool('Tool A'), mock_tool('Tool B')]
+    prompt = create_react_agent_prompt(config_react_agent)
+    return ReActAgentGraph(llm=mock_llm, prompt=prompt, tools=tools, parallel_actions=True, tool_call_timeout=1.0)
+
+
+def test_react_parallel_actions_prompt(mock_parallel_react_agent, mock_react_agent):
+    assert PARALLEL_ACTIONS_PROMPT.strip() in mock_parallel_react_agent.agent.get_prompts(
+    )[0].messages[0].prompt.template
+    assert PARALLEL_ACTIONS_PROMPT.strip() not in mock_react_agent.agent.get_prompts()[0].messages[0].prompt.template
+
+
+async def test_output_parser_parallel_actions():
+    mock_input = ('Thought: I can look up both at once\nAction: Tool A\nAction Input: {"query": "a",\n"limit": 1}\n'
+                  'Action: Tool B\nAction Input: b\nObservation:')
+    test_output = await ReActOutputParser(parallel_actions=True).aparse(mock_input)
+    assert isinstance(test_output, list)
+    assert [(action.tool, action.tool_input) for action in test_output] == [("Tool A", '{"query": "a",\n"limit": 1}'),
+                                                                            ("Tool B", "b")]
+    assert all(action.log == mock_input for action in test_output)
+
+
+async def test_output_parser_parallel_actions_single_action():
+    mock_input = 'Thought:not_many Action:Tool A Action Input: hello, world! Observation:'
+    test_output = await ReActOutputParser(parallel_actions=True).aparse(mock_input)
+    assert [(action.tool, action.tool_input) for action in test_output] == [("Tool A", "hello, world!")]
+
+
+async def test_output_parser_parallel_actions_and_final_answer():
+    mock_input = 'Action: Tool A\nAction Input: a\nAction: Tool B\nAction Input: b\nFinal Answer: lorem ipsum'
+    with pytest.raises(ReActOutputParserException) as ex:
+        await ReActOutputParser(parallel_actions=True).aparse(mock_input)
+    assert ex.value.final_answer_and_action
+
+
+async def test_agent_node_parse_parallel_actions(mock_parallel_react_agent):
+    mock_react_agent_output = 'Thought:not_many\nAction:Tool A\nAction Input: a\nAction:Tool B\nAction Input: b'
+    mock_state = ReActGraphState(messages=[HumanMessage(content=mock_react_agent_output)])
+    agent_output = await mock_parallel_react_agent.agent_node(mock_state)
+    agent_output = agent_output.agent_scratchpad[-1]
+    assert isinstance(agent_output, list)
+    assert [(action.tool, action.tool_input) for action in agent_output] == [("Tool A", "a"), ("Tool B", "b")]
+
+
+async def test_agent_node_parse_parallel_single_action(mock_parallel_react_agent):
+    # a single action is kept as is in the scratchpad
+    mock_react_agent_output = 'Thought:not_many\nAction:Tool A\nAction Input: hello, world!\nObservation:'
+    mock_state = ReActGraphState(messages=[HumanMessage(content=mock_react_agent_output)])
+    agent_output = await mock_parallel_react_agent.agent_node(mock_state)
+    agent_output = agent_output.agent_scratchpad[-1]
+    assert isinstance(agent_output, AgentAction)
+    assert agent_output.tool == 'Tool A'
+
+
+async def test_agent_node_parallel_actions_scratchpad(mock_parallel_react_agent):
+    # the mock LLM repeats the last message, the observations of every tool called in the previous step
+    actions = [
+        AgentAction(tool='Tool A', tool_input='a', log='mock'), AgentAction(tool='Tool B', tool_input='b', log='mock')
+    ]
+    tool_response = ToolMessage(name='Tool A,Tool B', tool_call_id='Tool A,Tool B', content='Final Answer: a and b')
+    mock_state = ReActGraphState(messages=[HumanMessage('question')],
+                                 agent_scratchpad=[actions],
+                                 tool_responses=[tool_response])
+    response = await mock_parallel_react_agent.agent_node(mock_state)
+    assert response.messages[-1].content == 'a and b'
+
+
+async def test_conditional_edge_parallel_actions(mock_parallel_react_agent):
+    actions = [
+        AgentAction(tool='Tool A', tool_input='a', log='mock'), AgentAction(tool='Tool B', tool_input='b', log='mock')
+    ]
+    tool = await mock_parallel_react_agent.conditional_edge(ReActGraphState(agent_scratchpad=[actions]))
+    assert tool == AgentDecision.TOOL
+
+
+async def test_tool_node_parallel_actions(mock_parallel_react_agent):
+    actions = [
+        AgentAction(tool='Tool A', tool_input='hello', log='mock'),
+        AgentAction(tool='test', tool_input='test', log='mock'),
+        AgentAction(tool='Tool B', tool_input='world', log='mock')
+    ]
+    response = await mock_parallel_react_agent.tool_node(ReActGraphState(agent_scratchpad=[actions]))
+    assert len(response.tool_responses) == 1
+    response = response.tool_responses[-1]
+    assert isinstance(response, ToolMessage)
+    assert response.name == 'Tool A,test,Tool B'
+    not_found = TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name='test', tools=['Tool A', 'Tool B'])
+    assert response.content == (f"Observation 1 (Tool A): hello\n\nObservation 2 (test): {not_found}\n\n"
+                                "Observation 3 (Tool B): world")
+
+
+async def test_tool_node_parallel_actions_run_concurrently(mock_parallel_react_agent, monkeypatch):
+    started = []
+    release = asyncio.Event()
+
+    async def _call_tool(agent_thoughts: AgentAction) -> ToolMessage:
+        started.append(agent_thoughts.tool)
+        if len(started) == 2:
+            release.set()
+        # neither tool returns before both have started
+        await release.wait()
+        return ToolMessage(name=agent_thoughts.tool,
+                           tool_call_id=agent_thoughts.tool,
+                           content=agent_thoughts.tool_input)
+
+    monkeypatch.setattr(mock_parallel_react_agent, "_call_tool", _call_tool)
+
+    actions = [
+        AgentAction(tool='Tool A', tool_input='a', log='mock'), AgentAction(tool='Tool B', tool_input='b', log='mock')
+    ]
+    response = await mock_parallel_react_agent.tool_node(ReActGraphState(agent_scratchpad=[actions]))
+    assert sorted(started) == ['Tool A', 'Tool B']
+    assert response.tool_responses[-1].content == "Observation 1 (Tool A): a\n\nObservation 2 (Tool B): b"
+
+
+async def test_tool_node_timeout(mock_parallel_react_agent, monkeypatch):
+    original_call_tool = mock_parallel_react_agent._call_tool
+
+    async def _call_tool(agent_thoughts: AgentAction) -> ToolMessage:
+        if agent_thoughts.tool == 'Tool B':
+            await asyncio.sleep(10)
+        return await original_call_tool(agent_thoughts)
+
+    monkeypatch.setattr(mock_parallel_react_agent, "_call_tool", _call_tool)
+    monkeypatch.setattr(mock_parallel_react_agent, "tool_call_timeout", 0.01)
+
+    actions = [
+        AgentAction(tool='Tool A', tool_input='a', log='mock'), AgentAction(tool='Tool B', tool_input='b', log='mock')
+    ]
+    response = await mock_parallel_react_agent.tool_node(ReActGraphState(agent_scratchpad=[actions]))
+    timeout_message = TOOL_TIMEOUT_ERROR_MESSAGE.format(tool_name='Tool B', timeout=0.01)
+    assert response.tool_responses[
+        -1].content == f"Observation 1 (Tool A): a\n\nObservation 2 (Tool B): {timeout_message}"
+
+    # the timeout applies to a single tool call as well
+    response = await mock_parallel_react_agent.tool_node(ReActGraphState(agent_scratchpad=[actions[1]]))
+    assert response.tool_responses[-1].content == timeout_message
+
+
+async def test_tool_node_parallel_actions_error(mock_parallel_react_agent, monkeypatch):
+    cancelled = asyncio.Event()
+
+    async def _call_tool(agent_thoughts: AgentAction) -> ToolMessage:
+        if agent_thoughts.tool == 'Tool A':
+            raise RuntimeError("tool failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    monkeypatch.setattr(mock_parallel_react_agent, "_call_tool", _call_tool)
+
+    actions = [
+        AgentAction(tool='Tool A', tool_input='a', log='mock'), AgentAction(tool='Tool B', tool_input='b', log='mock')
+    ]
+    with pytest.raises(RuntimeError, match="tool failed"):
+        await mock_parallel_react_agent.tool_node(ReActGraphState(agent_scratchpad=[actions]))
+
+    # the remaining tool calls are cancelled and have finished by the time the error is raised
+    assert cancelled.is_set()
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+async def test_agent_node_context_manager(mock_llm, mock_tool):
+    context_manager = AgentContextManager(max_tokens=100, max_observation_tokens=10)
+    prompt = create_react_agent_prompt(ReActAgentWorkflowConfig(tool_names=['test'], llm_name='test'))
+    agent = ReActAgentGraph(llm=mock_llm, prompt=prompt, tools=[mock_tool('Tool A')], context_manager=context_manager)
+    agent_scratchpad = [AgentAction(tool='Tool A', tool_input='a', log=f'thought {index}') for index in range(5)]
+    tool_responses = [
+        ToolMessage(name='Tool A', tool_call_id='Tool A', content=f'{index} ' + 'x' * 200) for index in range(4)
+    ]
+    tool_responses.append(ToolMessage(name='Tool A', tool_call_id='Tool A', content='Final Answer: done'))
+    state = ReActGraphState(messages=[HumanMessage('question')],
+                            agent_scratchpad=agent_scratchpad,
+                            tool_responses=tool_responses)
+
+    scratchpad = await agent._build_scratchpad(state)
+    assert scratchpad[-2:] == [AIMessage(content='thought 4'), HumanMessage(content='Final Answer: done')]
+    assert len(scratchpad) < 10
+    assert context_manager.count_tokens([HumanMessage('question')] + scratchpad) <= 100
+    assert all(len(message.content) < 200 for message in scratchpad)
+
+    # the mock LLM repeats the most recent tool response
+    state = await agent.agent_node(state)
+    assert state.messages[-1].content == 'done'
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -287,3 +288,122 @@ def test_validate_solver_prompt_no_input():
 def test_validate_solver_prompt():
     mock_prompt = 'solve the problem'
     assert ReWOOAgentGraph.validate_solver_prompt(mock_prompt)
+
+
+def test_get_step_dependencies():
+    steps = [
+        _create_step_info("step1", "#E1", "mock_tool_A", "arg1"),
+        _create_step_info("step2", "#E2", "mock_tool_B", "arg2"),
+        _create_step_info("step3", "#E3", "mock_tool_A", {"query": "#E1 and #E2"}),
+        _create_step_info("step4", "#E4", "mock_tool_B", "#E3, #E5"),
+        _create_step_info("step5", "#E5", "mock_tool_A", "arg5"),
+    ]
+
+    # Only earlier steps are dependencies, a reference to a later placeholder is left as is
+    assert ReWOOAgentGraph._get_step_dependencies(steps) == [set(), set(), {0, 1}, {2}, set()]
+
+
+@pytest.fixture(name='mock_parallel_rewoo_agent')
+def mock_parallel_agent(mock_config_rewoo_agent, mock_llm, mock_tool):
+    tools = [mock_tool('mock_tool_A'), mock_tool('mock_tool_B')]
+    return ReWOOAgentGraph(llm=mock_llm,
+                           planner_prompt=rewoo_planner_prompt,
+                           solver_prompt=rewoo_solver_prompt,
+                           tools=tools,
+                           detailed_logs=mock_config_rewoo_agent.verbose,
+                           max_parallel_steps=2)
+
+
+def test_rewoo_init_invalid_max_parallel_steps(mock_llm, mock_tool):
+    with pytest.raises(ValueError):
+        ReWOOAgentGraph(llm=mock_llm,
+                        planner_prompt=rewoo_planner_prompt,
+                        solver_prompt=rewoo_solver_prompt,
+                        tools=[mock_tool('mock_tool_A')],
+                        max_parallel_steps=0)
+
+
+async def test_executor_node_parallel(mock_parallel_rewoo_agent):
+    execute_step = mock_parallel_rewoo_agent._execute_step
+    running = 0
+    max_running = 0
+    started = []
+
+    async def _execute_step(step_info, intermediate_results):
+        nonlocal running, max_running
+        started.append(step_info["placeholder"])
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return await execute_step(step_info, intermediate_results)
+
+    mock_parallel_rewoo_agent._execute_step = _execute_step
+
+    mock_state = ReWOOGraphState(task=HumanMessage(content="This is a task"),
+                                 plan=AIMessage(content="This is the plan"),
+                                 steps=AIMessage(content=[
+                                     _create_step_info("step1", "#E1", "mock_tool_A", "result1"),
+                                     _create_step_info("step2", "#E2", "mock_tool_B", "result2"),
+                                     _create_step_info("step3", "#E3", "mock_tool_A", "#E1 and #E2"),
+                                     _create_step_info("step4", "#E4", "mock_tool_B", "result4"),
+                                 ]),
+                                 intermediate_results={})
+
+    # All the steps are executed by a single call, at most two at a time
+    state = await mock_parallel_rewoo_agent.executor_node(mock_state)
+    assert max_running == 2
+    # The results are in plan order, although the fourth step finishes before the third one
+    assert list(state["intermediate_results"].keys()) == ["#E1", "#E2", "#E3", "#E4"]
+    assert state["intermediate_results"]["#E3"].content == "result1 and result2"
+
+    # The third step waits for the first two, the fourth step is started before it
+    assert started.index("#E4") < started.index("#E3")
+    assert await mock_parallel_rewoo_agent.conditional_edge(mock_state) == AgentDecision.END
+
+
+async def test_executor_node_parallel_resumes(mock_parallel_rewoo_agent):
+    mock_state = ReWOOGraphState(
+        task=HumanMessage(content="This is a task"),
+        plan=AIMessage(content="This is the plan"),
+        steps=AIMessage(content=[
+            _create_step_info("step1", "#E1", "mock_tool_A", "arg1"),
+            _create_step_info("step2", "#E2", "mock_tool_B", "#E1 again"),
+        ]),
+        intermediate_results={"#E1": ToolMessage(content="result1", tool_call_id="mock_tool_A")})
+
+    state = await mock_parallel_rewoo_agent.executor_node(mock_state)
+    assert state["intermediate_results"]["#E1"].content == "result1"
+    assert state["intermediate_results"]["#E2"].content == "result1 again"
+
+
+async def test_executor_node_parallel_error(mock_parallel_rewoo_agent):
+    execute_step = mock_parallel_rewoo_agent._execute_step
+    cancelled = asyncio.Event()
+
+    async def _execute_step(step_info, intermediate_results):
+        if step_info["placeholder"] == "#E1":
+            raise RuntimeError("tool failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return await execute_step(step_info, intermediate_results)
+
+    mock_parallel_rewoo_agent._execute_step = _execute_step
+
+    mock_state = ReWOOGraphState(task=HumanMessage(content="This is a task"),
+                                 plan=AIMessage(content="This is the plan"),
+                                 steps=AIMessage(content=[
+                                     _create_step_info("step1", "#E1", "mock_tool_A", "arg1"),
+                                     _create_step_info("step2", "#E2", "mock_tool_B", "arg2"),
+                                 ]),
+                                 intermediate_results={})
+
+    with pytest.raises(RuntimeError, match="tool failed"):
+        await mock_parallel_rewoo_agent.executor_node(mock_state)
+
+    # The remaining steps are cancelled and have finished by the time the error is raised
+    assert cancelled.is_set()
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
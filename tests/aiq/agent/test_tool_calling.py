@@ -21,6 +21,7 @@ from langgraph.graph.graph import CompiledGraph
 from langgraph.prebuilt import ToolNode
 
 from aiq.agent.base import AgentDecision
+from aiq.agent.context_manager import AgentContextManager
 from aiq.agent.tool_calling_agent.agent import ToolCallAgentGraph
 from aiq.agent.tool_calling_agent.agent import ToolCallAgentGraphState
 from aiq.agent.tool_calling_agent.register import ToolCallAgentWorkflowConfig
@@ -141,3 +142,22 @@ async def test_graph(mock_tool_graph):
     response = response.messages[-1]  # pylint: disable=unsubscriptable-object
     assert isinstance(response, AIMessage)
     assert response.content == 'mock query'
+
+
+async def test_agent_node_context_manager(mock_tool, mock_llm):
+    context_manager = AgentContextManager(max_tokens=100, max_observation_tokens=10)
+    agent = ToolCallAgentGraph(llm=mock_llm, tools=[mock_tool('Tool A')], context_manager=context_manager)
+    tool_call = {"name": "Tool A", "args": {"query": "test"}, "id": "Tool A", "type": "tool_call"}
+    messages = [HumanMessage(content='question')]
+    for index in range(5):
+        messages += [
+            AIMessage(content='', tool_calls=[tool_call]),
+            ToolMessage(content=f'{index} ' + 'x' * 200, tool_call_id='Tool A')
+        ]
+
+    state = await agent.agent_node(ToolCallAgentGraphState(messages=list(messages)))
+
+    # the whole conversation is kept in the state, only the messages sent to the LLM are reduced
+    assert state.messages[:-1] == messages
+    # the mock LLM repeats the last message it received, the most recent tool response is never compacted
+    assert state.messages[-1].content == messages[-1].content
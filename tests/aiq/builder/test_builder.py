@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 import pytest
 from openai import BaseModel
 from pydantic import ConfigDict
@@ -34,6 +36,9 @@ from aiq.cli.register_workflow import register_memory
 from aiq.cli.register_workflow import register_retriever_client
 from aiq.cli.register_workflow import register_retriever_provider
 from aiq.cli.register_workflow import register_tool_wrapper
+from aiq.data_models.component_ref import FunctionRef
+from aiq.data_models.component_ref import LLMRef
+from aiq.data_models.config import AIQConfig
 from aiq.data_models.config import GeneralConfig
 from aiq.data_models.embedder import EmbedderBaseConfig
 from aiq.data_models.function import FunctionBaseConfig
@@ -75,6 +80,16 @@ class TRetrieverProviderConfig(RetrieverBaseConfig, name="test_retriever"):
     raise_error: bool = False
 
 
+class SlowFunctionConfig(FunctionBaseConfig, name="test_slow_fn"):
+    llm_name: LLMRef | None = None
+    fn_names: list[FunctionRef] = []
+    raise_error: bool = False
+
+
+# Tracks the builds of `SlowFunctionConfig` functions
+_slow_builds = {"active": 0, "max_active": 0, "built": []}
+
+
 @pytest.fixture(scope="module", autouse=True)
 async def _register():
 
@@ -151,6 +166,31 @@ async def _register():
 
         yield TestMemoryEditor()
 
+    @register_function(config_type=SlowFunctionConfig)
+    async def register8(config: SlowFunctionConfig, b: Builder):
+
+        if config.llm_name is not None:
+            b.get_llm_config(config.llm_name)
+        for fn_name in config.fn_names:
+            b.get_function(fn_name)
+
+        _slow_builds["active"] += 1
+        _slow_builds["max_active"] = max(_slow_builds["max_active"], _slow_builds["active"])
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            _slow_builds["active"] -= 1
+
+        if (config.raise_error):
+            raise ValueError("Error")
+
+        _slow_builds["built"].append(config)
+
+        async def _inner(some_input: str) -> str:
+            return some_input + "!"
+
+        yield _inner
+
     # Register mock provider
     @register_retriever_provider(config_type=TRetrieverProviderConfig)
     async def register7(config: TRetrieverProviderConfig, builder: Builder):
@@ -585,3 +625,48 @@ async def test_built_config():
         assert workflow_config.embedders == {"embedder1": embedder_config}
         assert workflow_config.memory == {"memory1": memory_config}
         assert workflow_config.retrievers == {"retriever1": retriever_config}
+
+
+@pytest.fixture(name="slow_builds")
+def slow_builds_fixture():
+    _slow_builds.update(active=0, max_active=0, built=[])
+    return _slow_builds
+
+
+def _make_slow_config(build_concurrency: int, raise_error: bool = False) -> AIQConfig:
+    return AIQConfig(general=GeneralConfig(build_concurrency=build_concurrency),
+                     llms={"llm": TLLMProviderConfig()},
+                     functions={
+                         "leaf0": SlowFunctionConfig(llm_name="llm"),
+                         "leaf1": SlowFunctionConfig(raise_error=raise_error),
+                         "leaf2": SlowFunctionConfig(),
+                         "nested": SlowFunctionConfig(fn_names=["leaf0", "leaf1"]),
+                     },
+                     workflow=SlowFunctionConfig(fn_names=["nested", "leaf2"]))
+
+
+@pytest.mark.parametrize("build_concurrency, expected_max_active", [(1, 1), (8, 3)])
+async def test_populate_builder_concurrency(slow_builds, build_concurrency, expected_max_active):
+
+    config = _make_slow_config(build_concurrency)
+
+    async with WorkflowBuilder.from_config(config) as builder:
+        workflow = builder.build()
+
+        assert set(workflow.functions) == {"leaf0", "leaf1", "leaf2", "nested"}
+
+    # the leaves are independent of each other, the nested function and the workflow are built after them
+    assert slow_builds["max_active"] == expected_max_active
+    assert slow_builds["built"][-2:] == [config.functions["nested"], config.workflow]
+
+
+async def test_populate_builder_concurrent_error(slow_builds):
+
+    config = _make_slow_config(build_concurrency=8, raise_error=True)
+
+    with pytest.raises(ValueError) as exc_info:
+        async with WorkflowBuilder.from_config(config):
+            pass
+
+    assert "While building functions `leaf1`" in exc_info.value.__notes__
+    assert config.functions["nested"] not in slow_builds["built"]
@@ -29,6 +29,7 @@ from pydantic import BaseModel
 from aiq.builder.builder import Builder
 from aiq.builder.component_utils import ComponentInstanceData
 from aiq.builder.component_utils import _component_group_order
+from aiq.builder.component_utils import build_dependency_levels
 from aiq.builder.component_utils import build_dependency_sequence
 from aiq.builder.component_utils import config_to_dependency_objects
 from aiq.builder.component_utils import group_from_component
@@ -410,6 +411,27 @@ def test_build_dependency_sequence(nested_aiq_config: AIQConfig):
     assert noref_instance_ids == list(noref_order.keys())
 
 
+def test_build_dependency_levels(nested_aiq_config: AIQConfig):
+
+    expected_levels = [
+        {"memory0", "llm0", "embedder0", "retriever0"},
+        {"leaf_fn0", "leaf_fn1", "leaf_fn2", "leaf_fn3", "leaf_fn4"},
+        {"nested_fn1"},
+        {"nested_fn0"},
+        {"<workflow>"},
+    ]
+
+    dependency_levels = build_dependency_levels(nested_aiq_config)
+
+    assert [{x.name for x in level} for level in dependency_levels] == expected_levels
+    assert dependency_levels[-1][0].is_root
+
+    # Levels only regroup the build sequence
+    dependency_sequence = build_dependency_sequence(nested_aiq_config)
+    assert sorted(x.instance_id for level in dependency_levels for x in level) == sorted(x.instance_id
+                                                                                         for x in dependency_sequence)
+
+
 @pytest.mark.usefixtures("set_test_api_keys")
 async def test_load_hierarchial_workflow(nested_aiq_config: AIQConfig):
 
@@ -125,6 +125,27 @@ def test_chunk_preserves_parent_id(ctx: AIQContext, mgr: IntermediateStepManager
     mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_END))
 
 
+def test_function_ancestry(ctx_state: AIQContextState,
+                           mgr: IntermediateStepManager,
+                           output_steps: list[IntermediateStep]):
+    start = _payload()
+    mgr.push_intermediate_step(start)
+    mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_NEW_TOKEN))
+
+    # A chunk pushed from a different function gets its own ancestry
+    other_function = _DummyFunction(name="other")
+    token = ctx_state.active_function.set(other_function)
+    mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_NEW_TOKEN))
+    ctx_state.active_function.reset(token)
+
+    mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_END))
+
+    ancestries = [step.function_ancestry for step in output_steps]
+    assert [a.function_name for a in ancestries] == ["fn", "fn", "other", "fn"]
+    assert all(a.parent_id == "root" for a in ancestries)
+    assert ancestries[0] == ancestries[1] == ancestries[3]
+
+
 def test_end_same_context_restores_parent(ctx: AIQContext, mgr: IntermediateStepManager):
     start1 = _payload()
     mgr.push_intermediate_step(start1)
@@ -18,7 +18,9 @@ import pytest
 from _utils.configs import FunctionTestConfig
 from aiq.builder.builder import Builder
 from aiq.cli.type_registry import RegisteredFunctionInfo
+from aiq.cli.type_registry import RegisteredToolWrapper
 from aiq.cli.type_registry import TypeRegistry
+from aiq.data_models.discovery_metadata import DiscoveryMetadata
 
 
 def test_register_function(registry: TypeRegistry):
@@ -37,3 +39,63 @@ def test_register_function(registry: TypeRegistry):
     assert workflow_info.local_name == "function"
     assert workflow_info.config_type is FunctionTestConfig
     assert workflow_info.build_fn is tool_fn
+
+
+def test_get_registered_names(registry: TypeRegistry):
+
+    def tool_fn(builder: Builder):  # pylint: disable=unused-argument
+        pass
+
+    registry.register_function(
+        RegisteredFunctionInfo(full_type="test/function", config_type=FunctionTestConfig, build_fn=tool_fn))
+
+    names = registry.get_registered_names()
+    assert "function:test/function" in names
+    assert "function:function" in names
+
+
+def test_lazy_loader(registry: TypeRegistry):
+    requested: list[str] = []
+
+    def lazy_loader(name: str) -> bool:
+        requested.append(name)
+
+        if (name != "tool_wrapper:test_framework" or len(requested) > 1):
+            return False
+
+        registry.register_tool_wrapper(
+            RegisteredToolWrapper(llm_framework="test_framework",
+                                  build_fn=tool_wrapper_fn,
+                                  discovery_metadata=DiscoveryMetadata()))
+        return True
+
+    def tool_wrapper_fn(name, fn, builder):  # pylint: disable=unused-argument
+        pass
+
+    registry.set_lazy_loader(lazy_loader)
+
+    assert registry.get_tool_wrapper("test_framework").build_fn is tool_wrapper_fn
+
+    with pytest.raises(KeyError):
+        registry.get_tool_wrapper("missing_framework")
+
+    assert requested == ["tool_wrapper:test_framework", "tool_wrapper:missing_framework"]
+
+
+def test_schema_fingerprint(registry: TypeRegistry):
+    fingerprint = registry.get_schema_fingerprint()
+    annotation = registry.compute_annotation(FunctionTestConfig)
+
+    assert registry.get_schema_fingerprint() is fingerprint
+    assert registry.compute_annotation(FunctionTestConfig) is annotation
+
+    def tool_fn(builder: Builder):  # pylint: disable=unused-argument
+        pass
+
+    # Registrations change the fingerprint even when the registration changed hooks are paused
+    with registry.pause_registration_changed_hooks():
+        registry.register_function(
+            RegisteredFunctionInfo(full_type="test/function", config_type=FunctionTestConfig, build_fn=tool_fn))
+
+        assert registry.get_schema_fingerprint() != fingerprint
+        assert registry.compute_annotation(FunctionTestConfig) != annotation
@@ -15,10 +15,12 @@
 
 import json
 import typing
+from collections import OrderedDict
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+from pydantic import BaseModel
 
 from aiq.data_models import common
 
@@ -85,3 +87,39 @@ def test_subclass_depth():
                          ids=["dict-with-_type", "dict-with-type", "dict with both", "no_type", "object"])
 def test_type_discriminator(v: typing.Any, expected_value: str | None):
     assert common.TypedBaseModel.discriminator(v) == expected_value
+
+
+def test_rebuild_model(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(common, "_rebuilt_models", OrderedDict())
+
+    class RebuiltModel(BaseModel):
+        value: int
+
+    def _set_annotation(annotation: type):
+        RebuiltModel.model_fields["value"].annotation = annotation
+
+    _set_annotation(str)
+    assert common.rebuild_model(RebuiltModel, "str")
+    str_validator = RebuiltModel.__pydantic_validator__
+    assert RebuiltModel(value="a").value == "a"
+
+    _set_annotation(int)
+    assert common.rebuild_model(RebuiltModel, "int")
+    assert RebuiltModel(value="1").value == 1
+
+    # Returning to a previous fingerprint restores the schema compiled for it
+    rebuild_count = 0
+    model_rebuild = RebuiltModel.model_rebuild
+
+    def _model_rebuild(**kwargs):
+        nonlocal rebuild_count
+        rebuild_count += 1
+        return model_rebuild(**kwargs)
+
+    monkeypatch.setattr(RebuiltModel, "model_rebuild", _model_rebuild)
+
+    _set_annotation(str)
+    assert common.rebuild_model(RebuiltModel, "str")
+    assert RebuiltModel.__pydantic_validator__ is str_validator
+    assert RebuiltModel(value="a").value == "a"
+    assert rebuild_count == 0
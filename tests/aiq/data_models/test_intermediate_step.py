@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import uuid
+
+import pytest
+
+from aiq.data_models.intermediate_step import IntermediateStepCategory
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.utils.uuid_utils import uuid4_str
+
+
+@pytest.mark.parametrize("event_type", list(IntermediateStepType))
+def test_event_category_and_state(event_type: IntermediateStepType):
+    payload = IntermediateStepPayload(event_type=event_type)
+
+    category, state = event_type.value.rsplit("_", 1)
+    if event_type == IntermediateStepType.LLM_NEW_TOKEN:
+        category, state = "LLM", "CHUNK"
+
+    assert payload.event_category == IntermediateStepCategory(category)
+    assert payload.event_state == IntermediateStepState(state)
+
+
+def test_span_event_timestamp_requires_end_state():
+    IntermediateStepPayload(event_type=IntermediateStepType.TOOL_END, span_event_timestamp=1.0)
+
+    with pytest.raises(ValueError):
+        IntermediateStepPayload(event_type=IntermediateStepType.TOOL_START, span_event_timestamp=1.0)
+
+
+def test_uuid4_str():
+    ids = {uuid4_str() for _ in range(1000)}
+    assert len(ids) == 1000
+
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
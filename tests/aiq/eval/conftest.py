@@ -18,10 +18,31 @@ import typing
 import pytest
 
 if typing.TYPE_CHECKING:
+    from aiq.data_models.intermediate_step import IntermediateStep
     from aiq.eval.evaluator.evaluator_model import EvalInput
+    from aiq.eval.evaluator.evaluator_model import EvalInputItem
     from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
 
 
+@pytest.fixture(name="make_eval_input_item")
+def make_eval_input_item_fixture() -> typing.Callable[..., "EvalInputItem"]:
+    """Fixture providing a factory of EvalInputItems with the given id, output and trajectory."""
+    from aiq.eval.evaluator.evaluator_model import EvalInputItem
+
+    def _make_eval_input_item(item_id: typing.Any,
+                              output: str | None = None,
+                              trajectory: list["IntermediateStep"] | None = None) -> EvalInputItem:
+        return EvalInputItem(id=item_id,
+                             input_obj=f"question {item_id}",
+                             expected_output_obj="answer",
+                             output_obj=output,
+                             trajectory=trajectory or [],
+                             expected_trajectory=[],
+                             full_dataset_entry={})
+
+    return _make_eval_input_item
+
+
 @pytest.fixture(name="rag_expected_outputs")
 def rag_expected_outputs_fixture() -> list[str]:
     """Fixture providing expected outputs corresponding to user inputs."""
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.eval.checkpoint import EvalCheckpointWriter
+from aiq.eval.checkpoint import get_checkpoint_path
+from aiq.eval.checkpoint import load_checkpoint
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    return get_checkpoint_path(tmp_path)
+
+
+def make_trajectory(output: str) -> list[IntermediateStep]:
+    return [
+        IntermediateStep(payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_END,
+                                                         data=StreamEventData(input="question", output=output)))
+    ]
+
+
+def test_checkpoint_round_trip(checkpoint_path, make_eval_input_item):
+    with EvalCheckpointWriter(checkpoint_path) as writer:
+        writer.write_workflow_item(make_eval_input_item(1, "one", make_trajectory("one")))
+        writer.write_evaluator_item("accuracy", 1, EvalOutputItem(id=1, score=0.5, reasoning="ok"))
+        writer.write_evaluator_output("ragas", EvalOutput(average_score=0.7, eval_output_items=[]))
+
+    state = load_checkpoint(checkpoint_path)
+
+    # integer ids are keyed by their string representation
+    workflow_item = state.workflow_items["1"]
+    assert workflow_item.output_obj == "one"
+    assert workflow_item.trajectory[0].event_type == IntermediateStepType.LLM_END
+    assert workflow_item.trajectory[0].data.output == "one"
+    assert state.evaluator_items["accuracy"]["1"].score == 0.5
+    assert state.evaluator_outputs["ragas"].average_score == 0.7
+
+
+def test_checkpoint_append_and_truncate(checkpoint_path, make_eval_input_item):
+    with EvalCheckpointWriter(checkpoint_path) as writer:
+        writer.write_workflow_item(make_eval_input_item("a", "first", make_trajectory("first")))
+
+    with EvalCheckpointWriter(checkpoint_path).open(append=True) as writer:
+        writer.write_workflow_item(make_eval_input_item("b", "second", make_trajectory("second")))
+
+    assert set(load_checkpoint(checkpoint_path).workflow_items) == {"a", "b"}
+
+    # a new run starts with an empty checkpoint
+    with EvalCheckpointWriter(checkpoint_path):
+        pass
+
+    assert not load_checkpoint(checkpoint_path).workflow_items
+
+
+def test_checkpoint_skips_truncated_record(checkpoint_path, make_eval_input_item):
+    with EvalCheckpointWriter(checkpoint_path) as writer:
+        writer.write_workflow_item(make_eval_input_item("a", "first", make_trajectory("first")))
+        writer.write_workflow_item(make_eval_input_item("b", "second", make_trajectory("second")))
+
+    # simulate a crash while the last record was being written
+    content = checkpoint_path.read_text(encoding="utf-8")
+    checkpoint_path.write_text(content[:-20], encoding="utf-8")
+
+    state = load_checkpoint(checkpoint_path)
+    assert set(state.workflow_items) == {"a"}
+
+
+def test_checkpoint_drops_stale_scores(checkpoint_path, make_eval_input_item):
+    """Scores recorded before an item was re-run by the workflow are discarded"""
+    with EvalCheckpointWriter(checkpoint_path) as writer:
+        writer.write_evaluator_item("accuracy", "a", EvalOutputItem(id="a", score=0.0, reasoning=None))
+        writer.write_evaluator_item("accuracy", "b", EvalOutputItem(id="b", score=1.0, reasoning=None))
+        writer.write_evaluator_output("ragas", EvalOutput(average_score=0.0, eval_output_items=[]))
+        writer.write_workflow_item(make_eval_input_item("a", "rerun", make_trajectory("rerun")))
+
+    state = load_checkpoint(checkpoint_path)
+    assert set(state.evaluator_items["accuracy"]) == {"b"}
+    assert not state.evaluator_outputs
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import json
+import logging
 import os
 import time
 from contextlib import asynccontextmanager
@@ -28,6 +29,7 @@ from uuid import uuid4
 
 import pytest
 
+from aiq.builder.evaluator import EvaluatorInfo
 from aiq.data_models.config import AIQConfig
 from aiq.data_models.dataset_handler import EvalDatasetJsonConfig
 from aiq.data_models.evaluate import EvalConfig
@@ -38,8 +40,12 @@ from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepType
 from aiq.data_models.intermediate_step import StreamEventData
+from aiq.eval.checkpoint import EvalCheckpointWriter
+from aiq.eval.checkpoint import get_checkpoint_path
+from aiq.eval.checkpoint import load_checkpoint
 from aiq.eval.evaluate import EvaluationRun
 from aiq.eval.evaluate import EvaluationRunConfig
+from aiq.eval.evaluator.base_evaluator import BaseEvaluator
 from aiq.eval.evaluator.evaluator_model import EvalInput
 from aiq.eval.evaluator.evaluator_model import EvalInputItem
 from aiq.eval.evaluator.evaluator_model import EvalOutput
@@ -208,6 +214,25 @@ async def test_run_workflow_local_success(evaluation_run, session_manager, gener
     assert not evaluation_run.workflow_interrupted
 
 
+async def test_run_workflow_local_streams_profiler_traces(evaluation_run, session_manager, tmp_path):
+    """Test that profiler traces are written while the workflow runs when the profiler is enabled."""
+    from aiq.data_models.profiler import ProfilerConfig
+    from aiq.profiler.trace_writer import iter_profiler_traces
+
+    evaluation_run.eval_config.general.output_dir = tmp_path
+    evaluation_run.eval_config.general.profiler = ProfilerConfig()
+
+    await evaluation_run.run_workflow_local(session_manager)
+
+    assert evaluation_run.profiler_trace_path is not None
+    traces = list(iter_profiler_traces(evaluation_run.profiler_trace_path))
+    assert len(traces) == 1
+
+    request_number, steps = traces[0]
+    assert request_number == 0
+    assert steps == evaluation_run.eval_input.eval_input_items[0].trajectory
+
+
 async def test_run_workflow_local_errors(evaluation_run, session_manager):
     """Test workflow with no 'single output' fails gracefully."""
 
@@ -642,3 +667,150 @@ def test_output_directory_cleanup(max_jobs, eviction_policy, modify_jobs_fn, exp
 
     remaining_dirs = sorted(p.name for p in jobs_dir.iterdir())
     assert remaining_dirs == sorted(expected_remaining_names)
+
+
+class LengthEvaluator(BaseEvaluator):
+    """Scores items by output length and records the evaluation order"""
+
+    def __init__(self):
+        super().__init__(max_concurrency=2, tqdm_desc="Length Evaluator")
+        self.evaluated = []
+
+    async def evaluate_item(self, item: EvalInputItem) -> EvalOutputItem:
+        self.evaluated.append(item.id)
+        return EvalOutputItem(id=item.id, score=len(item.output_obj or ""), reasoning=None)
+
+
+@pytest.fixture
+def streaming_evaluator():
+    """Fixture to provide an EvaluatorInfo supporting item-level evaluation"""
+    evaluator = LengthEvaluator()
+    evaluator_info = EvaluatorInfo(config=MagicMock(),
+                                   evaluate_fn=AsyncMock(side_effect=evaluator.evaluate),
+                                   description="Length Evaluator",
+                                   evaluate_item_fn=evaluator.evaluate_item_with_limits,
+                                   aggregate_fn=evaluator.aggregate)
+    return evaluator, evaluator_info
+
+
+async def test_pipeline_evaluates_items_during_workflow(evaluation_run,
+                                                        session_manager,
+                                                        streaming_evaluator,
+                                                        generated_answer):
+    """Items are scored as soon as their workflow run finishes, without calling the batch evaluate_fn"""
+    evaluator, evaluator_info = streaming_evaluator
+    mock_batch_evaluator = MagicMock()
+    evaluators = {"Length": evaluator_info, "Batch": mock_batch_evaluator}
+
+    batch_evaluators = evaluation_run.start_evaluator_stages(evaluators)
+    assert batch_evaluators == {"Batch": mock_batch_evaluator}
+
+    try:
+        await evaluation_run.run_workflow_local(session_manager)
+        # the item was handed to the evaluator before the workflow phase ended
+        assert evaluation_run._submitted_indices == {0}
+        await evaluation_run.finish_evaluator_stages()
+    finally:
+        await evaluation_run.close_evaluator_stages()
+
+    evaluator_info.evaluate_fn.assert_not_called()
+    assert evaluator.evaluated == [1]
+    evaluator_name, result = evaluation_run.evaluation_results[-1]
+    assert evaluator_name == "Length"
+    assert result.average_score == len(generated_answer)
+
+
+async def test_pipeline_evaluates_items_not_run(evaluation_run, eval_input, streaming_evaluator):
+    """Items the workflow did not run are still scored, matching the batch evaluation"""
+    evaluator, evaluator_info = streaming_evaluator
+    eval_input.eval_input_items.append(eval_input.eval_input_items[0].model_copy(update={"id": 2, "output_obj": "ab"}))
+
+    evaluation_run.start_evaluator_stages({"Length": evaluator_info})
+    try:
+        await evaluation_run.finish_evaluator_stages()
+    finally:
+        await evaluation_run.close_evaluator_stages()
+
+    _, result = evaluation_run.evaluation_results[-1]
+    batch_result = await evaluator.evaluate(eval_input)
+    assert result == batch_result
+    assert [item.id for item in result.eval_output_items] == [1, 2]
+
+
+async def test_pipeline_disabled(evaluation_run, streaming_evaluator):
+    """All evaluators are run after the workflow if the pipeline is disabled"""
+    _, evaluator_info = streaming_evaluator
+    evaluation_run.eval_config.general.pipeline.enabled = False
+
+    evaluators = {"Length": evaluator_info}
+    assert evaluation_run.start_evaluator_stages(evaluators) == evaluators
+    assert not evaluation_run.evaluator_stages
+
+
+async def test_resume_from_checkpoint(evaluation_run,
+                                      eval_input,
+                                      session_manager,
+                                      streaming_evaluator,
+                                      tmp_path,
+                                      generated_answer):
+    """Workflow results and scores recorded in the checkpoint are restored instead of being computed again"""
+    evaluator, evaluator_info = streaming_evaluator
+    eval_input.eval_input_items.append(eval_input.eval_input_items[0].model_copy(update={"id": 2}))
+    evaluation_run.eval_config.general.output_dir = tmp_path
+
+    # item 1 was run and scored, item 2 was not run before the previous evaluation was interrupted
+    with EvalCheckpointWriter(get_checkpoint_path(tmp_path)) as writer:
+        restored_item = eval_input.eval_input_items[0].model_copy(update={"output_obj": "restored"})
+        writer.write_workflow_item(restored_item)
+        writer.write_evaluator_item("Length", 1, EvalOutputItem(id=1, score=100, reasoning=None))
+        writer.write_evaluator_output("Batch", EvalOutput(average_score=0.5, eval_output_items=[]))
+
+    evaluation_run.config.resume = True
+    evaluation_run.open_checkpoint()
+    try:
+        assert evaluation_run._restored_workflow_indices == {0}
+        batch_evaluators = evaluation_run.start_evaluator_stages({"Length": evaluator_info, "Batch": MagicMock()})
+        try:
+            await evaluation_run.run_workflow_local(session_manager)
+            await evaluation_run.finish_evaluator_stages()
+        finally:
+            await evaluation_run.close_evaluator_stages()
+
+        # the batch result is stale because item 2 was run
+        batch_evaluator = batch_evaluators["Batch"]
+        batch_evaluator.evaluate_fn = AsyncMock(return_value=EvalOutput(average_score=1.0, eval_output_items=[]))
+        await evaluation_run.run_evaluators(batch_evaluators)
+    finally:
+        evaluation_run.close_checkpoint()
+
+    assert eval_input.eval_input_items[0].output_obj == "restored"
+    assert eval_input.eval_input_items[1].output_obj == generated_answer
+    assert evaluator.evaluated == [2]
+    results = dict(evaluation_run.evaluation_results)
+    assert [item.score for item in results["Length"].eval_output_items] == [100, len(generated_answer)]
+    assert results["Batch"].average_score == 1.0
+
+    # the new results were appended to the checkpoint
+    state = load_checkpoint(get_checkpoint_path(tmp_path))
+    assert set(state.workflow_items) == {"1", "2"}
+    assert set(state.evaluator_items["Length"]) == {"1", "2"}
+    assert state.evaluator_outputs["Batch"].average_score == 1.0
+
+
+async def test_resume_all_items_restored(evaluation_run, eval_input, session_manager, tmp_path, caplog):
+    """The workflow is not run when every item was restored from the checkpoint"""
+    evaluation_run.eval_config.general.output_dir = tmp_path
+    with EvalCheckpointWriter(get_checkpoint_path(tmp_path)) as writer:
+        writer.write_workflow_item(eval_input.eval_input_items[0].model_copy(update={"output_obj": "restored"}))
+
+    evaluation_run.config.resume = True
+    evaluation_run.open_checkpoint()
+    try:
+        with caplog.at_level(logging.INFO):
+            await evaluation_run.run_workflow_local(session_manager)
+    finally:
+        evaluation_run.close_checkpoint()
+
+    assert eval_input.eval_input_items[0].output_obj == "restored"
+    assert "All 1 items were restored from the checkpoint" in caplog.text
+    assert "non-empty output" not in caplog.text
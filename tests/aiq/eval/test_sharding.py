@@ -0,0 +1,231 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from aiq.builder.evaluator import EvaluatorInfo
+from aiq.data_models.config import AIQConfig
+from aiq.data_models.dataset_handler import EvalDatasetJsonConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.profiler import ProfilerConfig
+from aiq.eval.config import EvaluationRunConfig
+from aiq.eval.evaluate import EvaluationRun
+from aiq.eval.evaluate import _averages_item_scores
+from aiq.eval.evaluator.base_evaluator import BaseEvaluator
+from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+from aiq.eval.sharding import EvalShardResult
+from aiq.eval.sharding import get_shard_indices
+from aiq.eval.sharding import get_shard_output_dir
+from aiq.eval.sharding import merge_eval_outputs
+from aiq.eval.sharding import merge_profiler_traces
+from aiq.profiler.trace_writer import ProfilerTraceWriter
+from aiq.profiler.trace_writer import load_profiler_traces
+
+# pylint: disable=redefined-outer-name
+
+
+def make_step(name: str) -> IntermediateStep:
+    return IntermediateStep(payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_END, name=name))
+
+
+@pytest.fixture
+def evaluation_run(tmp_path, make_eval_input_item):
+    eval_run = EvaluationRun(EvaluationRunConfig(config_file=Path("config.yml"), dataset=None, shards=2))
+    eval_run.eval_config = AIQConfig().eval
+    eval_run.eval_config.general.output_dir = tmp_path
+    eval_run.eval_input = EvalInput(eval_input_items=[make_eval_input_item(i) for i in range(5)])
+    return eval_run
+
+
+def test_get_shard_indices():
+    shards = [get_shard_indices(10, i, 3) for i in range(3)]
+    assert shards == [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]]
+    assert get_shard_indices(1, 1, 2) == []
+
+    with pytest.raises(ValueError):
+        get_shard_indices(10, 3, 3)
+
+
+def test_merge_eval_outputs():
+    item_order = {str(i): i for i in range(5)}
+    shard_0 = EvalOutput(average_score=0.5,
+                         eval_output_items=[
+                             EvalOutputItem(id=0, score=0.0, reasoning=None),
+                             EvalOutputItem(id=2, score=1.0, reasoning=None),
+                         ])
+    shard_1 = EvalOutput(average_score=0.8, eval_output_items=[EvalOutputItem(id=1, score=0.8, reasoning=None)])
+    no_score = EvalOutput(average_score=None, eval_output_items=[])
+
+    merged = merge_eval_outputs([(shard_0, 2), (shard_1, 1), (no_score, 2)], item_order)
+
+    assert [item.id for item in merged.eval_output_items] == [0, 1, 2]
+    assert merged.average_score == pytest.approx(0.6)
+    assert merge_eval_outputs([(no_score, 1)], item_order).average_score is None
+
+
+class ScoreEvaluator(BaseEvaluator):
+
+    def __init__(self, scores: dict):
+        super().__init__()
+        self.scores = scores
+
+    async def evaluate_item(self, item: EvalInputItem) -> EvalOutputItem:
+        return EvalOutputItem(id=item.id, score=self.scores[item.id], reasoning=None)
+
+
+async def test_merge_eval_outputs_matches_unsharded(make_eval_input_item):
+    # shard averages are rounded and items without a numeric score do not count towards them
+    scores = {0: 0.333, 1: "n/a", 2: 0.666, 3: None, 4: 1.0, 5: 0.001, 6: 0.4}
+    evaluator = ScoreEvaluator(scores)
+    items = [make_eval_input_item(item_id) for item_id in scores]
+    item_order = {str(item_id): index for index, item_id in enumerate(scores)}
+
+    unsharded = await evaluator.evaluate(EvalInput(eval_input_items=items))
+
+    shard_outputs = []
+    for shard_index in range(3):
+        shard_items = [items[index] for index in get_shard_indices(len(items), shard_index, 3)]
+        shard_output = await evaluator.evaluate(EvalInput(eval_input_items=shard_items))
+        shard_outputs.append((shard_output, len(shard_items)))
+    merged = merge_eval_outputs(shard_outputs, item_order, mean_of_items=True)
+
+    assert merged.average_score == unsharded.average_score == 0.48
+    assert merged.eval_output_items == unsharded.eval_output_items
+
+
+def resolved_rate(items: list[EvalInputItem]) -> EvalOutput:
+    """Scores the fraction of resolved items, like SWE-bench, without a numeric item score"""
+    output_items = [EvalOutputItem(id=item.id, score=item.output_obj, reasoning=None) for item in items]
+    resolved = sum(item.output_obj == "resolved" for item in items)
+    return EvalOutput(average_score=resolved / len(items), eval_output_items=output_items)
+
+
+def unrounded_mean(items: list[EvalInputItem]) -> EvalOutput:
+    """Averages the item scores without rounding, like RAGAS"""
+    output_items = [EvalOutputItem(id=item.id, score=len(item.output_obj) / 3, reasoning=None) for item in items]
+    return EvalOutput(average_score=sum(item.score for item in output_items) / len(output_items),
+                      eval_output_items=output_items)
+
+
+@pytest.mark.parametrize("evaluate", [resolved_rate, unrounded_mean])
+def test_merge_eval_outputs_evaluator_average(make_eval_input_item, evaluate):
+    outputs = ["resolved", "failed", "resolved", "failed", "failed", "resolved", "failed"]
+    items = [make_eval_input_item(item_id, output) for item_id, output in enumerate(outputs)]
+    item_order = {str(item_id): item_id for item_id in range(len(items))}
+
+    unsharded = evaluate(items)
+
+    shard_outputs = []
+    for shard_index in range(3):
+        shard_items = [items[index] for index in get_shard_indices(len(items), shard_index, 3)]
+        shard_outputs.append((evaluate(shard_items), len(shard_items)))
+    merged = merge_eval_outputs(shard_outputs, item_order)
+
+    # the shard averages are weighted by the number of items each shard evaluated, and are not rounded
+    assert merged.average_score == pytest.approx(unsharded.average_score)
+    assert merged.eval_output_items == unsharded.eval_output_items
+
+
+def test_averages_item_scores():
+    evaluator = ScoreEvaluator({})
+    info = EvaluatorInfo(config=MagicMock(),
+                         evaluate_fn=evaluator.evaluate,
+                         description="Score Evaluator",
+                         evaluate_item_fn=evaluator.evaluate_item_with_limits,
+                         aggregate_fn=evaluator.aggregate)
+    assert _averages_item_scores(info)
+    assert not _averages_item_scores(EvaluatorInfo(config=MagicMock(), evaluate_fn=evaluator.evaluate, description=""))
+
+
+def test_merge_profiler_traces(tmp_path):
+    shard_results = []
+    for shard_index in range(2):
+        indices = get_shard_indices(3, shard_index, 2)
+        trace_path = tmp_path / f"shard_{shard_index}.jsonl"
+        with ProfilerTraceWriter(trace_path) as writer:
+            for local_index, index in enumerate(indices):
+                writer.write_request(local_index, [make_step(f"request {index}")])
+        shard_results.append(EvalShardResult(shard_index=shard_index, indices=indices, profiler_trace_path=trace_path))
+
+    merged_path = tmp_path / "merged.jsonl"
+    assert merge_profiler_traces(shard_results, merged_path) == 3
+
+    traces = load_profiler_traces(merged_path)
+    assert [steps[0].payload.name for steps in traces] == ["request 0", "request 1", "request 2"]
+
+
+def test_merge_shard_results(evaluation_run, make_eval_input_item):
+    evaluation_run.eval_config.general.profiler = ProfilerConfig()
+    results = [
+        EvalShardResult(
+            shard_index=0,
+            indices=[0, 2, 4],
+            eval_input_items=[make_eval_input_item(i, f"output {i}") for i in (0, 2, 4)],
+            evaluation_results=[
+                ("accuracy",
+                 EvalOutput(average_score=1.0,
+                            eval_output_items=[EvalOutputItem(id=i, score=1.0, reasoning=None) for i in (0, 2, 4)]))
+            ],
+            mean_of_items_evaluators=["accuracy"]),
+        RuntimeError("shard failed"),
+    ]
+
+    evaluation_run.merge_shard_results(results)
+
+    items = evaluation_run.eval_input.eval_input_items
+    assert [item.output_obj for item in items] == ["output 0", None, "output 2", None, "output 4"]
+    assert evaluation_run.workflow_interrupted
+
+    evaluator_name, eval_output = evaluation_run.evaluation_results[0]
+    assert evaluator_name == "accuracy"
+    assert eval_output.average_score == 1.0
+    assert [item.id for item in eval_output.eval_output_items] == [0, 2, 4]
+
+    # the traces of a failed shard are missing, the profiler falls back to the in-memory trajectories
+    assert evaluation_run.profiler_trace_path is None
+
+
+async def test_run_shard(evaluation_run, tmp_path, make_eval_input_item):
+    """A shard evaluates its own slice of the dataset and writes to its own output directory"""
+    aiq_config = AIQConfig()
+    aiq_config.eval.general.dataset = EvalDatasetJsonConfig()
+    dataset_handler = MagicMock()
+    dataset_handler.get_eval_input_from_dataset.return_value = EvalInput(
+        eval_input_items=[make_eval_input_item(i) for i in range(5)])
+
+    async def run_workflow_and_evaluators(_config):
+        for item in shard_run.eval_input.eval_input_items:
+            item.output_obj = f"output {item.id}"
+
+    shard_run = EvaluationRun(evaluation_run.config)
+    output_dir = get_shard_output_dir(tmp_path, 1)
+    with patch.object(shard_run, "load_aiq_config", return_value=aiq_config), \
+         patch("aiq.eval.evaluate.DatasetHandler", return_value=dataset_handler), \
+         patch.object(shard_run, "run_workflow_and_evaluators", side_effect=run_workflow_and_evaluators):
+        result = await shard_run.run_shard(1, 2, output_dir)
+
+    assert shard_run.eval_config.general.output_dir == output_dir
+    assert result.shard_index == 1
+    assert result.indices == [1, 3]
+    assert [item.output_obj for item in result.eval_input_items] == ["output 1", "output 3"]
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiq.builder.evaluator import EvaluatorInfo
+from aiq.eval.evaluator.base_evaluator import BaseEvaluator
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+from aiq.eval.utils.evaluator_pipeline import EvaluatorStage
+
+# pylint: disable=redefined-outer-name
+
+
+class LengthEvaluator(BaseEvaluator):
+    """Scores items by output length, optionally waiting on an event before scoring each item."""
+
+    def __init__(self, gate: asyncio.Event | None = None):
+        super().__init__(max_concurrency=4, tqdm_desc="Length Evaluator")
+        self.gate = gate
+        self.started = 0
+
+    async def evaluate_item(self, item: EvalInputItem) -> EvalOutputItem:
+        self.started += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if item.output_obj == "fail":
+            raise RuntimeError("Intentional failure")
+        return EvalOutputItem(id=item.id, score=len(item.output_obj), reasoning=None)
+
+
+def make_info(evaluator: BaseEvaluator) -> EvaluatorInfo:
+    return EvaluatorInfo(config=MagicMock(),
+                         evaluate_fn=evaluator.evaluate,
+                         description="Length Evaluator",
+                         evaluate_item_fn=evaluator.evaluate_item_with_limits,
+                         aggregate_fn=evaluator.aggregate)
+
+
+def test_evaluator_info_requires_both_item_functions():
+    evaluator = LengthEvaluator()
+    with pytest.raises(ValueError):
+        EvaluatorInfo(config=MagicMock(),
+                      evaluate_fn=evaluator.evaluate,
+                      description="Length Evaluator",
+                      evaluate_item_fn=evaluator.evaluate_item_with_limits)
+
+    info = EvaluatorInfo(config=MagicMock(), evaluate_fn=evaluator.evaluate, description="Length Evaluator")
+    assert not info.supports_streaming
+    with pytest.raises(ValueError):
+        EvaluatorStage("length", info, queue_size=1, max_concurrency=1, total=0)
+
+
+async def test_stage_orders_results_by_index(make_eval_input_item):
+    """Items submitted out of order are aggregated in dataset order."""
+    stage = EvaluatorStage("length", make_info(LengthEvaluator()), queue_size=2, max_concurrency=2, total=3)
+    stage.start()
+    try:
+        await stage.submit(2, make_eval_input_item(2, "ccc"))
+        await stage.submit(0, make_eval_input_item(0, "a"))
+        await stage.submit(1, make_eval_input_item(1, "fail"))
+        output = await stage.finish()
+    finally:
+        await stage.close()
+
+    assert [item.id for item in output.eval_output_items] == [0, 1, 2]
+    assert output.eval_output_items[1].score == 0.0
+    assert "error" in output.eval_output_items[1].reasoning
+    # (1 + 0 + 3) / 3
+    assert output.average_score == 1.33
+
+
+async def test_stage_applies_backpressure(make_eval_input_item):
+    """Submitting blocks once the workers are busy and the queue is full."""
+    gate = asyncio.Event()
+    evaluator = LengthEvaluator(gate)
+    stage = EvaluatorStage("length", make_info(evaluator), queue_size=1, max_concurrency=1, total=3)
+    stage.start()
+    try:
+        await stage.submit(0, make_eval_input_item(0, "a"))
+        # let the worker pick up the first item, the second one fills the queue
+        await asyncio.sleep(0)
+        await stage.submit(1, make_eval_input_item(1, "b"))
+        assert evaluator.started == 1
+
+        blocked = asyncio.create_task(stage.submit(2, make_eval_input_item(2, "c")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        output = await stage.finish()
+    finally:
+        await stage.close()
+
+    assert len(output.eval_output_items) == 3
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import asyncio
+import threading
 import time
 from contextlib import asynccontextmanager
 
@@ -33,6 +34,7 @@ from aiq.data_models.config import AIQConfig
 from aiq.data_models.config import GeneralConfig
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorker
+from aiq.front_ends.fastapi.job_store import SQLiteJobStore
 from aiq.test.functions import EchoFunctionConfig
 from aiq.test.functions import StreamingEchoFunctionConfig
 from aiq.utils.type_utils import override
@@ -255,6 +257,42 @@ async def test_generate_async(fn_use_openai_api: bool):
                 await asyncio.sleep(0.1)
 
 
+async def test_generate_async_sqlite_job_store(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    # the job store blocks on the database, it is never called from the event loop thread
+    store_threads = set()
+    for method_name in ("_execute", "_fetchone", "_fetchall"):
+        method = getattr(SQLiteJobStore, method_name)
+
+        def record_thread(self, *args, _method=method, **kwargs):
+            store_threads.add(threading.get_ident())
+            return _method(self, *args, **kwargs)
+
+        monkeypatch.setattr(SQLiteJobStore, method_name, record_thread)
+
+    front_end_config = FastApiFrontEndConfig(job_store_path=str(tmp_path / "jobs.db"))
+
+    config = AIQConfig(
+        general=GeneralConfig(front_end=front_end_config),
+        workflow=EchoFunctionConfig(use_openai_api=False),
+    )
+
+    workflow_path = f"{front_end_config.workflow.path}/async"
+    async with _build_client(config) as client:
+        response = await client.post(workflow_path, json={"message": "Hello", "job_id": "1", "sync_timeout": 10})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["output"] == {"value": "Hello"}
+
+        response = await client.get(f"{workflow_path}/job/1")
+        assert response.status_code == 200
+        assert response.json()["output"] == {"value": "Hello"}
+
+    assert store_threads
+    assert threading.get_ident() not in store_threads
+
+
 async def test_async_job_status_not_found():
     front_end_config = FastApiFrontEndConfig()
 
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.front_ends.fastapi.job_store import SQLiteJobStore
+
+
+class _Output(BaseModel):
+    value: str
+
+
+@pytest.fixture(name="job_store", params=["memory", "sqlite"])
+def job_store_fixture(request, tmp_path) -> JobStoreBase:
+    if request.param == "memory":
+        return JobStore()
+
+    return SQLiteJobStore(tmp_path / "jobs.db")
+
+
+def test_create_and_update_job(job_store: JobStoreBase):
+    job_id = job_store.create_job(config_file="config.yml", expiry_seconds=10)
+
+    job = job_store.get_job(job_id)
+    assert job.status == "submitted"
+    assert job.config_file == "config.yml"
+    assert job.expiry_seconds == JobStoreBase.MIN_EXPIRY
+    assert job_store.get_expires_at(job) is None
+
+    job_store.update_status(job_id, "success", output_path="/tmp/output", output=_Output(value="done"))
+
+    job = job_store.get_job(job_id)
+    assert job.status == "success"
+    assert job.output_path == "/tmp/output"
+    assert job_store.get_expires_at(job) == job.updated_at + timedelta(seconds=JobStoreBase.MIN_EXPIRY)
+
+    assert job_store.get_job("missing") is None
+    with pytest.raises(ValueError):
+        job_store.update_status("missing", "running")
+
+
+def test_list_jobs(job_store: JobStoreBase):
+    job_ids = [job_store.create_job(job_id=f"job_{i}") for i in range(5)]
+    for job_id in job_ids[:2]:
+        job_store.update_status(job_id, "failure", error="error")
+
+    assert [job.job_id for job in job_store.list_jobs()] == job_ids
+    assert [job.job_id for job in job_store.list_jobs(limit=2, offset=1)] == job_ids[1:3]
+    assert [job.job_id for job in job_store.list_jobs(status="failure")] == job_ids[:2]
+    assert [job.job_id for job in job_store.get_jobs_by_status("submitted")] == job_ids[2:]
+    assert len(job_store.get_all_jobs()) == 5
+    assert job_store.get_last_job().job_id == "job_4"
+
+
+def test_cleanup_expired_jobs(job_store: JobStoreBase, tmp_path):
+    output_dirs = []
+    for i in range(3):
+        job_store.create_job(job_id=f"job_{i}")
+        output_dir = tmp_path / f"output_{i}"
+        output_dir.mkdir()
+        output_dirs.append(output_dir)
+        job_store.update_status(f"job_{i}", "success", output_path=str(output_dir))
+    job_store.create_job(job_id="active")
+
+    future = datetime.now(UTC) + timedelta(seconds=JobStoreBase.MAX_EXPIRY + 1)
+    with patch("aiq.front_ends.fastapi.job_store.datetime") as mock_datetime:
+        mock_datetime.now.return_value = future
+        mock_datetime.fromtimestamp = datetime.fromtimestamp
+        job_store.cleanup_expired_jobs()
+
+    # The most recently updated finished job and active jobs are kept
+    assert sorted(job.job_id for job in job_store.get_all_jobs()) == ["active", "job_2"]
+    assert [d.exists() for d in output_dirs] == [False, False, True]
+
+
+def test_sqlite_job_store_shared(tmp_path):
+    db_path = tmp_path / "jobs.db"
+    first = SQLiteJobStore(db_path, namespace="async_generation")
+    second = SQLiteJobStore(db_path, namespace="async_generation")
+    other = SQLiteJobStore(db_path, namespace="async_evaluation")
+
+    job_id = first.create_job()
+    second.update_status(job_id, "success", output=_Output(value="done"))
+
+    job = first.get_job(job_id)
+    assert job.status == "success"
+    assert job.output == {"value": "done"}
+    assert other.get_job(job_id) is None
+
+    first.close()
+
+    # Jobs persist once the store is re-opened
+    assert SQLiteJobStore(db_path, namespace="async_generation").get_job(job_id).status == "success"
@@ -13,7 +13,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from openinference.semconv.trace import SpanAttributes
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from aiq.builder.context import AIQContextState
+from aiq.data_models.config import SpanOverflowPolicy
+from aiq.data_models.config import SpanQueueConfig
+from aiq.data_models.config import TailSamplingConfig
+from aiq.data_models.config import TraceSamplingConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.observability.async_otel_listener import AsyncOtelSpanListener
 from aiq.observability.async_otel_listener import merge_dicts
+from aiq.observability.sampling import TraceSampler
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.utils.reactive.subject import Subject
+
+# pylint: disable=redefined-outer-name,protected-access
 
 
 def test_merge_dicts_basic():
@@ -67,3 +94,199 @@ def test_merge_dicts_complex_types():
     dict2 = {"a": [4, 5, 6], "b": "test"}
     result = merge_dicts(dict1, dict2)
     assert result == {"a": [1, 2, 3], "b": "test"}
+
+
+@pytest.fixture
+def context_state():
+    state = AIQContextState()
+    state.event_stream.set(Subject())
+    return state
+
+
+@pytest.fixture
+def span_exporter():
+    return InMemorySpanExporter()
+
+
+def make_listener(context_state, span_exporter, sampler=None, **queue_kwargs) -> AsyncOtelSpanListener:
+    listener = AsyncOtelSpanListener(context_state=context_state,
+                                     queue_config=SpanQueueConfig(**queue_kwargs),
+                                     sampler=sampler)
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    listener._tracer = provider.get_tracer("test")
+    return listener
+
+
+def make_steps(name: str, uuid: str, parent_id: str = "root") -> tuple[IntermediateStep, IntermediateStep]:
+    ancestry = InvocationNode(function_name=name, function_id=uuid, parent_id=parent_id)
+    start = IntermediateStep(function_ancestry=ancestry,
+                             payload=IntermediateStepPayload(UUID=uuid,
+                                                             event_type=IntermediateStepType.TOOL_START,
+                                                             name=name,
+                                                             data=StreamEventData(input="input")))
+    end = IntermediateStep(function_ancestry=ancestry,
+                           payload=IntermediateStepPayload(UUID=uuid,
+                                                           event_type=IntermediateStepType.TOOL_END,
+                                                           name=name,
+                                                           data=StreamEventData(output="output")))
+    return start, end
+
+
+@pytest.mark.parametrize("background", [True, False])
+async def test_listener_creates_spans(context_state, span_exporter, background):
+    listener = make_listener(context_state, span_exporter, background=background)
+    outer_start, outer_end = make_steps("outer", "outer-id")
+    inner_start, inner_end = make_steps("inner", "inner-id", parent_id="outer-id")
+
+    async with listener.start():
+        for step in (outer_start, inner_start, inner_end, outer_end):
+            context_state.event_stream.get().on_next(step)
+
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    assert set(spans) == {"outer", "inner"}
+    assert spans["inner"].parent.span_id == spans["outer"].context.span_id
+    assert spans["inner"].attributes[SpanAttributes.OUTPUT_VALUE] == '"output"'
+    assert listener.dropped_events == 0
+
+
+async def test_listener_does_not_block_on_span_creation(context_state, span_exporter):
+    """Events are handed to the background thread without waiting for their spans to be created"""
+    listener = make_listener(context_state, span_exporter)
+    started = threading.Event()
+    release = threading.Event()
+    process_start_event = listener._process_start_event
+
+    def slow_process_start_event(step):
+        started.set()
+        release.wait(timeout=5)
+        process_start_event(step)
+
+    listener._process_start_event = slow_process_start_event
+    start, end = make_steps("tool", "tool-id")
+
+    async with listener.start():
+        context_state.event_stream.get().on_next(start)
+        context_state.event_stream.get().on_next(end)
+        assert started.wait(timeout=5)
+        # the workflow thread was not held up by the span that is still being created
+        assert not span_exporter.get_finished_spans()
+        release.set()
+
+    assert [span.name for span in span_exporter.get_finished_spans()] == ["tool"]
+
+
+@pytest.mark.parametrize(
+    "policy, expected_spans",
+    [
+        (SpanOverflowPolicy.DROP_NEWEST, {"first"}),
+        (SpanOverflowPolicy.DROP_OLDEST, {"third"}),
+        # the event loop thread is never blocked, the new events are dropped instead
+        (SpanOverflowPolicy.BLOCK, {"first"}),
+    ])
+async def test_listener_overflow_policy(context_state, span_exporter, policy, expected_spans):
+    listener = make_listener(context_state, span_exporter, max_queue_size=2, overflow_policy=policy)
+    steps = [make_steps(name, f"{name}-id") for name in ("first", "second", "third")]
+
+    with patch("aiq.observability.async_otel_listener._get_span_executor") as get_executor:
+        executor = ThreadPoolExecutor(max_workers=1)
+        get_executor.return_value = executor
+        release = threading.Event()
+        # hold the background thread so the queue fills up
+        executor.submit(release.wait, 5)
+
+        async with listener.start():
+            for start, end in steps:
+                context_state.event_stream.get().on_next(start)
+                context_state.event_stream.get().on_next(end)
+            release.set()
+
+        executor.shutdown()
+
+    assert {span.name for span in span_exporter.get_finished_spans()} == expected_spans
+    assert listener.dropped_events == 6 - 2 * len(expected_spans)
+
+
+async def test_listener_block_policy_waits_off_the_event_loop(context_state, span_exporter):
+    listener = make_listener(context_state, span_exporter, max_queue_size=2, overflow_policy=SpanOverflowPolicy.BLOCK)
+    steps = [make_steps(name, f"{name}-id") for name in ("first", "second")]
+
+    with patch("aiq.observability.async_otel_listener._get_span_executor") as get_executor:
+        executor = ThreadPoolExecutor(max_workers=1)
+        get_executor.return_value = executor
+        release = threading.Event()
+        executor.submit(release.wait, 5)
+
+        async with listener.start():
+            # the event loop thread never waits for space, the new events are dropped to keep the queue bounded
+            for start, end in steps:
+                context_state.event_stream.get().on_next(start)
+                context_state.event_stream.get().on_next(end)
+            assert len(listener._queue) == 2
+            assert listener._dropped_on_loop_events == 2
+
+            # other threads wait until the background thread makes space
+            emitted = threading.Event()
+            thread_steps = make_steps("third", "third-id")
+            event_stream = context_state.event_stream.get()
+
+            def emit():
+                for step in thread_steps:
+                    event_stream.on_next(step)
+                emitted.set()
+
+            emitter = threading.Thread(target=emit)
+            emitter.start()
+            assert not emitted.wait(timeout=0.2)
+            release.set()
+            emitter.join(timeout=5)
+            assert emitted.is_set()
+
+        executor.shutdown()
+
+    assert {span.name for span in span_exporter.get_finished_spans()} == {"first", "third"}
+    assert listener.dropped_events == 2
+
+
+def make_llm_steps(uuid: str, total_tokens: int) -> tuple[IntermediateStep, IntermediateStep]:
+    ancestry = InvocationNode(function_name="llm", function_id=uuid)
+    start = IntermediateStep(function_ancestry=ancestry,
+                             payload=IntermediateStepPayload(UUID=uuid,
+                                                             event_type=IntermediateStepType.LLM_START,
+                                                             name="llm"))
+    end = IntermediateStep(function_ancestry=ancestry,
+                           payload=IntermediateStepPayload(
+                               UUID=uuid,
+                               event_type=IntermediateStepType.LLM_END,
+                               name="llm",
+                               usage_info=UsageInfo(token_usage=TokenUsageBaseModel(total_tokens=total_tokens))))
+    return start, end
+
+
+@pytest.mark.parametrize("background", [True, False])
+@pytest.mark.parametrize("total_tokens, expected_spans", [(50, set()), (150, {"llm"})])
+async def test_listener_tail_sampling_tokens(context_state, span_exporter, background, total_tokens, expected_spans):
+    sampler = TraceSampler(TraceSamplingConfig(tail=TailSamplingConfig(token_threshold=100)))
+    listener = make_listener(context_state, span_exporter, sampler=sampler, background=background)
+
+    async with listener.start():
+        for step in make_llm_steps("llm-id", total_tokens):
+            context_state.event_stream.get().on_next(step)
+        # spans are held back until the sampling decision
+        assert not span_exporter.get_finished_spans()
+
+    assert {span.name for span in span_exporter.get_finished_spans()} == expected_spans
+
+
+@pytest.mark.parametrize("keep_errors, expected_spans", [(True, {"tool"}), (False, set())])
+async def test_listener_tail_sampling_errors(context_state, span_exporter, keep_errors, expected_spans):
+    sampler = TraceSampler(TraceSamplingConfig(tail=TailSamplingConfig(keep_errors=keep_errors)))
+    listener = make_listener(context_state, span_exporter, sampler=sampler)
+
+    with pytest.raises(RuntimeError):
+        async with listener.start():
+            for step in make_steps("tool", "tool-id"):
+                context_state.event_stream.get().on_next(step)
+            raise RuntimeError("workflow failed")
+
+    assert {span.name for span in span_exporter.get_finished_spans()} == expected_spans
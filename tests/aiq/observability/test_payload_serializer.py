@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest.mock import patch
+
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
+from aiq.observability.payload_serializer import PayloadSerializer
+from aiq.observability.payload_serializer import get_payload_serializer
+from aiq.observability.payload_serializer import get_type_adapter
+from aiq.observability.payload_serializer import set_payload_serializer
+
+
+class Payload(BaseModel):
+    name: str
+    values: list[int]
+
+
+class Opaque:
+
+    def __str__(self):
+        return "opaque"
+
+
+def test_serialize_matches_type_adapter():
+    serializer = PayloadSerializer()
+    for value in ["text", 42, {"key": [1, 2]}, Payload(name="n", values=[1, 2])]:
+        assert serializer.serialize(value) == (TypeAdapter(type(value)).dump_json(value).decode("utf-8"), True)
+
+
+def test_serialize_falls_back_to_str():
+    serializer = PayloadSerializer()
+    assert serializer.serialize(Opaque()) == ("opaque", False)
+    value = {"key": Opaque()}
+    assert serializer.serialize(value) == (str(value), False)
+
+
+def test_type_adapters_are_cached():
+    get_type_adapter.cache_clear()
+    serializer = PayloadSerializer()
+
+    with patch("aiq.observability.payload_serializer.TypeAdapter", wraps=TypeAdapter) as type_adapter:
+        for _ in range(3):
+            serializer.serialize(Payload(name="n", values=[]))
+            serializer.serialize(Opaque())
+
+        # built once per type, including types which pydantic cannot serialize
+        assert type_adapter.call_count == 2
+
+    # shared by all serializers
+    assert get_type_adapter.cache_info().hits == 4
+    PayloadSerializer(max_length=10).serialize(Payload(name="n", values=[]))
+    assert get_type_adapter.cache_info().hits == 5
+
+
+def test_serialize_truncates_long_payloads():
+    serializer = PayloadSerializer(max_length=5)
+
+    assert serializer.serialize("abc") == ('"abc"', True)
+    assert serializer.serialize("abcdefgh") == ("abcde... [truncated 3 characters]", False)
+
+    serialized, is_json = serializer.serialize({"key": "value"})
+    assert serialized == '{"key... [truncated 10 characters]'
+    assert not is_json
+
+
+def test_serialize_samples_long_sequences():
+    serializer = PayloadSerializer(max_items=2)
+
+    assert serializer.serialize([1, 2, 3, 4]) == ("[1,2]", True)
+    assert json.loads(serializer.serialize((1, 2, 3))[0]) == [1, 2]
+    assert serializer.serialize([1]) == ("[1]", True)
+
+
+def test_default_payload_serializer():
+    default_serializer = get_payload_serializer()
+    try:
+        serializer = PayloadSerializer(max_length=3)
+        set_payload_serializer(serializer)
+        assert get_payload_serializer() is serializer
+    finally:
+        set_payload_serializer(default_serializer)
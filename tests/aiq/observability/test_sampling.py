@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiq.builder.context import AIQContextState
+from aiq.data_models.config import TailSamplingConfig
+from aiq.data_models.config import TraceSamplingConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.observability.async_otel_listener import SpanListenerSettings
+from aiq.observability.payload_serializer import PayloadSerializer
+from aiq.observability.sampling import TraceSampler
+from aiq.observability.sampling import count_tokens
+from aiq.observability.sampling import get_trace_sampler
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.runtime.runner import AIQRunner
+
+
+def make_step(event_type: IntermediateStepType, total_tokens: int = 0) -> IntermediateStep:
+    return IntermediateStep(function_ancestry=InvocationNode(function_name="fn", function_id="fn-id"),
+                            payload=IntermediateStepPayload(
+                                event_type=event_type,
+                                usage_info=UsageInfo(token_usage=TokenUsageBaseModel(total_tokens=total_tokens))))
+
+
+@pytest.mark.parametrize("head_rate, expected", [(1.0, 100), (0.0, 0)])
+def test_sample_head_bounds(head_rate, expected):
+    sampler = TraceSampler(TraceSamplingConfig(head_rate=head_rate))
+    assert sum(sampler.sample_head() for _ in range(100)) == expected
+
+
+def test_sample_head_rate():
+    sampler = TraceSampler(TraceSamplingConfig(head_rate=0.25), rng=random.Random(0))
+    sampled = sum(sampler.sample_head() for _ in range(10000))
+    assert 2300 < sampled < 2700
+
+
+def test_count_tokens_only_counts_llm_calls():
+    steps = [
+        make_step(IntermediateStepType.LLM_END, 10),
+        make_step(IntermediateStepType.LLM_END, 5),
+        # totals reported by other steps would count the same tokens twice
+        make_step(IntermediateStepType.FUNCTION_END, 15),
+    ]
+    assert count_tokens(steps) == 15
+
+
+def test_keep_trace_without_tail_sampling():
+    sampler = TraceSampler()
+    assert not sampler.tail_sampling
+    assert sampler.keep_trace([], duration=0.0, errored=False)
+
+
+@pytest.mark.parametrize("tail, duration, errored, total_tokens, expected",
+                         [
+                             (TailSamplingConfig(), 10.0, False, 1000, False),
+                             (TailSamplingConfig(), 0.1, True, 0, True),
+                             (TailSamplingConfig(keep_errors=False), 0.1, True, 0, False),
+                             (TailSamplingConfig(latency_threshold=1.0), 0.5, False, 0, False),
+                             (TailSamplingConfig(latency_threshold=1.0), 1.5, False, 0, True),
+                             (TailSamplingConfig(token_threshold=100), 0.1, False, 100, False),
+                             (TailSamplingConfig(token_threshold=100), 0.1, False, 101, True),
+                         ])
+def test_keep_trace(tail, duration, errored, total_tokens, expected):
+    sampler = TraceSampler(TraceSamplingConfig(tail=tail))
+    steps = [make_step(IntermediateStepType.LLM_END, total_tokens)]
+    assert sampler.tail_sampling
+    assert sampler.keep_trace(steps, duration=duration, errored=errored) == expected
+
+
+@pytest.mark.parametrize("head_rate", [0.0, 1.0])
+def test_runner_uses_workflow_sampler(head_rate):
+    settings = SpanListenerSettings(payload_serializer=PayloadSerializer(max_length=10),
+                                    sampler=TraceSampler(TraceSamplingConfig(head_rate=head_rate)))
+    default_sampler = get_trace_sampler()
+
+    runner = AIQRunner(input_message="hello",
+                       entry_fn=MagicMock(),
+                       context_state=AIQContextState.get(),
+                       span_listener_settings=settings)
+
+    # the settings only apply to the runs of the workflow, the process-wide defaults are left alone
+    assert runner.trace_sampled == bool(head_rate)
+    assert get_trace_sampler() is default_sampler
+    if runner.trace_sampled:
+        span_manager = runner._span_manager  # pylint: disable=protected-access
+        assert span_manager._sampler is settings.sampler  # pylint: disable=protected-access
+        assert span_manager._payload_serializer is settings.payload_serializer  # pylint: disable=protected-access
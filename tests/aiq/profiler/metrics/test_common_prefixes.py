@@ -101,3 +101,83 @@ def test_get_common_prefixes_min_call_percentage(minimal_valid_df):
         for pfx_obj in v.prefix_info:
             # calls_percentage >= 0.6
             assert pfx_obj.calls_percentage >= 0.6, "Expected calls_percentage >= 0.6"
+
+
+def _reference_common_prefixes(strings: list[str], min_call_percentage: float) -> list[tuple[str, int]]:
+    """
+    Reference implementation using a character-level trie of nested dicts.
+    """
+    root = {'count': 0, 'children': {}}
+    for s in strings:
+        node = root
+        node['count'] += 1
+        for ch in s:
+            node = node['children'].setdefault(ch, {'count': 0, 'children': {}})
+            node['count'] += 1
+
+    results = []
+    stack = [(root, "")]
+    while stack:
+        node, prefix = stack.pop()
+        if prefix and node['count'] / len(strings) >= min_call_percentage:
+            results.append((prefix, node['count']))
+        for ch, child in node['children'].items():
+            stack.append((child, prefix + ch))
+
+    results.sort(key=lambda x: (len(x[0]), x[1]), reverse=True)
+    final_results = []
+    for prefix, count in results:
+        if not any(prefix in kept for kept, _ in final_results):
+            final_results.append((prefix, count))
+
+    return sorted(final_results)
+
+
+def _make_llm_steps(text_inputs: list[str]) -> list[list[IntermediatePropertyAdaptor]]:
+    steps = [
+        IntermediateStep(payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_START,
+                                                         framework=LLMFrameworkEnum.LANGCHAIN,
+                                                         event_timestamp=float(i),
+                                                         name="llama-3",
+                                                         data=StreamEventData(input=text)))
+        for i, text in enumerate(text_inputs)
+    ]
+    return [[IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps]]
+
+
+@pytest.mark.parametrize("min_call_percentage", [0.0, 0.25, 0.5, 0.6, 1.0])
+def test_get_common_prefixes_matches_character_trie(min_call_percentage: float):
+    text_inputs = [
+        "You are a helpful assistant. Answer: a",
+        "You are a helpful assistant. Answer: b",
+        "You are a helpful assistant. Summarize",
+        "You are a helpful",
+        "You are a helpful",
+        "Translate the following",
+        "",
+    ]
+
+    result = get_common_prefixes(_make_llm_steps(text_inputs), min_call_percentage=min_call_percentage)
+
+    prefixes = sorted((p.prefix, p.calls_count) for p in result.root["llama-3"].prefix_info)
+    assert prefixes == _reference_common_prefixes(text_inputs, min_call_percentage)
+
+
+def test_get_common_prefixes_token_level():
+    from aiq.profiler.inference_optimization.prompt_caching import tokenize_text
+
+    text_inputs = ["Answer the question: what", "Answer the question: who", "Answer the questions"]
+
+    result = get_common_prefixes(_make_llm_steps(text_inputs), min_call_percentage=0.6, tokenizer=tokenize_text)
+
+    # At the character level "Answer the question" is shared by every call, at the token level it is not
+    prefix_info = result.root["llama-3"].prefix_info
+    assert [(p.prefix, p.calls_count) for p in prefix_info] == [("Answer the question: ", 2)]
+
+
+def test_get_common_prefixes_max_prefix_length():
+    text_inputs = ["abcdefgh", "abcdefgh", "abcdxyz"]
+
+    result = get_common_prefixes(_make_llm_steps(text_inputs), min_call_percentage=0.5, max_prefix_length=6)
+
+    assert [(p.prefix, p.calls_count) for p in result.root["llama-3"].prefix_info] == [("abcdef", 2)]
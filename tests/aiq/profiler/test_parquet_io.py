@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import TraceMetadata
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.data_models.profiler import ProfilerConfig
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.profiler.parquet_io import STANDARDIZED_DATA_FILE_NAME
+from aiq.profiler.parquet_io import TRACE_PARQUET_FILE_NAME
+from aiq.profiler.parquet_io import read_intermediate_steps_parquet
+from aiq.profiler.parquet_io import read_standardized_dataframe_parquet
+from aiq.profiler.parquet_io import write_intermediate_steps_parquet
+from aiq.profiler.parquet_io import write_standardized_dataframe_parquet
+from aiq.profiler.profile_runner import ProfilerRunner
+from aiq.profiler.trace_writer import load_profiler_traces
+from aiq.profiler.utils import create_standardized_dataframe
+
+
+def test_standardized_dataframe_round_trip(tmp_path, rag_intermediate_property_adaptor):
+    df = create_standardized_dataframe(rag_intermediate_property_adaptor)
+
+    path = write_standardized_dataframe_parquet(df, tmp_path / STANDARDIZED_DATA_FILE_NAME)
+
+    schema = pq.read_schema(path)
+    for column in ("event_type", "llm_name", "function_name"):
+        assert pa.types.is_dictionary(schema.field(column).type)
+
+    assert read_standardized_dataframe_parquet(path).to_dict(orient="records") == df.to_dict(orient="records")
+
+
+def test_intermediate_steps_round_trip(tmp_path, rag_intermediate_steps: list[list[IntermediateStep]]):
+    # An empty request at the end must be preserved
+    all_steps = rag_intermediate_steps + [[]]
+
+    path = write_intermediate_steps_parquet(all_steps, tmp_path / TRACE_PARQUET_FILE_NAME)
+    assert pa.types.is_dictionary(pq.read_schema(path).field("event_type").type)
+
+    loaded = read_intermediate_steps_parquet(path)
+    assert len(loaded) == len(all_steps)
+    for steps, loaded_steps in zip(all_steps, loaded):
+        assert [step.model_dump() for step in loaded_steps] == [step.model_dump() for step in steps]
+
+    assert [len(steps) for steps in load_profiler_traces(path)] == [len(steps) for steps in all_steps]
+
+
+def test_intermediate_steps_typed_columns(tmp_path):
+    steps = [
+        IntermediateStep(function_ancestry=InvocationNode(function_name="fn", function_id="fn-1", parent_id="root"),
+                         payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_END,
+                                                         span_event_timestamp=1.5,
+                                                         framework=LLMFrameworkEnum.LANGCHAIN,
+                                                         name="llm",
+                                                         tags=["a", "b"],
+                                                         metadata=TraceMetadata(chat_inputs=["hello"]),
+                                                         data=StreamEventData(input="hello", output={"answer": 42}),
+                                                         usage_info=UsageInfo(token_usage=TokenUsageBaseModel(
+                                                             prompt_tokens=3, total_tokens=5),
+                                                                              num_llm_calls=1),
+                                                         custom_field="extra")),
+        IntermediateStep(function_ancestry=None,
+                         payload=IntermediateStepPayload(event_type=IntermediateStepType.SPAN_START)),
+    ]
+
+    path = write_intermediate_steps_parquet([steps], tmp_path / TRACE_PARQUET_FILE_NAME)
+
+    # the steps are stored in typed columns, only the free-form payloads are JSON
+    schema = pq.read_schema(path)
+    for column in ("event_type", "name", "function_name", "framework"):
+        assert pa.types.is_dictionary(schema.field(column).type)
+    assert schema.field("event_timestamp").type == pa.float64()
+    assert schema.field("total_tokens").type == pa.int64()
+    assert pq.read_table(path, columns=["total_tokens"]).column(0).to_pylist() == [5, None]
+
+    loaded = read_intermediate_steps_parquet(path)[0]
+    assert [step.model_dump() for step in loaded] == [step.model_dump() for step in steps]
+    assert loaded[0].event_type is IntermediateStepType.LLM_END
+    assert loaded[0].framework is LLMFrameworkEnum.LANGCHAIN
+    assert loaded[0].data == steps[0].data
+    assert loaded[0].payload.custom_field == "extra"
+    assert loaded[1].function_ancestry is None and loaded[1].usage_info is None
+
+
+async def test_profiler_runner_exports_parquet(tmp_path, rag_intermediate_steps: list[list[IntermediateStep]]):
+    runner = ProfilerRunner(ProfilerConfig(export_parquet=True, workflow_runtime_forecast=True), tmp_path)
+    await runner.run(rag_intermediate_steps)
+
+    assert (tmp_path / STANDARDIZED_DATA_FILE_NAME).exists()
+
+    # Re-run the profiler on the saved traces without re-running the workflow
+    reloaded_steps = load_profiler_traces(tmp_path / TRACE_PARQUET_FILE_NAME)
+    rerun_dir = tmp_path / "rerun"
+    rerun = ProfilerRunner(ProfilerConfig(workflow_runtime_forecast=True), rerun_dir)
+    await rerun.run(reloaded_steps)
+
+    assert (rerun_dir / "inference_optimization.json").read_text() == \
+        (tmp_path / "inference_optimization.json").read_text()
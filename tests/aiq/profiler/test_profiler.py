@@ -25,7 +25,10 @@ from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepType as WorkflowEventEnum
 from aiq.data_models.profiler import ProfilerConfig
 from aiq.profiler.data_frame_row import DataFrameRow
+from aiq.profiler.inference_optimization.llm_metrics import LLMMetrics
+from aiq.profiler.inference_optimization.workflow_runtimes import compute_workflow_runtime_metrics
 from aiq.profiler.profile_runner import ProfilerRunner
+from aiq.profiler.utils import create_standardized_dataframe
 
 
 @pytest.fixture(name="minimal_eval_config")
@@ -153,6 +156,49 @@ def test_validate_assignment():
     assert row.llm_text_input == "9876"
 
 
+def test_standardized_dataframe_matches_data_frame_row(rag_intermediate_property_adaptor):
+    # The column-wise builder must produce the same rows as validating each step with DataFrameRow.
+    df = create_standardized_dataframe(rag_intermediate_property_adaptor)
+
+    expected_rows = []
+    for i, steps in enumerate(rag_intermediate_property_adaptor):
+        for step in steps:
+            expected_rows.append(
+                DataFrameRow(event_timestamp=step.event_timestamp,
+                             example_number=i,
+                             prompt_tokens=step.token_usage.prompt_tokens,
+                             completion_tokens=step.token_usage.completion_tokens,
+                             total_tokens=step.token_usage.total_tokens,
+                             llm_text_input=step.llm_text_input,
+                             llm_text_output=step.llm_text_output,
+                             llm_new_token=step.llm_text_chunk,
+                             llm_name=step.llm_name,
+                             tool_name=step.tool_name,
+                             function_name=step.function_name,
+                             function_id=step.function_id,
+                             parent_function_name=step.parent_function_name,
+                             parent_function_id=step.parent_function_id,
+                             UUID=step.payload.UUID,
+                             framework=step.framework,
+                             event_type=step.event_type).model_dump())
+
+    assert list(df.columns) == list(DataFrameRow.model_fields)
+    assert df.to_dict(orient="records") == expected_rows
+
+
+def test_analyses_accept_standardized_dataframe(rag_intermediate_property_adaptor):
+    df = create_standardized_dataframe(rag_intermediate_property_adaptor)
+    original_columns = list(df.columns)
+
+    assert compute_workflow_runtime_metrics(df) == compute_workflow_runtime_metrics(rag_intermediate_property_adaptor)
+
+    metrics_df = LLMMetrics.compute_profiling_metrics(df)
+    assert "NOVA-Event-ID" in metrics_df.columns
+
+    # The shared frame must not be modified by the analyses
+    assert list(df.columns) == original_columns
+
+
 @pytest.mark.asyncio
 async def test_average_workflow_runtime(minimal_eval_config):
     """
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.profiler import ProfilerConfig
+from aiq.profiler.profile_runner import ProfilerRunner
+from aiq.profiler.trace_writer import ProfilerTraceWriter
+from aiq.profiler.trace_writer import get_trace_path
+from aiq.profiler.trace_writer import iter_profiler_traces
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["jsonl", "zstd"])
+def test_trace_round_trip(tmp_path, rag_intermediate_steps: list[list[IntermediateStep]], compress: bool):
+    if compress:
+        pytest.importorskip("zstandard")
+
+    trace_path = get_trace_path(tmp_path, compress=compress)
+    assert trace_path.name.endswith(".jsonl.zst" if compress else ".jsonl")
+
+    with ProfilerTraceWriter(trace_path, compress=compress) as writer:
+        # Requests may complete out of order
+        for i in reversed(range(len(rag_intermediate_steps))):
+            writer.write_request(i, rag_intermediate_steps[i])
+
+    assert writer.num_requests == len(rag_intermediate_steps)
+
+    traces = dict(iter_profiler_traces(trace_path))
+    assert sorted(traces) == list(range(len(rag_intermediate_steps)))
+    for i, steps in traces.items():
+        assert [step.model_dump() for step in steps] == [step.model_dump() for step in rag_intermediate_steps[i]]
+
+
+def test_write_before_open_raises(tmp_path):
+    writer = ProfilerTraceWriter(get_trace_path(tmp_path))
+    with pytest.raises(RuntimeError):
+        writer.write_request(0, [])
+
+
+async def test_profiler_runner_writes_traces(tmp_path, rag_intermediate_steps: list[list[IntermediateStep]]):
+    runner = ProfilerRunner(ProfilerConfig(), tmp_path)
+    await runner.run(rag_intermediate_steps)
+
+    assert runner.trace_path == get_trace_path(tmp_path)
+    assert [request_number for request_number, _ in iter_profiler_traces(runner.trace_path)] == [0, 1]
+
+
+async def test_profiler_runner_reuses_existing_traces(tmp_path, rag_intermediate_steps: list[list[IntermediateStep]]):
+    trace_path = tmp_path / "streamed_traces.jsonl"
+    with ProfilerTraceWriter(trace_path) as writer:
+        for i, steps in enumerate(rag_intermediate_steps):
+            writer.write_request(i, steps)
+
+    runner = ProfilerRunner(ProfilerConfig(), tmp_path)
+    await runner.run(rag_intermediate_steps, trace_path=trace_path)
+
+    assert runner.trace_path == trace_path
+    assert not get_trace_path(tmp_path).exists()
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from aiq.utils.reactive.batch_observer import BatchObserver
+from aiq.utils.reactive.subject import Subject
+
+
+def test_batch_observer_without_event_loop():
+    sub = Subject[int]()
+    batches = []
+    sub.subscribe(BatchObserver(on_batch=batches.append))
+
+    sub.on_next(1)
+    sub.on_next(2)
+
+    # Without a running event loop events are delivered immediately
+    assert batches == [[1], [2]]
+
+
+async def test_batch_observer_batches_until_yield():
+    sub = Subject[int]()
+    batches = []
+    completed = []
+    sub.subscribe(BatchObserver(on_batch=batches.append, on_complete=lambda: completed.append(True)))
+
+    for i in range(5):
+        sub.on_next(i)
+    assert not batches
+
+    await asyncio.sleep(0)
+    assert batches == [[0, 1, 2, 3, 4]]
+
+    sub.on_next(5)
+    sub.on_complete()
+
+    # Pending events are delivered before completion
+    assert batches == [[0, 1, 2, 3, 4], [5]]
+    assert completed == [True]
+
+
+async def test_batch_observer_max_batch_size():
+    sub = Subject[int]()
+    batches = []
+    sub.subscribe(BatchObserver(on_batch=batches.append, max_batch_size=2))
+
+    for i in range(5):
+        sub.on_next(i)
+    assert batches == [[0, 1], [2, 3]]
+
+    await asyncio.sleep(0)
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+async def test_batch_observer_errors():
+    sub = Subject[int]()
+    batches = []
+    errors = []
+
+    def on_batch(batch: list[int]):
+        batches.append(batch)
+        raise ValueError("bad batch")
+
+    sub.subscribe(BatchObserver(on_batch=on_batch, on_error=lambda e: errors.append(str(e))))
+
+    sub.on_next(1)
+    sub.on_error(RuntimeError("upstream"))
+
+    assert batches == [[1]]
+    assert errors == ["bad batch", "upstream"]
+
+    with pytest.raises(ValueError):
+        BatchObserver(max_batch_size=0)
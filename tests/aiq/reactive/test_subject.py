@@ -84,3 +84,23 @@ def test_subject_late_subscriber_after_dispose():
     sub.subscribe(Observer(on_next=items.append))
     sub.on_next("ignored")
     assert not items
+
+
+def test_subject_unsubscribe_during_delivery():
+    sub = Subject[str]()
+    items1, items2 = [], []
+
+    subscriptions = []
+
+    def on_next_first(value: str):
+        items1.append(value)
+        # Unsubscribing while delivering does not affect the observers receiving the current event
+        subscriptions[1].unsubscribe()
+
+    subscriptions.append(sub.subscribe(Observer(on_next=on_next_first)))
+    subscriptions.append(sub.subscribe(Observer(on_next=items2.append)))
+
+    sub.on_next("X")
+    sub.on_next("Y")
+    assert items1 == ["X", "Y"]
+    assert items2 == ["X"]
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+
 import pytest
 from langchain_core.embeddings import Embeddings
 from pytest_httpserver import HTTPServer
@@ -109,6 +111,7 @@ class CustomMilvusClient:
         assert isinstance(anns_field, str)
         to_return = min(limit, 4)
 
+        # one list of hits per query vector
         return [[
             {
                 'id': '1234', 'distance': 0.45, 'entity': self._get_entity_from_fields(output_fields, num=1)
@@ -122,7 +125,7 @@ class CustomMilvusClient:
             {
                 'id': '1357', 'distance': 0.85, 'entity': self._get_entity_from_fields(output_fields, num=4)
             },
-        ][:to_return]]
+        ][:to_return] for _ in data]
 
     def search_iterator(
         self,
@@ -258,6 +261,71 @@ async def test_milvus_validation(milvus_retriever):
         _ = await milvus_retriever.search(query="Test query", collection_name="collection1", top_k=2)
 
 
+class CountingMilvusClient(CustomMilvusClient):
+    """Records the blocking calls made to the client and the threads they were made from"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+
+    def list_collections(self):
+        self.calls.append(("list_collections", threading.get_ident()))
+        return super().list_collections()
+
+    def describe_collection(self, collection_name: str):
+        self.calls.append(("describe_collection", threading.get_ident()))
+        return super().describe_collection(collection_name)
+
+    def search(self, **kwargs):
+        self.calls.append(("search", threading.get_ident()))
+        return super().search(**kwargs)
+
+
+async def test_milvus_search_off_loop():
+    client = CountingMilvusClient()
+    milvus_retriever = MilvusRetriever(client=client, embedder=TestEmbeddings())
+
+    for _ in range(3):
+        res = await milvus_retriever.search(query="Test query", collection_name="collection1", top_k=2)
+        assert len(res) == 2
+
+    # the collection is only described once, and no blocking call is made from the event loop's thread
+    assert [name
+            for name, _ in client.calls] == ["list_collections", "describe_collection", "search", "search", "search"]
+    assert threading.get_ident() not in {thread_id for _, thread_id in client.calls}
+
+    milvus_retriever.invalidate_collections()
+    _ = await milvus_retriever.search(query="Test query", collection_name="collection1", top_k=2)
+    assert [name for name, _ in client.calls].count("describe_collection") == 2
+
+    # collections which do not exist are not cached
+    for _ in range(2):
+        with pytest.raises(CollectionNotFoundError):
+            _ = await milvus_retriever.search(query="Test query", collection_name="collection_not_exist", top_k=2)
+    assert [name for name, _ in client.calls].count("list_collections") == 4
+
+
+async def test_milvus_search_many():
+    client = CountingMilvusClient()
+    milvus_retriever = MilvusRetriever(client=client, embedder=TestEmbeddings())
+    milvus_retriever.bind(top_k=3, collection_name="collection1")
+
+    results = await milvus_retriever.search_many(["Test query 1", "Test query 2"], output_fields=["title"])
+
+    assert len(results) == 2
+    for res in results:
+        assert isinstance(res, RetrieverOutput)
+        assert len(res) == 3
+        _validate_document_milvus(res.results[0], ["title"])
+
+    # both queries are searched with a single request
+    assert [name for name, _ in client.calls].count("search") == 1
+    assert await milvus_retriever.search_many([]) == []
+
+    with pytest.raises(CollectionNotFoundError):
+        _ = await milvus_retriever.search_many(["Test query"], collection_name="collection_not_exist")
+
+
 @pytest.fixture(name="nemo_retriever")
 def get_nemo_retriever(httpserver: HTTPServer):
     httpserver.expect_request(
@@ -378,3 +446,63 @@ async def test_nemo_binding(nemo_retriever):
 
     nemo_retriever.bind(top_k=2, collection_name="test_collection_1")
     _ = await nemo_retriever.search("Test query")
+
+
+def _count_requests(httpserver: HTTPServer, path: str) -> int:
+    return sum(1 for request, _ in httpserver.log if request.path == path)
+
+
+async def test_nemo_collection_cache(nemo_retriever, httpserver: HTTPServer):
+
+    async with nemo_retriever:
+        for collection_name in ("test_collection_1", "test_collection_2", "test_collection_1"):
+            _ = await nemo_retriever.search("Test query", collection_name=collection_name, top_k=2)
+
+        # the collections are listed once, and every search reuses the same client
+        assert _count_requests(httpserver, "/v1/collections") == 1
+        client = nemo_retriever.client
+
+        nemo_retriever.invalidate_collections()
+        _ = await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+        assert _count_requests(httpserver, "/v1/collections") == 2
+        assert nemo_retriever.client is client
+
+    assert client.is_closed
+
+
+async def test_nemo_collection_cache_expired(nemo_retriever, httpserver: HTTPServer):
+    nemo_retriever.collection_cache_ttl = 0
+
+    for _ in range(2):
+        _ = await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+
+    assert _count_requests(httpserver, "/v1/collections") == 2
+    await nemo_retriever.aclose()
+
+
+async def test_nemo_collection_recreated(nemo_retriever, httpserver: HTTPServer):
+    httpserver.expect_request("/v1/collections/deleted/search", method="POST").respond_with_data(status=404)
+
+    # the collection is cached with an id the service no longer knows
+    collection = await nemo_retriever.get_collection_by_name("test_collection_1")
+    nemo_retriever._collections = {"test_collection_1": collection.model_copy(update={"id": "deleted"})}
+    nemo_retriever._collections_expire_at = float("inf")
+
+    res = await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+    assert len(res) == 2
+    assert _count_requests(httpserver, "/v1/collections/deleted/search") == 1
+    await nemo_retriever.aclose()
+
+
+async def test_nemo_search_many(nemo_retriever, httpserver: HTTPServer):
+    nemo_retriever.bind(top_k=2)
+
+    results = await nemo_retriever.search_many(["Test query 1", "Test query 2", "Test query 3"],
+                                               collection_name="test_collection_2")
+
+    assert [[doc.page_content for doc in res.results] for res in results] == [["Text Chunk - 3", "Text Chunk - 4"]] * 3
+    assert _count_requests(httpserver, "/v1/collections") == 1
+
+    with pytest.raises(CollectionUnavailableError):
+        _ = await nemo_retriever.search_many(["Test query"], collection_name="collection_not_exist")
+    await nemo_retriever.aclose()
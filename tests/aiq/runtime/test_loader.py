@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.metadata
+from pathlib import Path
+
+import pytest
+
+from _utils.configs import FunctionTestConfig
+from aiq.builder.builder import Builder
+from aiq.cli.type_registry import RegisteredFunctionInfo
+from aiq.cli.type_registry import TypeRegistry
+from aiq.runtime import loader
+from aiq.runtime.plugin_manifest import MANIFEST_FILE_NAME
+from aiq.runtime.plugin_manifest import PluginManifest
+from aiq.runtime.plugin_manifest import PluginManifestEntry
+from aiq.runtime.plugin_manifest import save_manifest
+
+
+def _register_test_function(registry: TypeRegistry):
+
+    def tool_fn(builder: Builder):  # pylint: disable=unused-argument
+        pass
+
+    registry.register_function(
+        RegisteredFunctionInfo(full_type="test/test_function", config_type=FunctionTestConfig, build_fn=tool_fn))
+
+
+@pytest.fixture(name="loaded_entry_points")
+def loaded_entry_points_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replaces importing entry points with recording their names"""
+    monkeypatch.setenv("AIQ_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(loader, "_plugin_manifest", None)
+
+    loaded = []
+
+    def _load_entry_point(entry_point: importlib.metadata.EntryPoint) -> bool:
+        if (entry_point.name in loaded):
+            return False
+
+        loaded.append(entry_point.name)
+        return True
+
+    monkeypatch.setattr(loader, "_load_entry_point", _load_entry_point)
+
+    return loaded
+
+
+@pytest.fixture(name="manifest")
+def manifest_fixture(monkeypatch: pytest.MonkeyPatch) -> PluginManifest:
+    manifest = PluginManifest(fingerprint="abc",
+                              entries=[
+                                  PluginManifestEntry(group="aiq.components",
+                                                      name="functions",
+                                                      value="pkg.functions",
+                                                      provides=["function:test_function"]),
+                                  PluginManifestEntry(group="aiq.components",
+                                                      name="wrappers",
+                                                      value="pkg.wrappers",
+                                                      provides=["tool_wrapper:test_framework"]),
+                              ])
+    monkeypatch.setattr(loader, "_plugin_manifest", manifest)
+
+    return manifest
+
+
+def test_register_plugins_for_config(registry: TypeRegistry,
+                                     loaded_entry_points: list[str],
+                                     manifest: PluginManifest,
+                                     monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(registry, "get_registered_names", lambda: set())
+    monkeypatch.setattr(loader, "discover_and_register_plugins", pytest.fail)
+
+    loader.register_plugins_for_config({"workflow": {"_type": "test_function"}})
+
+    assert loaded_entry_points == ["functions"]
+
+
+def test_register_plugins_for_config_registered(loaded_entry_points: list[str], manifest: PluginManifest):
+    _register_test_function(loader.GlobalTypeRegistry.get())
+
+    loader.register_plugins_for_config({"workflow": {"_type": "test_function"}})
+
+    assert not loaded_entry_points
+
+
+def test_register_plugins_for_config_unknown(registry: TypeRegistry,
+                                             loaded_entry_points: list[str],
+                                             tmp_path: Path,
+                                             monkeypatch: pytest.MonkeyPatch):
+    manifest = PluginManifest(fingerprint="abc")
+    save_manifest(manifest, tmp_path / MANIFEST_FILE_NAME)
+    monkeypatch.setattr(loader, "_plugin_manifest", manifest)
+
+    discovered = []
+
+    def _discover_and_register_plugins(plugin_type: loader.PluginTypes):
+        discovered.append(plugin_type)
+        _register_test_function(registry)
+
+    monkeypatch.setattr(loader, "discover_and_register_plugins", _discover_and_register_plugins)
+
+    loader.register_plugins_for_config({"workflow": {"_type": "test_function"}})
+
+    # The manifest did not list a type provided by one of the plugins, it is out of date
+    assert discovered == [loader.PluginTypes.CONFIG_OBJECT]
+    assert not (tmp_path / MANIFEST_FILE_NAME).exists()
+
+
+def test_lazy_loader(registry: TypeRegistry, loaded_entry_points: list[str], manifest: PluginManifest):
+    loader.register_plugins_for_config({})
+
+    # The plugin providing the tool wrapper is imported when it is first requested
+    with pytest.raises(KeyError):
+        registry.get_tool_wrapper("test_framework")
+
+    assert loaded_entry_points == ["wrappers"]
+
+
+def test_build_plugin_manifest(registry: TypeRegistry, monkeypatch: pytest.MonkeyPatch):
+
+    def _load_entry_point(entry_point: importlib.metadata.EntryPoint) -> bool:
+        if (entry_point.name == "functions"):
+            _register_test_function(registry)
+
+        # The "imported" entry point was loaded before the manifest was built
+        return entry_point.name != "imported"
+
+    monkeypatch.setattr(loader, "_load_entry_point", _load_entry_point)
+
+    entry_points = [
+        importlib.metadata.EntryPoint(name=name, value=f"pkg.{name}", group="aiq.components")
+        for name in ("functions", "empty", "imported")
+    ]
+
+    manifest = loader._build_plugin_manifest(entry_points, "abc")
+
+    assert manifest.fingerprint == "abc"
+    assert [entry.provides for entry in manifest.entries] == [["function:test/test_function", "function:test_function"],
+                                                              [],
+                                                              None]
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.metadata
+from pathlib import Path
+
+import pytest
+
+from aiq.runtime.plugin_manifest import MANIFEST_FILE_NAME
+from aiq.runtime.plugin_manifest import PluginManifest
+from aiq.runtime.plugin_manifest import PluginManifestEntry
+from aiq.runtime.plugin_manifest import compute_fingerprint
+from aiq.runtime.plugin_manifest import get_config_type_names
+from aiq.runtime.plugin_manifest import get_manifest_path
+from aiq.runtime.plugin_manifest import load_manifest
+from aiq.runtime.plugin_manifest import remove_manifest
+from aiq.runtime.plugin_manifest import save_manifest
+
+
+def _entry_point(name: str, value: str) -> importlib.metadata.EntryPoint:
+    return importlib.metadata.EntryPoint(name=name, value=value, group="aiq.components")
+
+
+@pytest.fixture(name="manifest")
+def manifest_fixture() -> PluginManifest:
+    return PluginManifest(fingerprint="abc",
+                          entries=[
+                              PluginManifestEntry(group="aiq.components",
+                                                  name="llms",
+                                                  value="pkg.llms",
+                                                  provides=["llm_provider:nim", "llm_provider:openai"]),
+                              PluginManifestEntry(group="aiq.components",
+                                                  name="embedders",
+                                                  value="pkg.embedders",
+                                                  provides=["embedder_provider:nim"]),
+                              PluginManifestEntry(group="aiq.components", name="unknown", value="pkg.unknown"),
+                          ])
+
+
+def test_get_config_type_names():
+    config = {
+        "general": {
+            "front_end": {
+                "_type": "fastapi"
+            },
+            "telemetry": {
+                "tracing": {
+                    "phoenix": {
+                        "_type": "phoenix"
+                    }
+                }
+            },
+        },
+        "functions": {
+            "search": {
+                "_type": "wiki_search", "options": {
+                    "type": "not_a_component"
+                }
+            }
+        },
+        "llms": {
+            "nim_llm": {
+                "type": "nim"
+            }
+        },
+        "embedders": {
+            "nim_embedder": {
+                "_type": "nim"
+            }
+        },
+        "workflow": {
+            "_type": "react_agent"
+        },
+        "eval": {
+            "general": {
+                "dataset": {
+                    "_type": "json"
+                }
+            }, "evaluators": {
+                "rag": {
+                    "_type": "ragas"
+                }
+            }
+        },
+    }
+
+    assert get_config_type_names(config) == {
+        "front_end:fastapi",
+        "tracing:phoenix",
+        "function:wiki_search",
+        "llm_provider:nim",
+        "embedder_provider:nim",
+        "function:react_agent",
+        "evaluator:ragas",
+    }
+
+
+def test_get_config_type_names_empty():
+    assert not get_config_type_names({})
+    assert not get_config_type_names({"functions": None, "workflow": "react_agent"})
+
+
+def test_find_entries(manifest: PluginManifest):
+    entries, missing = manifest.find_entries(["llm_provider:nim", "llm_provider:openai"])
+
+    assert [entry.name for entry in entries] == ["llms"]
+    assert not missing
+
+
+def test_find_entries_missing(manifest: PluginManifest):
+    # Entries with unknown registrations may provide any missing name
+    entries, missing = manifest.find_entries(["embedder_provider:nim", "function:missing"])
+
+    assert [entry.name for entry in entries] == ["embedders", "unknown"]
+    assert missing == {"function:missing"}
+
+
+def test_compute_fingerprint():
+    entry_points = [_entry_point("a", "pkg.a"), _entry_point("b", "pkg.b")]
+
+    assert compute_fingerprint(entry_points) == compute_fingerprint(list(reversed(entry_points)))
+    assert compute_fingerprint(entry_points) != compute_fingerprint([_entry_point("a", "pkg.a")])
+    assert compute_fingerprint(entry_points) != compute_fingerprint(
+        [_entry_point("a", "pkg.a"), _entry_point("b", "pkg.c")])
+
+
+def test_get_manifest_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("AIQ_CACHE_DIR", str(tmp_path))
+
+    assert get_manifest_path() == tmp_path / MANIFEST_FILE_NAME
+
+
+def test_save_and_load_manifest(tmp_path: Path, manifest: PluginManifest):
+    path = tmp_path / "cache" / MANIFEST_FILE_NAME
+
+    assert load_manifest(path, "abc") is None
+
+    save_manifest(manifest, path)
+
+    assert load_manifest(path, "abc") == manifest
+    assert load_manifest(path, "other") is None
+    assert list(path.parent.iterdir()) == [path]
+
+    remove_manifest(path)
+    assert not path.exists()
+
+
+def test_load_manifest_invalid(tmp_path: Path):
+    path = tmp_path / MANIFEST_FILE_NAME
+    path.write_text("{not json", encoding="utf-8")
+
+    assert load_manifest(path, "abc") is None
@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import contextlib
 import logging
+import threading
 from io import StringIO
+from unittest.mock import patch
 from urllib.parse import urljoin
 
+import httpx
 import pytest
 import requests
 from pytest_httpserver import HTTPServer
@@ -75,6 +79,11 @@ async def test_bad_response(httpserver: HTTPServer):
     client = code_sandbox.get_sandbox("local", uri="http://localhost:9999")
 
     # Test that connection error is raised when the service is unavailable
+    with pytest.raises(httpx.ConnectError):
+        _ = await client.execute_code(generated_code='print("Hello World")')
+
+    # The blocking fallback surfaces the errors raised by requests
+    client = code_sandbox.get_sandbox("local", uri="http://localhost:9999", use_async_client=False)
     with pytest.raises(requests.exceptions.ConnectionError):
         _ = await client.execute_code(generated_code='print("Hello World")')
 
@@ -134,3 +143,97 @@ print(5+5)
     assert resp.get("process_status") == "completed"
     assert resp.get("stdout").rstrip() == "10"
     assert resp.get("stderr") == ""
+
+
+@pytest.mark.parametrize("use_async_client", [True, False], ids=["async", "blocking"])
+async def test_handle_response_clients(httpserver: HTTPServer, use_async_client: bool):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"), use_async_client=use_async_client)
+    httpserver.expect_request("/execute", method="POST").respond_with_json({
+        "process_status": "completed", "stdout": "Hello World", "stderr": ""
+    })
+
+    resp = await client.execute_code(generated_code='print("Hello World")')
+    assert resp == {"process_status": "completed", "stdout": "Hello World", "stderr": ""}
+
+    await client.aclose()
+
+
+async def test_async_client_per_event_loop(httpserver: HTTPServer):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"))
+    httpserver.expect_request("/execute", method="POST").respond_with_json({
+        "process_status": "completed", "stdout": "", "stderr": ""
+    })
+
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+        await client.execute_code(generated_code="print(1)")
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(client.execute_code(generated_code="print(1)"), other_loop))
+
+        # each loop has its own client, using another loop does not replace the client of the current one
+        async_clients = [async_client for async_client, _ in client._async_clients.values()]
+        assert len(async_clients) == 2
+        assert client._get_async_client()[0] is client._async_clients[asyncio.get_running_loop()][0]
+
+        # closing the sandbox closes the clients of every loop
+        await client.aclose()
+        assert all(async_client.is_closed for async_client in async_clients)
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+async def test_retry_on_502(httpserver: HTTPServer):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"), max_retries=2, retry_backoff=0.01)
+
+    # Two 502s followed by a success
+    httpserver.expect_ordered_request("/execute", method="POST").respond_with_data("", status=502)
+    httpserver.expect_ordered_request("/execute", method="POST").respond_with_data("", status=502)
+    httpserver.expect_ordered_request("/execute", method="POST").respond_with_json({
+        "process_status": "completed", "stdout": "Hello World", "stderr": ""
+    })
+
+    resp = await client.execute_code(generated_code='print("Hello World")')
+    assert resp.get("process_status") == "completed"
+
+    # Retries exhausted, reported as a timeout
+    httpserver.clear()
+    httpserver.expect_request("/execute", method="POST").respond_with_data("", status=502)
+
+    resp = await client.execute_code(generated_code='print("Hello World")')
+    assert resp == {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
+    assert len(httpserver.log) == 3
+
+    await client.aclose()
+
+
+async def test_bounded_concurrency(httpserver: HTTPServer):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"), max_concurrency=2)
+    httpserver.expect_request("/execute", method="POST").respond_with_json({
+        "process_status": "completed", "stdout": "", "stderr": ""
+    })
+
+    in_flight = 0
+    max_in_flight = 0
+    original_post = httpx.AsyncClient.post
+
+    async def tracking_post(self, *args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.05)
+            return await original_post(self, *args, **kwargs)
+        finally:
+            in_flight -= 1
+
+    with patch.object(httpx.AsyncClient, "post", tracking_post):
+        results = await asyncio.gather(*[client.execute_code(generated_code="print(1)") for _ in range(6)])
+
+    assert all(r.get("process_status") == "completed" for r in results)
+    assert max_in_flight == 2
+
+    await client.aclose()
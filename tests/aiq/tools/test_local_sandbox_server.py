@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+pytest.importorskip("flask")
+
+from aiq.tool.code_execution.local_sandbox import local_sandbox_server  # noqa: E402  # pylint: disable=C0413
+
+
+@pytest.fixture(name="pool")
+def pool_fixture():
+    pool = local_sandbox_server.WorkerPool(size=1)
+    yield pool
+    pool.close()
+
+
+def test_execute(pool: local_sandbox_server.WorkerPool):
+    assert pool.execute("print(1 + 1)", timeout=10) == "2\n"
+
+    result = pool.execute("raise ValueError('invalid value')", timeout=10)
+    assert result == {"process_status": "error", "stdout": "", "stderr": "invalid value\n"}
+
+
+def test_execute_isolated(pool: local_sandbox_server.WorkerPool):
+    # every execution runs in a fresh process, nothing done by the previous code is visible
+    pids = {pool.execute("import os; print(os.getpid())", timeout=10) for _ in range(3)}
+    assert len(pids) == 3
+
+    pool.execute("import json, os; json.X = 5; os.environ['SANDBOX_TEST'] = '1'; os.chdir('/')", timeout=10)
+    output = pool.execute("import json, os; print(getattr(json, 'X', None), 'SANDBOX_TEST' in os.environ, os.getcwd())",
+                          timeout=10)
+    assert output == f"None False {os.getcwd()}\n"
+
+
+def test_execute_timeout(pool: local_sandbox_server.WorkerPool):
+    result = pool.execute("while True:\n    pass", timeout=1)
+    assert result == {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
+
+    # the worker which timed out is replaced
+    assert pool.execute("print('done')", timeout=10) == "done\n"
+
+
+def test_execute_crash(pool: local_sandbox_server.WorkerPool):
+    result = pool.execute("import os; os._exit(1)", timeout=10)
+    assert result == {"process_status": "error", "stdout": "", "stderr": "Worker process exited unexpectedly\n"}
+
+    # the worker which crashed is replaced
+    assert pool.execute("print('done')", timeout=10) == "done\n"
+
+
+def test_execute_endpoint(monkeypatch: pytest.MonkeyPatch, pool: local_sandbox_server.WorkerPool):
+    monkeypatch.setattr(local_sandbox_server, "get_worker_pool", lambda: pool)
+    client = local_sandbox_server.app.test_client()
+
+    response = client.post("/execute", json={"generated_code": "print('hello')", "timeout": 10})
+    assert response.get_data(as_text=True) == "hello\n"
+
+    response = client.post("/execute", json={"generated_code": "", "timeout": 10, "language": "bash"})
+    assert response.json["process_status"] == "error"
@@ -13,13 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from contextlib import asynccontextmanager
 from typing import get_args
+from unittest.mock import patch
 
+import anyio
 import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_client_server_memory_streams
 from pydantic import ValidationError
 from pytest_httpserver import HTTPServer
 
+from aiq.tool.mcp.mcp_client import MCPBuilder
+from aiq.tool.mcp.mcp_client import MCPSessionManager
 from aiq.tool.mcp.mcp_client import model_from_mcp_schema
+from aiq.tool.mcp.mcp_client import shared_session_manager
 
 
 @pytest.fixture(name="test_mcp_server")
@@ -168,3 +177,92 @@ def test_schema_missing_required_fields_raises(sample_schema):
     errors = exc_info.value.errors()
     missing_fields = {e['loc'][0] for e in errors if e['type'] == 'missing'}
     assert 'required_int_field' in missing_fields
+
+
+@pytest.fixture(name="memory_mcp_server")
+def _get_memory_mcp_server():
+    """Replace the SSE transport with in-memory streams connected to a FastMCP server, counting the connections"""
+    server = FastMCP("test")
+
+    @server.tool()
+    async def echo(text: str) -> str:
+        """Echo the input text"""
+        await asyncio.sleep(0.05)
+        return text
+
+    connections = []
+
+    @asynccontextmanager
+    async def _memory_sse_client(url, **kwargs):  # pylint: disable=unused-argument
+        async with create_client_server_memory_streams() as (client_streams, server_streams):
+            async with anyio.create_task_group() as tg:
+                mcp_server = server._mcp_server  # pylint: disable=protected-access
+                tg.start_soon(mcp_server.run,
+                              server_streams[0],
+                              server_streams[1],
+                              mcp_server.create_initialization_options())
+                connections.append(client_streams)
+                try:
+                    yield client_streams
+                finally:
+                    tg.cancel_scope.cancel()
+
+    with patch("aiq.tool.mcp.mcp_client.sse_client", _memory_sse_client):
+        yield connections
+
+
+async def test_session_manager_reuses_session(memory_mcp_server):
+    manager = MCPSessionManager("http://localhost:9901/sse")
+    builder = MCPBuilder("http://localhost:9901/sse", session_manager=manager)
+
+    tool = await builder.get_tool("echo")
+    results = await asyncio.gather(*[tool.acall({"text": str(i)}) for i in range(10)])
+
+    assert results == [str(i) for i in range(10)]
+    assert len(memory_mcp_server) == 1
+    assert manager.num_connections == 1
+
+    await manager.aclose()
+    assert not manager.is_connected
+
+
+async def test_session_manager_reconnects(memory_mcp_server):
+    manager = MCPSessionManager("http://localhost:9901/sse")
+    tool = await MCPBuilder("http://localhost:9901/sse", session_manager=manager).get_tool("echo")
+
+    assert await tool.acall({"text": "first"}) == "first"
+
+    # Simulate the server dropping the connection
+    read_stream, write_stream = memory_mcp_server[-1]
+    await write_stream.aclose()
+    await read_stream.aclose()
+
+    assert await tool.acall({"text": "second"}) == "second"
+    assert manager.num_connections == 2
+
+    await manager.aclose()
+
+
+async def test_builder_without_session_manager(memory_mcp_server):
+    tool = await MCPBuilder("http://localhost:9901/sse").get_tool("echo")
+
+    assert await tool.acall({"text": "a"}) == "a"
+    assert await tool.acall({"text": "b"}) == "b"
+    assert len(memory_mcp_server) == 3
+
+
+async def test_shared_session_manager(memory_mcp_server):
+    url = "http://localhost:9901/sse"
+    async with shared_session_manager(url) as first:
+        async with shared_session_manager(url) as second:
+            assert first is second
+            await second.list_tools()
+
+        # Still in use by the outer context
+        assert first.is_connected
+
+    assert not first.is_connected
+    assert len(memory_mcp_server) == 1
+
+    async with shared_session_manager(url) as third:
+        assert third is not first
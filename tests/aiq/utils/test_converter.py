@@ -305,3 +305,66 @@ def test_three_hop_chain(inheritance_converter):
     result = inheritance_converter.convert(data, float)
     assert result == float(1234)
     assert isinstance(result, float)
+
+
+def test_conversion_path_is_cached(basic_converter, monkeypatch):
+    """
+    Once resolved, a path is replayed without searching the registry again.
+    """
+    data = {"value": "123.456"}
+    assert basic_converter.convert(data, float) == 123.456
+
+    def fail(*args, **kwargs):
+        raise AssertionError("conversion path was resolved again")
+
+    monkeypatch.setattr(basic_converter, "_get_direct_converters", fail)
+    monkeypatch.setattr(basic_converter, "_try_indirect_conversion", fail)
+
+    assert basic_converter.convert({"value": "1.5"}, float) == 1.5
+    assert basic_converter.convert(data, float) == 123.456
+
+
+def test_missing_path_is_cached(basic_converter, monkeypatch):
+    """A search which failed without any converter rejecting the data is not repeated."""
+    with pytest.raises(ValueError):
+        basic_converter.convert(123.456, dict)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("conversion path was resolved again")
+
+    monkeypatch.setattr(basic_converter, "_try_indirect_conversion", fail)
+
+    with pytest.raises(ValueError):
+        basic_converter.convert(123.456, dict)
+
+
+def test_rejected_data_does_not_prevent_conversion(basic_converter):
+    """A converter rejecting one value with ConvertException may accept another value of the same type."""
+    with pytest.raises(ValueError):
+        basic_converter.convert({"value": "not-a-number"}, float)
+
+    assert basic_converter.convert({"value": "2.5"}, float) == 2.5
+
+
+def test_add_converter_invalidates_cache(basic_converter):
+    with pytest.raises(ValueError):
+        basic_converter.convert(123.456, dict)
+
+    def convert_float_to_dict(f: float) -> dict:
+        return {"value": f}
+
+    basic_converter.add_converter(convert_float_to_dict)
+
+    assert basic_converter.convert(123.456, dict) == {"value": 123.456}
+
+
+def test_parent_add_converter_invalidates_cache(parent_converter, child_converter):
+    with pytest.raises(ValueError):
+        child_converter.convert(1.5, dict)
+
+    def convert_float_to_dict(f: float) -> dict:
+        return {"value": f}
+
+    parent_converter.add_converter(convert_float_to_dict)
+
+    assert child_converter.convert(1.5, dict) == {"value": 1.5}